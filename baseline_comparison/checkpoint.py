@@ -0,0 +1,109 @@
+"""Checkpoints of partially judged (contract, model) results for Phase 2.
+
+Each finished judge call appends its evaluations to a JSON-lines file next to
+the result file. An interrupted or budget-limited run leaves the checkpoint
+behind; the next run loads it and only judges the GT issues still missing.
+The checkpoint is removed once the full result file is written.
+
+The first line records the raw review hash and GT version. A checkpoint whose
+header no longer matches is discarded rather than mixed with new judgements.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from .evaluator import BatchEvaluation, JudgeUsage
+
+logger = logging.getLogger(__name__)
+
+
+def checkpoint_path(result_path: Path) -> Path:
+    """Checkpoint file for a result file: <dir>/.<model_id>.checkpoint.jsonl"""
+    return result_path.with_name(f".{result_path.stem}.checkpoint.jsonl")
+
+
+class JudgeCheckpoint:
+    """Append-only store of judged GT issues for one (contract, model).
+
+    Args:
+        path: The checkpoint file.
+        raw_review: The review being judged (hashed into the header).
+        gt_version: GT version of the contract.
+
+    Usage:
+        checkpoint = JudgeCheckpoint(checkpoint_path(result_path), raw_review, gt_version)
+        done = checkpoint.load()        # gt_id -> evaluation
+        checkpoint.append(batch)        # after each judge call
+        checkpoint.discard()            # once the result file is written
+    """
+
+    def __init__(self, path: Path, raw_review: str, gt_version: str):
+        self.path = Path(path)
+        self.header = {
+            "review_sha256": hashlib.sha256(raw_review.encode("utf-8")).hexdigest(),
+            "gt_version": gt_version,
+        }
+        self.usage = JudgeUsage(batch_size=0)
+
+    def load(self) -> dict[str, dict[str, Any]]:
+        """Evaluations already judged, keyed by gt_id.
+
+        Also restores self.usage to the usage recorded so far.
+        """
+        if not self.path.exists():
+            return {}
+
+        done: dict[str, dict[str, Any]] = {}
+        usage = JudgeUsage(batch_size=0)
+        with open(self.path) as f:
+            lines = f.read().splitlines()
+
+        try:
+            header = json.loads(lines[0]) if lines else None
+        except json.JSONDecodeError:
+            header = None
+        if header != self.header:
+            logger.warning("Discarding stale checkpoint %s (review or GT changed)", self.path)
+            self.discard()
+            return {}
+
+        kept = [lines[0]]
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final line from an interrupted write
+                logger.warning("Dropping truncated checkpoint line in %s", self.path)
+                continue
+            kept.append(line)
+            for ev in entry["evaluations"]:
+                done[ev["gt_id"]] = ev
+            usage.merge(JudgeUsage(**entry["usage"]))
+
+        if len(kept) < len(lines):
+            self.path.write_text("\n".join(kept) + "\n")
+
+        self.usage = usage
+        return done
+
+    def append(self, batch: BatchEvaluation) -> None:
+        """Record one finished judge call."""
+        new_file = not self.path.exists()
+        with open(self.path, "a") as f:
+            if new_file:
+                f.write(json.dumps(self.header) + "\n")
+            f.write(json.dumps({"evaluations": batch.evaluations, "usage": asdict(batch.usage)}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.usage.merge(batch.usage)
+
+    def discard(self) -> None:
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
@@ -14,6 +14,14 @@ FREEFORM_CONFIG = PROJECT_ROOT / "framework" / "config" / "freeform.json"
 RAW_RESPONSES_DIR = BASELINE_DIR / "raw_responses"
 RESULTS_DIR = BASELINE_DIR / "results"
 REPORTS_DIR = BASELINE_DIR / "reports"
+RESPONSE_CACHE_DIR = BASELINE_DIR / ".response_cache"
+EXTRACTION_CACHE_DIR = BASELINE_DIR / ".extraction_cache"
+
+# Redlined contracts of the stacking modes (nested by contract type for rules)
+STACKING_CONTRACT_DIRS = [
+    PROJECT_ROOT / "freeform_stacking" / "redlined_contracts",
+    PROJECT_ROOT / "rules_stacking" / "redlined_contracts",
+]
 
 ENV_FILE = Path("/Users/liz/Work/.env")
 
@@ -68,6 +76,46 @@ ALL_MODELS = list(MODELS.keys())
 EVALUATOR_MODEL = "claude-sonnet-4-20250514"
 EVALUATOR_PROVIDER = "anthropic"
 
+# GT issues judged per evaluator call; 1 sends one prompt per GT issue
+EVALUATOR_BATCH_SIZE = 1
+
+# Evaluator list prices (USD per million tokens), used for Phase 2 cost budgets.
+# Prompt-cache reads bill at 0.1x and writes at 1.25x the input rate.
+EVALUATOR_PRICING: dict[str, float] = {
+    "input_usd_per_mtok": 3.0,
+    "output_usd_per_mtok": 15.0,
+    "cache_read_usd_per_mtok": 0.30,
+    "cache_write_usd_per_mtok": 3.75,
+}
+
+# Judge order in Phase 2: T1 first, since they decide t1_gate_pass
+TIER_PRIORITY: dict[str, int] = {"T1": 0, "T2": 1, "T3": 2}
+
+# --- Pooled API clients ---
+
+# One HTTP connection pool per (provider, api_key); see llm_clients.get_client
+CLIENT_POOL: dict[str, float] = {
+    "max_connections": 20,
+    "max_keepalive_connections": 10,
+    "keepalive_expiry": 30.0,  # seconds an idle connection is kept open
+    "timeout": 600.0,  # seconds per request
+    "connect_timeout": 10.0,
+}
+
+# --- LLM response cache ---
+
+RESPONSE_CACHE_MAX_BYTES = 500 * 1024 * 1024  # LRU eviction above this size
+
+# --- Judge call concurrency (Phase 2) ---
+
+JUDGE_CONCURRENCY = 8  # judge calls in flight across all providers
+
+# Per-provider limits: concurrent calls and requests per minute
+PROVIDER_LIMITS: dict[str, dict] = {
+    "anthropic": {"concurrency": 8, "requests_per_minute": 50},
+    "openai": {"concurrency": 8, "requests_per_minute": 500},
+}
+
 # --- Scoring config (mirrors framework/config/freeform.json) ---
 
 DETECTION_POINTS: dict[str, dict[str, float]] = {
@@ -1,15 +1,139 @@
-"""Extract text from .docx contract files using python-docx."""
+"""Extract text from .docx contract files using python-docx.
 
+Extractions are cached on disk keyed by the SHA-256 of the .docx file and
+PARSER_VERSION, so a contract is parsed once per content change. Each cache
+entry holds the text and the (start, end) character offsets of its
+paragraphs.
+"""
+
+import bisect
+import json
+import logging
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable, Optional
+
+from .config import CONTRACTS_DIR, EXTRACTION_CACHE_DIR, STACKING_CONTRACT_DIRS
+
+_project_root = Path(__file__).resolve().parent.parent
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
+
+from framework.fileio import file_sha256
+
+logger = logging.getLogger(__name__)
+
+PARAGRAPH_SEPARATOR = "\n\n"
+
+# Bump whenever _parse_docx output changes; older cache entries are then ignored
+PARSER_VERSION = 1
+
+
+@dataclass
+class ExtractedContract:
+    """Text of one .docx contract with its paragraph offsets."""
+
+    path: Path
+    sha256: str
+    text: str
+    paragraph_offsets: list[tuple[int, int]]
+
+    @property
+    def paragraphs(self) -> list[str]:
+        return [self.text[start:end] for start, end in self.paragraph_offsets]
+
+    def paragraph_index(self, offset: int) -> Optional[int]:
+        """Index of the paragraph containing character offset, if any."""
+        i = bisect.bisect_right([start for start, _ in self.paragraph_offsets], offset) - 1
+        if i >= 0 and offset < self.paragraph_offsets[i][1]:
+            return i
+        return None
+
+
+def _parse_docx(docx_path: Path) -> tuple[str, list[tuple[int, int]]]:
+    """Parse a .docx into text and paragraph offsets (no caching)."""
+    from docx import Document
+
+    doc = Document(str(docx_path))
+    paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
+
+    if not paragraphs:
+        raise ValueError(f"No text extracted from: {docx_path}")
+
+    offsets = []
+    position = 0
+    for paragraph in paragraphs:
+        offsets.append((position, position + len(paragraph)))
+        position += len(paragraph) + len(PARAGRAPH_SEPARATOR)
+
+    return PARAGRAPH_SEPARATOR.join(paragraphs), offsets
+
+
+def _cache_path(cache_dir: Path, sha256: str) -> Path:
+    return cache_dir / f"{sha256}.v{PARSER_VERSION}.json"
+
+
+def _read_cache(cache_dir: Path, sha256: str) -> Optional[tuple[str, list[tuple[int, int]]]]:
+    try:
+        with open(_cache_path(cache_dir, sha256)) as f:
+            data = json.load(f)
+        return data["text"], [tuple(o) for o in data["paragraph_offsets"]]
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, KeyError, TypeError):
+        logger.warning("Ignoring corrupt extraction cache entry %s", sha256)
+        return None
+
+
+def _write_cache(cache_dir: Path, sha256: str, source: Path, text: str, offsets: list[tuple[int, int]]) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    data = json.dumps({"source": source.name, "text": text, "paragraph_offsets": offsets})
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        f.write(data)
+    os.replace(tmp, _cache_path(cache_dir, sha256))
 
-from docx import Document
 
+def extract_contract(
+    docx_path: Path,
+    cache_dir: Optional[Path] = EXTRACTION_CACHE_DIR,
+) -> ExtractedContract:
+    """Extract a .docx contract, reading and filling the extraction cache.
 
-def extract_text(docx_path: Path) -> str:
+    Args:
+        docx_path: Path to the .docx file.
+        cache_dir: Extraction cache directory; None disables caching.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file is empty or unreadable.
+    """
+    docx_path = Path(docx_path)
+    if not docx_path.exists():
+        raise FileNotFoundError(f"Contract not found: {docx_path}")
+
+    sha256 = file_sha256(docx_path)
+    cached = _read_cache(cache_dir, sha256) if cache_dir is not None else None
+    if cached is not None:
+        text, offsets = cached
+    else:
+        text, offsets = _parse_docx(docx_path)
+        if cache_dir is not None:
+            _write_cache(cache_dir, sha256, docx_path, text, offsets)
+
+    return ExtractedContract(docx_path, sha256, text, offsets)
+
+
+def extract_text(docx_path: Path, cache_dir: Optional[Path] = EXTRACTION_CACHE_DIR) -> str:
     """Extract full text from a .docx file, joining paragraphs with newlines.
 
     Args:
         docx_path: Path to the .docx file.
+        cache_dir: Extraction cache directory; None disables caching.
 
     Returns:
         The full text content of the document.
@@ -18,13 +142,66 @@ def extract_text(docx_path: Path) -> str:
         FileNotFoundError: If the file does not exist.
         ValueError: If the file is empty or unreadable.
     """
-    if not docx_path.exists():
-        raise FileNotFoundError(f"Contract not found: {docx_path}")
+    return extract_contract(docx_path, cache_dir).text
 
-    doc = Document(str(docx_path))
-    paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
 
-    if not paragraphs:
-        raise ValueError(f"No text extracted from: {docx_path}")
+def all_contract_paths() -> list[Path]:
+    """The base contracts in CONTRACTS_DIR plus every stacking redlined contract."""
+    paths = sorted(CONTRACTS_DIR.glob("*.docx"))
+    for stacking_dir in STACKING_CONTRACT_DIRS:
+        paths.extend(sorted(stacking_dir.rglob("*.docx")))
+    return paths
+
+
+def extract_all(
+    paths: Optional[Iterable[Path]] = None,
+    *,
+    cache_dir: Optional[Path] = EXTRACTION_CACHE_DIR,
+    max_workers: Optional[int] = None,
+) -> dict[Path, ExtractedContract]:
+    """Extract many contracts, parsing cache misses in parallel processes.
+
+    Args:
+        paths: .docx files to extract; defaults to all_contract_paths().
+        cache_dir: Extraction cache directory; None disables caching.
+        max_workers: Worker processes for parsing (default: CPU count).
+
+    Returns:
+        Dict of path -> ExtractedContract in input order. Files that are
+        missing, unreadable or fail to parse are logged and left out.
+    """
+    paths = [Path(p) for p in (all_contract_paths() if paths is None else paths)]
+
+    hashes: dict[Path, str] = {}
+    found: dict[Path, tuple[str, list[tuple[int, int]]]] = {}
+    for path in paths:
+        try:
+            hashes[path] = file_sha256(path)
+        except OSError as exc:
+            logger.warning("Failed to read %s: %s", path, exc)
+            continue
+        cached = _read_cache(cache_dir, hashes[path]) if cache_dir is not None else None
+        if cached is not None:
+            found[path] = cached
+
+    misses = [p for p in hashes if p not in found]
+    if misses:
+        logger.info("Extracting %d of %d contracts (%d cached)", len(misses), len(paths), len(paths) - len(misses))
+        workers = min(max_workers or os.cpu_count() or 1, len(misses))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {path: pool.submit(_parse_docx, path) for path in misses}
+            for path, future in futures.items():
+                try:
+                    text, offsets = future.result()
+                except Exception as exc:
+                    logger.warning("Failed to extract %s: %s", path, exc)
+                    continue
+                found[path] = (text, offsets)
+                if cache_dir is not None:
+                    _write_cache(cache_dir, hashes[path], path, text, offsets)
 
-    return "\n\n".join(paragraphs)
+    return {
+        path: ExtractedContract(path, hashes[path], *found[path])
+        for path in paths
+        if path in found
+    }
@@ -1,13 +1,15 @@
 """Evaluator: checks whether raw LLM contract reviews detected ground truth issues.
 
-Detection-only evaluation (recall). One Claude Sonnet call per GT issue.
+Detection-only evaluation (recall). One Claude Sonnet call per GT issue, or
+one call per batch of GT issues sharing a single review block (batched mode).
 No quality scoring — raw LLMs weren't asked to produce amendments.
 """
 
 import json
 import logging
 import re
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, Optional
 
 from .llm_clients import call_anthropic, LLMResponse
 from .config import EVALUATOR_MODEL, DETECTION_POINTS
@@ -21,6 +23,7 @@ if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
 from framework.scoring.detection import calculate_detection_points
+from framework.scripts.gt_index import GroundTruthIndex
 
 logger = logging.getLogger(__name__)
 
@@ -37,21 +40,8 @@ You must assess the review text holistically, looking for any mention, discussio
 or implication of the ground truth issue, even if phrased differently."""
 
 
-def build_evaluator_prompt(
-    raw_review: str,
-    gt_issue: dict[str, Any],
-    contract_id: str,
-) -> str:
-    """Build the per-issue evaluator prompt.
-
-    Args:
-        raw_review: The raw text output from the LLM being evaluated.
-        gt_issue: A single ground truth issue dict.
-        contract_id: Short name of the contract.
-
-    Returns:
-        The formatted prompt string for the evaluator.
-    """
+def _format_gt_issue(gt_issue: dict[str, Any], contract_id: str) -> str:
+    """Format the bullet list describing one GT issue."""
     key_elements = gt_issue.get("key_elements", [])
     key_elements_text = "\n".join(f"  - {e}" for e in key_elements) if key_elements else "  (none specified)"
 
@@ -66,8 +56,6 @@ def build_evaluator_prompt(
             contract_text = "\n---\n".join(alt_texts)
 
     return f"""\
-## Ground Truth Issue
-
 - **Contract:** {contract_id}
 - **GT ID:** {gt_issue["gt_id"]}
 - **Clause:** {gt_issue.get("clause", "N/A")}
@@ -75,7 +63,28 @@ def build_evaluator_prompt(
 - **Issue:** {gt_issue["issue"]}
 - **Key elements to look for:**
 {key_elements_text}
-- **Relevant contract text:** {contract_text}
+- **Relevant contract text:** {contract_text}"""
+
+
+def build_evaluator_prompt(
+    raw_review: str,
+    gt_issue: dict[str, Any],
+    contract_id: str,
+) -> str:
+    """Build the per-issue evaluator prompt.
+
+    Args:
+        raw_review: The raw text output from the LLM being evaluated.
+        gt_issue: A single ground truth issue dict.
+        contract_id: Short name of the contract.
+
+    Returns:
+        The formatted prompt string for the evaluator.
+    """
+    return f"""\
+## Ground Truth Issue
+
+{_format_gt_issue(gt_issue, contract_id)}
 
 ## Raw LLM Review (to evaluate)
 
@@ -112,6 +121,78 @@ Respond with ONLY a JSON object (no markdown fences, no commentary):
 }}"""
 
 
+def build_batch_review_block(raw_review: str) -> str:
+    """Build the review block shared by every batched prompt for one review.
+
+    It is sent first and unchanged, so it forms a common prompt prefix across
+    the batches of a review.
+    """
+    return f"""\
+## Raw LLM Review (to evaluate)
+
+<review>
+{raw_review}
+</review>
+
+"""
+
+
+def build_batch_evaluator_prompt(
+    gt_issues: list[dict[str, Any]],
+    contract_id: str,
+) -> str:
+    """Build the batched evaluator prompt that follows the shared review block.
+
+    Args:
+        gt_issues: The ground truth issues to judge in one call.
+        contract_id: Short name of the contract.
+
+    Returns:
+        The prompt text asking for one JSON verdict per GT issue.
+    """
+    issues_text = "\n\n".join(
+        f"### Issue {i}\n\n{_format_gt_issue(gt_issue, contract_id)}"
+        for i, gt_issue in enumerate(gt_issues, start=1)
+    )
+
+    return f"""\
+## Ground Truth Issues ({len(gt_issues)})
+
+{issues_text}
+
+## Your Task
+
+Judge EACH ground truth issue above independently. For each one, search the raw
+review above for ANY mention, discussion, or implication of that issue. The
+review is unstructured prose — the model may have used different terminology,
+grouped multiple issues together, or mentioned the risk in passing.
+
+Determine detection status per issue:
+
+- **Y (Yes):** The review clearly identifies this risk. It discusses the core
+  concern even if using different words or clause references.
+- **P (Partial):** The review touches on a related concern but misses the core
+  risk, or identifies the clause but mischaracterises the issue.
+- **N (No):** The review does not mention this risk at all despite it being
+  present in the contract.
+- **NMI (Not Mentioned in Input):** Only use if the risk relates to something
+  genuinely absent from the contract text provided to the model.
+
+## Response Format
+
+Respond with ONLY a JSON array (no markdown fences, no commentary) containing
+exactly one object per issue, in the order given:
+
+[
+  {{
+    "gt_id": "GT ID of the issue",
+    "detection": "Y|P|N|NMI",
+    "evidence_excerpt": "Brief quote from the review that relates to this issue (or empty string if N/NMI)",
+    "reasoning": "1-2 sentence explanation of your detection decision"
+  }}
+]"""
+
+
 def parse_evaluator_response(response_text: str) -> dict[str, Any]:
     """Parse the evaluator's JSON response, with regex fallback.
 
@@ -121,13 +202,7 @@ def parse_evaluator_response(response_text: str) -> dict[str, Any]:
     Raises:
         ValueError: If the response cannot be parsed at all.
     """
-    text = response_text.strip()
-
-    # Strip markdown fences if present
-    if text.startswith("```"):
-        lines = text.split("\n")
-        lines = [l for l in lines if not l.strip().startswith("```")]
-        text = "\n".join(lines)
+    text = _strip_fences(response_text)
 
     try:
         data = json.loads(text)
@@ -137,6 +212,67 @@ def parse_evaluator_response(response_text: str) -> dict[str, Any]:
         if data is None:
             raise ValueError(f"Failed to parse evaluator response.\nText: {text[:500]}")
 
+    return _validate_fields(data)
+
+
+def parse_batch_evaluator_response(
+    response_text: str,
+    gt_ids: list[str],
+) -> list[dict[str, Any]]:
+    """Parse a batched evaluator response into one verdict per GT ID.
+
+    No regex fallback: a batched answer is only accepted if it is a JSON array
+    holding exactly one valid verdict for each requested GT ID.
+
+    Returns:
+        Verdict dicts (detection, evidence_excerpt, reasoning) in gt_ids order.
+
+    Raises:
+        ValueError: If the array is malformed, incomplete or has unknown IDs.
+    """
+    text = _strip_fences(response_text)
+
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"Failed to parse batched evaluator response: {exc}\nText: {text[:500]}") from exc
+
+    if not isinstance(data, list):
+        raise ValueError(f"Batched evaluator response is not a JSON array: {type(data).__name__}")
+
+    verdicts: dict[str, dict[str, Any]] = {}
+    for item in data:
+        if not isinstance(item, dict):
+            raise ValueError(f"Batched evaluator verdict is not an object: {item!r}")
+        gt_id = item.get("gt_id")
+        if gt_id not in gt_ids:
+            raise ValueError(f"Unexpected GT ID in batched response: {gt_id!r}")
+        if gt_id in verdicts:
+            raise ValueError(f"Duplicate GT ID in batched response: {gt_id!r}")
+        verdicts[gt_id] = _validate_fields(item)
+
+    missing = [gt_id for gt_id in gt_ids if gt_id not in verdicts]
+    if missing:
+        raise ValueError(f"Batched response missing GT IDs: {', '.join(missing)}")
+
+    return [verdicts[gt_id] for gt_id in gt_ids]
+
+
+def _strip_fences(response_text: str) -> str:
+    """Strip surrounding whitespace and markdown fences."""
+    text = response_text.strip()
+
+    # Strip markdown fences if present
+    if text.startswith("```"):
+        lines = text.split("\n")
+        lines = [l for l in lines if not l.strip().startswith("```")]
+        text = "\n".join(lines)
+
+    return text
+
+
+def _validate_fields(data: dict[str, Any]) -> dict[str, Any]:
+    """Check the detection value and return the normalised verdict fields."""
     detection = data.get("detection", "").upper().strip()
     if detection not in ("Y", "P", "N", "NMI"):
         raise ValueError(f"Invalid detection value: {detection!r}")
@@ -163,15 +299,85 @@ def _extract_fields_regex(text: str) -> dict[str, Any] | None:
     return result
 
 
+@dataclass
+class JudgeUsage:
+    """Evaluator token usage for the GT issues of one (contract, model).
+
+    unbatched_input_tokens estimates what one call per GT issue would have
+    used, scaling the batched call's input tokens by prompt length. Responses
+    replayed from the ResponseCache made no API call: they count under
+    cached_calls and add no tokens.
+    """
+
+    batch_size: int = 1
+    calls: int = 0
+    cached_calls: int = 0
+    fallback_batches: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+    unbatched_input_tokens: int = 0
+
+    def record(self, response: LLMResponse, unbatched_input_tokens: int | None = None) -> None:
+        if response.cached:
+            self.cached_calls += 1
+            return
+        self.calls += 1
+        self.input_tokens += response.input_tokens
+        self.output_tokens += response.output_tokens
+        self.cache_read_tokens += response.cache_read_tokens
+        self.cache_creation_tokens += response.cache_creation_tokens
+        self.unbatched_input_tokens += (
+            response.input_tokens if unbatched_input_tokens is None else unbatched_input_tokens
+        )
+
+    def merge(self, other: "JudgeUsage") -> None:
+        self.batch_size = max(self.batch_size, other.batch_size)
+        self.calls += other.calls
+        self.cached_calls += other.cached_calls
+        self.fallback_batches += other.fallback_batches
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.cache_read_tokens += other.cache_read_tokens
+        self.cache_creation_tokens += other.cache_creation_tokens
+        self.unbatched_input_tokens += other.unbatched_input_tokens
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "batch_size": self.batch_size,
+            "calls": self.calls,
+            "cached_calls": self.cached_calls,
+            "fallback_batches": self.fallback_batches,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_creation_tokens": self.cache_creation_tokens,
+            "unbatched_input_tokens_est": self.unbatched_input_tokens,
+            "input_tokens_saved_est": self.unbatched_input_tokens - self.input_tokens,
+        }
+
+
+@dataclass
+class BatchEvaluation:
+    """Evaluations for a batch of GT issues, in input order, with usage."""
+
+    evaluations: list[dict[str, Any]]
+    usage: JudgeUsage = field(default_factory=JudgeUsage)
+
+
 def evaluate_single_issue(
     raw_review: str,
     gt_issue: dict[str, Any],
     contract_id: str,
     anthropic_api_key: str,
     dry_run: bool = False,
+    usage: JudgeUsage | None = None,
 ) -> dict[str, Any]:
     """Evaluate a single GT issue against a raw review (detection only).
 
+    If usage is given, the call's token usage is added to it.
+
     Returns:
         Evaluation dict with detection and detection_points.
     """
@@ -195,6 +401,8 @@ def evaluate_single_issue(
             api_key=anthropic_api_key,
             max_tokens=500,
         )
+        if usage is not None:
+            usage.record(response)
         scores = parse_evaluator_response(response.text)
     except Exception:
         logger.exception("Evaluator failed for %s/%s", contract_id, gt_id)
@@ -203,6 +411,77 @@ def evaluate_single_issue(
     return _build_evaluation_dict(gt_issue=gt_issue, **scores)
 
 
+def evaluate_issue_batch(
+    raw_review: str,
+    gt_issues: list[dict[str, Any]],
+    contract_id: str,
+    anthropic_api_key: str,
+    dry_run: bool = False,
+) -> BatchEvaluation:
+    """Evaluate several GT issues against a raw review in one evaluator call.
+
+    The review is sent once as a prompt-cached block ahead of the issues, so
+    consecutive batches for the same review share a prompt prefix. A batch of
+    one issue uses the per-issue prompt. If the batched answer cannot be
+    parsed, each issue in the batch is re-judged with its own call.
+
+    Returns:
+        BatchEvaluation with one evaluation dict per GT issue and the
+        evaluator token usage.
+    """
+    usage = JudgeUsage(batch_size=len(gt_issues))
+
+    if dry_run or len(gt_issues) == 1:
+        evaluations = [
+            evaluate_single_issue(raw_review, gt_issue, contract_id, anthropic_api_key,
+                                  dry_run=dry_run, usage=usage)
+            for gt_issue in gt_issues
+        ]
+        return BatchEvaluation(evaluations, usage)
+
+    gt_ids = [gt_issue["gt_id"] for gt_issue in gt_issues]
+    review_block = build_batch_review_block(raw_review)
+    prompt = build_batch_evaluator_prompt(gt_issues, contract_id)
+
+    try:
+        response: LLMResponse = call_anthropic(
+            prompt,
+            system=EVALUATOR_SYSTEM,
+            model=EVALUATOR_MODEL,
+            api_key=anthropic_api_key,
+            max_tokens=500 * len(gt_issues),
+            cache_prefix=review_block,
+        )
+    except Exception:
+        logger.exception("Batched evaluator failed for %s/%s", contract_id, ",".join(gt_ids))
+        raise
+
+    batch_chars = len(EVALUATOR_SYSTEM) + len(review_block) + len(prompt)
+    unbatched_chars = sum(
+        len(EVALUATOR_SYSTEM) + len(build_evaluator_prompt(raw_review, gt_issue, contract_id))
+        for gt_issue in gt_issues
+    )
+    usage.record(response, round(response.input_tokens * unbatched_chars / batch_chars))
+
+    try:
+        verdicts = parse_batch_evaluator_response(response.text, gt_ids)
+    except ValueError as exc:
+        logger.warning("Malformed batched answer for %s/%s, judging per issue: %s",
+                       contract_id, ",".join(gt_ids), exc)
+        usage.fallback_batches += 1
+        evaluations = [
+            evaluate_single_issue(raw_review, gt_issue, contract_id, anthropic_api_key, usage=usage)
+            for gt_issue in gt_issues
+        ]
+        return BatchEvaluation(evaluations, usage)
+
+    evaluations = [
+        _build_evaluation_dict(gt_issue=gt_issue, **scores)
+        for gt_issue, scores in zip(gt_issues, verdicts)
+    ]
+    return BatchEvaluation(evaluations, usage)
+
+
 def _build_evaluation_dict(
     gt_issue: dict[str, Any],
     detection: str,
@@ -227,8 +506,15 @@ def _build_evaluation_dict(
     }
 
 
-def build_result_summary(evaluations: list[dict[str, Any]]) -> dict[str, Any]:
-    """Build the summary block from a list of evaluated GT issues."""
+def build_result_summary(
+    evaluations: list[dict[str, Any]],
+    gt_index: Optional[GroundTruthIndex] = None,
+) -> dict[str, Any]:
+    """Build the summary block from a list of evaluated GT issues.
+
+    With the contract's GroundTruthIndex, weighted_max comes from its
+    precompiled tier counts rather than a recount of the evaluations.
+    """
     detection_counts = {"Y": 0, "P": 0, "N": 0, "NMI": 0}
     detection_by_tier: dict[str, dict[str, int]] = {}
 
@@ -255,14 +541,17 @@ def build_result_summary(evaluations: list[dict[str, Any]]) -> dict[str, Any]:
 
     t1_gate_pass = t1_detected == t1_count if t1_count > 0 else True
 
-    # Calculate weighted max from the evaluations' tiers
-    tier_counts: dict[str, int] = {}
-    for ev in evaluations:
-        tier_counts[ev["tier"]] = tier_counts.get(ev["tier"], 0) + 1
-    weighted_max = sum(
-        count * DETECTION_POINTS[tier]["Y"]
-        for tier, count in tier_counts.items()
-    )
+    if gt_index is not None:
+        weighted_max = gt_index.max_points(DETECTION_POINTS)
+    else:
+        # Calculate weighted max from the evaluations' tiers
+        tier_counts: dict[str, int] = {}
+        for ev in evaluations:
+            tier_counts[ev["tier"]] = tier_counts.get(ev["tier"], 0) + 1
+        weighted_max = sum(
+            count * DETECTION_POINTS[tier]["Y"]
+            for tier, count in tier_counts.items()
+        )
 
     total_issues = sum(detection_counts.values())
     detection_rate = (detection_counts["Y"] + detection_counts["P"]) / total_issues if total_issues > 0 else 0
@@ -1,32 +1,75 @@
-"""API wrappers for OpenAI and Anthropic with retry/backoff."""
+"""API wrappers for OpenAI and Anthropic with retry/backoff and an optional response cache.
 
+API clients are pooled: one client, and so one HTTP connection pool, per
+(provider, api_key, base URL), shared by every call and thread.
+"""
+
+import os
+import threading
 import time
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Optional
 
 import openai
 import anthropic
 
+from .config import CLIENT_POOL
+from .scheduler import charge_attempt
+
+if TYPE_CHECKING:
+    from .response_cache import ResponseCache
+
 logger = logging.getLogger(__name__)
 
 MAX_RETRIES = 3
 INITIAL_BACKOFF = 2.0  # seconds
 
+# Response cache consulted by call_openai / call_anthropic (None = disabled)
+_response_cache: Optional["ResponseCache"] = None
+
+# Pooled clients keyed by (provider, api_key, base_url)
+_clients: dict[tuple[str, str, Optional[str]], Any] = {}
+_clients_lock = threading.Lock()
+_pool_settings: dict[str, float] = dict(CLIENT_POOL)
+
+# Per-thread network timing of the current call (see _attach_trace)
+_timing = threading.local()
+
 
 @dataclass
 class LLMResponse:
-    """Standardised response from any LLM provider."""
+    """Standardised response from any LLM provider.
+
+    input_tokens counts every prompt token, including cache_read_tokens read
+    from and cache_creation_tokens written to the provider's prompt cache.
+    cached marks a response served by the local ResponseCache, which cost
+    no API call. latency_seconds splits into
+    network_seconds (on the wire, over all attempts) and queue_seconds
+    (everything else: waiting for a pooled connection, retry backoff).
+    """
 
     text: str
     model: str
     input_tokens: int
     output_tokens: int
     latency_seconds: float
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+    queue_seconds: float = 0.0
+    network_seconds: float = 0.0
+    cached: bool = False
+
 
+def _retry_with_backoff(fn, *, max_retries: int = MAX_RETRIES, before_attempt=charge_attempt):
+    """Call fn() with exponential backoff on rate-limit or transient errors.
 
-def _retry_with_backoff(fn, *, max_retries: int = MAX_RETRIES):
-    """Call fn() with exponential backoff on rate-limit or transient errors."""
+    before_attempt() runs ahead of every attempt; by default it charges the
+    judge scheduler's rate limit for the running call (see
+    scheduler.charge_attempt), so retries are rate limited too.
+    """
     for attempt in range(max_retries + 1):
+        before_attempt()
         try:
             return fn()
         except (
@@ -47,6 +90,110 @@ def _retry_with_backoff(fn, *, max_retries: int = MAX_RETRIES):
             time.sleep(wait)
 
 
+def configure_client_pool(**settings: float) -> None:
+    """Override CLIENT_POOL settings and close clients built with the old ones.
+
+    Keys: max_connections, max_keepalive_connections, keepalive_expiry,
+    timeout, connect_timeout.
+    """
+    unknown = set(settings) - set(CLIENT_POOL)
+    if unknown:
+        raise ValueError(f"Unknown client pool settings: {', '.join(sorted(unknown))}")
+    _pool_settings.update(settings)
+    close_clients()
+
+
+def get_client(provider: str, api_key: str) -> Any:
+    """Return the shared client for provider and api_key, creating it once.
+
+    The base URL (ANTHROPIC_BASE_URL / OPENAI_BASE_URL) is part of the key,
+    so pointing a run at another endpoint gets a fresh pool.
+    """
+    base_url = os.environ.get(f"{provider.upper()}_BASE_URL") or None
+    key = (provider, api_key, base_url)
+
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            sdk = {"openai": openai, "anthropic": anthropic}.get(provider)
+            if sdk is None:
+                raise ValueError(f"Unknown provider: {provider}")
+            # Build the pool from the SDK's own httpx types; the SDK rejects others
+            limits_cls = type(sdk.DEFAULT_CONNECTION_LIMITS)
+            timeout = sdk.Timeout(_pool_settings["timeout"], connect=_pool_settings["connect_timeout"])
+            http_client = sdk.DefaultHttpxClient(
+                limits=limits_cls(
+                    max_connections=int(_pool_settings["max_connections"]),
+                    max_keepalive_connections=int(_pool_settings["max_keepalive_connections"]),
+                    keepalive_expiry=_pool_settings["keepalive_expiry"],
+                ),
+                timeout=timeout,
+                event_hooks={"request": [_attach_trace]},
+            )
+            client_cls = openai.OpenAI if provider == "openai" else anthropic.Anthropic
+            client = client_cls(api_key=api_key, timeout=timeout, http_client=http_client)
+            _clients[key] = client
+        return client
+
+
+def close_clients() -> None:
+    """Close every pooled client and its connections."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+def _attach_trace(request: Any) -> None:
+    """httpx request hook: time the request from its first connection event.
+
+    Connection events start once a pooled connection is available, so the
+    wait for a free connection counts as queue time, not network time.
+    """
+    request.extensions["trace"] = _trace
+
+
+def _trace(event: str, info: dict) -> None:
+    now = time.monotonic()
+    if getattr(_timing, "span_start", None) is None:
+        _timing.span_start = now
+    _timing.span_end = now
+    if event.endswith("response_closed.complete"):
+        _end_span()
+
+
+def _end_span() -> None:
+    start = getattr(_timing, "span_start", None)
+    if start is not None:
+        _timing.network += _timing.span_end - start
+        _timing.span_start = None
+
+
+def _timed_call(fn) -> tuple[Any, float, float]:
+    """Run fn with retries; return (result, latency, network seconds)."""
+    _timing.network = 0.0
+    _timing.span_start = None
+    t0 = time.monotonic()
+    try:
+        result = _retry_with_backoff(fn)
+    finally:
+        _end_span()
+    latency = time.monotonic() - t0
+    return result, latency, min(_timing.network, latency)
+
+
+def set_response_cache(cache: Optional["ResponseCache"]) -> None:
+    """Enable (or with None, disable) the response cache for all calls."""
+    global _response_cache
+    _response_cache = cache
+
+
+def get_response_cache() -> Optional["ResponseCache"]:
+    """Return the active response cache, if any."""
+    return _response_cache
+
+
 def call_openai(
     prompt: str,
     *,
@@ -65,7 +212,14 @@ def call_openai(
     Returns:
         LLMResponse with the model's text and usage metadata.
     """
-    client = openai.OpenAI(api_key=api_key)
+    cache = _response_cache
+    if cache is not None:
+        cache_key = cache.key("openai", model, "", prompt, max_tokens)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return replace(cached, cached=True)
+
+    client = get_client("openai", api_key)
 
     # o-series models (o1, o3, etc.) require max_completion_tokens
     _is_o_series = model.startswith("o")
@@ -78,26 +232,29 @@ def call_openai(
             **{token_param: max_tokens},
         )
 
-    t0 = time.monotonic()
     try:
-        response = _retry_with_backoff(_call)
+        response, latency, network = _timed_call(_call)
     except openai.AuthenticationError as exc:
         raise RuntimeError(
             f"OpenAI authentication failed for model {model}. "
             f"Check your API key has the 'model.request' scope: {exc}"
         ) from exc
-    latency = time.monotonic() - t0
 
     choice = response.choices[0]
     usage = response.usage
 
-    return LLMResponse(
+    result = LLMResponse(
         text=choice.message.content or "",
         model=response.model,
         input_tokens=usage.prompt_tokens if usage else 0,
         output_tokens=usage.completion_tokens if usage else 0,
         latency_seconds=round(latency, 2),
+        queue_seconds=round(latency - network, 3),
+        network_seconds=round(network, 3),
     )
+    if cache is not None:
+        cache.put(cache_key, result)
+    return result
 
 
 def call_anthropic(
@@ -107,6 +264,7 @@ def call_anthropic(
     model: str,
     api_key: str,
     max_tokens: int = 8_000,
+    cache_prefix: str = "",
 ) -> LLMResponse:
     """Send a single-turn prompt to an Anthropic model.
 
@@ -116,35 +274,61 @@ def call_anthropic(
         model: Anthropic model ID.
         api_key: Anthropic API key.
         max_tokens: Maximum response tokens.
+        cache_prefix: Optional start of the user message, sent ahead of
+            prompt as a prompt-cached block so repeated calls sharing it
+            read it from the provider's cache.
 
     Returns:
         LLMResponse with the model's text and usage metadata.
     """
-    client = anthropic.Anthropic(api_key=api_key)
+    cache = _response_cache
+    if cache is not None:
+        cache_key = cache.key("anthropic", model, system, prompt, max_tokens, cache_prefix=cache_prefix)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return replace(cached, cached=True)
+
+    client = get_client("anthropic", api_key)
 
     def _call():
+        content = prompt
+        if cache_prefix:
+            content = [
+                {"type": "text", "text": cache_prefix, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": prompt},
+            ]
         kwargs = dict(
             model=model,
             max_tokens=max_tokens,
-            messages=[{"role": "user", "content": prompt}],
+            messages=[{"role": "user", "content": content}],
         )
         if system:
             kwargs["system"] = system
         return client.messages.create(**kwargs)
 
-    t0 = time.monotonic()
-    response = _retry_with_backoff(_call)
-    latency = time.monotonic() - t0
+    response, latency, network = _timed_call(_call)
 
     text = ""
     for block in response.content:
         if block.type == "text":
             text += block.text
 
-    return LLMResponse(
+    # Anthropic reports prompt-cache reads and writes apart from input_tokens
+    usage = response.usage
+    cache_written = getattr(usage, "cache_creation_input_tokens", None) or 0
+    cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+
+    result = LLMResponse(
         text=text,
         model=response.model,
-        input_tokens=response.usage.input_tokens,
-        output_tokens=response.usage.output_tokens,
+        input_tokens=usage.input_tokens + cache_written + cache_read,
+        output_tokens=usage.output_tokens,
         latency_seconds=round(latency, 2),
+        cache_read_tokens=cache_read,
+        cache_creation_tokens=cache_written,
+        queue_seconds=round(latency - network, 3),
+        network_seconds=round(network, 3),
     )
+    if cache is not None:
+        cache.put(cache_key, result)
+    return result
@@ -0,0 +1,182 @@
+"""Content-addressed disk cache for LLM responses.
+
+Responses are keyed by a hash of everything that determines them: provider,
+model, system prompt, user prompt, max_tokens and any prompt-cached prefix.
+Rerunning a phase after a prompt change therefore only calls the API for
+prompts that changed.
+
+One JSON file per entry under the cache directory. The cache is bounded by
+total size; the least recently used entries (by file mtime, refreshed on
+every hit) are evicted first.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+from pathlib import Path
+from typing import Optional
+
+from .llm_clients import LLMResponse
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCacheMiss(LookupError):
+    """Raised in replay mode when a prompt has no cached response."""
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of LLMResponse objects on disk.
+
+    Args:
+        cache_dir: Directory holding the cache entries.
+        max_bytes: Total size above which least recently used entries are
+            evicted.
+        read_only: Replay mode. Misses raise ResponseCacheMiss instead of
+            letting the call through, and nothing is written or evicted.
+
+    Safe to share between threads.
+
+    Usage:
+        cache = ResponseCache(RESPONSE_CACHE_DIR)
+        key = cache.key("anthropic", model, system, prompt, max_tokens)
+        response = cache.get(key)
+        if response is None:
+            response = ...
+            cache.put(key, response)
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 500 * 1024 * 1024, *, read_only: bool = False):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.read_only = read_only
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()  # key -> size, oldest first
+        self._total_bytes = 0
+
+        if not read_only:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def key(
+        provider: str, model: str, system: str, prompt: str, max_tokens: int, cache_prefix: str = ""
+    ) -> str:
+        """Hash the request fields that determine a response.
+
+        cache_prefix is its own field, so splitting the same text differently
+        between prefix and prompt gives a different key. Without a prefix the
+        key is unchanged from entries written before prefixes existed.
+        """
+        fields = [provider, model, system, prompt, max_tokens]
+        if cache_prefix:
+            fields.append(cache_prefix)
+        payload = json.dumps(fields, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _load_index(self) -> None:
+        if not self.cache_dir.exists():
+            return
+        found = []
+        for path in self.cache_dir.glob("*/*.json"):
+            stat = path.stat()
+            found.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total_bytes += size
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """Return the cached response for key, or None on a miss.
+
+        Raises:
+            ResponseCacheMiss: On a miss in read-only replay mode.
+        """
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            response = LLMResponse(**data["response"])
+        except FileNotFoundError:
+            response = None
+        except (json.JSONDecodeError, KeyError, TypeError):
+            logger.warning("Ignoring corrupt response cache entry %s", path)
+            response = None
+
+        with self._lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+        if response is None:
+            if self.read_only:
+                raise ResponseCacheMiss(f"No cached response for key {key} (replay mode)")
+            return None
+
+        if not self.read_only:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return response
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """Store a response and evict old entries beyond max_bytes."""
+        if self.read_only:
+            return
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps({"key": key, "response": asdict(response)}).encode("utf-8")
+
+        # Write atomically so concurrent readers never see a partial entry
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+        with self._lock:
+            self.writes += 1
+            self._total_bytes += len(data) - self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self._evict()
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            old_key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            try:
+                self._path(old_key).unlink()
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "read_only": self.read_only,
+            }
@@ -2,7 +2,9 @@
 
 Usage:
     python -m baseline_comparison.run_comparison [--phase 1|2|3|all] \
-        [--contracts consulting,sla] [--models o3,gpt41] [--dry-run] [--verbose]
+        [--contracts consulting,sla] [--models o3,gpt41] [--concurrency 8] \
+        [--batch-size 8] [--budget-tokens N] [--budget-usd X] [--budget-minutes M] \
+        [--no-cache | --replay] [--dry-run] [--verbose]
 """
 
 import argparse
@@ -11,7 +13,9 @@ import logging
 import os
 import sys
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv
 
@@ -26,21 +30,43 @@ from baseline_comparison.config import (
     CONTRACT_FILES,
     CONTRACTS_DIR,
     ENV_FILE,
+    EVALUATOR_BATCH_SIZE,
+    EVALUATOR_PRICING,
+    EVALUATOR_PROVIDER,
     GT_DIR,
+    JUDGE_CONCURRENCY,
     MODELS,
     RAW_RESPONSES_DIR,
     RAW_REVIEW_PROMPT,
+    RESPONSE_CACHE_DIR,
+    RESPONSE_CACHE_MAX_BYTES,
     RESULTS_DIR,
     REPORTS_DIR,
+    TIER_PRIORITY,
 )
 from baseline_comparison.contracts import extract_text
-from baseline_comparison.llm_clients import call_openai, call_anthropic, LLMResponse
-from baseline_comparison.evaluator import evaluate_single_issue, build_result_summary
+from baseline_comparison.llm_clients import (
+    call_openai,
+    call_anthropic,
+    close_clients,
+    set_response_cache,
+    LLMResponse,
+)
+from baseline_comparison.response_cache import ResponseCache
+from baseline_comparison.checkpoint import JudgeCheckpoint, checkpoint_path
+from baseline_comparison.evaluator import (
+    BatchEvaluation,
+    JudgeUsage,
+    evaluate_issue_batch,
+    build_result_summary,
+)
+from baseline_comparison.scheduler import JudgeBudget, JudgeCall, JudgeScheduler
 from baseline_comparison.report import (
     load_all_results,
     generate_summary_json,
     generate_report_md,
 )
+from framework.scripts.gt_index import GroundTruthIndex, load_indexes
 
 logger = logging.getLogger("baseline_comparison")
 
@@ -171,6 +197,8 @@ def phase1_generate_reviews(
                 "input_tokens": response.input_tokens,
                 "output_tokens": response.output_tokens,
                 "latency_seconds": response.latency_seconds,
+                "queue_seconds": response.queue_seconds,
+                "network_seconds": response.network_seconds,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
             with open(meta_path, "w") as f:
@@ -191,8 +219,19 @@ def phase2_evaluate(
     models: list[str],
     api_keys: dict[str, str],
     dry_run: bool = False,
+    concurrency: int = JUDGE_CONCURRENCY,
+    batch_size: int = EVALUATOR_BATCH_SIZE,
+    budget: Optional[JudgeBudget] = None,
 ) -> None:
-    """Evaluate raw responses against ground truth using Claude as judge."""
+    """Evaluate raw responses against ground truth using Claude as judge.
+
+    Judge calls for all pending (contract, model) pairs run concurrently on a
+    JudgeScheduler, each judging up to batch_size GT issues of one tier. T1
+    issues are judged first across all pairs, then T2, then T3. Every finished
+    call is checkpointed, so a run stopped by the budget, an error or an
+    interrupt resumes with only the missing GT issues. Each result file is
+    written once all of its GT issues are judged, in GT file order.
+    """
     logger.info("=== Phase 2: Evaluate Against Ground Truth ===")
 
     if "anthropic" not in api_keys and not dry_run:
@@ -200,12 +239,29 @@ def phase2_evaluate(
         return
 
     anthropic_key = api_keys.get("anthropic", "")
+    gt_indexes = load_indexes(GT_DIR)
 
-    total_calls = 0
     total_skipped = 0
+    total_resumed = 0
+    calls: list[JudgeCall] = []
+    pending: dict[tuple[str, str], dict] = {}
+    contract_usage: dict[str, JudgeUsage] = {}
+
+    def _finish(group: tuple[str, str], evaluations: list[dict]) -> None:
+        contract, model_id = group
+        state = pending.pop(group)
+        by_id = {**state["done"], **{ev["gt_id"]: ev for ev in evaluations}}
+        ordered = [by_id[gt_issue["gt_id"]] for gt_issue in state["gt_issues"]]
+        usage = state["checkpoint"].usage
+        usage.batch_size = batch_size
+        contract_usage.setdefault(contract, JudgeUsage(batch_size=batch_size)).merge(usage)
+        _write_result(contract, model_id, ordered, state["result_path"], usage, gt_indexes.get(contract))
+        if not dry_run:
+            state["checkpoint"].discard()
 
     for contract in contracts:
         gt_issues = load_ground_truth(contract)
+        gt_version = _get_gt_version(contract)
         logger.info("%s: %d GT issues", contract, len(gt_issues))
 
         for model_id in models:
@@ -225,63 +281,133 @@ def phase2_evaluate(
                 continue
 
             raw_review = response_path.read_text()
-            logger.info("  Evaluating %s/%s (%d GT issues)...", contract, model_id, len(gt_issues))
-
-            evaluations = []
-            for i, gt_issue in enumerate(gt_issues):
-                gt_id = gt_issue["gt_id"]
-                logger.debug("    %s/%s/%s (%d/%d)", contract, model_id, gt_id, i + 1, len(gt_issues))
-
-                ev = evaluate_single_issue(
-                    raw_review=raw_review,
-                    gt_issue=gt_issue,
-                    contract_id=contract,
-                    anthropic_api_key=anthropic_key,
-                    dry_run=dry_run,
-                )
-                evaluations.append(ev)
-                total_calls += 1
-
-            # Build summary
-            summary = build_result_summary(evaluations)
-
-            # Load metadata if available
-            meta_path = RAW_RESPONSES_DIR / contract / f"{model_id}.meta.json"
-            meta_info = {}
-            if meta_path.exists():
-                with open(meta_path) as f:
-                    meta_info = json.load(f)
-
-            # Assemble result in existing schema format
-            result = {
-                "meta": {
-                    "contract": contract,
-                    "model_id": model_id,
-                    "evaluation_timestamp": datetime.now(timezone.utc).isoformat(),
-                    "evaluator_model": "sonnet",
-                    "gt_version": _get_gt_version(contract),
-                    "raw_llm_baseline": True,
-                    "raw_model": MODELS[model_id]["api_model"],
-                    "raw_prompt": RAW_REVIEW_PROMPT,
-                    "raw_input_tokens": meta_info.get("input_tokens"),
-                    "raw_output_tokens": meta_info.get("output_tokens"),
-                    "raw_latency_seconds": meta_info.get("latency_seconds"),
-                },
-                "gt_evaluations": evaluations,
-                "additional_issues": [],
-                "summary": summary,
+            group = (contract, model_id)
+
+            checkpoint = JudgeCheckpoint(checkpoint_path(result_path), raw_review, gt_version)
+            done = {} if dry_run else checkpoint.load()
+            todo = [gt_issue for gt_issue in gt_issues if gt_issue["gt_id"] not in done]
+            pending[group] = {
+                "gt_issues": gt_issues,
+                "done": done,
+                "result_path": result_path,
+                "checkpoint": checkpoint,
             }
+            total_resumed += len(gt_issues) - len(todo)
 
-            with open(result_path, "w") as f:
-                json.dump(result, f, indent=2)
-
-            logger.info("  Saved %s/%s: %.1f det pts (%s, T1 gate %s)",
-                       contract, model_id,
-                       summary["total_detection_points"],
-                       f"{summary['detection_counts']['Y']}Y/{summary['detection_counts']['P']}P/{summary['detection_counts']['N']}N",
-                       "PASS" if summary["t1_gate_pass"] else "FAIL")
-
-    logger.info("Phase 2 complete. %d evaluator calls, %d skipped.", total_calls, total_skipped)
+            if not todo:
+                logger.info("  %s/%s — all GT issues in checkpoint", contract, model_id)
+                _finish(group, [])
+                continue
+            logger.info("  Queued %s/%s (%d GT issues, %d from checkpoint)",
+                       contract, model_id, len(todo), len(done))
+
+            # Batches hold one tier each, so they can run in tier order
+            by_tier: dict[str, list[dict]] = {}
+            for gt_issue in todo:
+                by_tier.setdefault(gt_issue["tier"], []).append(gt_issue)
+            index = 0
+            for tier, tier_issues in by_tier.items():
+                for start in range(0, len(tier_issues), batch_size):
+                    calls.append(JudgeCall(
+                        group=group,
+                        index=index,
+                        provider=EVALUATOR_PROVIDER,
+                        priority=TIER_PRIORITY.get(tier, len(TIER_PRIORITY)),
+                        fn=partial(
+                            evaluate_issue_batch,
+                            raw_review=raw_review,
+                            gt_issues=tier_issues[start:start + batch_size],
+                            contract_id=contract,
+                            anthropic_api_key=anthropic_key,
+                            dry_run=dry_run,
+                        ),
+                    ))
+                    index += 1
+
+    def _on_result(call: JudgeCall, batch: BatchEvaluation) -> None:
+        if not dry_run:
+            pending[call.group]["checkpoint"].append(batch)
+
+    def _on_group_complete(group: tuple[str, str], batches: list[BatchEvaluation]) -> None:
+        _finish(group, [ev for batch in batches for ev in batch.evaluations])
+
+    logger.info("Running %d evaluator batches of up to %d GT issues (concurrency %d)...",
+               len(calls), batch_size, concurrency)
+    scheduler = JudgeScheduler(max_concurrency=concurrency, budget=budget)
+    outcome = scheduler.run(calls, on_group_complete=_on_group_complete, on_result=_on_result)
+
+    for (contract, model_id), error in sorted(outcome.failed.items()):
+        logger.error("  FAILED %s/%s — %s", contract, model_id, error)
+
+    if outcome.deferred:
+        logger.warning("  Budget stop: %s. %d evaluator calls deferred, %d results incomplete — "
+                       "rerun Phase 2 to resume from checkpoints.",
+                       outcome.budget_stop, outcome.deferred, len(pending) - len(outcome.failed))
+
+    for contract, usage in contract_usage.items():
+        logger.info("  %s: %d evaluator calls, %d input tokens (est. %d saved by batching), %d fallbacks",
+                   contract, usage.calls, usage.input_tokens,
+                   usage.unbatched_input_tokens - usage.input_tokens, usage.fallback_batches)
+
+    logger.info(
+        "Phase 2 complete. %d evaluator calls, %d skipped, %d GT issues resumed, %d failed "
+        "in %.1fs (%.1fs rate-limited).",
+        outcome.calls_made, total_skipped, total_resumed, len(outcome.failed),
+        outcome.seconds, outcome.rate_limit_wait_seconds,
+    )
+    if budget is not None:
+        spent = budget.spent()
+        logger.info("  Judge spend: %d input + %d output tokens, $%.2f",
+                   spent["input_tokens"], spent["output_tokens"], spent["cost_usd"])
+
+
+def _write_result(
+    contract: str,
+    model_id: str,
+    evaluations: list[dict],
+    result_path: Path,
+    usage: JudgeUsage,
+    gt_index: Optional[GroundTruthIndex] = None,
+) -> None:
+    """Build the summary for one (contract, model) and save its result file."""
+    summary = build_result_summary(evaluations, gt_index)
+
+    # Load metadata if available
+    meta_path = RAW_RESPONSES_DIR / contract / f"{model_id}.meta.json"
+    meta_info = {}
+    if meta_path.exists():
+        with open(meta_path) as f:
+            meta_info = json.load(f)
+
+    # Assemble result in existing schema format
+    result = {
+        "meta": {
+            "contract": contract,
+            "model_id": model_id,
+            "evaluation_timestamp": datetime.now(timezone.utc).isoformat(),
+            "evaluator_model": "sonnet",
+            "gt_version": _get_gt_version(contract),
+            "raw_llm_baseline": True,
+            "raw_model": MODELS[model_id]["api_model"],
+            "raw_prompt": RAW_REVIEW_PROMPT,
+            "raw_input_tokens": meta_info.get("input_tokens"),
+            "raw_output_tokens": meta_info.get("output_tokens"),
+            "raw_latency_seconds": meta_info.get("latency_seconds"),
+            "judge_usage": usage.to_dict(),
+        },
+        "gt_evaluations": evaluations,
+        "additional_issues": [],
+        "summary": summary,
+    }
+
+    with open(result_path, "w") as f:
+        json.dump(result, f, indent=2)
+
+    logger.info("  Saved %s/%s: %.1f det pts (%s, T1 gate %s)",
+               contract, model_id,
+               summary["total_detection_points"],
+               f"{summary['detection_counts']['Y']}Y/{summary['detection_counts']['P']}P/{summary['detection_counts']['N']}N",
+               "PASS" if summary["t1_gate_pass"] else "FAIL")
 
 
 def _get_gt_version(contract_id: str) -> str:
@@ -370,6 +496,52 @@ Examples:
         action="store_true",
         help="Verify paths and config without making API calls",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=JUDGE_CONCURRENCY,
+        help=f"Concurrent evaluator calls in Phase 2 (default: {JUDGE_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=EVALUATOR_BATCH_SIZE,
+        help=f"GT issues judged per evaluator call in Phase 2 (default: {EVALUATOR_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--budget-tokens",
+        type=int,
+        default=None,
+        help="Stop starting Phase 2 evaluator calls after this many input+output tokens",
+    )
+    parser.add_argument(
+        "--budget-usd",
+        type=float,
+        default=None,
+        help="Stop starting Phase 2 evaluator calls after this estimated spend",
+    )
+    parser.add_argument(
+        "--budget-minutes",
+        type=float,
+        default=None,
+        help="Stop starting Phase 2 evaluator calls after this many minutes",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Do not read or write the LLM response cache ({RESPONSE_CACHE_DIR.name})",
+    )
+    parser.add_argument(
+        "--replay",
+        action="store_true",
+        help="Serve LLM calls only from the response cache; uncached prompts fail",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=RESPONSE_CACHE_MAX_BYTES // (1024 * 1024),
+        help="Response cache size limit in MB (default: %(default)s)",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -415,6 +587,12 @@ def main() -> None:
 
     if not validate_inputs(contracts, models):
         sys.exit(1)
+    if args.batch_size < 1 or args.concurrency < 1:
+        logger.error("--batch-size and --concurrency must be at least 1")
+        sys.exit(1)
+    if args.replay and args.no_cache:
+        logger.error("--replay needs the response cache; drop --no-cache")
+        sys.exit(1)
 
     # Count GT issues for summary
     total_gt = 0
@@ -431,7 +609,19 @@ def main() -> None:
 
     api_keys = load_api_keys()
 
-    if not args.dry_run:
+    cache = None
+    if not args.no_cache:
+        cache = ResponseCache(
+            RESPONSE_CACHE_DIR,
+            max_bytes=args.cache_max_mb * 1024 * 1024,
+            read_only=args.replay,
+        )
+        set_response_cache(cache)
+    if args.replay:
+        # Replayed calls never reach the API, so no real keys are needed
+        api_keys = {provider: api_keys.get(provider, "") for provider in ("openai", "anthropic")}
+
+    if not args.dry_run and not args.replay:
         phase = args.phase
         # Check which providers are needed for the selected models
         needed_providers = {MODELS[m]["provider"] for m in models}
@@ -450,11 +640,28 @@ def main() -> None:
         phase1_generate_reviews(contracts, models, api_keys, dry_run=args.dry_run)
 
     if phase in ("2", "all"):
-        phase2_evaluate(contracts, models, api_keys, dry_run=args.dry_run)
+        budget = None
+        if args.budget_tokens is not None or args.budget_usd is not None or args.budget_minutes is not None:
+            budget = JudgeBudget(
+                max_tokens=args.budget_tokens,
+                max_cost_usd=args.budget_usd,
+                max_seconds=args.budget_minutes * 60 if args.budget_minutes is not None else None,
+                **EVALUATOR_PRICING,
+            )
+        phase2_evaluate(contracts, models, api_keys, dry_run=args.dry_run,
+                        concurrency=args.concurrency, batch_size=args.batch_size, budget=budget)
 
     if phase in ("3", "all"):
         phase3_report(contracts, models)
 
+    close_clients()
+
+    if cache is not None:
+        stats = cache.stats()
+        logger.info("Response cache: %d hits, %d misses, %d writes, %d evictions (%d entries, %.1f MB)",
+                   stats["hits"], stats["misses"], stats["writes"], stats["evictions"],
+                   stats["entries"], stats["bytes"] / (1024 * 1024))
+
 
 if __name__ == "__main__":
     main()
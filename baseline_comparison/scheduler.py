@@ -0,0 +1,383 @@
+"""Concurrent judge-call scheduling for Phase 2.
+
+Judge calls are independent blocking HTTP round-trips, so they run on a
+bounded thread pool. Three limits apply to every call:
+
+- a global concurrency limit (thread pool size)
+- a per-provider semaphore (concurrent calls to one API)
+- a per-provider token bucket (requests per minute)
+
+Calls start in priority order (lowest first; Phase 2 uses the GT tier). An
+optional JudgeBudget caps tokens, cost and wall-clock time: once spent, calls
+not yet started are deferred to the next run.
+
+Retries stay in llm_clients._retry_with_backoff, inside each call, but
+every API request is rate limited: the scheduler takes a token when a call
+starts and llm_clients calls charge_attempt() before each request, which
+waits for another token on retries and on further requests the same call
+makes (e.g. per-issue fallback after a malformed batched answer). Results
+are collected per (contract, model) group in their original order, so the
+output does not depend on completion order.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, Optional
+
+from .config import JUDGE_CONCURRENCY, PROVIDER_LIMITS
+
+logger = logging.getLogger(__name__)
+
+# Per-thread hook charging the running judge call's provider bucket
+_attempts = threading.local()
+
+
+def charge_attempt() -> None:
+    """Take a rate-limit token for one API request of the current judge call.
+
+    Called by llm_clients before every request. The first request of a call
+    uses the token the scheduler took when the call started; later ones wait
+    for their own. Does nothing outside a scheduled call.
+    """
+    hook = getattr(_attempts, "hook", None)
+    if hook is not None:
+        hook()
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Refills at `rate` tokens per second up to `capacity`; acquire() blocks
+    until enough tokens are available.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError(f"Token bucket rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float, **kwargs) -> "TokenBucket":
+        """Bucket allowing requests_per_minute, with bursts of up to one second's worth."""
+        rate = requests_per_minute / 60.0
+        return cls(rate, capacity=max(1.0, rate), **kwargs)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens, waiting if necessary. Returns the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait = (tokens - self._tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+
+class JudgeBudget:
+    """Spending limits for one scheduler run; None means unlimited.
+
+    Args:
+        max_tokens: Input plus output tokens.
+        max_cost_usd: Cost at the given per-million-token prices.
+        max_seconds: Wall-clock seconds since start().
+        input_usd_per_mtok / output_usd_per_mtok: Prices for max_cost_usd.
+        cache_read_usd_per_mtok / cache_write_usd_per_mtok: Prices of the
+            prompt-cache reads and writes counted within input_tokens.
+
+    The scheduler records each call's result as it finishes: results with a
+    `usage` attribute (input_tokens, output_tokens and optionally
+    cache_read_tokens, cache_creation_tokens) are charged. Calls already in
+    flight when a limit is hit still complete.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_tokens: Optional[int] = None,
+        max_cost_usd: Optional[float] = None,
+        max_seconds: Optional[float] = None,
+        input_usd_per_mtok: float = 0.0,
+        output_usd_per_mtok: float = 0.0,
+        cache_read_usd_per_mtok: float = 0.0,
+        cache_write_usd_per_mtok: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_tokens = max_tokens
+        self.max_cost_usd = max_cost_usd
+        self.max_seconds = max_seconds
+        self.input_usd_per_mtok = input_usd_per_mtok
+        self.output_usd_per_mtok = output_usd_per_mtok
+        self.cache_read_usd_per_mtok = cache_read_usd_per_mtok
+        self.cache_write_usd_per_mtok = cache_write_usd_per_mtok
+        self._clock = clock
+        self._started: Optional[float] = None
+        self._lock = threading.Lock()
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_creation_tokens = 0
+
+    def start(self) -> None:
+        if self._started is None:
+            self._started = self._clock()
+
+    def charge(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_creation_tokens: int = 0,
+    ) -> None:
+        """Add one call's usage; input_tokens includes the cache tokens."""
+        with self._lock:
+            self.input_tokens += input_tokens
+            self.output_tokens += output_tokens
+            self.cache_read_tokens += cache_read_tokens
+            self.cache_creation_tokens += cache_creation_tokens
+
+    def record(self, result: Any) -> None:
+        usage = getattr(result, "usage", None)
+        if usage is not None:
+            self.charge(
+                usage.input_tokens,
+                usage.output_tokens,
+                getattr(usage, "cache_read_tokens", 0),
+                getattr(usage, "cache_creation_tokens", 0),
+            )
+
+    @property
+    def cost_usd(self) -> float:
+        uncached = self.input_tokens - self.cache_read_tokens - self.cache_creation_tokens
+        return (uncached * self.input_usd_per_mtok
+                + self.cache_read_tokens * self.cache_read_usd_per_mtok
+                + self.cache_creation_tokens * self.cache_write_usd_per_mtok
+                + self.output_tokens * self.output_usd_per_mtok) / 1_000_000
+
+    def exceeded(self) -> Optional[str]:
+        """The first limit reached, or None while within budget."""
+        with self._lock:
+            if self.max_tokens is not None and self.input_tokens + self.output_tokens >= self.max_tokens:
+                return f"token budget of {self.max_tokens} reached"
+            if self.max_cost_usd is not None and self.cost_usd >= self.max_cost_usd:
+                return f"cost budget of ${self.max_cost_usd:.2f} reached"
+        if self.max_seconds is not None and self._started is not None:
+            if self._clock() - self._started >= self.max_seconds:
+                return f"time budget of {self.max_seconds:.0f}s reached"
+        return None
+
+    def spent(self) -> dict:
+        return {
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_creation_tokens": self.cache_creation_tokens,
+            "cost_usd": round(self.cost_usd, 4),
+        }
+
+
+@dataclass
+class JudgeCall:
+    """One judge call; result lands at `index` within its `group`.
+
+    Calls with a lower priority start first.
+    """
+
+    group: Hashable
+    index: int
+    provider: str
+    fn: Callable[[], Any]
+    priority: int = 0
+
+
+@dataclass
+class SchedulerResult:
+    """Outcome of JudgeScheduler.run."""
+
+    completed: dict = field(default_factory=dict)   # group -> results in index order
+    failed: dict = field(default_factory=dict)      # group -> error message
+    calls_made: int = 0
+    deferred: int = 0                               # calls not started: budget spent
+    budget_stop: str = ""                           # which budget limit was reached
+    rate_limit_wait_seconds: float = 0.0
+    seconds: float = 0.0
+
+
+class _Skipped(Exception):
+    """A call skipped because its group already failed."""
+
+
+class _Deferred(Exception):
+    """A call not started because the budget is spent."""
+
+
+class JudgeScheduler:
+    """Runs judge calls concurrently under global and per-provider limits.
+
+    Args:
+        max_concurrency: Calls in flight across all providers.
+        provider_limits: provider -> {"concurrency": int,
+            "requests_per_minute": float}; missing entries are unlimited
+            beyond max_concurrency.
+        budget: Optional JudgeBudget checked before each call starts.
+
+    Usage:
+        scheduler = JudgeScheduler(max_concurrency=8)
+        outcome = scheduler.run(calls, on_group_complete=write_result)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = JUDGE_CONCURRENCY,
+        provider_limits: Optional[dict[str, dict]] = None,
+        budget: Optional[JudgeBudget] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        self.max_concurrency = max_concurrency
+        self.budget = budget
+        limits = PROVIDER_LIMITS if provider_limits is None else provider_limits
+
+        self._semaphores: dict[str, threading.Semaphore] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+        for provider, limit in limits.items():
+            if limit.get("concurrency"):
+                self._semaphores[provider] = threading.BoundedSemaphore(limit["concurrency"])
+            if limit.get("requests_per_minute"):
+                self._buckets[provider] = TokenBucket.per_minute(limit["requests_per_minute"])
+
+        self._wait_lock = threading.Lock()
+        self._rate_limit_wait = 0.0
+
+    def _acquire(self, bucket: TokenBucket) -> None:
+        waited = bucket.acquire()
+        if waited:
+            with self._wait_lock:
+                self._rate_limit_wait += waited
+
+    def _execute(self, call: JudgeCall, failed_groups: set) -> Any:
+        if call.group in failed_groups:
+            raise _Skipped()
+        if self.budget is not None:
+            reason = self.budget.exceeded()
+            if reason:
+                raise _Deferred(reason)
+
+        semaphore = self._semaphores.get(call.provider)
+        bucket = self._buckets.get(call.provider)
+
+        if semaphore is not None:
+            semaphore.acquire()
+        try:
+            if bucket is not None:
+                self._acquire(bucket)
+                prepaid = True
+
+                def _charge() -> None:
+                    nonlocal prepaid
+                    if prepaid:
+                        prepaid = False
+                    else:
+                        self._acquire(bucket)
+
+                _attempts.hook = _charge
+            try:
+                result = call.fn()
+            finally:
+                _attempts.hook = None
+            if self.budget is not None:
+                # Charge before this worker picks up its next call
+                self.budget.record(result)
+            return result
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    def run(
+        self,
+        calls: list[JudgeCall],
+        on_group_complete: Optional[Callable[[Hashable, list], None]] = None,
+        on_result: Optional[Callable[[JudgeCall, Any], None]] = None,
+    ) -> SchedulerResult:
+        """Run all calls, lowest priority value first.
+
+        on_result(call, result) is called on the calling thread for each
+        successful call, e.g. to checkpoint it. on_group_complete(group,
+        results) is called on the calling thread as soon as every call of a
+        group has succeeded, with results in index order. A failed call fails
+        its group: the group's remaining calls are skipped and
+        on_group_complete is not called for it. Calls deferred by the budget
+        leave their group incomplete but not failed.
+        """
+        start = time.monotonic()
+        outcome = SchedulerResult()
+
+        expected: dict[Hashable, int] = {}
+        for call in calls:
+            expected[call.group] = expected.get(call.group, 0) + 1
+        partial: dict[Hashable, list] = {g: [None] * n for g, n in expected.items()}
+        remaining = dict(expected)
+        failed_groups: set = set()
+        if self.budget is not None:
+            self.budget.start()
+
+        # The pool starts queued calls in submission order
+        ordered = sorted(calls, key=lambda c: c.priority)
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            futures = {pool.submit(self._execute, call, failed_groups): call for call in ordered}
+
+            for future in as_completed(futures):
+                call = futures[future]
+                try:
+                    result = future.result()
+                except _Skipped:
+                    continue
+                except _Deferred as exc:
+                    outcome.deferred += 1
+                    outcome.budget_stop = outcome.budget_stop or str(exc)
+                    continue
+                except Exception as exc:
+                    if call.group not in failed_groups:
+                        failed_groups.add(call.group)
+                        outcome.failed[call.group] = f"{type(exc).__name__}: {exc}"
+                        logger.error("Judge call failed for %s (#%d): %s", call.group, call.index, exc)
+                    continue
+
+                outcome.calls_made += 1
+                if on_result is not None:
+                    on_result(call, result)
+                if call.group in failed_groups:
+                    continue
+
+                partial[call.group][call.index] = result
+                remaining[call.group] -= 1
+                if remaining[call.group] == 0:
+                    results = partial.pop(call.group)
+                    outcome.completed[call.group] = results
+                    if on_group_complete is not None:
+                        on_group_complete(call.group, results)
+
+        outcome.rate_limit_wait_seconds = round(self._rate_limit_wait, 2)
+        outcome.seconds = round(time.monotonic() - start, 2)
+        return outcome
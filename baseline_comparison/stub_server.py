@@ -0,0 +1,221 @@
+"""Local stub of the Anthropic and OpenAI HTTP APIs for offline runs and tests.
+
+Serves POST /v1/messages (Anthropic) and POST /v1/chat/completions (OpenAI)
+with canned responses, optional latency and injected failures. The SDK
+clients use it when ANTHROPIC_BASE_URL / OPENAI_BASE_URL point at it.
+
+Usage:
+    python -m baseline_comparison.stub_server --port 8765 --latency 0.2
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8765 \\
+        python -m baseline_comparison.run_comparison --phase 2
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+
+DEFAULT_REPLY = json.dumps({
+    "detection": "Y",
+    "evidence_excerpt": "[stub]",
+    "reasoning": "Stub server response",
+})
+
+
+class StubProviderServer:
+    """Threaded HTTP server mimicking the provider APIs.
+
+    Args:
+        responder: Maps (api, request_body) to reply text; api is
+            "anthropic" or "openai". Defaults to a fixed Y detection.
+        latency: Seconds to wait before answering each request.
+        fail_first: Answer this many requests with fail_status first.
+        fail_status: HTTP status for injected failures (429, 500, 529...).
+
+    Records every request body in `requests`, the peak number of requests in
+    flight in `max_in_flight` and the client ports seen in `connections`.
+    Connections are kept alive (HTTP/1.1) so pooled clients can reuse them.
+
+    Usage:
+        with StubProviderServer(latency=0.05) as stub:
+            os.environ["ANTHROPIC_BASE_URL"] = stub.url
+            ...
+    """
+
+    def __init__(
+        self,
+        responder: Optional[Callable[[str, dict], str]] = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        fail_first: int = 0,
+        fail_status: int = 429,
+    ):
+        self.responder = responder or (lambda api, body: DEFAULT_REPLY)
+        self.latency = latency
+        self.fail_first = fail_first
+        self.fail_status = fail_status
+
+        self.requests: list[dict] = []
+        self.connections: set[int] = set()
+        self.failures_sent = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubProviderServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StubProviderServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # --- request handling ---
+
+    def _handle(self, api: str, body: dict) -> tuple[int, dict]:
+        with self._lock:
+            self.requests.append(body)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            fail = self.failures_sent < self.fail_first
+            if fail:
+                self.failures_sent += 1
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            if fail:
+                return self.fail_status, _error_body(api, self.fail_status)
+            text = self.responder(api, body)
+            return 200, _success_body(api, body, text)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                length = int(self.headers.get("content-length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                with stub._lock:
+                    stub.connections.add(self.client_address[1])
+
+                if self.path.rstrip("/").endswith("/messages"):
+                    api = "anthropic"
+                elif self.path.rstrip("/").endswith("/chat/completions"):
+                    api = "openai"
+                else:
+                    self.send_error(404)
+                    return
+
+                status, payload = stub._handle(api, body)
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(data)))
+                # Leave retries to llm_clients._retry_with_backoff
+                self.send_header("x-should-retry", "false")
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def _usage_tokens(body: dict) -> int:
+    return sum(len(str(m.get("content", ""))) // 4 for m in body.get("messages", []))
+
+
+def _success_body(api: str, body: dict, text: str) -> dict:
+    if api == "anthropic":
+        return {
+            "id": "msg_stub",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "stub"),
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": _usage_tokens(body), "output_tokens": len(text) // 4},
+        }
+    return {
+        "id": "chatcmpl-stub",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "stub"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": text},
+            "finish_reason": "stop",
+        }],
+        "usage": {
+            "prompt_tokens": _usage_tokens(body),
+            "completion_tokens": len(text) // 4,
+            "total_tokens": _usage_tokens(body) + len(text) // 4,
+        },
+    }
+
+
+def _error_body(api: str, status: int) -> dict:
+    message = f"Stub injected error {status}"
+    if api == "anthropic":
+        error_type = "rate_limit_error" if status == 429 else "api_error"
+        return {"type": "error", "error": {"type": error_type, "message": message}}
+    return {"error": {"message": message, "type": "stub_error", "code": str(status)}}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stub Anthropic/OpenAI API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds per request")
+    parser.add_argument("--fail-first", type=int, default=0, help="Inject this many failures")
+    parser.add_argument("--fail-status", type=int, default=429)
+    args = parser.parse_args()
+
+    stub = StubProviderServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        fail_first=args.fail_first,
+        fail_status=args.fail_status,
+    )
+    print(f"Stub provider API listening on {stub.url} (Ctrl-C to stop)")
+    try:
+        stub._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,489 @@
+"""
+Aggregation engine for multi-run evaluation results.
+
+Reads run evaluation files on a worker pool and merges one (contract, model)
+key at a time. Each run file is decoded once per invocation, by the merge of
+its key, and everything else that needs its contents works on that decoded
+document: the pre-aggregation content checks (Gate 4) and, in the pipeline,
+the results table. A key drops its run documents once merged, keeping only
+its aggregated result, so peak memory is bounded by the number of keys
+rather than the number of runs.
+
+Besides the primary (most recent) evaluation, each aggregated file carries
+run-to-run statistics in aggregation_meta["statistics"]; see
+framework.run_statistics.
+
+Aggregation is incremental: a manifest in the output directory records the
+fingerprint of every input file per output key, and keys whose inputs are
+unchanged are neither re-read nor rewritten. plan_aggregation() works out
+which keys those are without opening a run file, so callers can also limit
+validation to the changed inputs. Outputs of keys whose inputs have all
+disappeared are removed.
+"""
+
+import json
+import logging
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from .fileio import atomic_write_json, file_fingerprint, fingerprint_matches, read_with_fingerprint
+from .run_statistics import RunStatistics
+from .validators.base import Severity, ValidationIssue, ValidationResult
+from .validators.pre_aggregate import evaluation_issues, invalid_json_issue
+
+if TYPE_CHECKING:
+    from .document_store import DocumentStore
+    from .results_table import ResultsTableBuilder
+
+logger = logging.getLogger(__name__)
+
+AggregationKey = Tuple[str, str]  # (contract, model)
+
+MANIFEST_NAME = "_aggregation_manifest.json"
+MANIFEST_VERSION = 2
+
+
+@dataclass
+class KeyTiming:
+    """Timing for a single (contract, model) merge."""
+    contract: str
+    model: str
+    num_runs: int
+    read_seconds: float
+    write_seconds: float
+    inputs: List[Dict[str, Any]] = field(default_factory=list, repr=False)
+
+    @property
+    def total_seconds(self) -> float:
+        return self.read_seconds + self.write_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "contract": self.contract,
+            "model": self.model,
+            "num_runs": self.num_runs,
+            "read_seconds": round(self.read_seconds, 4),
+            "write_seconds": round(self.write_seconds, 4),
+            "total_seconds": round(self.total_seconds, 4),
+        }
+
+
+@dataclass
+class MergedKey:
+    """A merged (contract, model) key whose output is not written yet."""
+    timing: KeyTiming
+    result: Dict[str, Any]
+    issues: List[ValidationIssue] = field(default_factory=list)
+
+
+def discover_inputs(run_dirs: List[Path]) -> Dict[AggregationKey, List[Tuple[Path, Path]]]:
+    """
+    Map each (contract, model) key to its input files in run order.
+
+    Only walks the directory tree; no evaluation file is opened.
+
+    Args:
+        run_dirs: Run directories, each containing evaluations/{contract}/{model}.json
+
+    Returns:
+        Dict mapping (contract, model) to a list of (run_dir, evaluation_path)
+    """
+    inputs: Dict[AggregationKey, List[Tuple[Path, Path]]] = {}
+
+    for run_dir in run_dirs:
+        eval_dir = run_dir / "evaluations"
+        if not eval_dir.exists():
+            logger.warning(f"Evaluation directory not found: {eval_dir}, skipping")
+            continue
+
+        for contract_dir in sorted(eval_dir.iterdir()):
+            if not contract_dir.is_dir():
+                continue
+
+            for model_file in sorted(contract_dir.glob("*.json")):
+                key = (contract_dir.name, model_file.stem)
+                inputs.setdefault(key, []).append((run_dir, model_file))
+
+    return inputs
+
+
+def _manifest_key(key: AggregationKey) -> str:
+    return f"{key[0]}/{key[1]}"
+
+
+def load_manifest(output_dir: Path) -> Dict[str, Any]:
+    """
+    Load the per-key input fingerprints recorded by the last aggregation.
+
+    Returns an empty dict if the manifest is missing, unreadable or was
+    written by a different MANIFEST_VERSION.
+    """
+    try:
+        with open(output_dir / MANIFEST_NAME) as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("outputs", {})
+
+
+def inputs_unchanged(
+    sources: List[Tuple[Path, Path]],
+    entry: Dict[str, Any],
+    output_file: Path
+) -> bool:
+    """Check whether a key's inputs match its manifest entry and its output exists."""
+    if not output_file.exists():
+        return False
+
+    recorded = entry.get("inputs", [])
+    if [r.get("path") for r in recorded] != [str(path) for _, path in sources]:
+        return False
+
+    return all(
+        fingerprint_matches(path, fingerprint)
+        for (_, path), fingerprint in zip(sources, recorded)
+    )
+
+
+@dataclass
+class AggregationPlan:
+    """
+    Which keys an aggregation has to merge, worked out from the manifest.
+
+    Attributes:
+        inputs: Every key found in the run directories, with its sources
+        previous: Manifest entries the skip decisions were based on
+        to_merge: Keys that are new, changed or missing their output
+        skipped: Keys whose inputs match their manifest entry
+        stale: Manifest keys with no inputs left; their outputs are removed
+    """
+    inputs: Dict[AggregationKey, List[Tuple[Path, Path]]]
+    previous: Dict[str, Any]
+    to_merge: List[Tuple[AggregationKey, List[Tuple[Path, Path]]]]
+    skipped: List[AggregationKey]
+    stale: List[AggregationKey]
+
+    def changed_files(self) -> List[Path]:
+        """Input files of the keys to merge."""
+        return [path for _, sources in self.to_merge for _, path in sources]
+
+    def unchanged_files(self) -> List[Tuple[str, str]]:
+        """(path, sha256) of the input files of skipped keys, as recorded."""
+        return [
+            (r["path"], r["sha256"])
+            for key in self.skipped
+            for r in self.previous[_manifest_key(key)]["inputs"]
+        ]
+
+    def recorded_inputs(self) -> Optional[List[Tuple[str, str]]]:
+        """
+        (path, sha256) of every input file, if all of them match the manifest.
+
+        None if any key has to be merged, since its fingerprints are not
+        known until it is read.
+        """
+        if self.to_merge:
+            return None
+        return self.unchanged_files()
+
+
+def plan_aggregation(run_dirs: List[Path], output_dir: Path, full: bool = False) -> AggregationPlan:
+    """
+    Compare the run directories with the manifest in output_dir.
+
+    Only stats input files (and hashes those whose mtime changed); no file
+    is parsed.
+
+    Args:
+        run_dirs: Run directories to aggregate
+        output_dir: Directory holding the aggregated results and manifest
+        full: Merge every key regardless of the manifest
+    """
+    inputs = discover_inputs(run_dirs)
+    recorded = load_manifest(output_dir)
+    previous = {} if full else recorded
+
+    to_merge: List[Tuple[AggregationKey, List[Tuple[Path, Path]]]] = []
+    skipped: List[AggregationKey] = []
+    for key, sources in inputs.items():
+        entry = previous.get(_manifest_key(key))
+        output_file = output_dir / key[0] / f"{key[1]}.json"
+        if entry and inputs_unchanged(sources, entry, output_file):
+            skipped.append(key)
+        else:
+            to_merge.append((key, sources))
+
+    # With no inputs at all the run directories are more likely wrong than
+    # empty, so nothing is treated as stale
+    stale: List[AggregationKey] = []
+    if inputs:
+        current = {_manifest_key(key) for key in inputs}
+        stale = [
+            tuple(name.split("/", 1)) for name in sorted(recorded) if name not in current
+        ]
+
+    return AggregationPlan(
+        inputs=inputs, previous=previous, to_merge=to_merge, skipped=skipped, stale=stale
+    )
+
+
+class AggregationEngine:
+    """
+    Merges per-run evaluations into one aggregated file per (contract, model).
+
+    Keys are processed concurrently on a thread pool. Within a key, runs are
+    read in order and only the most recent evaluation is retained as primary;
+    earlier runs contribute their run directory and the scoring fields that
+    feed the run-to-run statistics.
+
+    Each run file is read and decoded once. The manifest fingerprint is
+    taken from the bytes that are parsed; with validate=True the Gate 4
+    checks of framework.validators.pre_aggregate run on the decoded
+    document, and with a ResultsTableBuilder it is flattened into the
+    table. Outputs are only written once every key has been merged, so a
+    Gate 4 error aborts the run before any output changes. With a
+    DocumentStore, run files are read through the store without being
+    cached (so they count towards its I/O stats), and each aggregated
+    result is registered in the store for the workbook stage.
+
+    Usage:
+        engine = AggregationEngine(max_workers=8)
+        summary = engine.run(run_dirs, output_dir)             # incremental
+        summary = engine.run(run_dirs, output_dir, full=True)  # rebuild all
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        load_json: Optional[Callable[[Path], Any]] = None,
+        store: Optional["DocumentStore"] = None,
+        quality_dims: Optional[List[str]] = None,
+        validate: bool = False,
+        table: Optional["ResultsTableBuilder"] = None
+    ):
+        """
+        Args:
+            max_workers: Worker pool size (None = ThreadPoolExecutor default)
+            load_json: Callable used to read an evaluation file (files are
+                then fingerprinted with a separate read)
+            store: Shared DocumentStore (takes precedence over load_json)
+            quality_dims: Quality score fields summarised across runs
+                (None = run_statistics.DEFAULT_QUALITY_DIMS)
+            validate: Run the Gate 4 checks on every file read; invalid JSON
+                then aborts the run instead of skipping the file
+            table: Results table builder fed every file read
+        """
+        self.max_workers = max_workers
+        self.quality_dims = quality_dims
+        self.store = store
+        self.load_json = load_json
+        self.validate = validate
+        self.table = table
+
+    def _read(self, path: Path) -> Tuple[Any, Dict[str, Any]]:
+        """Parse a run file and fingerprint the bytes parsed."""
+        if self.store is not None:
+            return self.store.load_with_fingerprint(path, stage="aggregate")
+        if self.load_json is not None:
+            # Fingerprint before reading so a concurrent edit is never
+            # recorded as already aggregated
+            fingerprint = file_fingerprint(path)
+            return self.load_json(path), fingerprint
+        raw, fingerprint = read_with_fingerprint(path)
+        return json.loads(raw), fingerprint
+
+    def run(
+        self,
+        run_dirs: List[Path],
+        output_dir: Path,
+        full: bool = False,
+        plan: Optional[AggregationPlan] = None
+    ) -> Dict[str, Any]:
+        """
+        Aggregate all keys found in run_dirs and write them to output_dir.
+
+        Args:
+            run_dirs: Run directories to aggregate
+            output_dir: Directory for aggregated results and the manifest
+            full: Ignore the manifest and recompute every key
+            plan: plan_aggregation() result already computed by the caller
+                (run_dirs and full are then taken as given)
+
+        Returns:
+            Dictionary with aggregation summary and timings
+        """
+        t0 = time.perf_counter()
+        if plan is None:
+            plan = plan_aggregation(run_dirs, output_dir, full=full)
+        inputs, previous = plan.inputs, plan.previous
+        to_merge, skipped = plan.to_merge, plan.skipped
+
+        merged: List[MergedKey] = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            if to_merge:
+                results = pool.map(lambda item: self.merge_key(*item), to_merge)
+                merged = [m for m in results if m is not None]
+
+            # Nothing is written or removed unless every merged key passed
+            if self.validate:
+                self._check(merged)
+
+            for contract, model in plan.stale:
+                output_file = output_dir / contract / f"{model}.json"
+                logger.warning(f"Removing {output_file}: its inputs no longer exist")
+                output_file.unlink(missing_ok=True)
+                if self.store is not None:
+                    self.store.release(output_file)
+
+            to_write = [m for m in merged if m.result]
+            if to_write:
+                output_dir.mkdir(parents=True, exist_ok=True)
+            timings = list(pool.map(lambda m: self.write_key(m, output_dir), to_write))
+
+        if inputs and output_dir.exists():
+            outputs = {
+                _manifest_key(key): previous[_manifest_key(key)] for key in skipped
+            }
+            for t in timings:
+                if t.inputs:
+                    outputs[_manifest_key((t.contract, t.model))] = {"inputs": t.inputs}
+            atomic_write_json(
+                output_dir / MANIFEST_NAME,
+                {"version": MANIFEST_VERSION, "outputs": outputs},
+                indent=2
+            )
+
+        if skipped:
+            logger.info(f"Skipped {len(skipped)} unchanged keys")
+        if plan.stale:
+            logger.info(f"Removed {len(plan.stale)} stale outputs")
+
+        total_seconds = time.perf_counter() - t0
+        produced = [(t.contract, t.model) for t in timings] + skipped
+
+        return {
+            "files_written": len(timings),
+            "files_skipped": len(skipped),
+            "files_removed": len(plan.stale),
+            "contracts": sorted({contract for contract, _ in produced}),
+            "models": sorted({model for _, model in produced}),
+            "output_dir": str(output_dir),
+            "timings": {
+                "total_seconds": round(total_seconds, 4),
+                "per_key": [t.to_dict() for t in timings],
+            },
+        }
+
+    def _check(self, merged: List[MergedKey]) -> None:
+        """Abort on Gate 4 errors of the merged keys; warn about the rest."""
+        issues = [issue for m in merged for issue in m.issues]
+        result = ValidationResult(
+            valid=not any(i.severity == Severity.ERROR for i in issues),
+            issues=issues
+        )
+        result.abort_if_errors("pre-aggregation")
+        for warning in result.warnings:
+            warnings.warn(f"{warning.message} (at {warning.location})", UserWarning)
+
+    def merge_key(
+        self,
+        key: AggregationKey,
+        sources: List[Tuple[Path, Path]]
+    ) -> Optional[MergedKey]:
+        """
+        Merge every run of a single (contract, model) key.
+
+        Each run file is decoded once, checked (validate=True) and added to
+        the results table before it is merged. Only the aggregated result
+        is kept; the output is written by write_key.
+
+        Returns:
+            MergedKey for the key, or None if no run could be loaded
+        """
+        contract, model = key
+
+        t_read = time.perf_counter()
+        primary_eval = None
+        loaded_run_dirs: List[str] = []
+        statistics = RunStatistics(self.quality_dims)
+        fingerprints: List[Dict[str, Any]] = []
+        issues: List[ValidationIssue] = []
+
+        for run_dir, model_file in sources:
+            try:
+                evaluation, fingerprint = self._read(model_file)
+            except json.JSONDecodeError as e:
+                if self.validate:
+                    issues.append(invalid_json_issue(model_file, e))
+                else:
+                    logger.error(f"Failed to load {model_file}: {e}")
+                continue
+            except (ValueError, OSError) as e:
+                logger.error(f"Failed to load {model_file}: {e}")
+                continue
+            fingerprints.append({"path": str(model_file), **fingerprint})
+
+            if self.validate:
+                issues.extend(evaluation_issues(evaluation, f"{run_dir.name}/{contract}/{model}"))
+            if self.table is not None:
+                self.table.add(run_dir, model_file, evaluation, fingerprint["sha256"])
+
+            # Take the most recent evaluation (last run) as primary
+            primary_eval = evaluation
+            loaded_run_dirs.append(str(run_dir))
+            statistics.add(evaluation)
+
+        read_seconds = time.perf_counter() - t_read
+
+        if primary_eval is None:
+            if issues:
+                # Nothing to write, but the Gate 4 errors must still be reported
+                return MergedKey(KeyTiming(contract, model, 0, read_seconds, 0.0), {}, issues)
+            return None
+
+        aggregated_result = {
+            **primary_eval,
+            "aggregation_meta": {
+                "num_runs": len(loaded_run_dirs),
+                "run_dirs": loaded_run_dirs,
+                "aggregated_at": datetime.now().isoformat(),
+                "statistics": statistics.compute(),
+            }
+        }
+
+        timing = KeyTiming(
+            contract=contract,
+            model=model,
+            num_runs=len(loaded_run_dirs),
+            read_seconds=read_seconds,
+            write_seconds=0.0,
+            inputs=fingerprints if len(fingerprints) == len(sources) else [],
+        )
+        return MergedKey(timing, aggregated_result, issues)
+
+    def write_key(self, merged: MergedKey, output_dir: Path) -> KeyTiming:
+        """Write a merged key's aggregated result and register it in the store."""
+        timing = merged.timing
+        t_write = time.perf_counter()
+
+        output_file = output_dir / timing.contract / f"{timing.model}.json"
+        atomic_write_json(output_file, merged.result, indent=2)
+
+        if self.store is not None:
+            self.store.put(output_file, merged.result)
+
+        timing.write_seconds = time.perf_counter() - t_write
+
+        logger.debug(
+            f"Aggregated {timing.contract}/{timing.model}: {timing.num_runs} runs "
+            f"(read {timing.read_seconds:.3f}s, write {timing.write_seconds:.3f}s)"
+        )
+        return timing
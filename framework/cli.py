@@ -5,14 +5,14 @@ Usage:
     leah-eval freeform hotfix
     leah-eval rules test_prod2 --mode-dir /path/to/rules
     leah-eval freeform hotfix --validate-only
+    leah-eval freeform hotfix --full
+    leah-eval freeform hotfix --score
 """
 
 import argparse
 import sys
 from pathlib import Path
 
-from .pipeline import EvaluationPipeline
-
 
 def main():
     """Main CLI entry point."""
@@ -24,6 +24,8 @@ Examples:
   leah-eval freeform hotfix
   leah-eval rules test_prod2 --mode-dir ./rules
   leah-eval freeform hotfix --validate-only
+  leah-eval freeform hotfix --full
+  leah-eval freeform hotfix --score --workers 8
   leah-eval guidelines prod --output-dir ./custom_output
         """
     )
@@ -56,6 +58,25 @@ Examples:
         help="Only run validation gates, skip aggregation and workbook generation"
     )
 
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Re-aggregate every output, ignoring the input fingerprint manifest"
+    )
+
+    parser.add_argument(
+        "--score",
+        action="store_true",
+        help="Score raw canonical JSON into {mode_dir}/scored/{env} and aggregate that "
+             "run (default output: {mode_dir}/scored/{env}_results)"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Process pool size for --score (default: CPU count)"
+    )
+
     parser.add_argument(
         "--config",
         type=Path,
@@ -64,6 +85,9 @@ Examples:
 
     args = parser.parse_args()
 
+    # Imported after argument parsing so --help and usage errors stay fast
+    from .pipeline import EvaluationPipeline
+
     try:
         # Initialize pipeline
         print(f"Initializing {args.mode} evaluation pipeline...")
@@ -82,29 +106,41 @@ Examples:
             print("✓ Pre-evaluation validation passed")
 
             # Try to discover and validate runs
-            env_dir = pipeline.mode_dir / "environments" / args.env
-            if env_dir.exists():
-                run_dirs = [
-                    d for d in env_dir.iterdir()
-                    if d.is_dir() and (d / "evaluations").exists()
-                ]
-                if run_dirs:
-                    print(f"\nValidating {len(run_dirs)} evaluation runs...")
-                    pipeline.validate_runs(run_dirs)
-                    print("✓ Pre-aggregation validation passed")
-                else:
-                    print(f"\nNo evaluation runs found in {env_dir}")
+            run_dirs = pipeline.discover_runs(args.env)
+            if run_dirs:
+                print(f"\nValidating {len(run_dirs)} evaluation runs...")
+                pipeline.validate_runs(run_dirs)
+                print("✓ Pre-aggregation validation passed")
             else:
-                print(f"\nEnvironment directory not found: {env_dir}")
+                print(f"\nNo evaluation runs found for environment: {args.env}")
 
             print("\n✓ Validation complete - no errors found")
             return 0
 
+        run_dirs = None
+        output_dir = args.output_dir
+        if args.score:
+            print(f"\nScoring canonical JSON for environment: {args.env}")
+            scored = pipeline.score_environment(args.env, max_workers=args.workers)
+            print(f"✓ Scored {scored['files_written']} evaluations "
+                  f"in {scored['total_seconds']:.2f}s -> {scored['output_dir']}")
+            for error in scored["errors"]:
+                print(f"  ✗ {error['contract']}/{error['model']}: {error['error']}",
+                      file=sys.stderr)
+
+            # The scored run is aggregated on its own, away from judged results
+            scored_dir = Path(scored["output_dir"])
+            run_dirs = [scored_dir]
+            if output_dir is None:
+                output_dir = scored_dir.with_name(f"{scored_dir.name}_results")
+
         # Run full pipeline
         print(f"\nRunning full evaluation pipeline for environment: {args.env}")
         summary = pipeline.run_full_pipeline(
             env=args.env,
-            output_dir=args.output_dir
+            run_dirs=run_dirs,
+            output_dir=output_dir,
+            full=args.full
         )
 
         print("\n" + "=" * 60)
@@ -113,6 +149,8 @@ Examples:
         print(f"Mode:            {summary['mode']}")
         print(f"Environment:     {summary['env']}")
         print(f"Runs processed:  {summary['runs_processed']}")
+        print(f"Files written:   {summary['files_written']} "
+              f"({summary['files_skipped']} unchanged)")
         print(f"Output directory: {summary['output_dir']}")
         print(f"Workbook:        {summary['workbook']}")
         print("=" * 60)
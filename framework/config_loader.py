@@ -3,13 +3,31 @@ Configuration loading and validation for evaluation modes.
 
 This module provides utilities to load and validate evaluation mode configuration
 files against the JSON schema, with clear error messages for debugging.
+
+Importing jsonschema and compiling the schema dominate the cost of loading a
+config, so both are avoided where possible: the compiled validator is cached
+per schema file for the life of the process, and every successful validation
+is recorded in a stamp file keyed by the SHA-256 of the config and the schema.
+A config whose stamp matches is not validated again (jsonschema is not even
+imported) until either file changes.
 """
 
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple
 import warnings
 
+from .fileio import atomic_write_json, file_sha256
+
+DEFAULT_SCHEMA_PATH = Path(__file__).parent / "schemas" / "mode_config_schema.json"
+
+# "{config sha256}:{schema sha256}" -> config file name, for configs that passed.
+# Kept at the project root with the other run caches, not inside the package.
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+VALIDATION_STAMPS_PATH = PROJECT_ROOT / "_validated_configs.json"
+MAX_VALIDATION_STAMPS = 64
+
 
 class ConfigValidationError(Exception):
     """Raised when a configuration file fails validation."""
@@ -41,10 +59,55 @@ class ConfigValidationError(Exception):
         return "\n".join(lines)
 
 
+@lru_cache(maxsize=8)
+def _compiled_validator(schema_path: Path, version: Tuple[int, int]):
+    """Draft7Validator for a schema file; version (mtime_ns, size) keys reloads."""
+    from jsonschema import Draft7Validator
+
+    with open(schema_path, 'r', encoding='utf-8') as f:
+        schema = json.load(f)
+    return Draft7Validator(schema)
+
+
+def get_validator(schema_path: Optional[Path] = None):
+    """
+    Compiled Draft7Validator for a schema file, cached per process.
+
+    Raises:
+        ImportError: If jsonschema is not installed
+    """
+    schema_path = Path(schema_path or DEFAULT_SCHEMA_PATH).resolve()
+    stat = schema_path.stat()
+    return _compiled_validator(schema_path, (stat.st_mtime_ns, stat.st_size))
+
+
+def _read_stamps() -> Dict[str, str]:
+    try:
+        with open(VALIDATION_STAMPS_PATH, 'r', encoding='utf-8') as f:
+            stamps = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return stamps if isinstance(stamps, dict) else {}
+
+
+def _write_stamp(stamp: str, config_path: Path) -> None:
+    stamps = _read_stamps()
+    stamps.pop(stamp, None)
+    stamps[stamp] = config_path.name
+    # Oldest stamps first; edited configs leave stale ones behind
+    stamps = dict(list(stamps.items())[-MAX_VALIDATION_STAMPS:])
+    try:
+        atomic_write_json(VALIDATION_STAMPS_PATH, stamps, indent=2)
+    except OSError:
+        # Read-only install: configs are simply validated every time
+        pass
+
+
 def load_mode_config(
     config_path: Path,
     schema_path: Optional[Path] = None,
-    validate: bool = True
+    validate: bool = True,
+    use_stamps: bool = True
 ) -> Dict[str, Any]:
     """
     Load and validate an evaluation mode configuration file.
@@ -53,6 +116,8 @@ def load_mode_config(
         config_path: Path to the configuration JSON file
         schema_path: Optional path to the JSON schema file. If None, uses default.
         validate: Whether to validate against schema (default True)
+        use_stamps: Skip validation of a config already validated against
+            the same schema, and record new successful validations
 
     Returns:
         Dictionary containing the configuration
@@ -81,8 +146,7 @@ def load_mode_config(
     # Validate against schema if requested
     if validate:
         if schema_path is None:
-            # Default schema location
-            schema_path = Path(__file__).parent / "schemas" / "mode_config_schema.json"
+            schema_path = DEFAULT_SCHEMA_PATH
 
         if not schema_path.exists():
             warnings.warn(
@@ -92,10 +156,14 @@ def load_mode_config(
             )
             return config
 
+        if use_stamps:
+            stamp = f"{file_sha256(config_path)}:{file_sha256(schema_path)}"
+            if stamp in _read_stamps():
+                return config
+
         # Import jsonschema only if validation is requested
         try:
-            import jsonschema
-            from jsonschema import Draft7Validator
+            validator = get_validator(schema_path)
         except ImportError:
             warnings.warn(
                 "jsonschema package not installed. "
@@ -105,17 +173,14 @@ def load_mode_config(
             )
             return config
 
-        # Load and compile schema
-        with open(schema_path, 'r', encoding='utf-8') as f:
-            schema = json.load(f)
-
-        # Validate
-        validator = Draft7Validator(schema)
         errors = list(validator.iter_errors(config))
 
         if errors:
             raise ConfigValidationError(config_path, errors)
 
+        if use_stamps:
+            _write_stamp(stamp, config_path)
+
     return config
 
 
@@ -0,0 +1,145 @@
+"""
+Shared parsed-document store for a single pipeline invocation.
+
+Validation gates, aggregation and workbook generation all read the same
+evaluation files. Routing those reads through one DocumentStore gives every
+stage the same I/O counters, and lets files that several stages need be
+read and decoded once.
+
+Within a pipeline invocation each run file is decoded once, by the
+aggregation merge of its key (read with load_with_fingerprint, never
+cached). The merge runs the pre-aggregation content checks and feeds the
+results table from that same document, then drops it, so peak memory does
+not grow with the number of runs. Only documents whose total size is
+bounded by the number of output keys are cached: the aggregated results,
+which the pre-workbook gate and the workbook stage both read. load(...,
+cache=False) serves callers that read run files on their own, such as the
+pre-aggregation gate run outside the pipeline.
+
+Documents returned by the store are shared and must be treated as read-only.
+"""
+
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .fileio import read_with_fingerprint
+
+
+@dataclass
+class StageStats:
+    """I/O counters for one pipeline stage."""
+    bytes_read: int = 0
+    parse_calls: int = 0
+    cache_hits: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "bytes_read": self.bytes_read,
+            "parse_calls": self.parse_calls,
+            "cache_hits": self.cache_hits,
+        }
+
+
+class DocumentStore:
+    """
+    Thread-safe cache of parsed JSON documents keyed by resolved path.
+
+    Usage:
+        store = DocumentStore()
+        data = store.load(path, stage="pre_aggregate")   # reads + parses
+        data = store.load(path, stage="aggregate")       # cache hit
+        store.stats()  # {"pre_aggregate": {...}, "aggregate": {...}}
+    """
+
+    def __init__(self):
+        self._docs: Dict[Path, Any] = {}
+        self._stats: Dict[str, StageStats] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path: Union[Path, str]) -> Path:
+        return Path(path).resolve()
+
+    def _stage(self, stage: str) -> StageStats:
+        if stage not in self._stats:
+            self._stats[stage] = StageStats()
+        return self._stats[stage]
+
+    def load(self, path: Union[Path, str], stage: str = "default", cache: bool = True) -> Any:
+        """
+        Return the parsed JSON document at path, reading it only on first use.
+
+        Args:
+            path: JSON file
+            stage: Pipeline stage the I/O counters are recorded under
+            cache: Keep the parsed document for later loads (a document
+                already in the store is returned either way)
+
+        Raises:
+            OSError: If the file cannot be read
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        key = self._key(path)
+
+        with self._lock:
+            if key in self._docs:
+                self._stage(stage).cache_hits += 1
+                return self._docs[key]
+
+        with open(key, "rb") as f:
+            raw = f.read()
+        data = json.loads(raw)
+
+        with self._lock:
+            stats = self._stage(stage)
+            stats.bytes_read += len(raw)
+            stats.parse_calls += 1
+            if cache:
+                self._docs[key] = data
+
+        return data
+
+    def load_with_fingerprint(self, path: Union[Path, str], stage: str = "default") -> Tuple[Any, Dict[str, Any]]:
+        """
+        Read and parse a file, returning it with a fingerprint of the bytes parsed.
+
+        Always reads the file (a cached copy has no fingerprint of its own)
+        and never caches the result.
+
+        Raises:
+            OSError: If the file cannot be read
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        raw, fingerprint = read_with_fingerprint(self._key(path))
+        data = json.loads(raw)
+
+        with self._lock:
+            stats = self._stage(stage)
+            stats.bytes_read += len(raw)
+            stats.parse_calls += 1
+
+        return data, fingerprint
+
+    def put(self, path: Union[Path, str], data: Any) -> None:
+        """Register a document this invocation wrote itself, so later reads hit."""
+        with self._lock:
+            self._docs[self._key(path)] = data
+
+    def release(self, path: Union[Path, str]) -> None:
+        """Drop a document that no later stage needs."""
+        with self._lock:
+            self._docs.pop(self._key(path), None)
+
+    def __contains__(self, path: Union[Path, str]) -> bool:
+        with self._lock:
+            return self._key(path) in self._docs
+
+    def stats(self, stage: Optional[str] = None) -> Dict[str, Any]:
+        """Return counters for one stage, or for every stage seen so far."""
+        with self._lock:
+            if stage is not None:
+                return self._stage(stage).to_dict()
+            return {name: s.to_dict() for name, s in self._stats.items()}
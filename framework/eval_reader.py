@@ -0,0 +1,198 @@
+"""
+Selective reader for evaluation result files.
+
+Workbook generation and sales metrics need a few fields of each evaluation
+(usually summary, sometimes a handful of per-item fields), while json.load
+decodes everything, including long evidence strings. read_fields() maps the
+file and decodes only the requested parts:
+
+    read_fields(path, ["summary"])
+    read_fields(path, ["summary", "gt_evaluations[*].detection", "gt_evaluations[*].tier"])
+
+A field is either a top-level key, returned whole, or key[*].name, which
+projects a list of objects down to the named fields. The result has the
+shape of the document restricted to those fields, so code written against
+the full document reads it unchanged.
+
+The fast path relies on the layout json.dump(..., indent=n) writes: a
+member at depth d sits on its own line indented by d * n spaces, and
+strings never contain a raw newline, so member boundaries can be found
+with a byte search instead of tokenising every value. Compact files, other
+layouts and any span that fails to decode fall back to a full parse.
+"""
+
+import json
+import mmap
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Set, Union
+
+_INDENT = re.compile(rb"\{\n( +)\"")
+
+
+class _LayoutError(ValueError):
+    """The file is not in the indented layout the fast path expects."""
+
+
+def parse_fields(fields: Iterable[str]) -> Dict[str, Optional[Set[str]]]:
+    """
+    Parse field specs into key -> projected names (None = whole value).
+
+    Raises:
+        ValueError: If a spec is not "key" or "key[*].name"
+    """
+    spec: Dict[str, Optional[Set[str]]] = {}
+    for field in fields:
+        key, sep, rest = field.partition("[*].")
+        if not key or (sep and not rest) or "[" in key or "." in rest:
+            raise ValueError(f"Unsupported field spec: {field!r}")
+        if not sep:
+            spec[key] = None
+        elif key not in spec or spec[key] is not None:
+            spec.setdefault(key, set()).add(rest)
+    return spec
+
+
+def project(document: dict, spec: Dict[str, Optional[Set[str]]]) -> Dict[str, Any]:
+    """Restrict a fully parsed document to a parsed field spec."""
+    result: Dict[str, Any] = {}
+    for key, names in spec.items():
+        if key not in document:
+            continue
+        value = document[key]
+        if names is None or not isinstance(value, list):
+            result[key] = value
+        else:
+            result[key] = [
+                {n: item[n] for n in names if n in item} if isinstance(item, dict) else item
+                for item in value
+            ]
+    return result
+
+
+@lru_cache(maxsize=None)
+def _member_pattern(indent: bytes) -> "re.Pattern[bytes]":
+    return re.compile(b"\n" + indent + rb'"((?:[^"\\\n]|\\.)*)": ')
+
+
+@lru_cache(maxsize=None)
+def _item_pattern(indent: bytes) -> "re.Pattern[bytes]":
+    return re.compile(b"\n" + indent + rb"\{")
+
+
+def _members(buf, start: int, end: int, indent: bytes) -> Dict[str, tuple]:
+    """(start, end) value spans of the object members at one indent level."""
+    spans: Dict[str, tuple] = {}
+    previous = None
+    for match in _member_pattern(indent).finditer(buf, start, end):
+        if previous is not None:
+            spans[previous[0]] = (previous[1], match.start())
+        previous = (json.loads(b'"' + match.group(1) + b'"'), match.end())
+    if previous is not None:
+        spans[previous[0]] = (previous[1], end)
+    return spans
+
+
+def _decode(buf, start: int, end: int) -> Any:
+    raw = buf[start:end].rstrip()
+    if raw.endswith(b","):
+        raw = raw[:-1]
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=None)
+def _projection_pattern(indent: bytes, names: FrozenSet[str]) -> "re.Pattern[bytes]":
+    """Matches item openings and the lines of the selected fields."""
+    alternatives = b"|".join(re.escape(json.dumps(n).encode()) for n in sorted(names))
+    # No groups, so findall returns whole matches; the shared literal prefix
+    # lets the regex engine skip ahead between candidate lines
+    return re.compile(
+        b"\n" + indent * 2 + rb"(?:\{|" + indent + b"(?:" + alternatives + b"): [^\n]*)"
+    )
+
+
+_MULTILINE_VALUE = re.compile(rb'": [\[{](?=\n|\Z)')
+_LINE_END_COMMA = re.compile(rb",(?=\n|\Z)")
+
+
+def _project_list(buf, start: int, end: int, indent: bytes, names: Set[str]) -> list:
+    """
+    Decode only the named fields of each object in a list value.
+
+    The item openings and selected member lines are cut out with one regex
+    scan, spliced into a single JSON array of objects and decoded in one
+    call. Selected values spanning several lines are not spliced.
+    """
+    if buf[start:start + 2] == b"[]":
+        return []
+    if buf[start:start + 2] != b"[\n":
+        raise _LayoutError("list is not one item per line")
+    list_end = buf.rfind(b"\n" + indent + b"]", start, end)
+    if list_end < 0:
+        raise _LayoutError("list has no closing bracket on its own line")
+
+    item_open = b"\n" + indent * 2 + b"{"
+    field_line = b"\n" + indent * 3
+    text = b"".join(_projection_pattern(indent, frozenset(names)).findall(buf, start, list_end))
+    if not text.startswith(item_open):
+        raise _LayoutError("list items are not objects")
+    if _MULTILINE_VALUE.search(text):
+        raise _LayoutError("a selected value spans several lines")
+
+    text = _LINE_END_COMMA.sub(b"", text)
+    text = text.replace(item_open + field_line, b"},{").replace(item_open, b"},{").replace(field_line, b",")
+    return json.loads(b"[" + text[2:] + b"}]")
+
+
+def _fast_read(buf, spec: Dict[str, Optional[Set[str]]]) -> Dict[str, Any]:
+    match = _INDENT.match(buf)
+    doc_end = buf.rfind(b"\n}")
+    if match is None or doc_end < 0:
+        raise _LayoutError("not an indented JSON object")
+    indent = match.group(1)
+
+    members = _members(buf, 1, doc_end, indent)
+    result: Dict[str, Any] = {}
+    for key, names in spec.items():
+        if key not in members:
+            continue
+        start, end = members[key]
+        if names is None or buf[start:start + 1] != b"[":
+            result[key] = _decode(buf, start, end)
+        else:
+            result[key] = _project_list(buf, start, end, indent, names)
+    return result
+
+
+def read_fields(path: Union[Path, str], fields: Iterable[str]) -> Dict[str, Any]:
+    """
+    Read selected fields of a JSON evaluation file.
+
+    Args:
+        path: Evaluation JSON (a top-level object)
+        fields: Field specs, "key" or "key[*].name"
+
+    Returns:
+        The document restricted to the requested fields. Missing keys and
+        missing per-item fields are left out.
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not valid JSON
+        ValueError: If a field spec is not supported
+    """
+    spec = parse_fields(fields)
+    with open(path, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file: let json report it
+            return project(json.loads(f.read()), spec)
+        try:
+            try:
+                return _fast_read(buf, spec)
+            except (_LayoutError, json.JSONDecodeError, KeyError):
+                return project(json.loads(buf[:]), spec)
+        finally:
+            buf.close()
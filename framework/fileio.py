@@ -0,0 +1,95 @@
+"""File helpers shared by pipeline stages that keep manifests on disk."""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Tuple, Union
+
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_sha256(path: Union[Path, str]) -> str:
+    """Return the hex SHA-256 digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_fingerprint(path: Union[Path, str], with_hash: bool = True) -> Dict[str, Any]:
+    """
+    Return a fingerprint dict for a file: mtime_ns, size and (optionally) sha256.
+
+    Args:
+        path: File to fingerprint
+        with_hash: Include the content hash (reads the whole file)
+    """
+    st = os.stat(path)
+    fingerprint: Dict[str, Any] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+    if with_hash:
+        fingerprint["sha256"] = file_sha256(path)
+    return fingerprint
+
+
+def read_with_fingerprint(path: Union[Path, str]) -> Tuple[bytes, Dict[str, Any]]:
+    """
+    Read a file and fingerprint the bytes that were read.
+
+    For callers that parse the content anyway, this saves the second read
+    file_fingerprint would need. mtime_ns is taken before reading, so if the
+    file changes during the read, the recorded mtime no longer matches and
+    the content hash decides next time.
+    """
+    st = os.stat(path)
+    with open(path, "rb") as f:
+        raw = f.read()
+    return raw, {
+        "mtime_ns": st.st_mtime_ns,
+        "size": len(raw),
+        "sha256": hashlib.sha256(raw).hexdigest(),
+    }
+
+
+def fingerprint_matches(path: Union[Path, str], recorded: Dict[str, Any]) -> bool:
+    """
+    Check a file against a recorded fingerprint.
+
+    Matching mtime and size is trusted without reading the file. If only the
+    mtime differs (e.g. the file was touched or re-copied), the content hash
+    decides.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+
+    if st.st_size != recorded.get("size"):
+        return False
+    if st.st_mtime_ns == recorded.get("mtime_ns"):
+        return True
+    return "sha256" in recorded and file_sha256(path) == recorded["sha256"]
+
+
+def atomic_write_json(path: Union[Path, str], data: Any, **dump_kwargs) -> None:
+    """
+    Write JSON via a temp file in the same directory and an atomic rename.
+
+    Readers see either the previous file or the complete new one, never a
+    partially written file.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, **dump_kwargs)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
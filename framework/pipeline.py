@@ -2,24 +2,41 @@
 Evaluation Pipeline Orchestration.
 
 Provides high-level API for running evaluations end-to-end.
+
+The scoring, aggregation and workbook stages (numpy, openpyxl) are imported
+by the methods that run them, so validation-only use starts quickly.
 """
 
 import json
 import logging
-from datetime import datetime
+import re
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Any, Tuple
 import warnings
 
 from .config_loader import load_mode_config
+from .document_store import DocumentStore
+from .results_table import RESULTS_TABLE_NAME
+from .scripts.gt_index import GroundTruthIndex
 from .scripts.gt_loader import GTLoader
 from .validators.pre_eval import validate_pre_evaluation
 from .validators.pre_aggregate import validate_pre_aggregation
 from .validators.pre_workbook import validate_pre_workbook
 
+if TYPE_CHECKING:
+    from .aggregation import AggregationPlan
+    from .results_table import ResultsTableBuilder
+    from .scoring import PointsMatrix
+
 logger = logging.getLogger(__name__)
 
 
+def _run_order(run_dir: Path) -> list:
+    """Sort key placing run2 before run10, so the last run is the latest."""
+    return [(0, int(part), "") if part.isdigit() else (1, 0, part)
+            for part in re.split(r"(\d+)", run_dir.name)]
+
+
 class EvaluationPipeline:
     """
     Orchestrates evaluation pipeline from GT loading through workbook generation.
@@ -66,6 +83,8 @@ class EvaluationPipeline:
         # Initialize GT loader
         self.gt_loader = GTLoader(self.mode_dir, self.config)
 
+        self._points_matrix: Optional["PointsMatrix"] = None
+
     def load_ground_truth(
         self,
         contract: str,
@@ -85,14 +104,17 @@ class EvaluationPipeline:
         return {
             "data": result.data,
             "gt_type": result.gt_type,
-            "source_files": [str(f) for f in result.source_files]
+            "source_files": [str(f) for f in result.source_files],
+            "index": result.index
         }
 
     def validate_prerequisites(
         self,
         stage: str,
         env: Optional[str] = None,
-        run_dirs: Optional[List[Path]] = None
+        run_dirs: Optional[List[Path]] = None,
+        store: Optional[DocumentStore] = None,
+        changed_files: Optional[Iterable[Path]] = None
     ) -> None:
         """
         Run validation gate for a specific pipeline stage.
@@ -101,6 +123,8 @@ class EvaluationPipeline:
             stage: Stage to validate (pre_eval, pre_aggregate, pre_workbook)
             env: Environment name (required for pre_eval)
             run_dirs: Run directories (required for pre_aggregate, pre_workbook)
+            store: Shared DocumentStore for I/O counters and cached documents
+            changed_files: pre_aggregate only parses these files if given
 
         Raises:
             ValidationError: If validation fails with ERROR-severity issues
@@ -120,7 +144,7 @@ class EvaluationPipeline:
             if run_dirs is None:
                 raise ValueError("run_dirs parameter required for pre_aggregate validation")
 
-            result = validate_pre_aggregation(run_dirs)
+            result = validate_pre_aggregation(run_dirs, store=store, changed_files=changed_files)
             result.abort_if_errors("pre-aggregation")
 
             if result.warnings:
@@ -132,7 +156,7 @@ class EvaluationPipeline:
                 raise ValueError("env parameter required for pre_workbook validation")
 
             # pre_workbook validates mode_dir for aggregated results
-            result = validate_pre_workbook(self.mode_dir, env)
+            result = validate_pre_workbook(self.mode_dir, env, store=store)
             result.abort_if_errors("pre-workbook")
 
             if result.warnings:
@@ -142,17 +166,57 @@ class EvaluationPipeline:
         else:
             raise ValueError(f"Unknown validation stage: {stage}")
 
-    def validate_runs(self, run_dirs: List[Path]) -> None:
+    def validate_runs(
+        self,
+        run_dirs: List[Path],
+        store: Optional[DocumentStore] = None,
+        changed_files: Optional[Iterable[Path]] = None
+    ) -> None:
         """
         Validate multiple evaluation runs for aggregation.
 
+        Coverage is always checked across all runs; file contents only for
+        changed_files when given (AggregationPlan.changed_files).
+
         Args:
             run_dirs: List of run directory paths
+            store: Shared DocumentStore for I/O counters and cached documents
+            changed_files: Files to parse (None = every evaluation file)
 
         Raises:
             ValidationError: If coverage is incomplete or inconsistent
         """
-        self.validate_prerequisites("pre_aggregate", run_dirs=run_dirs)
+        self.validate_prerequisites(
+            "pre_aggregate", run_dirs=run_dirs, store=store, changed_files=changed_files
+        )
+
+    def discover_runs(self, env: str) -> List[Path]:
+        """
+        Find the judged run directories of an environment, in run order.
+
+        Runs are the subdirectories of environments/{env} (or run* under
+        mode_dir in the legacy layout) holding an evaluations/ directory.
+        Order matters: aggregation keeps the last run as primary.
+
+        Args:
+            env: Environment name
+
+        Returns:
+            Run directories sorted by name, numbers compared numerically
+        """
+        env_dir = self.mode_dir / "environments" / env
+        if env_dir.exists():
+            run_dirs = [
+                d for d in env_dir.iterdir()
+                if d.is_dir() and (d / "evaluations").exists()
+            ]
+        else:
+            # Legacy structure
+            run_dirs = [
+                d for d in self.mode_dir.iterdir()
+                if d.is_dir() and d.name.startswith("run") and (d / "evaluations").exists()
+            ]
+        return sorted(run_dirs, key=_run_order)
 
     def score_evaluation(
         self,
@@ -164,14 +228,14 @@ class EvaluationPipeline:
         """
         Score a single evaluation using mode-specific scoring logic.
 
-        Current implementation: Loads pre-scored evaluation JSON.
-        Future: Implement raw model output → scored evaluation transformation.
+        Raw canonical JSON (Leah output with a risk_table) is scored against
+        the GT by framework.scoring_engine. A file that already holds scored
+        evaluations (e.g. from a judging pass) is loaded and checked instead.
 
         Args:
             contract: Contract identifier
             model: Model identifier
-            canonical_json_path: Path to scored evaluation JSON
-                (currently expects already-scored evaluation with gt_evaluations array)
+            canonical_json_path: Path to canonical JSON or scored evaluation JSON
             contract_type: Contract type (for rules/guidelines modes)
 
         Returns:
@@ -201,6 +265,11 @@ class EvaluationPipeline:
                 e.doc, e.pos
             )
 
+        # Raw Leah output: score it
+        if "gt_evaluations" not in scored_eval and "risk_table" in scored_eval:
+            from .scoring_engine import score_canonical
+            return score_canonical(scored_eval, gt_result["data"], self.config, contract, model)
+
         # Validate structure
         if "gt_evaluations" not in scored_eval:
             raise KeyError(
@@ -223,178 +292,173 @@ class EvaluationPipeline:
         if "summary" not in scored_eval:
             scored_eval["summary"] = self._calculate_summary(
                 scored_eval["gt_evaluations"],
-                gt_issues
+                gt_issues,
+                gt_result["index"]
             )
 
         return scored_eval
 
+    def score_environment(
+        self,
+        env: str,
+        output_dir: Optional[Path] = None,
+        canonical_dir: Optional[Path] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Score every canonical JSON of an environment without a judging pass.
+
+        (contract, model) pairs are scored in parallel on a process pool by
+        framework.scoring_engine.ScoringEngine. The output is a run
+        directory ({output_dir}/evaluations/{contract}/{model}.json) that
+        aggregate_results and run_full_pipeline accept like any other run.
+        It is written outside environments/{env} by default, so
+        discover_runs never mixes scored output with judged runs.
+
+        Args:
+            env: Environment name
+            output_dir: Run directory to write (default:
+                mode_dir/scored/{env})
+            canonical_dir: Canonical JSON directory (default: discovered as
+                in the pre_eval gate)
+            max_workers: Process pool size (default: CPU count)
+
+        Returns:
+            Dictionary with files written, per-job timings and errors
+        """
+        from .scoring_engine import ScoringEngine, find_canonical_dir
+
+        if canonical_dir is None:
+            canonical_dir = find_canonical_dir(self.mode_dir, env)
+            if canonical_dir is None:
+                raise FileNotFoundError(
+                    f"No canonical JSON directory found for environment: {env}"
+                )
+
+        if output_dir is None:
+            output_dir = self.mode_dir / "scored" / env
+
+        engine = ScoringEngine(self.config, max_workers=max_workers)
+        jobs = engine.discover_jobs(Path(canonical_dir), Path(output_dir), self.gt_loader)
+        summary = engine.run(jobs)
+        summary["output_dir"] = str(output_dir)
+
+        logger.info(
+            f"Scored {summary['files_written']} evaluations "
+            f"({len(summary['errors'])} errors) in {summary['total_seconds']:.2f}s"
+        )
+
+        return summary
+
+    @property
+    def points_matrix(self) -> "PointsMatrix":
+        """Detection points for this mode's config, compiled once."""
+        if self._points_matrix is None:
+            from .scoring import compile_points_matrix
+
+            # Max points for a tier without a Y value count as 0 here
+            self._points_matrix = compile_points_matrix(
+                self.config.get("detection_points", {}), default_max=0
+            )
+        return self._points_matrix
+
     def _calculate_summary(
         self,
         gt_evaluations: List[Dict[str, Any]],
-        gt_issues: List[Dict[str, Any]]
+        gt_issues: List[Dict[str, Any]],
+        gt_index: Optional[GroundTruthIndex] = None
     ) -> Dict[str, Any]:
         """Calculate summary statistics for scored evaluation."""
-        from framework.scoring import calculate_detection_points
-
-        tier_config = self.config.get("detection_points", {})
-
-        total_detection_points = 0.0
-        total_quality_points = 0.0
-        detection_counts = {"Y": 0, "P": 0, "N": 0, "NMI": 0}
-        t1_gate_pass = True
-
-        for eval_item in gt_evaluations:
-            # Detection points
-            detection = eval_item.get("detection", "NMI")
-            tier = eval_item.get("tier", "T3")
-            detection_points = calculate_detection_points(detection, tier, tier_config)
-            total_detection_points += detection_points
-
-            # Quality points
-            quality_dims = self.config.get("quality_scores", {}).get("dimensions", [])
-            for dim in quality_dims:
-                total_quality_points += eval_item.get(dim, 0)
-
-            # Detection counts
-            if detection in detection_counts:
-                detection_counts[detection] += 1
-
-            # T1 gate check
-            if tier == "T1" and detection not in ("Y", "P"):
-                t1_gate_pass = False
-
-        # Calculate max possible points
-        max_detection_points = sum(
-            tier_config.get(gt.get("tier", "T3"), {}).get("Y", 0)
-            for gt in gt_issues
-        )
+        from .scoring_engine import summarise_detections
 
-        return {
-            "total_detection_points": total_detection_points,
-            "max_detection_points": max_detection_points,
-            "total_quality_points": total_quality_points,
-            "total_points": total_detection_points + total_quality_points,
-            "detection_counts": detection_counts,
-            "t1_gate_pass": t1_gate_pass,
-            "weighted_recall": total_detection_points / max_detection_points if max_detection_points > 0 else 0.0
-        }
+        quality_dims = self.config.get("quality_scores", {}).get("dimensions", [])
+        return summarise_detections(
+            gt_evaluations, gt_issues, self.points_matrix, quality_dims, gt_index=gt_index
+        )
 
     def aggregate_results(
         self,
         run_dirs: List[Path],
-        output_dir: Path
+        output_dir: Path,
+        max_workers: Optional[int] = None,
+        store: Optional[DocumentStore] = None,
+        validate: bool = True,
+        full: bool = False,
+        plan: Optional["AggregationPlan"] = None,
+        table: Optional["ResultsTableBuilder"] = None
     ) -> Dict[str, Any]:
         """
         Aggregate evaluations from multiple runs.
 
+        Keys are merged concurrently by AggregationEngine; see
+        framework.aggregation for memory and timing behaviour. Outputs whose
+        input files are unchanged since the last run are left as they are
+        unless full=True; outputs whose inputs are gone are removed. Each
+        output records run-to-run statistics (detection distributions,
+        majority vote, spread of points and quality scores) in
+        aggregation_meta["statistics"].
+
+        The coverage gates run first. The per-file checks of the
+        pre-aggregation gate run inside the merge, on the same decoded
+        documents, and abort before any output is written.
+
         Args:
             run_dirs: List of run directories to aggregate
             output_dir: Directory to write aggregated results
+            max_workers: Worker pool size for the aggregation engine
+            store: Shared DocumentStore for I/O counters
+            validate: Run the pre-aggregation gate (skip if already run)
+            full: Recompute every output, ignoring the fingerprint manifest
+            plan: plan_aggregation() result already computed by the caller
+            table: Results table builder fed every run file merged
 
         Returns:
-            Dictionary with aggregation summary
+            Dictionary with aggregation summary, including per-key and total timings
         """
-        # Validate runs first
-        logger.info(f"Validating {len(run_dirs)} runs before aggregation")
-        self.validate_runs(run_dirs)
-
-        # Collect all evaluations by (contract, model) key
-        aggregated = {}
-        run_count = 0
-
-        for run_dir in run_dirs:
-            eval_dir = run_dir / "evaluations"
-            if not eval_dir.exists():
-                logger.warning(f"Evaluation directory not found: {eval_dir}, skipping")
-                continue
-
-            run_count += 1
-            logger.info(f"Processing run {run_count}: {run_dir}")
-
-            for contract_dir in eval_dir.iterdir():
-                if not contract_dir.is_dir():
-                    continue
-
-                contract = contract_dir.name
-
-                for model_file in contract_dir.glob("*.json"):
-                    model = model_file.stem
-                    key = (contract, model)
-
-                    try:
-                        with open(model_file) as f:
-                            evaluation = json.load(f)
-                    except (json.JSONDecodeError, OSError) as e:
-                        logger.error(f"Failed to load {model_file}: {e}")
-                        continue
-
-                    if key not in aggregated:
-                        aggregated[key] = {
-                            "runs": [],
-                            "contracts_models": key
-                        }
-
-                    aggregated[key]["runs"].append({
-                        "run_dir": str(run_dir),
-                        "evaluation": evaluation
-                    })
+        from .aggregation import AggregationEngine, plan_aggregation
+
+        if plan is None:
+            plan = plan_aggregation(run_dirs, output_dir, full=full)
+
+        if validate:
+            # Coverage only: the engine checks each file's contents as it reads it
+            logger.info(f"Validating {len(run_dirs)} runs before aggregation")
+            self.validate_runs(run_dirs, store=store, changed_files=[])
+
+        engine = AggregationEngine(
+            max_workers=max_workers,
+            store=store,
+            quality_dims=self.config.get("quality_scores", {}).get("dimensions"),
+            validate=validate,
+            table=table
+        )
+        summary = engine.run(run_dirs, output_dir, full=full, plan=plan)
 
-        if not aggregated:
+        if summary["files_written"] == 0 and summary["files_skipped"] == 0:
             logger.warning("No evaluations found in any run directory")
             return {
                 "files_written": 0,
                 "contracts": [],
                 "models": [],
-                "message": "No evaluations to aggregate"
-            }
-
-        # Write aggregated results
-        output_dir.mkdir(parents=True, exist_ok=True)
-        contracts_processed = set()
-        models_processed = set()
-
-        for (contract, model), data in aggregated.items():
-            contract_dir = output_dir / contract
-            contract_dir.mkdir(exist_ok=True)
-
-            output_file = contract_dir / f"{model}.json"
-
-            # Take the most recent evaluation (last run) as primary
-            primary_eval = data["runs"][-1]["evaluation"]
-
-            # Add aggregation metadata
-            aggregated_result = {
-                **primary_eval,
-                "aggregation_meta": {
-                    "num_runs": len(data["runs"]),
-                    "run_dirs": [r["run_dir"] for r in data["runs"]],
-                    "aggregated_at": datetime.now().isoformat()
-                }
+                "message": "No evaluations to aggregate",
+                "timings": summary["timings"]
             }
 
-            with open(output_file, "w") as f:
-                json.dump(aggregated_result, f, indent=2)
-
-            contracts_processed.add(contract)
-            models_processed.add(model)
-
         logger.info(
-            f"Aggregation complete: {len(aggregated)} files written, "
-            f"{len(contracts_processed)} contracts, {len(models_processed)} models"
+            f"Aggregation complete: {summary['files_written']} files written, "
+            f"{summary['files_skipped']} unchanged, "
+            f"{len(summary['contracts'])} contracts, {len(summary['models'])} models "
+            f"in {summary['timings']['total_seconds']:.2f}s"
         )
 
-        return {
-            "files_written": len(aggregated),
-            "contracts": sorted(contracts_processed),
-            "models": sorted(models_processed),
-            "output_dir": str(output_dir)
-        }
+        return summary
 
     def generate_workbook(
         self,
         aggregated_dir: Path,
         output_path: Path,
-        env: str
+        env: str,
+        store: Optional[DocumentStore] = None
     ) -> Path:
         """
         Generate Excel workbook from aggregated results.
@@ -403,13 +467,14 @@ class EvaluationPipeline:
             aggregated_dir: Directory containing aggregated JSON results
             output_path: Path for output workbook
             env: Environment name
+            store: Shared DocumentStore (results just aggregated are reused)
 
         Returns:
             Path to generated workbook
         """
         # Validate prerequisites
         logger.info(f"Validating aggregated results in {aggregated_dir}")
-        self.validate_prerequisites("pre_workbook", env=env)
+        self.validate_prerequisites("pre_workbook", env=env, store=store)
 
         # Import workbook generation dependencies
         try:
@@ -492,8 +557,11 @@ class EvaluationPipeline:
                 if not eval_path.exists():
                     continue
 
-                with open(eval_path) as f:
-                    evaluation = json.load(f)
+                if store is not None:
+                    evaluation = store.load(eval_path, stage="workbook")
+                else:
+                    with open(eval_path) as f:
+                        evaluation = json.load(f)
 
                 summary = evaluation.get("summary", {})
 
@@ -512,37 +580,111 @@ class EvaluationPipeline:
 
         return output_path
 
+    def write_results_table(
+        self,
+        run_dirs: List[Path],
+        output_path: Path,
+        env: str,
+        store: Optional[DocumentStore] = None,
+        recorded_inputs: Optional[List[Tuple[str, str]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Write the flattened GT evaluations of every run to a Parquet table.
+
+        See framework.results_table for the schema and the loader API.
+
+        Args:
+            run_dirs: Run directories to flatten
+            output_path: Parquet file to write
+            env: Environment name
+            store: Shared DocumentStore for I/O counters
+            recorded_inputs: (path, sha256) of every run file, known unchanged;
+                an existing table built from them is kept
+
+        Returns:
+            Dictionary with output path, row count, number of source files
+            and whether the table was written
+        """
+        from .results_table import write_results_table
+
+        quality_dims, evaluations_key = self._results_table_fields()
+        return write_results_table(
+            run_dirs,
+            output_path,
+            mode=self.mode,
+            env=env,
+            quality_dims=quality_dims,
+            evaluations_key=evaluations_key,
+            store=store,
+            recorded_inputs=recorded_inputs
+        )
+
+    def results_table_builder(
+        self,
+        output_path: Path,
+        env: str,
+        store: Optional[DocumentStore] = None
+    ) -> "ResultsTableBuilder":
+        """
+        A ResultsTableBuilder for this mode, to be fed by aggregate_results.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        from .results_table import ResultsTableBuilder
+
+        quality_dims, evaluations_key = self._results_table_fields()
+        return ResultsTableBuilder(
+            output_path,
+            mode=self.mode,
+            env=env,
+            quality_dims=quality_dims,
+            evaluations_key=evaluations_key,
+            store=store
+        )
+
+    def _results_table_fields(self) -> Tuple[List[str], str]:
+        """Quality columns and evaluations key of this mode's results table."""
+        quality_dims = (
+            self.config.get("quality_scores", {}).get("dimensions")
+            or self.config.get("quality_fields")
+            or []
+        )
+        evaluations_key = self.config.get("evaluation_structure", {}).get(
+            "evaluations_key", "gt_evaluations"
+        )
+        return quality_dims, evaluations_key
+
     def run_full_pipeline(
         self,
         env: str,
         run_dirs: Optional[List[Path]] = None,
-        output_dir: Optional[Path] = None
+        output_dir: Optional[Path] = None,
+        full: bool = False
     ) -> Dict[str, Any]:
         """
-        Run complete pipeline: validate → aggregate → workbook.
+        Run complete pipeline: validate → aggregate + results table → workbook.
+
+        All stages share one DocumentStore; per-stage counters are returned
+        under "io_stats". The aggregation manifest is checked first, and
+        each run file of a key whose inputs changed is decoded once: the
+        merge of its key runs the pre-aggregation content checks, flattens
+        it into the results table and merges it, then drops it. Rows of
+        unchanged keys are copied from the existing results table, so an
+        unchanged rerun parses no run file. Aggregated results are cached
+        for the workbook stage.
 
         Args:
             env: Environment name
-            run_dirs: Run directories to aggregate (auto-discovers if None)
+            run_dirs: Run directories to aggregate (discover_runs if None)
             output_dir: Output directory (defaults to mode_dir/results)
+            full: Re-aggregate every output instead of only changed ones
 
         Returns:
             Dictionary with execution summary
         """
-        # Auto-discover runs if not provided
         if run_dirs is None:
-            env_dir = self.mode_dir / "environments" / env
-            if env_dir.exists():
-                run_dirs = [
-                    d for d in env_dir.iterdir()
-                    if d.is_dir() and (d / "evaluations").exists()
-                ]
-            else:
-                # Legacy structure
-                run_dirs = [
-                    d for d in self.mode_dir.iterdir()
-                    if d.is_dir() and d.name.startswith("run") and (d / "evaluations").exists()
-                ]
+            run_dirs = self.discover_runs(env)
 
         if not run_dirs:
             raise ValueError(f"No evaluation runs found for environment: {env}")
@@ -553,25 +695,49 @@ class EvaluationPipeline:
 
         output_dir = Path(output_dir)
 
-        # Step 1: Validate
+        store = DocumentStore()
+
+        from .aggregation import plan_aggregation
+
+        plan = plan_aggregation(run_dirs, output_dir, full=full)
+
+        # Step 1: Validate (the pre-aggregation gate runs with the merge)
         print(f"Validating {len(run_dirs)} runs...")
         self.validate_prerequisites("pre_eval", env=env)
-        self.validate_runs(run_dirs)
 
-        # Step 2: Aggregate
+        table_path = output_dir / RESULTS_TABLE_NAME
+        try:
+            table = self.results_table_builder(table_path, env, store=store)
+        except ImportError as e:
+            logger.warning(f"Skipping results table: {e}")
+            table, table_path = None, None
+
+        # Step 2: Aggregate, feeding the columnar table
         print(f"Aggregating results to {output_dir}...")
-        agg_summary = self.aggregate_results(run_dirs, output_dir)
+        agg_summary = self.aggregate_results(
+            run_dirs, output_dir, store=store, validate=True, full=full, plan=plan, table=table
+        )
+
+        # Step 3: Columnar table (unchanged keys are copied from the last one)
+        if table is not None:
+            table_summary = table.write(plan.unchanged_files())
+            print(f"Results table: {table_summary['rows']} rows -> {table_path}")
 
-        # Step 3: Generate workbook
+        # Step 4: Generate workbook
         workbook_path = output_dir / f"{self.mode}_{env}.xlsx"
         print(f"Generating workbook: {workbook_path}...")
-        self.generate_workbook(output_dir, workbook_path, env)
+        self.generate_workbook(output_dir, workbook_path, env, store=store)
 
         return {
             "mode": self.mode,
             "env": env,
             "runs_processed": len(run_dirs),
             "output_dir": str(output_dir),
+            "files_written": agg_summary["files_written"],
+            "files_skipped": agg_summary.get("files_skipped", 0),
+            "files_removed": agg_summary.get("files_removed", 0),
             "workbook": str(workbook_path),
+            "results_table": str(table_path) if table_path else None,
+            "io_stats": store.stats(),
             "status": "completed"
         }
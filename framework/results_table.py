@@ -0,0 +1,374 @@
+"""
+Columnar results table of flattened GT evaluations.
+
+Alongside the per-file {contract}/{model}.json tree, the pipeline writes one
+Parquet file with a row per (run, contract, model, gt item). Cross-model and
+cross-run queries then read a single memory-mapped file, with filters on the
+key columns pushed down to row-group statistics instead of opening hundreds
+of JSON files.
+
+Requires pyarrow (pip install pyarrow).
+
+Usage:
+    from framework.results_table import load_results
+
+    df = load_results(path, contract="dpa", tier=["T1", "T2"])
+    df = load_results(path, columns=["model", "gt_id", "detection"],
+                      filters=[("detection_points", ">", 0)])
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .fileio import read_with_fingerprint
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+    from .document_store import DocumentStore
+
+logger = logging.getLogger(__name__)
+
+RESULTS_TABLE_NAME = "_gt_evaluations.parquet"
+
+KEY_COLUMNS = ("mode", "env", "run", "contract", "model", "gt_id", "tier", "detection")
+POINT_COLUMNS = ("detection_points", "quality_points", "total_points")
+
+# Rows are sorted on these so each row group covers a narrow key range
+SORT_COLUMNS = ("contract", "model", "run")
+ROW_GROUP_SIZE = 8192
+
+# Schema metadata key holding the settings and source file hashes of a table
+INPUTS_KEY = b"inputs"
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "pyarrow required for the columnar results table. "
+            "Install with: pip install pyarrow"
+        )
+    return pa, pq
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def flatten_evaluation(
+    evaluation: Dict[str, Any],
+    context: Dict[str, str],
+    quality_dims: Sequence[str],
+    evaluations_key: str = "gt_evaluations"
+) -> List[Dict[str, Any]]:
+    """
+    Flatten one evaluation file into table rows.
+
+    Args:
+        evaluation: Parsed evaluation JSON
+        context: Values for mode, env, run, contract and model
+        quality_dims: Quality score fields to carry as columns
+        evaluations_key: Key holding the per-GT evaluation list
+
+    Returns:
+        One row dict per GT evaluation
+    """
+    rows = []
+    for item in evaluation.get(evaluations_key, []):
+        row = dict(context)
+        row["gt_id"] = item.get("gt_id")
+        row["tier"] = item.get("tier")
+        row["detection"] = item.get("detection")
+        for col in POINT_COLUMNS:
+            row[col] = _number(item.get(col))
+        for dim in quality_dims:
+            row[dim] = _number(item.get(dim))
+        rows.append(row)
+    return rows
+
+
+def table_schema(quality_dims: Sequence[str]) -> "pa.Schema":
+    """Arrow schema for a results table with the given quality columns."""
+    pa, _ = _require_pyarrow()
+    return pa.schema(
+        [(col, pa.string()) for col in KEY_COLUMNS]
+        + [(col, pa.float64()) for col in POINT_COLUMNS]
+        + [(dim, pa.float64()) for dim in quality_dims]
+    )
+
+
+def _file_identity(path: Path) -> str:
+    """run/contract/model of a run file (run_dir/evaluations/contract/model.json)."""
+    path = Path(path)
+    return f"{path.parents[2].name}/{path.parent.name}/{path.stem}"
+
+
+class ResultsTableBuilder:
+    """
+    Builds the results table from evaluations decoded by another stage.
+
+    The pipeline hands the builder to AggregationEngine, which calls add()
+    with each run file it decodes for a merge, so building the table costs
+    no extra read. Files of keys the engine skipped as unchanged are passed
+    to write() with their recorded sha256; their rows are copied from the
+    existing table when it was built from the same file and settings, and
+    only files it cannot supply are decoded here.
+
+    The table's schema metadata records the settings and the sha256 of
+    every source file. A table that needed no add() and no decode is left
+    as it is.
+
+    Usage:
+        builder = ResultsTableBuilder(path, mode="freeform", env="hotfix")
+        builder.add(run_dir, model_file, evaluation, sha256)   # thread-safe
+        summary = builder.write(unchanged_files)
+    """
+
+    def __init__(
+        self,
+        output_path: Path,
+        mode: str,
+        env: str,
+        quality_dims: Sequence[str] = (),
+        evaluations_key: str = "gt_evaluations",
+        store: Optional["DocumentStore"] = None
+    ):
+        """
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        _require_pyarrow()
+        self.output_path = Path(output_path)
+        self.mode = mode
+        self.env = env
+        self.quality_dims = list(quality_dims)
+        self.evaluations_key = evaluations_key
+        self.store = store
+        self._rows: List[Dict[str, Any]] = []
+        self._files: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def settings(self) -> Dict[str, Any]:
+        """The settings every row depends on, recorded with the table."""
+        return {
+            "mode": self.mode,
+            "env": self.env,
+            "quality_dims": self.quality_dims,
+            "evaluations_key": self.evaluations_key,
+        }
+
+    def add(self, run_dir: Path, path: Path, evaluation: Dict[str, Any], sha256: str) -> None:
+        """Flatten one decoded run file into the table."""
+        context = {
+            "mode": self.mode,
+            "env": self.env,
+            "run": Path(run_dir).name,
+            "contract": Path(path).parent.name,
+            "model": Path(path).stem,
+        }
+        rows = flatten_evaluation(evaluation, context, self.quality_dims, self.evaluations_key)
+        with self._lock:
+            self._rows.extend(rows)
+            self._files[str(path)] = sha256
+
+    def add_file(self, path: Path) -> None:
+        """Read, decode and add one run file (logged and skipped if unreadable)."""
+        try:
+            if self.store is not None:
+                evaluation, fingerprint = self.store.load_with_fingerprint(path, stage="results_table")
+            else:
+                raw, fingerprint = read_with_fingerprint(path)
+                evaluation = json.loads(raw)
+        except (ValueError, OSError) as e:
+            logger.error(f"Failed to load {path}: {e}")
+            return
+        self.add(path.parents[2], path, evaluation, fingerprint["sha256"])
+
+    def _recorded(self) -> Optional[Dict[str, Any]]:
+        """{"settings": ..., "files": {path: sha256}} of the existing table, if any."""
+        _, pq = _require_pyarrow()
+        try:
+            metadata = pq.read_schema(self.output_path).metadata or {}
+            return json.loads(metadata[INPUTS_KEY])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def write(self, unchanged_files: Iterable[Tuple[str, str]] = ()) -> Dict[str, Any]:
+        """
+        Write the table from the added files plus unchanged_files.
+
+        Args:
+            unchanged_files: (path, sha256) of run files that were not
+                added, as recorded when they were last read
+
+        Returns:
+            Dictionary with output path, row count, number of source files
+            and whether the table was written
+        """
+        pa, pq = _require_pyarrow()
+        recorded = self._recorded()
+        reusable = {}
+        if recorded is not None and recorded.get("settings") == self.settings:
+            reusable = recorded.get("files", {})
+
+        decoded = bool(self._files)
+        reused: Dict[str, str] = {}
+        for path, sha256 in unchanged_files:
+            if path in self._files:
+                continue
+            if reusable.get(path) == sha256:
+                reused[path] = sha256
+            else:
+                self.add_file(Path(path))
+                decoded = True
+
+        files = {**self._files, **reused}
+        if not decoded and recorded is not None and reused == recorded.get("files"):
+            rows = pq.read_metadata(self.output_path).num_rows
+            logger.info(f"Results table unchanged: {self.output_path}")
+            return {"path": str(self.output_path), "rows": rows, "files": len(files), "written": False}
+
+        schema = table_schema(self.quality_dims)
+        table = pa.Table.from_pylist(self._rows, schema=schema)
+        if reused:
+            table = pa.concat_tables([table, self._reused_rows(reused, schema)])
+        table = table.sort_by([(col, "ascending") for col in SORT_COLUMNS])
+        inputs = json.dumps({"settings": self.settings, "files": files}, sort_keys=True)
+        table = table.replace_schema_metadata({INPUTS_KEY: inputs})
+
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.output_path.with_name(f".{self.output_path.name}.tmp")
+        try:
+            pq.write_table(table, tmp_path, row_group_size=ROW_GROUP_SIZE)
+            tmp_path.replace(self.output_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        logger.info(f"Wrote {table.num_rows} rows from {len(files)} files to {self.output_path}")
+
+        return {"path": str(self.output_path), "rows": table.num_rows, "files": len(files), "written": True}
+
+    def _reused_rows(self, files: Dict[str, str], schema: "pa.Schema") -> "pa.Table":
+        """Rows of the existing table that came from files."""
+        pa, pq = _require_pyarrow()
+        import pyarrow.compute as pc
+
+        existing = pq.read_table(self.output_path, memory_map=True).cast(schema)
+        identity = pc.binary_join_element_wise(existing["run"], existing["contract"], existing["model"], "/")
+        wanted = pa.array(sorted({_file_identity(path) for path in files}), pa.string())
+        return existing.filter(pc.is_in(identity, value_set=wanted))
+
+
+def write_results_table(
+    run_dirs: List[Path],
+    output_path: Path,
+    mode: str,
+    env: str,
+    quality_dims: Sequence[str] = (),
+    evaluations_key: str = "gt_evaluations",
+    store: Optional["DocumentStore"] = None,
+    recorded_inputs: Optional[List[Tuple[str, str]]] = None
+) -> Dict[str, Any]:
+    """
+    Flatten every run evaluation into one Parquet file.
+
+    Given the run files' recorded fingerprints (AggregationPlan.recorded_inputs),
+    rows of files the existing table was built from are kept without
+    reading those files, and a table built from exactly those files is not
+    rewritten. Within the pipeline, ResultsTableBuilder is fed by the
+    aggregation merge instead.
+
+    Args:
+        run_dirs: Run directories, each containing evaluations/{contract}/{model}.json
+        output_path: Parquet file to write (replaced atomically)
+        mode: Evaluation mode recorded on every row
+        env: Environment recorded on every row
+        quality_dims: Quality score fields to carry as columns
+        evaluations_key: Key holding the per-GT evaluation list
+        store: Shared DocumentStore for I/O counters (run files are not cached)
+        recorded_inputs: (path, sha256) of every run file, known unchanged
+
+    Returns:
+        Dictionary with output path, row count, number of source files and
+        whether the table was written
+    """
+    builder = ResultsTableBuilder(output_path, mode, env, quality_dims, evaluations_key, store=store)
+    if recorded_inputs is not None:
+        return builder.write(recorded_inputs)
+
+    for run_dir in run_dirs:
+        eval_dir = run_dir / "evaluations"
+        if not eval_dir.exists():
+            continue
+
+        for contract_dir in sorted(eval_dir.iterdir()):
+            if not contract_dir.is_dir():
+                continue
+
+            for model_file in sorted(contract_dir.glob("*.json")):
+                builder.add_file(model_file)
+
+    return builder.write()
+
+
+def build_filters(
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
+    **predicates: Any
+) -> Optional[List[Tuple[str, str, Any]]]:
+    """
+    Combine explicit filters with column=value predicates (AND-ed).
+
+    A list, tuple or set value becomes an "in" filter; anything else "==".
+    """
+    combined = list(filters or [])
+    for column, value in predicates.items():
+        if isinstance(value, (list, tuple, set, frozenset)):
+            combined.append((column, "in", list(value)))
+        else:
+            combined.append((column, "==", value))
+    return combined or None
+
+
+def read_results_table(
+    path: Path,
+    columns: Optional[Iterable[str]] = None,
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
+    **predicates: Any
+) -> "pa.Table":
+    """
+    Read the results table as an Arrow table, pushing filters down to Parquet.
+
+    Args:
+        path: Parquet file written by write_results_table
+        columns: Columns to read (None = all)
+        filters: pyarrow-style filters, e.g. [("tier", "==", "T1")]
+        **predicates: Column=value shorthands, e.g. contract="dpa", model=["a", "b"]
+    """
+    _, pq = _require_pyarrow()
+    return pq.read_table(
+        path,
+        columns=list(columns) if columns is not None else None,
+        filters=build_filters(filters, **predicates),
+        memory_map=True,
+    )
+
+
+def load_results(
+    path: Path,
+    columns: Optional[Iterable[str]] = None,
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
+    **predicates: Any
+) -> "pd.DataFrame":
+    """Read the results table into a pandas DataFrame (see read_results_table)."""
+    return read_results_table(path, columns, filters, **predicates).to_pandas()
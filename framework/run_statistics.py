@@ -0,0 +1,193 @@
+"""
+Run-to-run statistics for multi-run aggregation.
+
+Each run of a (contract, model) key contributes its per-GT detections,
+quality scores and summary totals. Values are laid out as NumPy arrays
+(runs x gt items [x quality dimensions]) indexed by gt_id, so distributions,
+majority votes and spread are computed column-wise rather than per item.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .scoring.normalisation import normalise_detection
+
+DETECTION_ORDER = ("Y", "P", "N", "NMI")
+DEFAULT_QUALITY_DIMS = ("amendment_score", "rationale_score", "redline_quality_score")
+
+_DETECTION_CODE = {d: i for i, d in enumerate(DETECTION_ORDER)}
+_MISSING = -1
+
+
+def _detection_code(value: Any) -> int:
+    code = _DETECTION_CODE.get(value)
+    if code is not None:
+        return code
+    try:
+        return _DETECTION_CODE[normalise_detection(value)]
+    except ValueError:
+        return _MISSING
+
+
+def _as_float(value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return np.nan
+    return float(value)
+
+
+def _round(value: float) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), 4)
+
+
+def describe(values: np.ndarray) -> Dict[str, Any]:
+    """
+    Summarise a 1-D array, ignoring NaN (missing) entries.
+
+    std is the sample standard deviation (ddof=1); it is 0.0 for a single
+    observation and None when there are none.
+    """
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        return {"n": 0, "mean": None, "median": None, "std": None, "min": None, "max": None}
+
+    return {
+        "n": int(values.size),
+        "mean": _round(np.mean(values)),
+        "median": _round(np.median(values)),
+        "std": _round(np.std(values, ddof=1)) if values.size > 1 else 0.0,
+        "min": _round(np.min(values)),
+        "max": _round(np.max(values)),
+    }
+
+
+def _masked_mean_std(values: np.ndarray, axis: int):
+    """Mean and sample std along axis, skipping NaN without empty-slice warnings."""
+    valid = ~np.isnan(values)
+    count = valid.sum(axis=axis)
+    filled = np.where(valid, values, 0.0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = filled.sum(axis=axis) / count
+        deviations = np.where(valid, values - np.expand_dims(mean, axis), 0.0)
+        std = np.sqrt((deviations ** 2).sum(axis=axis) / (count - 1))
+
+    mean = np.where(count > 0, mean, np.nan)
+    std = np.where(count > 1, std, np.where(count == 1, 0.0, np.nan))
+    return mean, std
+
+
+class RunStatistics:
+    """
+    Collects the scoring fields of each run for one (contract, model) key.
+
+    Only the detection, quality scores and summary totals are kept per run,
+    so the full evaluations can be released as soon as they are added.
+
+    Usage:
+        stats = RunStatistics(quality_dims=["amendment_score", "rationale_score"])
+        for evaluation in run_evaluations:
+            stats.add(evaluation)
+        meta["statistics"] = stats.compute()
+    """
+
+    def __init__(self, quality_dims: Optional[Sequence[str]] = None):
+        self.quality_dims = tuple(DEFAULT_QUALITY_DIMS if quality_dims is None else quality_dims)
+        self._gt_index: Dict[str, int] = {}
+        self._detections: List[Dict[int, int]] = []
+        self._quality: List[Dict[int, List[float]]] = []
+        self._totals: List[List[float]] = []
+
+    @property
+    def num_runs(self) -> int:
+        return len(self._detections)
+
+    def add(self, evaluation: Dict[str, Any]) -> None:
+        """Record one run's evaluation. The evaluation itself is not retained."""
+        detections: Dict[int, int] = {}
+        quality: Dict[int, List[float]] = {}
+
+        for item in evaluation.get("gt_evaluations", []):
+            gt_id = item.get("gt_id")
+            if not gt_id:
+                continue
+            col = self._gt_index.setdefault(gt_id, len(self._gt_index))
+            detections[col] = _detection_code(item.get("detection"))
+            quality[col] = [_as_float(item.get(dim)) for dim in self.quality_dims]
+
+        summary = evaluation.get("summary", {})
+        self._detections.append(detections)
+        self._quality.append(quality)
+        self._totals.append([
+            _as_float(summary.get("total_detection_points")),
+            _as_float(summary.get("total_quality_points")),
+        ])
+
+    def _arrays(self):
+        n_runs, n_items, n_dims = self.num_runs, len(self._gt_index), len(self.quality_dims)
+
+        detection = np.full((n_runs, n_items), _MISSING, dtype=np.int8)
+        quality = np.full((n_runs, n_items, n_dims), np.nan)
+
+        for run, (det, qual) in enumerate(zip(self._detections, self._quality)):
+            if det:
+                cols = np.fromiter(det.keys(), dtype=np.intp, count=len(det))
+                detection[run, cols] = np.fromiter(det.values(), dtype=np.int8, count=len(det))
+                if n_dims:
+                    quality[run, cols] = np.array(list(qual.values()), dtype=float)
+
+        return detection, quality, np.array(self._totals, dtype=float).reshape(n_runs, 2)
+
+    def compute(self) -> Dict[str, Any]:
+        """
+        Compute run-to-run statistics.
+
+        Returns:
+            Dict with num_runs, total_detection_points / total_quality_points
+            distributions, per-dimension distributions of each run's mean
+            quality score, and per gt_id detection counts, majority-vote
+            detection, agreement and quality mean/std across runs.
+        """
+        detection, quality, totals = self._arrays()
+
+        # counts[g, d] = number of runs in which gt item g was scored DETECTION_ORDER[d]
+        counts = np.stack(
+            [(detection == code).sum(axis=0) for code in range(len(DETECTION_ORDER))],
+            axis=1,
+        )
+        observed = counts.sum(axis=1)
+
+        # Ties go to the more conservative detection (later in DETECTION_ORDER)
+        last = len(DETECTION_ORDER) - 1
+        majority = last - np.argmax(counts[:, ::-1], axis=1)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            agreement = counts.max(axis=1, initial=0) / observed
+
+        item_mean, item_std = _masked_mean_std(quality, axis=0)
+        run_mean, _ = _masked_mean_std(quality, axis=1)
+
+        gt_items: Dict[str, Any] = {}
+        for gt_id, col in self._gt_index.items():
+            has_votes = observed[col] > 0
+            gt_items[gt_id] = {
+                "detection_counts": dict(zip(DETECTION_ORDER, counts[col].tolist())),
+                "majority_detection": DETECTION_ORDER[majority[col]] if has_votes else None,
+                "agreement": _round(agreement[col]) if has_votes else None,
+                "quality_mean": {
+                    dim: _round(item_mean[col, d]) for d, dim in enumerate(self.quality_dims)
+                },
+                "quality_std": {
+                    dim: _round(item_std[col, d]) for d, dim in enumerate(self.quality_dims)
+                },
+            }
+
+        return {
+            "num_runs": self.num_runs,
+            "total_detection_points": describe(totals[:, 0]),
+            "total_quality_points": describe(totals[:, 1]),
+            "quality_dimensions": {
+                dim: describe(run_mean[:, d]) for d, dim in enumerate(self.quality_dims)
+            },
+            "gt_items": gt_items,
+        }
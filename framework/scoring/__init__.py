@@ -3,6 +3,9 @@ Scoring module - pure functions for evaluation scoring.
 
 All functions take configuration as explicit parameters.
 No global state, no file I/O, no LLM calls.
+
+The numpy-backed batch scorer is imported on first use, so importing the
+package (e.g. for clause normalisation in the validators) does not load numpy.
 """
 
 from .normalisation import (
@@ -16,9 +19,30 @@ from .detection import (
     Tier,
 )
 from .quality import validate_quality_score
-from .recall import calculate_recall, calculate_weighted_recall
+from .recall import calculate_recall, calculate_weighted_recall, weighted_recall_points
 from .precision import calculate_precision
 from .f1 import calculate_f1
+from .output_view import OutputView, as_output_view
+from .clause_index import ClauseIndex, Candidate
+from .matcher import PhraseMatcher, GTItemMatcher, compile_phrases
+
+_BATCH_NAMES = frozenset({
+    "compile_points_matrix",
+    "encode_detections",
+    "encode_tiers",
+    "score_batch",
+    "score_issues",
+    "PointsMatrix",
+    "BatchScores",
+})
+
+
+def __getattr__(name):
+    if name in _BATCH_NAMES:
+        from . import batch
+        return getattr(batch, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # Normalisation
@@ -34,8 +58,27 @@ __all__ = [
     # Recall
     "calculate_recall",
     "calculate_weighted_recall",
+    "weighted_recall_points",
     # Precision
     "calculate_precision",
     # F1
     "calculate_f1",
+    # Output view
+    "OutputView",
+    "as_output_view",
+    # Clause index
+    "ClauseIndex",
+    "Candidate",
+    # Phrase matching
+    "PhraseMatcher",
+    "GTItemMatcher",
+    "compile_phrases",
+    # Batch
+    "compile_points_matrix",
+    "encode_detections",
+    "encode_tiers",
+    "score_batch",
+    "score_issues",
+    "PointsMatrix",
+    "BatchScores",
 ]
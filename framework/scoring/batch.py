@@ -0,0 +1,192 @@
+"""Vectorised detection scoring over arrays of tier and detection codes."""
+
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+import numpy as np
+
+DETECTION_ORDER = ("Y", "P", "N", "NMI")
+
+# Code for a tier or detection not in the vocabulary. As an index it selects
+# the extra last row/column of the points matrix, which scores 0.
+UNKNOWN = -1
+
+_DETECTION_CODE = {d: i for i, d in enumerate(DETECTION_ORDER)}
+
+
+@dataclass(frozen=True, eq=False)
+class PointsMatrix:
+    """
+    Precompiled tier_config.
+
+    points[t, d] holds the points for tier t and detection DETECTION_ORDER[d];
+    max_points[t] the points for a Y on tier t. Both have one extra trailing
+    entry for UNKNOWN codes. integer_max is True when every max_points
+    value came from an int, so max totals can be reported as ints like the
+    scalar sums they replace.
+    """
+    tiers: tuple[str, ...]
+    points: np.ndarray
+    max_points: np.ndarray
+    integer_max: bool = False
+
+    def tier_code(self, tier: str) -> int:
+        try:
+            return self.tiers.index(tier)
+        except ValueError:
+            return UNKNOWN
+
+
+@dataclass(frozen=True, eq=False)
+class BatchScores:
+    """Result of score_batch."""
+    points: np.ndarray
+    max_points: np.ndarray
+    total_points: float
+    max_total: float
+    weighted_recall: float
+
+
+def compile_points_matrix(
+    tier_config: dict[str, dict[str, float]],
+    default_max: float = 1,
+) -> PointsMatrix:
+    """
+    Compile a tier_config into a PointsMatrix.
+
+    Args:
+        tier_config: Mapping from tier to detection values
+            e.g., {"T1": {"Y": 8, "P": 4, "N": 0, "NMI": 0}, ...}. Entries
+            that are not mappings (the per-dimension ints of the rules
+            mode's detection_points) are not tiers and are skipped.
+        default_max: Max points for a tier without a Y entry, and for
+            unknown tiers (calculate_weighted_recall uses 1)
+
+    Returns:
+        PointsMatrix for score_batch.
+    """
+    tiers = tuple(tier for tier, tier_points in tier_config.items() if isinstance(tier_points, dict))
+    points = np.zeros((len(tiers) + 1, len(DETECTION_ORDER) + 1), dtype=float)
+    max_points = np.full(len(tiers) + 1, float(default_max))
+    max_values = [default_max]
+
+    for t, tier in enumerate(tiers):
+        tier_points = tier_config[tier]
+        for d, detection in enumerate(DETECTION_ORDER):
+            points[t, d] = tier_points.get(detection, 0)
+        max_values.append(tier_points.get("Y", default_max))
+        max_points[t] = max_values[-1]
+
+    points.setflags(write=False)
+    max_points.setflags(write=False)
+    return PointsMatrix(
+        tiers=tiers,
+        points=points,
+        max_points=max_points,
+        integer_max=all(isinstance(v, int) and not isinstance(v, bool) for v in max_values),
+    )
+
+
+def encode_detections(values: Iterable[str], strict: bool = False) -> np.ndarray:
+    """
+    Map detection symbols to codes (index into DETECTION_ORDER).
+
+    Symbols must already be canonical (see normalise_detection); anything
+    else becomes UNKNOWN, or raises ValueError if strict.
+    """
+    codes = []
+    for value in values:
+        code = _DETECTION_CODE.get(value, UNKNOWN)
+        if code == UNKNOWN and strict:
+            raise ValueError(
+                f"Invalid detection value: {value!r}. "
+                f"Expected one of: Y, P, N, NMI"
+            )
+        codes.append(code)
+    return np.array(codes, dtype=np.intp)
+
+
+def encode_tiers(
+    values: Iterable[str],
+    matrix: PointsMatrix,
+    strict: bool = False,
+) -> np.ndarray:
+    """
+    Map tier labels to row indices of matrix.
+
+    Tiers missing from the compiled config become UNKNOWN, or raise
+    ValueError if strict.
+    """
+    lookup = {tier: t for t, tier in enumerate(matrix.tiers)}
+    codes = []
+    for value in values:
+        code = lookup.get(value, UNKNOWN)
+        if code == UNKNOWN and strict:
+            raise ValueError(
+                f"Unknown tier: {value!r}. "
+                f"Expected one of: {list(matrix.tiers)}"
+            )
+        codes.append(code)
+    return np.array(codes, dtype=np.intp)
+
+
+def _sequential_sum(values: np.ndarray) -> float:
+    # cumsum accumulates left to right like the scalar loops, so float totals
+    # match them exactly (np.sum uses pairwise summation)
+    return float(np.cumsum(values)[-1]) if values.size else 0.0
+
+
+def score_batch(
+    tier_codes: np.ndarray,
+    detection_codes: np.ndarray,
+    matrix: PointsMatrix,
+) -> BatchScores:
+    """
+    Score many GT items in one call.
+
+    Matches calculate_detection_points per item and calculate_weighted_recall
+    in aggregate (with the default default_max=1).
+
+    Args:
+        tier_codes: Tier codes from encode_tiers
+        detection_codes: Detection codes from encode_detections
+        matrix: Compiled tier_config
+
+    Returns:
+        BatchScores with per-item points and max points, their totals, and
+        weighted recall (0.0 if max total is 0).
+    """
+    tier_codes = np.asarray(tier_codes, dtype=np.intp)
+    detection_codes = np.asarray(detection_codes, dtype=np.intp)
+
+    points = matrix.points[tier_codes, detection_codes]
+    max_points = matrix.max_points[tier_codes]
+
+    total_points = _sequential_sum(points)
+    max_total = _sequential_sum(max_points)
+    weighted_recall = total_points / max_total if max_total > 0 else 0.0
+
+    return BatchScores(
+        points=points,
+        max_points=max_points,
+        total_points=total_points,
+        max_total=max_total,
+        weighted_recall=weighted_recall,
+    )
+
+
+def score_issues(
+    scored_issues: Sequence[dict],
+    matrix: PointsMatrix,
+    detection_field: str = "detection",
+    tier_field: str = "gt_tier",
+) -> BatchScores:
+    """
+    Encode and score a list of issue dicts.
+
+    Defaults mirror calculate_weighted_recall: a missing tier is T3 and a
+    missing detection NMI.
+    """
+    tier_codes = encode_tiers((i.get(tier_field, "T3") for i in scored_issues), matrix)
+    detection_codes = encode_detections(i.get(detection_field, "NMI") for i in scored_issues)
+    return score_batch(tier_codes, detection_codes, matrix)
@@ -0,0 +1,160 @@
+"""
+Inverted clause index over a canonical JSON.
+
+Matching GT items to Leah outputs by clause used to mean scanning every
+risk_table, proposed_redlines and new_clauses_proposed entry for every GT
+item. ClauseIndex is built once per canonical JSON and maps clause keys
+(as compared by clause_refs_match) and article numbers to entries, so a GT
+item's candidates are a few dictionary lookups.
+"""
+
+from dataclasses import dataclass
+
+from .clauses import (
+    clause_article,
+    clause_match_key,
+    clause_refs_match,
+    clause_refs_same_article,
+    split_clause_refs,
+)
+from .concepts import get_detection_strategy, should_search_section
+from .output_view import OutputView
+
+SECTIONS = ("risk_table", "proposed_redlines", "new_clauses_proposed")
+
+# Strategies that match on content anywhere, not on clause reference
+_CLAUSE_AGNOSTIC = ("pattern_match", "any_mention")
+
+
+@dataclass(frozen=True)
+class Candidate:
+    """A canonical JSON entry that may match a GT item."""
+    section: str
+    position: int
+    entry: OutputView
+    match: str  # "exact", "article" or "section"
+
+
+class ClauseIndex:
+    """
+    Clause lookups for one canonical JSON.
+
+    Candidates for a GT item, in order:
+    - "exact": entries whose clause_ref matches one of the GT clause refs
+    - "article": other entries in the same top-level article
+    - "section": entries without a clause_ref in new_clauses_proposed (for
+      new_clause_recommendation items), or every searchable entry for
+      pattern_match / any_mention items
+
+    Only sections allowed by should_search_section are returned.
+
+    Usage:
+        index = ClauseIndex(canonical_json)
+        for gt_item in gt_items:
+            for candidate in index.candidates(gt_item):
+                ...
+    """
+
+    def __init__(self, canonical_json: dict):
+        self.entries: list[list[OutputView]] = [
+            [OutputView(e) for e in canonical_json.get(section) or []]
+            for section in SECTIONS
+        ]
+
+        self._by_key: dict[str, set[tuple[int, int]]] = {}
+        self._by_article: dict[str, set[tuple[int, int]]] = {}
+        self._unreferenced: set[tuple[int, int]] = set()
+
+        for s, entries in enumerate(self.entries):
+            for p, entry in enumerate(entries):
+                ref = entry.get("clause_ref") or ""
+                if not ref:
+                    self._unreferenced.add((s, p))
+                    continue
+                self._by_key.setdefault(clause_match_key(ref), set()).add((s, p))
+                article = clause_article(ref)
+                if article:
+                    self._by_article.setdefault(article, set()).add((s, p))
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self.entries)
+
+    def lookup(self, clause_ref: str) -> list[Candidate]:
+        """Entries whose clause_ref matches clause_ref, in document order."""
+        hits = self._by_key.get(clause_match_key(clause_ref), set())
+        return [self._candidate(sp, "exact") for sp in sorted(hits)]
+
+    def lookup_article(self, article: str) -> list[Candidate]:
+        """Entries in a top-level article, in document order."""
+        hits = self._by_article.get(article, set())
+        return [self._candidate(sp, "article") for sp in sorted(hits)]
+
+    def candidates(self, gt_item: dict, clause_field: str = "clause") -> list[Candidate]:
+        """Entries a GT item should be compared against (see class docstring)."""
+        allowed = {
+            s for s, section in enumerate(SECTIONS) if should_search_section(gt_item, section)
+        }
+
+        if get_detection_strategy(gt_item) in _CLAUSE_AGNOSTIC:
+            return [
+                self._candidate((s, p), "section")
+                for s in sorted(allowed) for p in range(len(self.entries[s]))
+            ]
+
+        exact: set[tuple[int, int]] = set()
+        article: set[tuple[int, int]] = set()
+        for ref in split_clause_refs(gt_item.get(clause_field) or ""):
+            exact |= self._by_key.get(clause_match_key(ref), set())
+            art = clause_article(ref)
+            if art:
+                article |= self._by_article.get(art, set())
+        article -= exact
+
+        section: set[tuple[int, int]] = set()
+        if get_detection_strategy(gt_item) == "new_clause_recommendation":
+            new_clauses = SECTIONS.index("new_clauses_proposed")
+            section = {sp for sp in self._unreferenced if sp[0] == new_clauses}
+
+        return [
+            self._candidate(sp, match)
+            for hits, match in ((exact, "exact"), (article, "article"), (section, "section"))
+            for sp in sorted(hits)
+            if sp[0] in allowed
+        ]
+
+    def _candidate(self, sp: tuple[int, int], match: str) -> Candidate:
+        s, p = sp
+        return Candidate(SECTIONS[s], p, self.entries[s][p], match)
+
+
+def linear_candidates(
+    canonical_json: dict,
+    gt_item: dict,
+    clause_field: str = "clause",
+) -> list[Candidate]:
+    """
+    Reference implementation of ClauseIndex.candidates by full scan.
+
+    Compares the GT item with every entry; kept for tests and the benchmark.
+    """
+    strategy = get_detection_strategy(gt_item)
+    refs = split_clause_refs(gt_item.get(clause_field) or "")
+    buckets: dict[str, list[Candidate]] = {"exact": [], "article": [], "section": []}
+
+    for section in SECTIONS:
+        if not should_search_section(gt_item, section):
+            continue
+        for p, entry in enumerate(canonical_json.get(section) or []):
+            view = OutputView(entry)
+            ref = entry.get("clause_ref") or ""
+            if strategy in _CLAUSE_AGNOSTIC:
+                buckets["section"].append(Candidate(section, p, view, "section"))
+            elif ref and any(clause_refs_match(ref, r) for r in refs):
+                buckets["exact"].append(Candidate(section, p, view, "exact"))
+            elif ref and any(clause_refs_same_article(ref, r) for r in refs):
+                buckets["article"].append(Candidate(section, p, view, "article"))
+            elif (not ref and section == "new_clauses_proposed"
+                  and strategy == "new_clause_recommendation"):
+                buckets["section"].append(Candidate(section, p, view, "section"))
+
+    return buckets["exact"] + buckets["article"] + buckets["section"]
@@ -0,0 +1,62 @@
+"""Clause reference normalisation."""
+
+import re
+from typing import Optional
+
+_CLAUSE_PREFIXES = ("Section ", "Clause ", "Article ", "§ ", "§")
+_CLAUSE_NUMBER = re.compile(r'^(\d+(?:\.\d+)*)')
+_ARTICLE_NUMBER = re.compile(r'^(\d+)')
+_CLAUSE_SEPARATOR = re.compile(r'\s+/\s+|\s*[,;]\s*')
+
+
+def normalise_clause_ref(clause: str) -> str:
+    """
+    Normalise a clause reference for scope matching.
+
+    Strips a leading Section/Clause/Article/§ prefix and returns the dotted
+    clause number ("Section 4.2(a)" -> "4.2"), or the lower-cased first word
+    if there is no number.
+    """
+    if not clause:
+        return ""
+    text = clause.strip()
+    for prefix in _CLAUSE_PREFIXES:
+        if text.lower().startswith(prefix.lower()):
+            text = text[len(prefix):].strip()
+    match = _CLAUSE_NUMBER.match(text)
+    return match.group(1).lower() if match else text.split()[0].lower() if text else ""
+
+
+def clause_match_key(clause: str) -> str:
+    """Key under which clause_refs_match treats references as equal."""
+    c = clause.lower().replace("section", "").replace("clause", "").strip()
+    match = _CLAUSE_NUMBER.match(c)
+    return match.group(1) if match else c
+
+
+def clause_refs_match(clause1: str, clause2: str) -> bool:
+    """True if two clause references name the same clause number."""
+    return clause_match_key(clause1) == clause_match_key(clause2)
+
+
+def clause_article(clause: str) -> Optional[str]:
+    """Top-level article number of a clause reference ("Section 4.2" -> "4")."""
+    match = _ARTICLE_NUMBER.match(clause.replace("Section", "").replace("Clause", "").strip())
+    return match.group(1) if match else None
+
+
+def clause_refs_same_article(clause1: str, clause2: str) -> bool:
+    """True if two clause references share a top-level article number."""
+    a1, a2 = clause_article(clause1), clause_article(clause2)
+    return a1 and a2 and a1 == a2
+
+
+def split_clause_refs(clause: str) -> list[str]:
+    """
+    Split a GT clause field that names several clauses.
+
+    "9.1 / 9.2" -> ["9.1", "9.2"]; "N/A (Missing)" is left whole.
+    """
+    if not clause:
+        return []
+    return [part for part in _CLAUSE_SEPARATOR.split(clause.strip()) if part]
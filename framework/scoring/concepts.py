@@ -6,10 +6,18 @@ Supports:
 - detection_logic field: Different matching strategies based on GT item type
 """
 
-from typing import Optional
+from typing import Optional, Union
 
+from .output_view import OutputView
+from .matcher import (
+    combined_output_text,
+    compile_phrases,
+    concept_phrases,
+    score_concepts,
+)
 
-def matches_output_patterns(gt_item: dict, leah_output: dict) -> bool:
+
+def matches_output_patterns(gt_item: dict, leah_output: Union[dict, OutputView]) -> bool:
     """
     Check if Leah output matches expected_output_patterns.
 
@@ -17,7 +25,7 @@ def matches_output_patterns(gt_item: dict, leah_output: dict) -> bool:
 
     Args:
         gt_item: Ground truth item with optional 'expected_output_patterns' field
-        leah_output: Leah output item to check against patterns
+        leah_output: Leah output item (dict or OutputView) to check against patterns
 
     Returns:
         True if at least one pattern matches
@@ -27,30 +35,23 @@ def matches_output_patterns(gt_item: dict, leah_output: dict) -> bool:
     if not patterns:
         return False
 
-    # Combine all Leah output text
-    output_text = " ".join([
-        leah_output.get("clause_name", ""),
-        leah_output.get("rationale", ""),
-        leah_output.get("proposed_text", ""),
-        leah_output.get("issue_summary", ""),
-        leah_output.get("clause_summary", ""),
-        leah_output.get("detailed_reasoning", ""),
-    ]).lower()
+    # Single scan of all Leah output text for every pattern
+    hits = compile_phrases(tuple(patterns)).scan_lowered(combined_output_text(leah_output))
 
     # Check how many patterns match
-    matched = sum(1 for p in patterns if p.lower() in output_text)
+    matched = sum(1 for p in patterns if p.lower() in hits)
 
     # Require at least one pattern match
     return matched >= 1
 
 
-def calculate_pattern_match_score(gt_item: dict, leah_output: dict) -> float:
+def calculate_pattern_match_score(gt_item: dict, leah_output: Union[dict, OutputView]) -> float:
     """
     Calculate pattern match score as fraction of patterns found.
 
     Args:
         gt_item: Ground truth item with expected_output_patterns
-        leah_output: Leah output item to score
+        leah_output: Leah output item (dict or OutputView) to score
 
     Returns:
         Score 0.0-1.0 representing fraction of patterns matched
@@ -59,17 +60,9 @@ def calculate_pattern_match_score(gt_item: dict, leah_output: dict) -> float:
     if not patterns:
         return 0.0
 
-    # Combine all Leah output text
-    output_text = " ".join([
-        leah_output.get("clause_name", ""),
-        leah_output.get("rationale", ""),
-        leah_output.get("proposed_text", ""),
-        leah_output.get("issue_summary", ""),
-        leah_output.get("clause_summary", ""),
-        leah_output.get("detailed_reasoning", ""),
-    ]).lower()
-
-    matched = sum(1 for p in patterns if p.lower() in output_text)
+    hits = compile_phrases(tuple(patterns)).scan_lowered(combined_output_text(leah_output))
+
+    matched = sum(1 for p in patterns if p.lower() in hits)
     return matched / len(patterns)
 
 
@@ -114,24 +107,10 @@ def assess_concept_coverage(
             "detection_level": "Y"
         }
 
-    reasoning_lower = reasoning.lower()
-    matched = []
-    missing = []
-    total_score = 0.0
-
-    for concept in required_concepts:
-        concept_lower = concept.lower()
-
-        if concept_lower in reasoning_lower:
-            # Full concept match
-            matched.append(concept)
-            total_score += 1.0
-        elif not strict and any(word in reasoning_lower for word in concept_lower.split()):
-            # Partial match: at least one word from multi-word concept
-            matched.append(f"{concept} (partial)")
-            total_score += 0.5
-        else:
-            missing.append(concept)
+    # Concepts and their words are matched in one scan; a full concept match
+    # scores 1.0, a partial (at least one word, non-strict) 0.5
+    hits = compile_phrases(tuple(concept_phrases(required_concepts))).scan(reasoning)
+    total_score, matched, missing = score_concepts(required_concepts, hits, strict)
 
     coverage = min(total_score / len(required_concepts), 1.0)
 
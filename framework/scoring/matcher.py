@@ -0,0 +1,215 @@
+"""
+Compiled case-insensitive phrase matching.
+
+Pattern, concept and reasoning checks all ask the same question: which of a
+fixed set of phrases occur (case-insensitively) as substrings of a text.
+PhraseMatcher answers it for every phrase with one regex scan of the text
+instead of one substring scan per phrase. GTItemMatcher compiles all the
+phrases a GT item checks for into one matcher.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, Optional, Union
+
+from .output_view import OutputView, as_output_view
+
+
+def combined_output_text(leah_output: Union[dict, OutputView]) -> str:
+    """The pattern-searchable Leah output fields joined, lower-cased."""
+    return as_output_view(leah_output).combined_lower
+
+
+def reasoning_text(leah_output: Union[dict, OutputView]) -> str:
+    """rationale + " " + detailed_reasoning, lower-cased."""
+    return as_output_view(leah_output).reasoning_text_lower
+
+
+class PhraseMatcher:
+    """
+    Finds which of a fixed set of phrases occur in a text.
+
+    Matching is `phrase.lower() in text.lower()` for every phrase, done in a
+    single pass. The regex is a lookahead alternation tried at every position
+    with longer phrases first; a phrase hidden at some position by a longer
+    one it is a prefix of is recovered because every phrase found implies
+    all phrases that are substrings of it.
+
+    Usage:
+        matcher = PhraseMatcher(["Liability", "limitation of liability"])
+        matcher.scan("The Limitation of Liability clause...")
+        # frozenset({"liability", "limitation of liability"})
+    """
+
+    __slots__ = ("phrases", "_regex", "_implied", "_always")
+
+    def __init__(self, phrases: Iterable[str]):
+        lowered = {p.lower() for p in phrases}
+        self.phrases = frozenset(lowered)
+
+        # The empty string is in every text
+        self._always = frozenset(p for p in lowered if not p)
+        needles = sorted((p for p in lowered if p), key=lambda p: (-len(p), p))
+
+        self._regex: Optional[re.Pattern] = None
+        if needles:
+            alternation = "|".join(re.escape(p) for p in needles)
+            self._regex = re.compile(f"(?=({alternation}))", re.DOTALL)
+
+        self._implied = {
+            p: frozenset(q for q in needles if q in p) for p in needles
+        }
+
+    def scan(self, text: str) -> frozenset[str]:
+        """Return the lower-cased phrases that occur in text."""
+        return self.scan_lowered(text.lower())
+
+    def scan_lowered(self, text_lower: str) -> frozenset[str]:
+        """scan() for text that is already lower-cased (e.g. from OutputView)."""
+        if self._regex is None:
+            return self._always
+
+        found = set(self._always)
+        seen = set()
+        for m in self._regex.finditer(text_lower):
+            phrase = m.group(1)
+            if phrase not in seen:
+                seen.add(phrase)
+                found |= self._implied[phrase]
+                if len(found) == len(self.phrases):
+                    break
+        return frozenset(found)
+
+
+@lru_cache(maxsize=4096)
+def compile_phrases(phrases: tuple[str, ...]) -> PhraseMatcher:
+    """Return a cached PhraseMatcher for a tuple of phrases."""
+    return PhraseMatcher(phrases)
+
+
+def concept_phrases(concepts: Iterable[str]) -> list[str]:
+    """Phrases needed to score concepts: each concept and each of its words."""
+    phrases = []
+    for concept in concepts:
+        phrases.append(concept)
+        phrases.extend(concept.lower().split())
+    return phrases
+
+
+def score_concepts(
+    concepts: list[str],
+    hits: frozenset[str],
+    strict: bool = False,
+) -> tuple[float, list[str], list[str]]:
+    """
+    Score required concepts against scan hits.
+
+    A full concept match scores 1.0; unless strict, a concept with at least
+    one of its words present scores 0.5.
+
+    Returns:
+        (total_score, matched, missing), matched marking partials "(partial)"
+    """
+    total_score = 0.0
+    matched = []
+    missing = []
+
+    for concept in concepts:
+        concept_lower = concept.lower()
+        if concept_lower in hits:
+            matched.append(concept)
+            total_score += 1.0
+        elif not strict and any(word in hits for word in concept_lower.split()):
+            matched.append(f"{concept} (partial)")
+            total_score += 0.5
+        else:
+            missing.append(concept)
+
+    return total_score, matched, missing
+
+
+class GTItemMatcher:
+    """
+    Every phrase check for one GT item, compiled once.
+
+    Covers expected_output_patterns, required_concepts (with word-level
+    partial matches) and reasoning_must_contain / reasoning_must_not_contain.
+    Each text is scanned once; all checks read from the resulting hit set.
+
+    Usage:
+        matcher = GTItemMatcher(gt_item)
+        for leah_output in outputs:
+            score = matcher.pattern_match_score(leah_output)
+    """
+
+    __slots__ = ("patterns", "concepts", "must_contain", "must_not_contain", "_matcher")
+
+    def __init__(self, gt_item: dict):
+        self.patterns = list(gt_item.get("expected_output_patterns") or [])
+        self.concepts = list(gt_item.get("required_concepts") or [])
+        self.must_contain = list(gt_item.get("reasoning_must_contain") or [])
+        self.must_not_contain = list(gt_item.get("reasoning_must_not_contain") or [])
+
+        self._matcher = PhraseMatcher(
+            self.patterns
+            + concept_phrases(self.concepts)
+            + self.must_contain
+            + self.must_not_contain
+        )
+
+    def scan(self, text: str) -> frozenset[str]:
+        """Return every compiled phrase (lower-cased) that occurs in text."""
+        return self._matcher.scan(text)
+
+    def pattern_hits(self, leah_output: Union[dict, OutputView]) -> list[str]:
+        """expected_output_patterns found in the combined output text."""
+        hits = self._matcher.scan_lowered(combined_output_text(leah_output))
+        return [p for p in self.patterns if p.lower() in hits]
+
+    def matches_output_patterns(self, leah_output: Union[dict, OutputView]) -> bool:
+        """Same result as concepts.matches_output_patterns."""
+        return bool(self.patterns) and bool(self.pattern_hits(leah_output))
+
+    def pattern_match_score(self, leah_output: Union[dict, OutputView]) -> float:
+        """Same result as concepts.calculate_pattern_match_score."""
+        if not self.patterns:
+            return 0.0
+        return len(self.pattern_hits(leah_output)) / len(self.patterns)
+
+    def concept_coverage(self, reasoning: str, strict: bool = False) -> dict:
+        """Same result as concepts.assess_concept_coverage for required_concepts."""
+        if not self.concepts:
+            return {
+                "coverage": 1.0,
+                "matched_concepts": [],
+                "missing_concepts": [],
+                "detection_level": "Y"
+            }
+
+        total_score, matched, missing = score_concepts(
+            self.concepts, self.scan(reasoning), strict
+        )
+        coverage = min(total_score / len(self.concepts), 1.0)
+
+        return {
+            "coverage": coverage,
+            "matched_concepts": matched,
+            "missing_concepts": missing,
+            "detection_level": "Y" if coverage >= 0.5 else "P"
+        }
+
+    def detection_level(self, leah_output: Union[dict, OutputView]) -> str:
+        """Same result as polarity.assess_detection_level for a matched output."""
+        if not self.concepts:
+            return "Y"
+
+        hits = self._matcher.scan_lowered(reasoning_text(leah_output))
+        matched = sum(1 for concept in self.concepts if concept.lower() in hits)
+        return "Y" if matched / len(self.concepts) >= 0.5 else "P"
+
+    def validate_reasoning(self, reasoning: str) -> dict:
+        """Same result as reasoning.validate_reasoning for the item's phrases."""
+        from .reasoning import reasoning_result
+
+        hits = self.scan(reasoning)
+        return reasoning_result(self.must_contain, self.must_not_contain, hits)
@@ -0,0 +1,159 @@
+"""
+Cached normalised-text view of a Leah output item.
+
+One canonical-JSON output item is typically scored against every GT entry
+of its contract. OutputView wraps the item and lower-cases, joins and
+tokenises its text fields on first use only, so repeated scoring reuses
+the same strings. All scorers accept either a plain dict or an OutputView.
+"""
+
+from typing import Any, Optional, Union
+
+from .clauses import normalise_clause_ref
+
+# Leah output fields searched by expected_output_patterns
+OUTPUT_TEXT_FIELDS = (
+    "clause_name",
+    "rationale",
+    "proposed_text",
+    "issue_summary",
+    "clause_summary",
+    "detailed_reasoning",
+)
+
+# Logical fields with the fallbacks the validators use
+_DERIVED_FIELDS = {
+    "action": ("action", "recommendation"),
+    "revision": ("proposed_text", "redline_text"),
+    "reasoning": ("rationale", "detailed_reasoning"),
+}
+
+
+class OutputView:
+    """
+    Read-only wrapper around a Leah output item with memoised text forms.
+
+    Behaves like the wrapped dict for get(), [] and `in`, and is falsy when
+    the item is empty. Derived values are computed once per view.
+
+    Usage:
+        view = OutputView(item)
+        view.lower("revision")   # proposed_text (or redline_text), lower-cased
+        view.combined_lower      # all pattern-searchable fields, lower-cased
+        view.tokens              # set of lower-cased words in combined text
+        view.clause_ref_norm     # "Section 4.2(a)" -> "4.2"
+    """
+
+    __slots__ = ("item", "_lower", "_words", "_combined", "_reasoning_text",
+                 "_tokens", "_clause_ref_norm")
+
+    def __init__(self, item: dict):
+        self.item = item
+        self._lower: dict[str, str] = {}
+        self._words: dict[tuple[str, int], frozenset[str]] = {}
+        self._combined: Optional[str] = None
+        self._reasoning_text: Optional[str] = None
+        self._tokens: Optional[frozenset[str]] = None
+        self._clause_ref_norm: Optional[str] = None
+
+    # --- dict-like access -------------------------------------------------
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.item.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.item[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.item
+
+    def __bool__(self) -> bool:
+        return bool(self.item)
+
+    def __repr__(self) -> str:
+        return f"OutputView({self.item!r})"
+
+    # --- raw and lower-cased fields ----------------------------------------
+
+    def field(self, name: str) -> Any:
+        """
+        Value of a field. "action", "revision" and "reasoning" resolve to
+        action/recommendation, proposed_text/redline_text and
+        rationale/detailed_reasoning respectively.
+        """
+        if name in _DERIVED_FIELDS:
+            primary, fallback = _DERIVED_FIELDS[name]
+            return self.item.get(primary, self.item.get(fallback, ""))
+        return self.item.get(name, "")
+
+    @property
+    def action(self) -> Any:
+        return self.field("action")
+
+    @property
+    def revision(self) -> Any:
+        return self.field("revision")
+
+    @property
+    def reasoning(self) -> Any:
+        return self.field("reasoning")
+
+    def lower(self, name: str) -> str:
+        """Lower-cased field value ("" if missing or empty)."""
+        value = self._lower.get(name)
+        if value is None:
+            value = (self.field(name) or "").lower()
+            self._lower[name] = value
+        return value
+
+    def words(self, name: str, min_len: int = 4) -> frozenset[str]:
+        """Lower-cased words of a field with at least min_len characters."""
+        key = (name, min_len)
+        words = self._words.get(key)
+        if words is None:
+            words = frozenset(
+                w.lower() for w in (self.field(name) or "").split() if len(w) >= min_len
+            )
+            self._words[key] = words
+        return words
+
+    # --- combined texts -----------------------------------------------------
+
+    @property
+    def combined_lower(self) -> str:
+        """OUTPUT_TEXT_FIELDS joined with spaces, lower-cased."""
+        if self._combined is None:
+            self._combined = " ".join(
+                self.item.get(f, "") for f in OUTPUT_TEXT_FIELDS
+            ).lower()
+        return self._combined
+
+    @property
+    def reasoning_text_lower(self) -> str:
+        """rationale + " " + detailed_reasoning, lower-cased."""
+        if self._reasoning_text is None:
+            self._reasoning_text = (
+                self.item.get("rationale", "") + " " + self.item.get("detailed_reasoning", "")
+            ).lower()
+        return self._reasoning_text
+
+    @property
+    def tokens(self) -> frozenset[str]:
+        """Whitespace-separated words of combined_lower."""
+        if self._tokens is None:
+            self._tokens = frozenset(self.combined_lower.split())
+        return self._tokens
+
+    @property
+    def clause_ref_norm(self) -> str:
+        """clause_ref normalised with normalise_clause_ref."""
+        if self._clause_ref_norm is None:
+            self._clause_ref_norm = normalise_clause_ref(self.item.get("clause_ref", ""))
+        return self._clause_ref_norm
+
+
+def as_output_view(item: Union[dict, OutputView, None]) -> Optional[OutputView]:
+    """Wrap a Leah output item, passing OutputViews and None through."""
+    if item is None or isinstance(item, OutputView):
+        return item
+    return OutputView(item)
@@ -8,6 +8,7 @@ Handles both standard (negative) and compliance (positive) polarity items:
 
 from typing import Optional
 from .classification import is_issue_detected
+from .matcher import compile_phrases, concept_phrases, reasoning_text, score_concepts
 
 
 def assign_detection_with_polarity(gt_item: dict, matches: list[dict]) -> str:
@@ -64,7 +65,7 @@ def assess_detection_level(gt_item: dict, match: dict) -> str:
 
     Args:
         gt_item: Ground truth item with optional 'required_concepts' field
-        match: Matched Leah output with reasoning text
+        match: Match whose "item" is the Leah output (dict or OutputView)
 
     Returns:
         "Y" if sufficient concept coverage (>=50% or no requirements)
@@ -77,10 +78,9 @@ def assess_detection_level(gt_item: dict, match: dict) -> str:
         return "Y"
 
     # Check concept coverage in reasoning
-    reasoning = match["item"].get("rationale", "") + " " + match["item"].get("detailed_reasoning", "")
-    reasoning_lower = reasoning.lower()
+    hits = compile_phrases(tuple(required_concepts)).scan_lowered(reasoning_text(match["item"]))
 
-    matched_concepts = sum(1 for concept in required_concepts if concept.lower() in reasoning_lower)
+    matched_concepts = sum(1 for concept in required_concepts if concept.lower() in hits)
     coverage = matched_concepts / len(required_concepts)
 
     if coverage >= 0.5:
@@ -103,17 +103,9 @@ def calculate_concept_coverage(required_concepts: list[str], reasoning: str) ->
     if not required_concepts:
         return 1.0  # No requirements = full coverage
 
-    reasoning_lower = reasoning.lower()
-    matched = 0.0
-
-    for concept in required_concepts:
-        # Check for concept or close variants
-        concept_lower = concept.lower()
-        if concept_lower in reasoning_lower:
-            matched += 1.0
-        elif any(word in reasoning_lower for word in concept_lower.split()):
-            # Partial match: at least one word from multi-word concept
-            matched += 0.5
+    # Concept or, failing that, any of its words (partial match, 0.5)
+    hits = compile_phrases(tuple(concept_phrases(required_concepts))).scan(reasoning)
+    matched, _, _ = score_concepts(required_concepts, hits)
 
     return min(matched / len(required_concepts), 1.0)
 
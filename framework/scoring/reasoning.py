@@ -2,6 +2,8 @@
 
 from typing import Optional
 
+from .matcher import compile_phrases
+
 
 def validate_reasoning(
     reasoning: str,
@@ -19,19 +21,21 @@ def validate_reasoning(
             "confidence": float,            # 0.0-1.0 based on violations
         }
     """
-    reasoning_lower = reasoning.lower()
+    hits = compile_phrases(tuple(must_contain) + tuple(must_not_contain)).scan(reasoning)
+    return reasoning_result(must_contain, must_not_contain, hits)
+
 
+def reasoning_result(
+    must_contain: list[str],
+    must_not_contain: list[str],
+    hits: frozenset[str],
+) -> dict:
+    """Build the validate_reasoning result from a PhraseMatcher scan of the reasoning."""
     # Check required phrases
-    missing_required = []
-    for phrase in must_contain:
-        if phrase.lower() not in reasoning_lower:
-            missing_required.append(phrase)
+    missing_required = [p for p in must_contain if p.lower() not in hits]
 
     # Check forbidden phrases
-    forbidden_found = []
-    for phrase in must_not_contain:
-        if phrase.lower() in reasoning_lower:
-            forbidden_found.append(phrase)
+    forbidden_found = [p for p in must_not_contain if p.lower() in hits]
 
     # Calculate validity and confidence
     valid = len(missing_required) == 0 and len(forbidden_found) == 0
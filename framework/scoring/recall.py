@@ -1,6 +1,7 @@
 """Recall calculation - unweighted and tier-weighted."""
 
-from typing import Sequence
+from typing import Mapping, Sequence
+
 
 def calculate_recall(
     detected_count: int,
@@ -16,6 +17,30 @@ def calculate_recall(
     return detected_count / total_count
 
 
+def weighted_recall_points(
+    tier_points: Mapping[str, float],
+    detections: Mapping[str, int],
+    items: int,
+) -> tuple[float, float]:
+    """
+    Tier-weighted recall points of one tier's GT items.
+
+    Each item is worth tier_points["Y"] (1 if unset) at most and
+    tier_points[detection] (0 if unset) as scored.
+
+    Args:
+        tier_points: Detection values for the tier, e.g. {"Y": 8, "P": 4, "N": 0, "NMI": 0}
+        detections: Count of the tier's items per detection value
+        items: Number of the tier's items
+
+    Returns:
+        Tuple of (actual_score, max_score)
+    """
+    max_score = items * tier_points.get("Y", 1)
+    actual_score = sum(count * tier_points.get(det, 0) for det, count in detections.items())
+    return actual_score, max_score
+
+
 def calculate_weighted_recall(
     scored_issues: Sequence[dict],
     tier_config: dict[str, dict[str, float]],
@@ -39,17 +64,13 @@ def calculate_weighted_recall(
     actual_score = 0.0
     max_score = 0.0
 
+    # Summed item by item, in order, so the total matches score_batch exactly
     for issue in scored_issues:
         tier = issue.get(tier_field, "T3")
         detection = issue.get(detection_field, "NMI")
-
-        # Get max points for this tier (Y detection)
-        tier_points = tier_config.get(tier, {})
-        max_for_tier = tier_points.get("Y", 1)
-        max_score += max_for_tier
-
-        # Get actual points for this detection
-        actual_score += tier_points.get(detection, 0)
+        actual, maximum = weighted_recall_points(tier_config.get(tier, {}), {detection: 1}, 1)
+        max_score += maximum
+        actual_score += actual
 
     weighted_recall = actual_score / max_score if max_score > 0 else 0.0
 
@@ -0,0 +1,700 @@
+"""
+Deterministic scoring of raw Leah canonical JSON.
+
+Turns canonical JSON (risk_table / proposed_redlines / new_clauses_proposed,
+plus cp_redline_responses for the stacking modes) and ground truth into the
+evaluation documents the judging pass writes: per-item evaluations under the
+mode's evaluations key, additional issues and a summary. GT items are matched
+to outputs through a ClauseIndex; detection, quality and pass/fail come from
+the polarity, concepts, reasoning, rules, guidelines and stacking scorers.
+
+ScoringEngine fans (contract, model) pairs out across a ProcessPoolExecutor
+and writes each evaluation to {output_dir}/evaluations/{contract}/{model}.json,
+the run-directory layout the aggregation stage reads.
+"""
+
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .fileio import atomic_write_json
+from .scoring import (
+    ClauseIndex,
+    GTItemMatcher,
+    OutputView,
+    PointsMatrix,
+    calculate_detection_points,
+    compile_points_matrix,
+    encode_detections,
+    encode_tiers,
+    score_batch,
+)
+from .scoring.batch import DETECTION_ORDER
+from .scoring.classification import is_issue_detected
+from .scoring.clauses import clause_match_key, normalise_clause_ref
+from .scoring.concepts import get_detection_strategy
+from .scoring.polarity import assign_detection_with_polarity
+from .validators import (
+    build_redline_clause_set,
+    calculate_guidelines_pass_fail,
+    calculate_rules_pass_fail,
+    calculate_rules_stacking_pass_fail,
+    detect_critical_failures,
+    detect_scope_violations,
+    determine_stacking_pass_fail,
+    score_guidelines_issue,
+    score_part_a_redline,
+    score_rule_evaluation,
+    score_rules_stacking_redline,
+)
+
+logger = logging.getLogger(__name__)
+
+# Freeform quality scores run 1-3; null when the issue was not detected
+QUALITY_DIMENSIONS = ("amendment_score", "rationale_score", "redline_quality_score")
+
+_EXCERPT_CHARS = 300
+
+
+# --- Summaries ---------------------------------------------------------------
+
+def summarise_detections(
+    gt_evaluations: List[Dict[str, Any]],
+    gt_issues: List[Dict[str, Any]],
+    matrix: PointsMatrix,
+    quality_dims: List[str],
+    gt_index=None,
+) -> Dict[str, Any]:
+    """
+    Detection and quality totals for a list of scored GT evaluations.
+
+    Args:
+        gt_evaluations: Evaluations with tier, detection and quality fields
+        gt_issues: GT items (max points are taken over all of them)
+        matrix: Compiled detection points
+        quality_dims: Quality score fields to total
+        gt_index: Compiled GroundTruthIndex of gt_issues; when given, max
+            points come from its tier counts instead of a rescan
+
+    Returns:
+        Summary with points, detection counts, T1 gate and weighted recall
+    """
+    tiers = [e.get("tier", "T3") for e in gt_evaluations]
+    detections = [e.get("detection", "NMI") for e in gt_evaluations]
+
+    # Strict encoding raises the same errors as calculate_detection_points
+    detection_codes = encode_detections(detections, strict=True)
+    tier_codes = encode_tiers(tiers, matrix, strict=True)
+    scores = score_batch(tier_codes, detection_codes, matrix)
+
+    total_detection_points = scores.total_points
+    total_quality_points = 0.0
+    for eval_item in gt_evaluations:
+        for dim in quality_dims:
+            total_quality_points += eval_item.get(dim) or 0
+
+    counts = np.bincount(detection_codes, minlength=len(DETECTION_ORDER))
+    detection_counts = dict(zip(DETECTION_ORDER, counts.tolist()))
+
+    # T1 gate: every T1 item detected as Y or P
+    t1_missed = (
+        (tier_codes == matrix.tier_code("T1"))
+        & (detection_codes > DETECTION_ORDER.index("P"))
+    )
+    t1_gate_pass = not t1_missed.any()
+
+    # Calculate max possible points
+    if gt_index is not None:
+        max_detection_points = gt_index.max_detection_points(matrix)
+    else:
+        max_detection_points = score_batch(
+            encode_tiers((gt.get("tier", "T3") for gt in gt_issues), matrix),
+            np.zeros(len(gt_issues), dtype=np.intp),
+            matrix
+        ).max_total
+    if matrix.integer_max:
+        # Sums of int config values stay ints in the summary
+        max_detection_points = int(max_detection_points)
+
+    return {
+        "total_detection_points": total_detection_points,
+        "max_detection_points": max_detection_points,
+        "total_quality_points": total_quality_points,
+        "total_points": total_detection_points + total_quality_points,
+        "detection_counts": detection_counts,
+        "t1_gate_pass": t1_gate_pass,
+        "weighted_recall": total_detection_points / max_detection_points if max_detection_points > 0 else 0.0
+    }
+
+
+def _tier_breakdown(gt_evaluations: List[Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
+    by_tier: Dict[str, Dict[str, int]] = {}
+    for e in gt_evaluations:
+        stats = by_tier.setdefault(
+            e.get("tier", "T3"), {**{d: 0 for d in DETECTION_ORDER}, "total": 0, "detected": 0}
+        )
+        detection = e.get("detection", "NMI")
+        stats[detection] = stats.get(detection, 0) + 1
+        stats["total"] += 1
+        if detection in ("Y", "P"):
+            stats["detected"] += 1
+    return by_tier
+
+
+# --- Matching ----------------------------------------------------------------
+
+def match_gt_item(
+    index: ClauseIndex,
+    gt_item: dict,
+    clause_field: str = "clause",
+) -> List[Dict[str, Any]]:
+    """
+    Leah outputs matched to a GT item, best first.
+
+    Clause-agnostic strategies (pattern_match, any_mention) match entries
+    whose text contains an expected_output_pattern, highest pattern score
+    first. Other items match entries at the GT clause, falling back to the
+    same article; new_clause_recommendation items also match unreferenced
+    new clauses that contain a pattern.
+
+    Returns:
+        [{"item": OutputView, "section": str, "position": int, "match": str}]
+        as assign_detection_with_polarity expects
+    """
+    strategy = get_detection_strategy(gt_item)
+    candidates = index.candidates(gt_item, clause_field)
+
+    if strategy in ("pattern_match", "any_mention"):
+        matcher = GTItemMatcher(gt_item)
+        scored = [(matcher.pattern_match_score(c.entry), c) for c in candidates]
+        chosen = [c for score, c in sorted(scored, key=lambda sc: -sc[0]) if score > 0]
+    else:
+        exact = [c for c in candidates if c.match == "exact"]
+        chosen = exact or [c for c in candidates if c.match == "article"]
+        if strategy == "new_clause_recommendation":
+            matcher = GTItemMatcher(gt_item)
+            chosen += [
+                c for c in candidates
+                if c.match == "section" and matcher.matches_output_patterns(c.entry)
+            ]
+
+    # Entries that carry a classification decide detection, so they go first
+    chosen.sort(key=lambda c: is_issue_detected(c.entry.get("classification")) is None)
+
+    return [
+        {"item": c.entry, "section": c.section, "position": c.position, "match": c.match}
+        for c in chosen
+    ]
+
+
+def _clause_lookup(entries: List[dict]) -> Dict[str, List[OutputView]]:
+    """Entries keyed by normalised clause_ref (or section) for stacking responses."""
+    lookup: Dict[str, List[OutputView]] = {}
+    for entry in entries:
+        view = OutputView(entry)
+        for ref in (entry.get("clause_ref"), entry.get("section")):
+            if ref:
+                lookup.setdefault(clause_match_key(normalise_clause_ref(str(ref))), []).append(view)
+    return lookup
+
+
+def _find_response(lookup: Dict[str, List[OutputView]], gt_item: dict) -> Optional[OutputView]:
+    for ref in (gt_item.get("section"), gt_item.get("clause_ref")):
+        if ref:
+            views = lookup.get(clause_match_key(normalise_clause_ref(str(ref))))
+            if views:
+                return views[0]
+    return None
+
+
+def _best_clause_match(index: ClauseIndex, gt_item: dict, clause_field: str) -> Optional[OutputView]:
+    matches = match_gt_item(index, gt_item, clause_field)
+    return matches[0]["item"] if matches else None
+
+
+def _contract_items(items: List[dict], contract: str) -> List[dict]:
+    """GT items for one contract from a per-contract-type GT file."""
+    if not any("contract" in item for item in items):
+        return list(items)
+    key = contract.lower()
+    return [i for i in items if Path(str(i.get("contract", ""))).stem.lower() == key]
+
+
+# --- Freeform quality --------------------------------------------------------
+
+def _revision_text(view: OutputView) -> str:
+    return view.get("proposed_revision") or view.field("revision") or ""
+
+
+def _element_coverage(elements: List[str], text_lower: str) -> float:
+    """Fraction of elements with one of their first three long words in text."""
+    if not elements:
+        return 0.0
+    matched = sum(
+        1 for elem in elements
+        if any(w.lower() in text_lower for w in elem.split()[:3] if len(w) > 3)
+    )
+    return matched / len(elements)
+
+
+def _band(fraction: float) -> int:
+    return 3 if fraction >= 0.5 else 2 if fraction > 0 else 1
+
+
+def score_quality(gt_item: dict, matches: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Freeform quality scores (1-3) for a detected GT item.
+
+    - amendment_score: key_elements covered by the matched redline
+    - rationale_score: required_concepts (else key_elements) covered by the
+      reasoning; 1 if it contains a reasoning_must_not_contain phrase
+    - redline_quality_score: redline action in acceptable_actions, plus a
+      substantive revision
+
+    Returns:
+        Scores plus the matched redline (OutputView or None)
+    """
+    redline = next(
+        (m["item"] for m in matches if m["section"] in ("proposed_redlines", "new_clauses_proposed")),
+        None
+    )
+    key_elements = gt_item.get("key_elements") or []
+
+    if redline is None:
+        amendment_score = 1
+        redline_quality_score = 1
+    else:
+        revision = _revision_text(redline)
+        amendment_score = _band(_element_coverage(key_elements, revision.lower())) if key_elements else 2
+
+        action = (redline.get("change_type") or redline.field("action") or "").upper()
+        acceptable = [a.upper() for a in gt_item.get("acceptable_actions") or []]
+        redline_quality_score = 1 + (action in acceptable) + (len(revision) > 20)
+
+    reasoning = " ".join(
+        m["item"].reasoning_text_lower for m in matches
+    )
+    matcher = GTItemMatcher(gt_item)
+    if matcher.concepts:
+        coverage = matcher.concept_coverage(reasoning)["coverage"]
+    else:
+        coverage = _element_coverage(key_elements, reasoning)
+    rationale_score = _band(coverage)
+    if matcher.must_not_contain and matcher.validate_reasoning(reasoning)["forbidden_found"]:
+        rationale_score = 1
+
+    return {
+        "amendment_score": amendment_score,
+        "rationale_score": rationale_score,
+        "redline_quality_score": redline_quality_score,
+        "redline": redline,
+    }
+
+
+# --- Per-mode scorers --------------------------------------------------------
+
+def score_freeform(
+    canonical_json: dict,
+    gt_issues: List[dict],
+    config: dict,
+    tier_config: Optional[dict] = None,
+    index: Optional[ClauseIndex] = None,
+) -> Dict[str, Any]:
+    """
+    Score whole-document GT items (freeform, and Part B of freeform_stacking).
+
+    Returns:
+        {"gt_evaluations", "additional_issues", "summary"}
+    """
+    if tier_config is None:
+        tier_config = config.get("detection_points", {})
+    if index is None:
+        index = ClauseIndex(canonical_json)
+
+    gt_structure = config.get("gt_structure", {})
+    id_field = gt_structure.get("id_field", "gt_id")
+    tier_field = gt_structure.get("tier_field", "tier")
+    clause_field = gt_structure.get("clause_field", "clause")
+    issue_field = gt_structure.get("issue_field", "issue")
+
+    matched_positions = set()
+    evaluations = []
+
+    for gt_item in gt_issues:
+        tier = gt_item.get(tier_field, gt_item.get("tier", "T3"))
+        matches = match_gt_item(index, gt_item, clause_field)
+        detection = assign_detection_with_polarity(gt_item, matches)
+        detection_points = calculate_detection_points(detection, tier, tier_config)
+
+        for m in matches:
+            matched_positions.add((m["section"], m["position"]))
+
+        evaluation = {
+            "gt_id": gt_item.get(id_field, gt_item.get("gt_id")),
+            "clause": gt_item.get(clause_field, ""),
+            "tier": tier,
+            "issue": gt_item.get(issue_field, ""),
+            "detection": detection,
+            "detection_points": detection_points,
+        }
+
+        if detection in ("Y", "P"):
+            quality = score_quality(gt_item, matches)
+            redline = quality.pop("redline")
+            quality_points = sum(quality.values())
+            evaluation.update(quality)
+            evaluation["quality_points"] = quality_points
+            evaluation["total_points"] = detection_points + quality_points
+            evaluation["matched_redline_id"] = (
+                redline.get("recommendation_id") or redline.get("id") if redline else None
+            )
+            revision = _revision_text(redline) if redline else ""
+            evaluation["evidence"] = {
+                "proposed_revision_excerpt": revision[:_EXCERPT_CHARS] or None,
+                "effective_rationale_excerpt": (
+                    matches[0]["item"].field("reasoning")[:_EXCERPT_CHARS] or None
+                ),
+                "judge_reasoning": (
+                    f"Deterministic: {matches[0]['match']} match in {matches[0]['section']} "
+                    f"({len(matches)} candidate(s))"
+                ),
+            }
+        else:
+            evaluation.update({dim: None for dim in QUALITY_DIMENSIONS})
+            evaluation["quality_points"] = 0
+            evaluation["total_points"] = detection_points
+            evaluation["matched_redline_id"] = None
+            evaluation["evidence"] = {
+                "proposed_revision_excerpt": None,
+                "effective_rationale_excerpt": None,
+                "judge_reasoning": (
+                    f"Deterministic: {len(matches)} matching output(s), detection {detection}"
+                ),
+            }
+
+        evaluations.append(evaluation)
+
+    additional_issues = []
+    for p, entry in enumerate(index.entries[0]):
+        if ("risk_table", p) in matched_positions:
+            continue
+        if is_issue_detected(entry.get("classification")) is not True:
+            continue
+        additional_issues.append({
+            "clause": entry.get("clause_ref", ""),
+            "issue_summary": entry.get("clause_summary", entry.get("issue_summary", "")),
+            "leah_classification": entry.get("classification", ""),
+            "leah_action": entry.get("recommended_action", entry.field("action")) or "",
+            "assessment": "Unassessed",
+            "proposed_tier": None,
+            "gt_candidate": False,
+            "notes": "",
+        })
+
+    summary = summarise_detections(
+        evaluations, evaluations, compile_points_matrix(tier_config, default_max=0),
+        list(QUALITY_DIMENSIONS)
+    )
+    by_tier = _tier_breakdown(evaluations)
+    t1 = by_tier.get("T1", {})
+    summary.update({
+        "by_tier": by_tier,
+        "t1_count": t1.get("total", 0),
+        "t1_detected": t1.get("detected", 0),
+        "additional_issues_count": len(additional_issues),
+    })
+
+    return {
+        "gt_evaluations": evaluations,
+        "additional_issues": additional_issues,
+        "summary": summary,
+    }
+
+
+def score_freeform_stacking(canonical_json: dict, gt_data: dict, config: dict) -> Dict[str, Any]:
+    """Part A (CP redline responses) and Part B (whole document) scoring."""
+    gt_redlines = gt_data.get("part_a", {}).get("part_a_cp_redlines", [])
+    responses = canonical_json.get("cp_redline_responses") or canonical_json.get("proposed_redlines") or []
+    lookup = _clause_lookup(responses)
+
+    part_a = [
+        score_part_a_redline(_find_response(lookup, redline), redline, config)
+        for redline in gt_redlines
+    ]
+    critical_failures = detect_critical_failures(part_a)
+    total = sum(e["total_score"] for e in part_a)
+    max_total = sum(e["max_score"] for e in part_a)
+    percentage = total / max_total * 100 if max_total > 0 else 0
+    part_a_summary = {
+        "total_score": total,
+        "max_score": max_total,
+        "percentage": round(percentage, 2),
+        "critical_failures": len(critical_failures),
+        "pass_fail": (
+            "PASS" if percentage >= 70 and not critical_failures
+            else "MARGINAL" if percentage >= 50 and len(critical_failures) <= 1
+            else "FAIL"
+        ),
+    }
+
+    part_b_gt = gt_data.get("part_b", {}).get("ground_truth", [])
+    part_b_config = dict(config, gt_structure=config["gt_structure"]["parts"]["part_b"])
+    part_b = score_freeform(
+        canonical_json, part_b_gt, part_b_config,
+        tier_config=config.get("detection_points", {}).get("part_b", {})
+    )
+
+    return {
+        "part_a_evaluations": part_a,
+        "part_a_summary": part_a_summary,
+        "part_b_evaluations": part_b["gt_evaluations"],
+        "additional_issues": part_b["additional_issues"],
+        "summary": part_b["summary"],
+        "combined_summary": determine_stacking_pass_fail(
+            part_a_summary, part_b["summary"], critical_failures, config
+        ),
+    }
+
+
+def score_guidelines(canonical_json: dict, gt_issues: List[dict], config: dict) -> Dict[str, Any]:
+    """Playbook GT items scored with score_guidelines_issue."""
+    index = ClauseIndex(canonical_json)
+    clause_field = config.get("gt_structure", {}).get("clause_field", "clause_ref")
+    evaluations = [
+        score_guidelines_issue(_best_clause_match(index, gt, clause_field), gt, config)
+        for gt in gt_issues
+    ]
+    return {
+        "gt_evaluations": evaluations,
+        "summary": calculate_guidelines_pass_fail(evaluations, gt_issues, config),
+    }
+
+
+def score_rules(canonical_json: dict, gt_rules: List[dict], config: dict) -> Dict[str, Any]:
+    """Rule GT items scored with score_rule_evaluation."""
+    index = ClauseIndex(canonical_json)
+    evaluations = [
+        score_rule_evaluation(_best_clause_match(index, rule, "clause_ref"), rule, config)
+        for rule in gt_rules
+    ]
+    return {
+        "rule_evaluations": evaluations,
+        "summary": calculate_rules_pass_fail(evaluations, config),
+    }
+
+
+def score_rules_stacking(canonical_json: dict, gt_redlines: List[dict], config: dict) -> Dict[str, Any]:
+    """Redline GT items scored with score_rules_stacking_redline, plus scope violations."""
+    responses = canonical_json.get("cp_redline_responses") or canonical_json.get("proposed_redlines") or []
+    lookup = _clause_lookup(responses)
+    evaluations = [
+        score_rules_stacking_redline(_find_response(lookup, redline), redline, config)
+        for redline in gt_redlines
+    ]
+    violations = detect_scope_violations(
+        canonical_json, build_redline_clause_set(gt_redlines), config
+    )
+    return {
+        "redline_evaluations": evaluations,
+        "scope_violations": violations,
+        "summary": calculate_rules_stacking_pass_fail(evaluations, violations, config),
+    }
+
+
+def score_canonical(
+    canonical_json: dict,
+    gt_data: dict,
+    config: dict,
+    contract: str,
+    model: str,
+) -> Dict[str, Any]:
+    """
+    Score one canonical JSON against its GT for the config's mode.
+
+    Args:
+        canonical_json: Leah canonical output
+        gt_data: GT as loaded by GTLoader (GTLoadResult.data)
+        config: Mode config
+        contract: Contract identifier
+        model: Model identifier
+
+    Returns:
+        Evaluation document: meta, the mode's evaluations, summary
+    """
+    mode = config.get("mode", "freeform")
+
+    if mode == "freeform":
+        scored = score_freeform(canonical_json, gt_data.get("ground_truth", []), config)
+    elif mode == "freeform_stacking":
+        scored = score_freeform_stacking(canonical_json, gt_data, config)
+    elif mode == "guidelines":
+        scored = score_guidelines(
+            canonical_json, _contract_items(gt_data.get("ground_truth", []), contract), config
+        )
+    elif mode == "rules":
+        scored = score_rules(
+            canonical_json, _contract_items(gt_data.get("ground_truth", []), contract), config
+        )
+    elif mode == "rules_stacking":
+        scored = score_rules_stacking(
+            canonical_json, _contract_items(gt_data.get("ground_truth", []), contract), config
+        )
+    else:
+        raise ValueError(f"No scoring engine for mode: {mode}")
+
+    meta = {
+        "contract": contract,
+        "model_id": model,
+        "evaluation_timestamp": datetime.now().isoformat(),
+        "evaluator_model": "deterministic",
+        "gt_version": gt_data.get("gt_metadata", {}).get("gt_version"),
+    }
+    environment = canonical_json.get("meta", {}).get("environment")
+    if environment:
+        meta["environment"] = environment
+
+    return {"meta": meta, **scored}
+
+
+# --- Engine ------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class ScoringJob:
+    """One (contract, model) canonical JSON to score."""
+    contract: str
+    model: str
+    canonical_path: Path
+    output_path: Path
+    gt_data: dict
+
+
+def find_canonical_dir(mode_dir: Path, env: str) -> Optional[Path]:
+    """Canonical JSON directory for an env, in pre_eval lookup order."""
+    for candidate in (
+        mode_dir / "environments" / env / "canonical_json",
+        mode_dir / f"canonical_json_{env}",
+        mode_dir / "canonical_json",
+    ):
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def _score_job(job: ScoringJob, config: dict) -> Dict[str, Any]:
+    """Worker: read, score and write one canonical JSON."""
+    start = time.perf_counter()
+    with open(job.canonical_path) as f:
+        canonical_json = json.load(f)
+
+    evaluation = score_canonical(canonical_json, job.gt_data, config, job.contract, job.model)
+    atomic_write_json(job.output_path, evaluation)
+
+    return {
+        "contract": job.contract,
+        "model": job.model,
+        "path": str(job.output_path),
+        "seconds": round(time.perf_counter() - start, 4),
+    }
+
+
+class ScoringEngine:
+    """
+    Scores every (contract, model) canonical JSON of an environment.
+
+    Jobs run on a ProcessPoolExecutor (scoring is CPU-bound pure Python);
+    with max_workers=1 they run in-process. Each worker writes its own
+    output file, so results are identical whatever the pool size.
+
+    Usage:
+        engine = ScoringEngine(config, max_workers=8)
+        jobs = engine.discover_jobs(canonical_dir, output_dir, gt_loader)
+        summary = engine.run(jobs)
+    """
+
+    def __init__(self, config: dict, max_workers: Optional[int] = None):
+        self.config = config
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def discover_jobs(
+        self,
+        canonical_dir: Path,
+        output_dir: Path,
+        gt_loader,
+    ) -> List[ScoringJob]:
+        """
+        One job per {canonical_dir}/{contract}/{model}.json.
+
+        GT is loaded once per contract. Contracts without GT are skipped
+        with a warning.
+        """
+        jobs = []
+        for contract_dir in sorted(d for d in Path(canonical_dir).iterdir() if d.is_dir()):
+            contract = contract_dir.name
+            model_files = sorted(contract_dir.glob("*.json"))
+            if not model_files:
+                continue
+            try:
+                gt_data = gt_loader.load(contract).data
+            except (FileNotFoundError, ValueError) as e:
+                logger.warning(f"Skipping {contract}: {e}")
+                continue
+
+            for model_file in model_files:
+                jobs.append(ScoringJob(
+                    contract=contract,
+                    model=model_file.stem,
+                    canonical_path=model_file,
+                    output_path=Path(output_dir) / "evaluations" / contract / model_file.name,
+                    gt_data=gt_data,
+                ))
+        return jobs
+
+    def run(self, jobs: List[ScoringJob]) -> Dict[str, Any]:
+        """
+        Score all jobs.
+
+        Returns:
+            Summary with files_written, per-job results and errors (a job
+            that fails does not stop the others), and total_seconds
+        """
+        start = time.perf_counter()
+        worker = partial(_score_job, config=self.config)
+        results: List[Dict[str, Any]] = []
+        errors: List[Dict[str, Any]] = []
+
+        if self.max_workers == 1 or len(jobs) <= 1:
+            for job in jobs:
+                try:
+                    results.append(worker(job))
+                except Exception as e:
+                    errors.append({"contract": job.contract, "model": job.model, "error": str(e)})
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as pool:
+                futures = {pool.submit(worker, job): job for job in jobs}
+                for future in as_completed(futures):
+                    job = futures[future]
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        errors.append({"contract": job.contract, "model": job.model, "error": str(e)})
+
+        results.sort(key=lambda r: (r["contract"], r["model"]))
+        errors.sort(key=lambda r: (r["contract"], r["model"]))
+        for error in errors:
+            logger.error(f"Scoring failed for {error['contract']}/{error['model']}: {error['error']}")
+
+        return {
+            "files_written": len(results),
+            "results": results,
+            "errors": errors,
+            "total_seconds": round(time.perf_counter() - start, 4),
+        }
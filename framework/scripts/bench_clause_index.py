@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark GT-to-output clause matching: full scan vs ClauseIndex.
+
+For each contract, every GT item is matched against a canonical JSON either
+by scanning every entry (linear_candidates) or through a ClauseIndex built
+once for the canonical JSON. Both must return identical candidates.
+
+Without --canonical-dir, a synthetic canonical JSON is generated per
+contract from its GT clauses plus filler clauses, sized by --entries, to
+approximate large Leah outputs.
+
+Usage:
+    python -m framework.scripts.bench_clause_index
+    python -m framework.scripts.bench_clause_index --entries 600 --repeat 20
+    python -m framework.scripts.bench_clause_index \\
+        --canonical-dir freeform/environments/hotfix/canonical_json --model sonnet45
+"""
+
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+from typing import Optional
+
+from framework.scoring.clause_index import ClauseIndex, linear_candidates
+
+
+def load_gt_items(gt_file: Path) -> list[dict]:
+    with open(gt_file) as f:
+        data = json.load(f)
+    return data.get("ground_truth", data.get("issues", []))
+
+
+def synthetic_canonical(gt_items: list[dict], entries: int, seed: int = 0) -> dict:
+    """Canonical JSON with an entry per GT clause plus filler clauses."""
+    rng = random.Random(seed)
+    refs = [item.get("clause", "") for item in gt_items if item.get("clause")]
+    while len(refs) < entries:
+        refs.append(f"{rng.randint(1, 40)}.{rng.randint(1, 12)}")
+    rng.shuffle(refs)
+
+    def entry(ref: str) -> dict:
+        return {
+            "clause_ref": f"Section {ref}",
+            "classification": rng.choice(["❌", "⚠️", "✅"]),
+            "clause_summary": f"Summary of clause {ref}",
+            "detailed_reasoning": "Reasoning text " * 20,
+        }
+
+    return {
+        "risk_table": [entry(r) for r in refs],
+        "proposed_redlines": [entry(r) for r in refs[: entries // 2]],
+        "new_clauses_proposed": [
+            {"clause_type": f"New clause {i}", "proposed_text": "Text"} for i in range(entries // 20)
+        ],
+    }
+
+
+def _key(candidates) -> list[tuple]:
+    return [(c.section, c.position, c.match) for c in candidates]
+
+
+def bench_contract(canonical: dict, gt_items: list[dict], repeat: int) -> dict:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        linear = [linear_candidates(canonical, item) for item in gt_items]
+    linear_s = (time.perf_counter() - t0) / repeat
+
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        index = ClauseIndex(canonical)
+    build_s = (time.perf_counter() - t0) / repeat
+
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        indexed = [index.candidates(item) for item in gt_items]
+    lookup_s = (time.perf_counter() - t0) / repeat
+
+    if [_key(c) for c in linear] != [_key(c) for c in indexed]:
+        raise AssertionError("ClauseIndex candidates differ from full scan")
+
+    return {
+        "entries": len(index),
+        "gt_items": len(gt_items),
+        "linear_ms": linear_s * 1000,
+        "build_ms": build_s * 1000,
+        "lookup_ms": lookup_s * 1000,
+        "speedup": linear_s / (build_s + lookup_s) if build_s + lookup_s > 0 else float("inf"),
+    }
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark clause matching with ClauseIndex")
+    parser.add_argument("--gt-dir", type=Path, default=Path("freeform/ground_truth"))
+    parser.add_argument("--canonical-dir", type=Path, default=None,
+                        help="Real canonical JSONs ({contract}/{model}.json); synthetic if omitted")
+    parser.add_argument("--model", default="sonnet45", help="Model to read from --canonical-dir")
+    parser.add_argument("--entries", type=int, default=400,
+                        help="risk_table entries per synthetic canonical JSON")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    gt_files = sorted(f for f in args.gt_dir.glob("*.json") if not f.name.startswith("_"))
+    if not gt_files:
+        parser.error(f"No GT files found in {args.gt_dir}")
+
+    rows = []
+    for gt_file in gt_files:
+        contract = gt_file.stem
+        gt_items = load_gt_items(gt_file)
+
+        if args.canonical_dir:
+            canonical_path = args.canonical_dir / contract / f"{args.model}.json"
+            if not canonical_path.exists():
+                continue
+            with open(canonical_path) as f:
+                canonical = json.load(f)
+        else:
+            canonical = synthetic_canonical(gt_items, args.entries)
+
+        rows.append((contract, bench_contract(canonical, gt_items, args.repeat)))
+
+    # Largest contracts first
+    rows.sort(key=lambda r: r[1]["entries"] * r[1]["gt_items"], reverse=True)
+
+    print(f"{'contract':<14}{'entries':>8}{'gt':>5}{'scan ms':>10}{'build ms':>10}"
+          f"{'lookup ms':>11}{'speedup':>9}")
+    for contract, r in rows:
+        print(f"{contract:<14}{r['entries']:>8}{r['gt_items']:>5}{r['linear_ms']:>10.2f}"
+              f"{r['build_ms']:>10.2f}{r['lookup_ms']:>11.3f}{r['speedup']:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
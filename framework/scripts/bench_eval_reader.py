@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark selective evaluation reads: json.load vs framework.eval_reader.
+
+Every {contract}/{model}.json under --results-dir is read in full with
+json.load and through read_fields() for each field set below. Both must
+agree on the selected fields.
+
+Usage:
+    python -m framework.scripts.bench_eval_reader
+    python -m framework.scripts.bench_eval_reader --results-dir freeform_stacking/results --repeat 50
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+from framework.eval_reader import parse_fields, project, read_fields
+from framework.scripts.generate_workbooks import CONTRACT_FIELDS
+
+FIELD_SETS = {
+    "summary": ("summary",),
+    "detections": ("summary", "gt_evaluations[*].tier", "gt_evaluations[*].detection"),
+    "workbook": CONTRACT_FIELDS,
+}
+
+
+def _full(path: Path) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def bench(files: list[Path], repeat: int) -> list[tuple]:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        documents = [_full(p) for p in files]
+    full_s = (time.perf_counter() - t0) / repeat
+
+    rows = []
+    for name, fields in FIELD_SETS.items():
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            selected = [read_fields(p, fields) for p in files]
+        read_s = (time.perf_counter() - t0) / repeat
+
+        spec = parse_fields(fields)
+        if selected != [project(d, spec) for d in documents]:
+            raise AssertionError(f"read_fields differs from json.load for {name}")
+        rows.append((name, full_s * 1000, read_s * 1000, full_s / read_s if read_s > 0 else float("inf")))
+    return rows
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark selective reads of evaluation files")
+    parser.add_argument("--results-dir", type=Path, default=Path("freeform/results"))
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    files = sorted(
+        p for p in args.results_dir.glob("*/*.json")
+        if p.parent.name != "baseline" and not p.name.startswith("_")
+    )
+    if not files:
+        parser.error(f"No evaluation files found in {args.results_dir}")
+
+    total_mb = sum(p.stat().st_size for p in files) / 1e6
+    print(f"{len(files)} files, {total_mb:.1f} MB")
+    print(f"{'fields':<16}{'json.load ms':>14}{'read_fields ms':>16}{'speedup':>9}")
+    for name, full_ms, read_ms, speedup in bench(files, args.repeat):
+        print(f"{name:<16}{full_ms:>14.2f}{read_ms:>16.2f}{speedup:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
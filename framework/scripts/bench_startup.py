@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark leah-eval startup: import time and --validate-only wall time.
+
+Each measurement runs in a fresh interpreter. Import time comes from
+python -X importtime (cumulative microseconds of the top-level import); the
+slowest modules it pulls in are listed so a regression is easy to trace.
+--validate-only is timed for every mode, first with the config validation
+stamps cleared (cold) and then with them in place (warm).
+
+The script exits with status 1 if an import target takes longer than its
+budget in IMPORT_BUDGETS_MS (the fastest of --repeat runs is compared), so
+it can gate CI against a regression in lazy imports.
+
+Usage:
+    python -m framework.scripts.bench_startup
+    python -m framework.scripts.bench_startup --env hotfix --repeat 5
+    python -m framework.scripts.bench_startup --budget-ms 30
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+from framework.config_loader import VALIDATION_STAMPS_PATH
+
+MODES = ["freeform", "freeform_stacking", "rules", "rules_stacking", "guidelines"]
+IMPORT_TARGETS = ["framework.cli", "framework.pipeline", "framework.config_loader"]
+
+# Import-time ceilings in ms. framework.cli must stay light: it defers the
+# pipeline and jsonschema until a command needs them.
+IMPORT_BUDGETS_MS = {"framework.cli": 50.0, "framework.config_loader": 50.0}
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Cumulative import time in microseconds of every module loaded by `import module`.
+
+    Interpreter start-up imports (site and its .pth hooks) are left out.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+        if not name[1:].startswith(" ") and name.strip() != module:
+            # A finished top-level import other than ours
+            times = {}
+    return times
+
+
+def validate_only_ms(mode: str, env: str) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "framework.cli", mode, env, "--validate-only"],
+        capture_output=True,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark leah-eval startup")
+    parser.add_argument("--env", default="hotfix")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=5, help="Slowest imported modules to list")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="Import budget for framework.cli (default: IMPORT_BUDGETS_MS)")
+    args = parser.parse_args(argv)
+
+    budgets = dict(IMPORT_BUDGETS_MS)
+    if args.budget_ms is not None:
+        budgets["framework.cli"] = args.budget_ms
+
+    over_budget = []
+    print(f"{'import':<26}{'ms':>8}{'budget':>8}   slowest modules")
+    for target in IMPORT_TARGETS:
+        times = min((import_times(target) for _ in range(args.repeat)), key=lambda t: t[target])
+        slowest = sorted(
+            ((name, us) for name, us in times.items() if name != target),
+            key=lambda item: item[1], reverse=True,
+        )[:args.top]
+        ms = times[target] / 1000
+        budget = budgets.get(target)
+        if budget is not None and ms > budget:
+            over_budget.append(f"{target} {ms:.1f} ms > {budget:.1f} ms")
+        print(f"{target:<26}{ms:>8.1f}{budget if budget is not None else '-':>8}   "
+              + ", ".join(f"{name} {us / 1000:.1f}" for name, us in slowest))
+
+    print(f"\n{'--validate-only':<20}{'cold ms':>10}{'warm ms':>10}")
+    for mode in MODES:
+        VALIDATION_STAMPS_PATH.unlink(missing_ok=True)
+        cold = validate_only_ms(mode, args.env)
+        warm = min(validate_only_ms(mode, args.env) for _ in range(args.repeat))
+        print(f"{mode:<20}{cold:>10.0f}{warm:>10.0f}")
+
+    if over_budget:
+        print("\nImport budget exceeded: " + "; ".join(over_budget), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
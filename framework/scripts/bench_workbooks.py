@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark workbook generation: wall time and peak RSS.
+
+Each run builds every per-contract workbook and then the master workbook
+in a fresh interpreter, which reports its own wall time and peak resident
+set size, so runs do not share caches or allocator state. A full build
+(manifest ignored) is followed by a rerun with nothing changed.
+
+Without --base-path, a synthetic aggregated directory is generated with
+--contracts x --models evaluations of --gt-items GT items each, to
+approximate a full environment.
+
+Usage:
+    python -m framework.scripts.bench_workbooks
+    python -m framework.scripts.bench_workbooks --contracts 20 --models 30 --gt-items 200
+    python -m framework.scripts.bench_workbooks --base-path freeform/results --workers 4
+"""
+
+import argparse
+import json
+import random
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+CHILD = """
+import json, resource, sys, time
+from pathlib import Path
+from framework.scripts.generate_workbooks import (
+    build_contracts, discover_structure, generate_master_workbook,
+)
+base, out, workers, full = Path(sys.argv[1]), Path(sys.argv[2]), int(sys.argv[3]), sys.argv[4] == "full"
+contracts, models = discover_structure(base)
+start = time.perf_counter()
+outcomes = build_contracts(base, contracts, models, out, max_workers=workers, full=full)
+summaries = {contract: outcome["summaries"] for contract, outcome in outcomes.items()}
+generate_master_workbook(base, contracts, models, out / "MASTER_EVALUATION_WORKBOOK.xlsx", summaries)
+print(json.dumps({
+    "built": sum(outcome["status"] == "built" for outcome in outcomes.values()),
+    "seconds": time.perf_counter() - start,
+    "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}))
+"""
+
+
+def synthetic_aggregated(base: Path, contracts: int, models: int, gt_items: int, seed: int = 0) -> None:
+    """Write {contract}/{model}.json aggregated evaluations under base."""
+    rng = random.Random(seed)
+    for c in range(contracts):
+        tiers = [rng.choice(["T1", "T2", "T3"]) for _ in range(gt_items)]
+        for m in range(models):
+            evaluations = [
+                {
+                    "gt_id": f"GT-{i + 1:03d}",
+                    "clause": f"{rng.randint(1, 40)}.{rng.randint(1, 12)}",
+                    "tier": tier,
+                    "issue": f"Issue {i} " + "text " * 20,
+                    "detection": rng.choice(["Y", "P", "N", "NMI"]),
+                    "total_points": rng.choice([0, 1, 2.5, 5, 8]),
+                    "evidence": "Evidence " * 40,
+                }
+                for i, tier in enumerate(tiers)
+            ]
+            counts = {d: sum(e["detection"] == d for e in evaluations) for d in ("Y", "P", "N", "NMI")}
+            summary = {
+                "total_points": sum(e["total_points"] for e in evaluations),
+                "total_detection_points": sum(e["total_points"] for e in evaluations),
+                "total_quality_points": 0,
+                "t1_all_detected": rng.random() < 0.3,
+                "penalty_pct": rng.choice([0, 0, 10]),
+                "detection_counts": counts,
+                "detection_by_tier": {t: {"pct": rng.uniform(0, 100)} for t in ("T1", "T2", "T3")},
+            }
+            path = base / f"contract_{c:02d}" / f"model_{m:02d}.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w") as f:
+                json.dump({"summary": summary, "gt_evaluations": evaluations}, f, indent=2)
+
+
+def run_once(base: Path, out: Path, workers: int, full: bool) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD, str(base), str(out), str(workers), "full" if full else "incremental"],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark workbook generation")
+    parser.add_argument("--base-path", type=Path, help="Aggregated results (default: synthetic)")
+    parser.add_argument("--contracts", type=int, default=10)
+    parser.add_argument("--models", type=int, default=20)
+    parser.add_argument("--gt-items", type=int, default=150)
+    parser.add_argument("--workers", type=int, default=1, help="Process pool size for contract workbooks")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base = args.base_path
+        if base is None:
+            base = Path(tmp) / "aggregated"
+            synthetic_aggregated(base, args.contracts, args.models, args.gt_items)
+            print(f"Synthetic: {args.contracts} contracts x {args.models} models x {args.gt_items} GT items")
+
+        out = Path(tmp) / "workbooks"
+        print(f"{'run':<14}{'built':>7}{'seconds':>10}{'peak RSS MB':>14}")
+        for _ in range(args.repeat):
+            for label, full in (("full", True), ("unchanged", False)):
+                run = run_once(base, out, args.workers, full)
+                print(f"{label:<14}{run['built']:>7}{run['seconds']:>10.2f}{run['peak_rss_mb']:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
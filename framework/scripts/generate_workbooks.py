@@ -6,25 +6,37 @@ Creates:
 - Per-contract workbooks: {CONTRACT}_Evaluations.xlsx
 - Master workbook: MASTER_EVALUATION_WORKBOOK.xlsx (optional)
 
+Contract workbooks are built on a process pool. _workbook_manifest.json in
+the output directory records each contract's input fingerprints and model
+summaries: contracts whose aggregated files are unchanged are not rebuilt,
+and the master workbook is assembled from the recorded summaries instead
+of rereading every aggregated file.
+
 Usage:
-    python generate_workbooks.py --base-path /path/to/aggregated
-    python generate_workbooks.py --base-path /path/to/aggregated --contract consulting
-    python generate_workbooks.py --base-path /path/to/aggregated --master-only
+    python -m framework.scripts.generate_workbooks --base-path /path/to/aggregated
+    python -m framework.scripts.generate_workbooks --base-path /path/to/aggregated --workers 4 --full
+    python -m framework.scripts.generate_workbooks --base-path /path/to/aggregated --contract consulting
+    python -m framework.scripts.generate_workbooks --base-path /path/to/aggregated --master-only
 """
 
 import json
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from typing import Any, Dict, Optional
 
 try:
-    from openpyxl import Workbook
     from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-    from openpyxl.utils import get_column_letter
 except ImportError:
     print("ERROR: openpyxl required. Install with: pip3 install openpyxl")
     exit(1)
 
+from framework.eval_reader import read_fields
+from framework.fileio import atomic_write_json, file_fingerprint, fingerprint_matches
+from framework.scripts.workbook_writer import SheetBuffer, StreamingWorkbook
+
 # Styles
 HEADER_FILL = PatternFill(start_color="1F4E79", end_color="1F4E79", fill_type="solid")
 HEADER_FONT = Font(bold=True, color="FFFFFF")
@@ -40,9 +52,40 @@ THIN_BORDER = Border(
     left=Side(style='thin'), right=Side(style='thin'),
     top=Side(style='thin'), bottom=Side(style='thin')
 )
+CENTER = Alignment(horizontal='center')
+
+# Named styles registered in every workbook; cells refer to them by name
+NAMED_STYLES = {
+    'title': {'font': TITLE_FONT},
+    'title_centered': {'font': TITLE_FONT, 'alignment': CENTER},
+    'centered': {'alignment': CENTER},
+    'header': {'fill': HEADER_FILL, 'font': HEADER_FONT,
+               'alignment': Alignment(horizontal='center', wrap_text=True), 'border': THIN_BORDER},
+    'cell': {'border': THIN_BORDER},
+    'pass': {'fill': PASS_FILL, 'border': THIN_BORDER},
+    'fail': {'fill': FAIL_FILL, 'border': THIN_BORDER},
+    'tier_t1': {'fill': T1_FILL, 'border': THIN_BORDER},
+    'tier_t2': {'fill': T2_FILL, 'border': THIN_BORDER},
+    'tier_t3': {'fill': T3_FILL, 'border': THIN_BORDER},
+    'detection': {'alignment': CENTER, 'border': THIN_BORDER},
+    'detection_pass': {'fill': PASS_FILL, 'alignment': CENTER, 'border': THIN_BORDER},
+    'detection_partial': {'fill': PARTIAL_FILL, 'alignment': CENTER, 'border': THIN_BORDER},
+    'detection_fail': {'fill': FAIL_FILL, 'alignment': CENTER, 'border': THIN_BORDER},
+}
+TIER_STYLES = {'T1': 'tier_t1', 'T2': 'tier_t2', 'T3': 'tier_t3'}
+DETECTION_STYLES = {'Y': 'detection_pass', '△': 'detection_partial', 'P': 'detection_partial',
+                    'N': 'detection_fail', 'NMI': 'detection_fail'}
 
-TIER_FILLS = {'T1': T1_FILL, 'T2': T2_FILL, 'T3': T3_FILL}
-DETECTION_FILLS = {'Y': PASS_FILL, '△': PARTIAL_FILL, 'P': PARTIAL_FILL, 'N': FAIL_FILL, 'NMI': FAIL_FILL}
+MANIFEST_NAME = "_workbook_manifest.json"
+# Bump when workbook layout changes so existing workbooks are rebuilt
+MANIFEST_VERSION = 1
+
+# Fields each workbook reads from an aggregated evaluation
+MASTER_FIELDS = ('summary',)
+CONTRACT_FIELDS = ('summary',) + tuple(
+    f'gt_evaluations[*].{name}'
+    for name in ('gt_id', 'clause', 'tier', 'issue', 'detection', 'total_points')
+)
 
 
 def discover_structure(base_path: Path):
@@ -59,68 +102,67 @@ def discover_structure(base_path: Path):
     return contracts, sorted(models)
 
 
-def load_aggregated(base_path: Path, contract: str, model: str):
-    """Load aggregated JSON for contract/model."""
+def load_aggregated(base_path: Path, contract: str, model: str, fields=None):
+    """Load aggregated JSON for contract/model (only `fields` if given)."""
     path = base_path / contract / f"{model}.json"
     if not path.exists():
         return None
+    if fields is not None:
+        return read_fields(path, fields)
     with open(path) as f:
         return json.load(f)
 
 
-def apply_header_style(ws, row, cols):
-    """Apply header styling to a row."""
-    for col in range(1, cols + 1):
-        cell = ws.cell(row=row, column=col)
-        cell.fill = HEADER_FILL
-        cell.font = HEADER_FONT
-        cell.alignment = Alignment(horizontal='center', wrap_text=True)
-        cell.border = THIN_BORDER
+def titled_sheet(title: str, heading: str, headers: list, **widths) -> SheetBuffer:
+    """Sheet with a title in A1, a blank row and a header row."""
+    sheet = SheetBuffer(title, **widths)
+    sheet.append([heading], 'title')
+    sheet.append([])
+    sheet.append(headers, 'header')
+    return sheet
 
 
-def auto_width(ws, min_width=8, max_width=50):
-    """Auto-adjust column widths."""
-    for col_idx in range(1, ws.max_column + 1):
-        max_length = 0
-        column_letter = get_column_letter(col_idx)
-        for row_idx in range(1, min(ws.max_row + 1, 100)):  # Sample first 100 rows
-            cell = ws.cell(row=row_idx, column=col_idx)
-            if cell.value:
-                max_length = max(max_length, len(str(cell.value)))
-        ws.column_dimensions[column_letter].width = min(max(max_length + 2, min_width), max_width)
+def pass_style(passed: bool) -> str:
+    return 'pass' if passed else 'fail'
 
 
-def generate_master_workbook(base_path: Path, contracts: list, models: list, output_path: Path):
-    """Generate master workbook with all contract/model results."""
-    wb = Workbook()
+def load_summaries(base_path: Path, contract: str, models: list) -> Dict[str, dict]:
+    """Model -> summary for one contract's aggregated files."""
+    summaries = {}
+    for model in models:
+        agg = load_aggregated(base_path, contract, model, MASTER_FIELDS)
+        if agg and 'summary' in agg:
+            summaries[model] = agg['summary']
+    return summaries
+
+
+def generate_master_workbook(
+    base_path: Path,
+    contracts: list,
+    models: list,
+    output_path: Path,
+    summaries: Optional[Dict[str, Dict[str, dict]]] = None,
+):
+    """
+    Generate master workbook with all contract/model results.
+
+    summaries (contract -> model -> summary) replaces reading the
+    aggregated files for the contracts it covers.
+    """
+    book = StreamingWorkbook(NAMED_STYLES)
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
-    
-    # === SUMMARY RANKINGS ===
-    ws = wb.active
-    ws.title = "Summary Rankings"
-    
-    ws.merge_cells('A1:P1')
-    ws['A1'] = "LEAH MODEL EVALUATION - TEST RESULTS"
-    ws['A1'].font = TITLE_FONT
-    ws['A1'].alignment = Alignment(horizontal='center')
-    
-    ws.merge_cells('A2:P2')
-    ws['A2'] = f"Generated: {timestamp}"
-    ws['A2'].alignment = Alignment(horizontal='center')
-    
-    headers = ["Rank", "Contract", "Model", "Raw Score", "Penalty", "Final Score", 
-               "Det Pts", "Qual Pts", "T1 Gate", "T1%", "T2%", "T3%", "Y", "P", "N", "NMI"]
-    for col, header in enumerate(headers, 1):
-        ws.cell(row=4, column=col, value=header)
-    apply_header_style(ws, 4, len(headers))
+    summaries = summaries or {}
     
     # Collect all results
     results = []
     for contract in contracts:
+        if contract in summaries:
+            contract_summaries = summaries[contract]
+        else:
+            contract_summaries = load_summaries(base_path, contract, models)
         for model in models:
-            agg = load_aggregated(base_path, contract, model)
-            if agg and 'summary' in agg:
-                s = agg['summary']
+            if model in contract_summaries:
+                s = contract_summaries[model]
                 det_by_tier = s.get('detection_by_tier', {})
                 det_counts = s.get('detection_counts', {})
                 
@@ -147,43 +189,42 @@ def generate_master_workbook(base_path: Path, contracts: list, models: list, out
     # Sort by final score
     results.sort(key=lambda x: x['final_score'], reverse=True)
     
-    for i, r in enumerate(results, 1):
-        row = i + 4
-        ws.cell(row=row, column=1, value=i)
-        ws.cell(row=row, column=2, value=r['contract'])
-        ws.cell(row=row, column=3, value=r['model'])
-        ws.cell(row=row, column=4, value=round(r['raw_score'], 2))
-        ws.cell(row=row, column=5, value=f"{r['penalty']}%" if r['penalty'] else "-")
-        ws.cell(row=row, column=6, value=round(r['final_score'], 2))
-        ws.cell(row=row, column=7, value=round(r['det_pts'], 1))
-        ws.cell(row=row, column=8, value=round(r['qual_pts'], 1))
-        
-        t1_cell = ws.cell(row=row, column=9, value="PASS" if r['t1_pass'] else "FAIL")
-        t1_cell.fill = PASS_FILL if r['t1_pass'] else FAIL_FILL
-        
-        ws.cell(row=row, column=10, value=f"{r['t1_pct']:.0f}%")
-        ws.cell(row=row, column=11, value=f"{r['t2_pct']:.0f}%")
-        ws.cell(row=row, column=12, value=f"{r['t3_pct']:.0f}%")
-        ws.cell(row=row, column=13, value=r['y'])
-        ws.cell(row=row, column=14, value=r['partial'])
-        ws.cell(row=row, column=15, value=r['n'])
-        ws.cell(row=row, column=16, value=r['nmi'])
-        
-        for col in range(1, 17):
-            ws.cell(row=row, column=col).border = THIN_BORDER
+    # === SUMMARY RANKINGS ===
+    ws = SheetBuffer("Summary Rankings")
+    ws.append(["LEAH MODEL EVALUATION - TEST RESULTS"], 'title_centered')
+    ws.merge('A1:P1')
+    ws.append([f"Generated: {timestamp}"], 'centered')
+    ws.merge('A2:P2')
+    ws.append([])
+    ws.append(["Rank", "Contract", "Model", "Raw Score", "Penalty", "Final Score",
+               "Det Pts", "Qual Pts", "T1 Gate", "T1%", "T2%", "T3%", "Y", "P", "N", "NMI"], 'header')
     
-    auto_width(ws)
+    for i, r in enumerate(results, 1):
+        ws.append([
+            i,
+            r['contract'],
+            r['model'],
+            round(r['raw_score'], 2),
+            f"{r['penalty']}%" if r['penalty'] else "-",
+            round(r['final_score'], 2),
+            round(r['det_pts'], 1),
+            round(r['qual_pts'], 1),
+            "PASS" if r['t1_pass'] else "FAIL",
+            f"{r['t1_pct']:.0f}%",
+            f"{r['t2_pct']:.0f}%",
+            f"{r['t3_pct']:.0f}%",
+            r['y'],
+            r['partial'],
+            r['n'],
+            r['nmi'],
+        ], ['cell'] * 8 + [pass_style(r['t1_pass'])] + ['cell'] * 7)
+    
+    book.write_sheet(ws)
     
     # === MODEL AGGREGATES ===
-    ws2 = wb.create_sheet("Model Aggregates")
-    ws2['A1'] = "Model Performance Across All Contracts"
-    ws2['A1'].font = TITLE_FONT
-    
-    headers = ["Model", "Contracts", "Total Final", "Avg Final", "Total Raw", 
-               "Penalties Applied", "T1 Pass Rate", "Avg T1%", "Avg T2%", "Avg T3%", "Total Y", "Total N"]
-    for col, header in enumerate(headers, 1):
-        ws2.cell(row=3, column=col, value=header)
-    apply_header_style(ws2, 3, len(headers))
+    ws2 = titled_sheet("Model Aggregates", "Model Performance Across All Contracts", [
+        "Model", "Contracts", "Total Final", "Avg Final", "Total Raw",
+        "Penalties Applied", "T1 Pass Rate", "Avg T1%", "Avg T2%", "Avg T3%", "Total Y", "Total N"])
     
     # Aggregate by model
     model_agg = {}
@@ -205,35 +246,27 @@ def generate_master_workbook(base_path: Path, contracts: list, models: list, out
     
     sorted_models = sorted(model_agg.items(), key=lambda x: sum(x[1]['scores']), reverse=True)
     
-    for i, (model, ma) in enumerate(sorted_models, 1):
-        row = i + 3
-        ws2.cell(row=row, column=1, value=model)
-        ws2.cell(row=row, column=2, value=ma['count'])
-        ws2.cell(row=row, column=3, value=round(sum(ma['scores']), 2))
-        ws2.cell(row=row, column=4, value=round(sum(ma['scores']) / ma['count'], 2))
-        ws2.cell(row=row, column=5, value=round(sum(ma['raw']), 2))
-        ws2.cell(row=row, column=6, value=ma['penalties'] if ma['penalties'] else "")
-        ws2.cell(row=row, column=7, value=f"{ma['t1_pass'] / ma['count'] * 100:.0f}%")
-        ws2.cell(row=row, column=8, value=f"{sum(ma['t1_pct']) / len(ma['t1_pct']):.0f}%")
-        ws2.cell(row=row, column=9, value=f"{sum(ma['t2_pct']) / len(ma['t2_pct']):.0f}%")
-        ws2.cell(row=row, column=10, value=f"{sum(ma['t3_pct']) / len(ma['t3_pct']):.0f}%")
-        ws2.cell(row=row, column=11, value=ma['y'])
-        ws2.cell(row=row, column=12, value=ma['n'])
-        
-        for col in range(1, 13):
-            ws2.cell(row=row, column=col).border = THIN_BORDER
-    
-    auto_width(ws2)
+    for model, ma in sorted_models:
+        ws2.append([
+            model,
+            ma['count'],
+            round(sum(ma['scores']), 2),
+            round(sum(ma['scores']) / ma['count'], 2),
+            round(sum(ma['raw']), 2),
+            ma['penalties'] if ma['penalties'] else "",
+            f"{ma['t1_pass'] / ma['count'] * 100:.0f}%",
+            f"{sum(ma['t1_pct']) / len(ma['t1_pct']):.0f}%",
+            f"{sum(ma['t2_pct']) / len(ma['t2_pct']):.0f}%",
+            f"{sum(ma['t3_pct']) / len(ma['t3_pct']):.0f}%",
+            ma['y'],
+            ma['n'],
+        ], 'cell')
+    
+    book.write_sheet(ws2)
     
     # === CONTRACT COMPARISON ===
-    ws3 = wb.create_sheet("Contract Comparison")
-    ws3['A1'] = "Contract Difficulty Analysis"
-    ws3['A1'].font = TITLE_FONT
-    
-    headers = ["Contract", "Best Model", "Best Score", "Worst Model", "Worst Score", "Spread", "Avg Score", "All T1 Pass"]
-    for col, header in enumerate(headers, 1):
-        ws3.cell(row=3, column=col, value=header)
-    apply_header_style(ws3, 3, len(headers))
+    ws3 = titled_sheet("Contract Comparison", "Contract Difficulty Analysis", [
+        "Contract", "Best Model", "Best Score", "Worst Model", "Worst Score", "Spread", "Avg Score", "All T1 Pass"])
     
     # Aggregate by contract
     contract_results = {}
@@ -243,7 +276,6 @@ def generate_master_workbook(base_path: Path, contracts: list, models: list, out
             contract_results[c] = []
         contract_results[c].append(r)
     
-    row = 4
     for contract, cr in sorted(contract_results.items(), key=lambda x: max(r['final_score'] for r in x[1]), reverse=True):
         cr.sort(key=lambda x: x['final_score'], reverse=True)
         best = cr[0]
@@ -251,81 +283,68 @@ def generate_master_workbook(base_path: Path, contracts: list, models: list, out
         avg = sum(r['final_score'] for r in cr) / len(cr)
         all_pass = all(r['t1_pass'] for r in cr)
         
-        ws3.cell(row=row, column=1, value=contract)
-        ws3.cell(row=row, column=2, value=best['model'])
-        ws3.cell(row=row, column=3, value=round(best['final_score'], 2))
-        ws3.cell(row=row, column=4, value=worst['model'])
-        ws3.cell(row=row, column=5, value=round(worst['final_score'], 2))
-        ws3.cell(row=row, column=6, value=round(best['final_score'] - worst['final_score'], 2))
-        ws3.cell(row=row, column=7, value=round(avg, 2))
-        
-        pass_cell = ws3.cell(row=row, column=8, value="Yes" if all_pass else "No")
-        pass_cell.fill = PASS_FILL if all_pass else FAIL_FILL
-        
-        for col in range(1, 9):
-            ws3.cell(row=row, column=col).border = THIN_BORDER
-        row += 1
-    
-    auto_width(ws3)
+        ws3.append([
+            contract,
+            best['model'],
+            round(best['final_score'], 2),
+            worst['model'],
+            round(worst['final_score'], 2),
+            round(best['final_score'] - worst['final_score'], 2),
+            round(avg, 2),
+            "Yes" if all_pass else "No",
+        ], ['cell'] * 7 + [pass_style(all_pass)])
+    
+    book.write_sheet(ws3)
     
     # === PENALTY IMPACT ===
-    ws4 = wb.create_sheet("Penalty Impact")
-    ws4['A1'] = "Extra Step Penalty Analysis"
-    ws4['A1'].font = TITLE_FONT
-    
-    headers = ["Contract", "Model", "Raw Score", "Penalty", "Final Score", "Points Lost"]
-    for col, header in enumerate(headers, 1):
-        ws4.cell(row=3, column=col, value=header)
-    apply_header_style(ws4, 3, len(headers))
+    ws4 = titled_sheet("Penalty Impact", "Extra Step Penalty Analysis", [
+        "Contract", "Model", "Raw Score", "Penalty", "Final Score", "Points Lost"])
     
     penalized = [r for r in results if r['penalty']]
-    row = 4
     for r in sorted(penalized, key=lambda x: x['raw_score'] - x['final_score'], reverse=True):
-        ws4.cell(row=row, column=1, value=r['contract'])
-        ws4.cell(row=row, column=2, value=r['model'])
-        ws4.cell(row=row, column=3, value=round(r['raw_score'], 2))
-        ws4.cell(row=row, column=4, value=f"{r['penalty']}%")
-        ws4.cell(row=row, column=5, value=round(r['final_score'], 2))
-        ws4.cell(row=row, column=6, value=round(r['raw_score'] - r['final_score'], 2))
-        
-        for col in range(1, 7):
-            ws4.cell(row=row, column=col).border = THIN_BORDER
-        row += 1
+        ws4.append([
+            r['contract'],
+            r['model'],
+            round(r['raw_score'], 2),
+            f"{r['penalty']}%",
+            round(r['final_score'], 2),
+            round(r['raw_score'] - r['final_score'], 2),
+        ], 'cell')
     
-    auto_width(ws4)
+    book.write_sheet(ws4)
     
     # Save
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(output_path)
+    book.save(output_path)
     
     return results
 
 
-def generate_contract_workbook(base_path: Path, contract: str, models: list, output_path: Path):
-    """Generate detailed workbook for a single contract."""
+def load_contract(base_path: Path, contract: str, models: list) -> Dict[str, dict]:
+    """Model -> CONTRACT_FIELDS of each aggregated file of one contract."""
     models_data = {}
     for model in models:
-        agg = load_aggregated(base_path, contract, model)
+        agg = load_aggregated(base_path, contract, model, CONTRACT_FIELDS)
         if agg:
             models_data[model] = agg
-    
+    return models_data
+
+
+def generate_contract_workbook(base_path: Path, contract: str, models: list, output_path: Path):
+    """Generate detailed workbook for a single contract."""
+    models_data = load_contract(base_path, contract, models)
     if not models_data:
         return None
-    
-    wb = Workbook()
+    return write_contract_workbook(contract, models_data, output_path)
+
+
+def write_contract_workbook(contract: str, models_data: Dict[str, dict], output_path: Path):
+    """Write a contract workbook from load_contract() data."""
+    book = StreamingWorkbook(NAMED_STYLES)
     
     # === SUMMARY ===
-    ws = wb.active
-    ws.title = "Summary"
-    
-    ws.merge_cells('A1:M1')
-    ws['A1'] = f"{contract.upper()} - MODEL COMPARISON"
-    ws['A1'].font = TITLE_FONT
-    
-    headers = ["Rank", "Model", "Total", "Det Pts", "Qual Pts", "T1", "T1%", "T2%", "T3%", "Y", "P", "N", "NMI"]
-    for col, header in enumerate(headers, 1):
-        ws.cell(row=3, column=col, value=header)
-    apply_header_style(ws, 3, len(headers))
+    ws = titled_sheet("Summary", f"{contract.upper()} - MODEL COMPARISON", [
+        "Rank", "Model", "Total", "Det Pts", "Qual Pts", "T1", "T1%", "T2%", "T3%", "Y", "P", "N", "NMI"])
+    ws.merge('A1:M1')
     
     results = []
     for model, agg in models_data.items():
@@ -351,86 +370,205 @@ def generate_contract_workbook(base_path: Path, contract: str, models: list, out
     results.sort(key=lambda x: x['total'], reverse=True)
     
     for i, r in enumerate(results, 1):
-        row = i + 3
-        ws.cell(row=row, column=1, value=i)
-        ws.cell(row=row, column=2, value=r['model'])
-        ws.cell(row=row, column=3, value=round(r['total'], 2))
-        ws.cell(row=row, column=4, value=round(r['det'], 1))
-        ws.cell(row=row, column=5, value=round(r['qual'], 1))
-        
-        t1_cell = ws.cell(row=row, column=6, value="PASS" if r['t1_pass'] else "FAIL")
-        t1_cell.fill = PASS_FILL if r['t1_pass'] else FAIL_FILL
-        
-        ws.cell(row=row, column=7, value=f"{r['t1_pct']:.0f}%")
-        ws.cell(row=row, column=8, value=f"{r['t2_pct']:.0f}%")
-        ws.cell(row=row, column=9, value=f"{r['t3_pct']:.0f}%")
-        ws.cell(row=row, column=10, value=r['y'])
-        ws.cell(row=row, column=11, value=r['partial'])
-        ws.cell(row=row, column=12, value=r['n'])
-        ws.cell(row=row, column=13, value=r['nmi'])
-        
-        for col in range(1, 14):
-            ws.cell(row=row, column=col).border = THIN_BORDER
-    
-    auto_width(ws)
+        ws.append([
+            i,
+            r['model'],
+            round(r['total'], 2),
+            round(r['det'], 1),
+            round(r['qual'], 1),
+            "PASS" if r['t1_pass'] else "FAIL",
+            f"{r['t1_pct']:.0f}%",
+            f"{r['t2_pct']:.0f}%",
+            f"{r['t3_pct']:.0f}%",
+            r['y'],
+            r['partial'],
+            r['n'],
+            r['nmi'],
+        ], ['cell'] * 5 + [pass_style(r['t1_pass'])] + ['cell'] * 7)
+    
+    book.write_sheet(ws)
     
     # === GT MATRIX ===
-    ws2 = wb.create_sheet("GT Matrix")
+    ws2 = SheetBuffer("GT Matrix", max_width=40)
     
     first_model = list(models_data.values())[0]
     gt_items = first_model.get('gt_evaluations', [])
+    model_evals = [agg.get('gt_evaluations', []) for agg in models_data.values()]
     
-    headers = ["GT ID", "Clause", "Tier", "Issue"] + list(models_data.keys())
-    for col, header in enumerate(headers, 1):
-        ws2.cell(row=1, column=col, value=header)
-    apply_header_style(ws2, 1, len(headers))
+    ws2.append(["GT ID", "Clause", "Tier", "Issue"] + list(models_data.keys()), 'header')
     
     for i, gt in enumerate(gt_items):
-        row = i + 2
-        ws2.cell(row=row, column=1, value=gt.get('gt_id', ''))
-        ws2.cell(row=row, column=2, value=gt.get('clause', ''))
-        ws2.cell(row=row, column=3, value=gt.get('tier', ''))
-        ws2.cell(row=row, column=4, value=gt.get('issue', '')[:50])
-        
-        tier_fill = TIER_FILLS.get(gt.get('tier'))
-        if tier_fill:
-            for c in range(1, 5):
-                ws2.cell(row=row, column=c).fill = tier_fill
+        values = [gt.get('gt_id', ''), gt.get('clause', ''), gt.get('tier', ''), gt.get('issue', '')[:50]]
+        styles = [TIER_STYLES.get(gt.get('tier'), 'cell')] * 4
         
-        for j, (model, agg) in enumerate(models_data.items(), 5):
-            gt_evals = agg.get('gt_evaluations', [])
+        for gt_evals in model_evals:
             m_gt = gt_evals[i] if i < len(gt_evals) else {}
             det = m_gt.get('detection', 'NMI')
             pts = m_gt.get('total_points', 0)
-            
-            cell = ws2.cell(row=row, column=j, value=f"{det} ({pts:.1f})")
-            det_fill = DETECTION_FILLS.get(det)
-            if det_fill:
-                cell.fill = det_fill
-            cell.alignment = Alignment(horizontal='center')
+            values.append(f"{det} ({pts:.1f})")
+            styles.append(DETECTION_STYLES.get(det, 'detection'))
         
-        for c in range(1, 5 + len(models_data)):
-            ws2.cell(row=row, column=c).border = THIN_BORDER
+        ws2.append(values, styles)
     
-    auto_width(ws2, max_width=40)
+    book.write_sheet(ws2)
     
     # Save
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(output_path)
+    book.save(output_path)
     
     return output_path
 
 
+def contract_inputs(base_path: Path, contract: str, models: list) -> list:
+    """Aggregated files a contract workbook is built from, in model order."""
+    return [
+        (model, base_path / contract / f"{model}.json")
+        for model in models
+        if (base_path / contract / f"{model}.json").exists()
+    ]
+
+
+def load_manifest(output_dir: Path) -> Dict[str, Any]:
+    """
+    Per-contract entries recorded by the last run.
+
+    Returns an empty dict if the manifest is missing, unreadable or was
+    written by a different MANIFEST_VERSION.
+    """
+    try:
+        with open(output_dir / MANIFEST_NAME) as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("contracts", {})
+
+
+def contract_unchanged(inputs: list, entry: Dict[str, Any], output_path: Path) -> bool:
+    """Check a contract's inputs against its manifest entry and that its workbook exists."""
+    if not output_path.exists():
+        return False
+
+    recorded = entry.get("inputs", [])
+    if [r.get("model") for r in recorded] != [model for model, _ in inputs]:
+        return False
+
+    return all(
+        fingerprint_matches(path, fingerprint)
+        for (_, path), fingerprint in zip(inputs, recorded)
+    )
+
+
+def build_contract(base_path: Path, contract: str, models: list, output_path: Path) -> Dict[str, Any]:
+    """
+    Worker: write one contract workbook.
+
+    Returns the manifest entry for the contract: input fingerprints (taken
+    before reading, so a file changed mid-build is rebuilt next time), the
+    model summaries for the master workbook, and whether a workbook was
+    written.
+    """
+    inputs = [
+        {"model": model, **file_fingerprint(path)}
+        for model, path in contract_inputs(base_path, contract, models)
+    ]
+    models_data = load_contract(base_path, contract, models)
+    written = bool(models_data)
+    if written:
+        write_contract_workbook(contract, models_data, output_path)
+    return {
+        "inputs": inputs,
+        "summaries": {
+            model: agg['summary'] for model, agg in models_data.items() if 'summary' in agg
+        },
+        "written": written,
+    }
+
+
+def build_contracts(
+    base_path: Path,
+    contracts: list,
+    models: list,
+    output_dir: Path,
+    max_workers: Optional[int] = None,
+    full: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Build the contract workbooks that are missing or out of date.
+
+    Args:
+        base_path: Aggregated evaluation data
+        contracts: Contracts to build
+        models: Models to include
+        output_dir: Workbook directory (holds the manifest)
+        max_workers: Process pool size (default: CPU count; 1 = in-process)
+        full: Ignore the manifest and rebuild every contract
+
+    Returns:
+        contract -> {"status": "built" | "unchanged" | "no data" | "failed",
+        "summaries": model -> summary, "error": message if failed}
+    """
+    previous = {} if full else load_manifest(output_dir)
+    entries: Dict[str, Dict[str, Any]] = {}
+    outcomes: Dict[str, Dict[str, Any]] = {}
+    to_build = []
+
+    for contract in contracts:
+        output_path = output_dir / f"{contract.upper()}_Evaluations.xlsx"
+        entry = previous.get(contract)
+        if entry and contract_unchanged(contract_inputs(base_path, contract, models), entry, output_path):
+            entries[contract] = entry
+            outcomes[contract] = {"status": "unchanged", "summaries": entry["summaries"]}
+        else:
+            to_build.append((contract, output_path))
+
+    workers = min(max_workers or os.cpu_count() or 1, len(to_build))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                (contract, pool.submit(build_contract, base_path, contract, models, output_path))
+                for contract, output_path in to_build
+            ]
+            results = [(contract, future.exception() or future.result()) for contract, future in futures]
+    else:
+        results = []
+        for contract, output_path in to_build:
+            try:
+                results.append((contract, build_contract(base_path, contract, models, output_path)))
+            except Exception as e:
+                results.append((contract, e))
+
+    for contract, result in results:
+        if isinstance(result, Exception):
+            outcomes[contract] = {"status": "failed", "summaries": {}, "error": str(result)}
+        elif result.pop("written"):
+            entries[contract] = result
+            outcomes[contract] = {"status": "built", "summaries": result["summaries"]}
+        else:
+            outcomes[contract] = {"status": "no data", "summaries": {}}
+
+    # Entries of contracts outside this run (--contract) are kept
+    kept = {c: e for c, e in previous.items() if c not in outcomes}
+    atomic_write_json(
+        output_dir / MANIFEST_NAME,
+        {"version": MANIFEST_VERSION, "contracts": {**kept, **entries}},
+        indent=2
+    )
+    return {contract: outcomes[contract] for contract in contracts}
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Generate evaluation workbooks from aggregated data',
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-    python generate_workbooks.py --base-path ./aggregated
-    python generate_workbooks.py --base-path ./aggregated --output-dir ./workbooks
-    python generate_workbooks.py --base-path ./aggregated --contract consulting
-    python generate_workbooks.py --base-path ./aggregated --master-only
+    python -m framework.scripts.generate_workbooks --base-path ./aggregated
+    python -m framework.scripts.generate_workbooks --base-path ./aggregated --output-dir ./workbooks
+    python -m framework.scripts.generate_workbooks --base-path ./aggregated --contract consulting
+    python -m framework.scripts.generate_workbooks --base-path ./aggregated --master-only
+    python -m framework.scripts.generate_workbooks --base-path ./aggregated --workers 4 --full
         """
     )
     parser.add_argument('--base-path', '-b', type=Path, required=True,
@@ -443,6 +581,10 @@ Examples:
                         help='Only generate master workbook')
     parser.add_argument('--skip-master', action='store_true',
                         help='Skip master workbook, only generate per-contract')
+    parser.add_argument('--workers', '-w', type=int,
+                        help='Process pool size for contract workbooks (default: CPU count)')
+    parser.add_argument('--full', action='store_true',
+                        help='Rebuild every contract workbook, ignoring the manifest')
     args = parser.parse_args()
     
     if not args.base_path.exists():
@@ -470,29 +612,40 @@ Examples:
             exit(1)
         contracts = [args.contract]
     
-    # Master workbook
-    if not args.skip_master:
+    master_path = output_dir / "MASTER_EVALUATION_WORKBOOK.xlsx"
+    if args.master_only:
         print("Generating MASTER_EVALUATION_WORKBOOK.xlsx...", end=" ")
-        master_path = output_dir / "MASTER_EVALUATION_WORKBOOK.xlsx"
-        results = generate_master_workbook(args.base_path, contracts, models, master_path)
+        generate_master_workbook(args.base_path, contracts, models, master_path)
         print("✓")
-        
-        if args.master_only:
-            print(f"\nOutput: {master_path}")
-            return
+        print(f"\nOutput: {master_path}")
+        return
     
     # Per-contract workbooks
-    for contract in contracts:
-        filename = f"{contract.upper()}_Evaluations.xlsx"
-        print(f"Generating {filename}...", end=" ")
-        contract_path = output_dir / filename
-        result = generate_contract_workbook(args.base_path, contract, models, contract_path)
-        print("✓" if result else "✗ (no data)")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    outcomes = build_contracts(args.base_path, contracts, models, output_dir,
+                               max_workers=args.workers, full=args.full)
+    marks = {"built": "✓", "unchanged": "✓ (unchanged)", "no data": "✗ (no data)"}
+    for contract, outcome in outcomes.items():
+        mark = marks.get(outcome["status"]) or f"✗ ({outcome['error']})"
+        print(f"{contract.upper()}_Evaluations.xlsx {mark}")
+    
+    # Master workbook, from the summaries the contract builds recorded
+    if not args.skip_master:
+        print("Generating MASTER_EVALUATION_WORKBOOK.xlsx...", end=" ")
+        summaries = {
+            contract: outcome["summaries"]
+            for contract, outcome in outcomes.items() if outcome["status"] != "failed"
+        }
+        generate_master_workbook(args.base_path, contracts, models, master_path, summaries=summaries)
+        print("✓")
     
     print(f"\n{'='*60}")
     print("WORKBOOKS GENERATED")
     print(f"{'='*60}")
     print(f"Output: {output_dir}")
+    
+    if any(outcome["status"] == "failed" for outcome in outcomes.values()):
+        exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,211 @@
+"""Compiled per-file Ground Truth index.
+
+A GroundTruthIndex is built once from a GT file and answers the questions
+scoring, summaries and scripts otherwise answer by rescanning the item list:
+gt_id -> position, per-tier counts, max detection points under a tier
+config, the red-flag subset (guidelines) and the redline clause set
+(stacking).
+
+load_indexes() compiles every GT file in a directory and keeps the result in
+a binary cache (_gt_index.pickle) next to the directory's _manifest.json.
+Cache entries are revalidated against each file's fingerprint, so an edited
+GT file is recompiled on its next load.
+"""
+
+import json
+import logging
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from framework.fileio import file_fingerprint, fingerprint_matches
+from framework.scoring.clauses import normalise_clause_ref
+
+logger = logging.getLogger(__name__)
+
+# Item lists in a GT file, in lookup order (stacking Part A uses part_a_cp_redlines)
+GT_ITEM_KEYS = ("ground_truth", "part_a_cp_redlines")
+
+INDEX_CACHE_NAME = "_gt_index.pickle"
+# Bump when GroundTruthIndex changes shape; older caches are rebuilt
+INDEX_CACHE_FORMAT = 1
+
+RED_FLAG_STANDARD = "red flag"
+
+
+def gt_items(data: dict) -> list:
+    """The item list of a parsed GT file (empty if it has none)."""
+    for key in GT_ITEM_KEYS:
+        if isinstance(data.get(key), list):
+            return data[key]
+    return []
+
+
+@dataclass(frozen=True, eq=False)
+class GroundTruthIndex:
+    """
+    Precompiled lookups over one GT file's items.
+
+    Per-item tuples (ids, tiers, clauses, issues) are in file order. Items
+    without a gt_id/test_id have id None and no entry in positions; items
+    without a tier have tier None and are counted in untiered rather than
+    tier_counts.
+    """
+    ids: tuple
+    positions: Dict[str, int]
+    tiers: tuple
+    clauses: tuple
+    issues: tuple
+    tier_counts: Dict[str, int]
+    untiered: int
+    red_flag_ids: tuple
+    redline_clauses: frozenset
+
+    @classmethod
+    def from_items(cls, items: list) -> "GroundTruthIndex":
+        ids, tiers, clauses, issues, red_flags = [], [], [], [], []
+        positions: Dict[str, int] = {}
+        tier_counts: Dict[str, int] = {}
+        redline_clauses = set()
+
+        for position, item in enumerate(items):
+            item_id = item.get("gt_id") or item.get("test_id")
+            tier = item.get("tier")
+            ids.append(item_id)
+            tiers.append(tier)
+            clauses.append(item.get("clause") or item.get("clause_ref") or "")
+            issues.append(item.get("issue", ""))
+
+            if item_id is not None:
+                positions.setdefault(item_id, position)
+            if tier is not None:
+                tier_counts[tier] = tier_counts.get(tier, 0) + 1
+            if str(item.get("playbook_standard", "")).lower() == RED_FLAG_STANDARD:
+                red_flags.append(item_id)
+
+            # Same normalisation as validators.build_redline_clause_set
+            if item.get("clause_ref"):
+                redline_clauses.add(normalise_clause_ref(item["clause_ref"]))
+            if item.get("section"):
+                redline_clauses.add(normalise_clause_ref(str(item["section"])))
+
+        return cls(
+            ids=tuple(ids),
+            positions=positions,
+            tiers=tuple(tiers),
+            clauses=tuple(clauses),
+            issues=tuple(issues),
+            tier_counts=tier_counts,
+            untiered=len(items) - sum(tier_counts.values()),
+            red_flag_ids=tuple(red_flags),
+            redline_clauses=frozenset(redline_clauses),
+        )
+
+    @classmethod
+    def from_data(cls, data: dict) -> "GroundTruthIndex":
+        return cls.from_items(gt_items(data))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def position(self, gt_id: str) -> Optional[int]:
+        """File position of gt_id (or test_id), or None if not in this file."""
+        return self.positions.get(gt_id)
+
+    def tier_of(self, gt_id: str) -> Optional[str]:
+        position = self.positions.get(gt_id)
+        return self.tiers[position] if position is not None else None
+
+    def max_points(self, tier_config: Dict[str, Dict[str, float]], default_max: float = 1) -> float:
+        """Max detection points (all Y) of the tiered items under a detection_points config."""
+        return float(sum(
+            count * tier_config.get(tier, {}).get("Y", default_max)
+            for tier, count in self.tier_counts.items()
+        ))
+
+    def max_detection_points(self, matrix, default_tier: str = "T3") -> float:
+        """
+        Max detection points under a compiled PointsMatrix.
+
+        Matches score_batch(...).max_total over all items, with untiered
+        items scored as default_tier.
+        """
+        counts = dict(self.tier_counts)
+        if self.untiered:
+            counts[default_tier] = counts.get(default_tier, 0) + self.untiered
+        return float(sum(
+            count * float(matrix.max_points[matrix.tier_code(tier)])
+            for tier, count in counts.items()
+        ))
+
+
+def _read_index_cache(cache_path: Path) -> Dict[str, tuple]:
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable GT index cache {cache_path}: {e}")
+        return {}
+    if not isinstance(cached, dict) or cached.get("format") != INDEX_CACHE_FORMAT:
+        return {}
+    return cached.get("files", {})
+
+
+def _write_index_cache(cache_path: Path, files: Dict[str, tuple]) -> None:
+    payload = pickle.dumps({"format": INDEX_CACHE_FORMAT, "files": files}, protocol=pickle.HIGHEST_PROTOCOL)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{cache_path.name}.", suffix=".tmp", dir=cache_path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_name, cache_path)
+    except OSError as e:
+        # A read-only checkout still gets its indexes, just not cached
+        logger.warning(f"Could not write GT index cache {cache_path}: {e}")
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+
+
+def load_indexes(gt_dir: Path, write_cache: bool = True) -> Dict[str, GroundTruthIndex]:
+    """
+    Compiled indexes for every GT file in a directory, keyed by file stem.
+
+    Underscore-prefixed files (_manifest.json, _changelog.json) are skipped.
+    Unchanged files are served from gt_dir/_gt_index.pickle; new or edited
+    ones are parsed, compiled and written back to the cache.
+
+    Args:
+        gt_dir: Ground truth directory
+        write_cache: Update the on-disk cache when anything was recompiled
+
+    Raises:
+        json.JSONDecodeError: If a GT file that needs compiling is not valid JSON
+    """
+    gt_dir = Path(gt_dir)
+    cache_path = gt_dir / INDEX_CACHE_NAME
+    cached = _read_index_cache(cache_path)
+
+    files: Dict[str, tuple] = {}
+    changed = False
+    for path in sorted(gt_dir.glob("*.json")):
+        if path.name.startswith("_"):
+            continue
+        entry = cached.get(path.name)
+        if entry is not None and fingerprint_matches(path, entry[0]):
+            files[path.name] = entry
+            continue
+        with open(path) as f:
+            index = GroundTruthIndex.from_data(json.load(f))
+        files[path.name] = (file_fingerprint(path), index)
+        changed = True
+
+    if write_cache and (changed or files.keys() != cached.keys()):
+        _write_index_cache(cache_path, files)
+
+    return {Path(name).stem: index for name, (_, index) in files.items()}
@@ -4,12 +4,125 @@ Interprets gt_structure from mode config to load GT files correctly for:
 - flat: One GT file per contract (freeform, guidelines)
 - dual_part: Part A + Part B (freeform_stacking)
 - per_contract_type: One GT file per contract type (rules, rules_stacking)
+
+Parsed GT files are held in a process-wide LRU cache keyed by resolved path
+and checked against the file's mtime and size on every load, so a GT file is
+read once however many GTLoader instances, modes or (contract, model) pairs
+use it. Cached GT data is shared and must be treated as read-only.
 """
 
+from collections import OrderedDict
 from pathlib import Path
 import json
-from typing import Optional
-from dataclasses import dataclass
+import threading
+from typing import Dict, Optional
+from dataclasses import dataclass, field
+
+from .gt_index import GroundTruthIndex, gt_items
+
+
+@dataclass(frozen=True, eq=False)
+class CachedGT:
+    """
+    One parsed GT file with derived lookups.
+
+    items_by_id maps gt_id (or test_id) to item. index is the compiled
+    GroundTruthIndex of the items (positions, tier counts, red flags, ...).
+    """
+    path: Path
+    data: dict
+    items: list
+    items_by_id: Dict[str, dict]
+    index: GroundTruthIndex
+
+    @classmethod
+    def from_data(cls, path: Path, data: dict) -> "CachedGT":
+        items = gt_items(data)
+        items_by_id: Dict[str, dict] = {}
+        for item in items:
+            item_id = item.get("gt_id") or item.get("test_id")
+            if item_id is not None:
+                items_by_id[item_id] = item
+
+        return cls(path, data, items, items_by_id, GroundTruthIndex.from_items(items))
+
+    @property
+    def tier_counts(self) -> Dict[str, int]:
+        """Counts of the items that carry a tier."""
+        return self.index.tier_counts
+
+    def max_points(self, tier_config: Dict[str, Dict[str, float]], default_max: float = 1) -> float:
+        """Max detection points (all Y) under a detection_points config."""
+        return self.index.max_points(tier_config, default_max)
+
+
+class GTCache:
+    """
+    Thread-safe LRU cache of parsed GT files.
+
+    Entries are keyed by resolved path and revalidated against the file's
+    mtime and size, so an edited GT file is re-read on its next load.
+
+    Usage:
+        cache = GTCache(maxsize=64)
+        gt = cache.load(path)      # reads + parses
+        gt = cache.load(path)      # cache hit
+        cache.stats()              # {"hits": 1, "misses": 1, ...}
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Path, tuple[tuple[int, int], CachedGT]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, path: Path) -> CachedGT:
+        """
+        Return the parsed GT file at path.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        key = Path(path).resolve()
+        try:
+            stat = key.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"GT file not found: {path}")
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+        with open(key) as f:
+            gt = CachedGT.from_data(key, json.load(f))
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (version, gt)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return gt
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+# Shared by every GTLoader unless one is given its own cache
+GT_CACHE = GTCache()
 
 
 @dataclass
@@ -18,17 +131,45 @@ class GTLoadResult:
     data: dict
     gt_type: str  # flat, dual_part, per_contract_type
     source_files: list[Path]
+    parts: list[CachedGT] = field(default_factory=list)  # cached source files, in order
+
+    @property
+    def items_by_id(self) -> Dict[str, dict]:
+        """gt_id/test_id -> item across all source files."""
+        merged: Dict[str, dict] = {}
+        for part in self.parts:
+            merged.update(part.items_by_id)
+        return merged
+
+    @property
+    def tier_counts(self) -> Dict[str, int]:
+        merged: Dict[str, int] = {}
+        for part in self.parts:
+            for tier, count in part.tier_counts.items():
+                merged[tier] = merged.get(tier, 0) + count
+        return merged
+
+    @property
+    def index(self) -> Optional[GroundTruthIndex]:
+        """Compiled index of a single-file load; None for dual_part."""
+        return self.parts[0].index if len(self.parts) == 1 and self.gt_type != "dual_part" else None
+
+    def max_points(self, tier_config: Dict[str, Dict[str, float]], default_max: float = 1) -> float:
+        """Max detection points (all Y) under a detection_points config."""
+        return float(sum(part.index.max_points(tier_config, default_max) for part in self.parts))
 
 
 class GTLoader:
     """Mode-aware Ground Truth loader.
 
-    Interprets gt_structure from mode config to load GT files.
+    Interprets gt_structure from mode config to load GT files. Files are
+    read through a GTCache (by default the shared GT_CACHE).
     """
 
-    def __init__(self, mode_dir: Path, config: dict):
+    def __init__(self, mode_dir: Path, config: dict, cache: Optional[GTCache] = None):
         self.mode_dir = mode_dir
         self.config = config
+        self.cache = cache if cache is not None else GT_CACHE
         self.gt_structure = config.get("gt_structure", {})
         self.paths_config = config.get("paths", {})
         self.gt_type = self.gt_structure.get("type", "flat")
@@ -48,12 +189,9 @@ class GTLoader:
         else:
             raise ValueError(f"Unknown GT type: {self.gt_type}")
 
-    def _load_file(self, path: Path) -> dict:
-        """Load and validate a single GT file."""
-        if not path.exists():
-            raise FileNotFoundError(f"GT file not found: {path}")
-        with open(path) as f:
-            return json.load(f)
+    def _load_file(self, path: Path) -> CachedGT:
+        """Load a single GT file through the cache."""
+        return self.cache.load(path)
 
     def _load_flat(self, contract: str) -> GTLoadResult:
         """Load single GT file for contract (freeform, guidelines)."""
@@ -65,8 +203,8 @@ class GTLoader:
             pattern = "{contract}.json"
 
         gt_path = gt_dir / pattern.format(contract=contract)
-        data = self._load_file(gt_path)
-        return GTLoadResult(data=data, gt_type="flat", source_files=[gt_path])
+        gt = self._load_file(gt_path)
+        return GTLoadResult(data=gt.data, gt_type="flat", source_files=[gt_path], parts=[gt])
 
     def _load_dual_part(self, contract: str) -> GTLoadResult:
         """Load dual-part GT (Part A from this mode, Part B from freeform)."""
@@ -85,18 +223,23 @@ class GTLoader:
         part_b_path = (gt_dir / part_b_pattern.format(contract=contract)).resolve()
 
         source_files = []
+        parts = []
 
         # Load Part A (may not exist for all contracts)
         part_a_data = {"ground_truth": [], "part_a_cp_redlines": []}
         if part_a_path.exists():
-            part_a_data = self._load_file(part_a_path)
+            part_a = self._load_file(part_a_path)
+            part_a_data = part_a.data
             source_files.append(part_a_path)
+            parts.append(part_a)
 
         # Load Part B (should exist)
         part_b_data = {"ground_truth": []}
         if part_b_path.exists():
-            part_b_data = self._load_file(part_b_path)
+            part_b = self._load_file(part_b_path)
+            part_b_data = part_b.data
             source_files.append(part_b_path)
+            parts.append(part_b)
 
         return GTLoadResult(
             data={
@@ -109,7 +252,8 @@ class GTLoader:
                 }
             },
             gt_type="dual_part",
-            source_files=source_files
+            source_files=source_files,
+            parts=parts
         )
 
     def _load_per_contract_type(
@@ -138,8 +282,8 @@ class GTLoader:
                 f"Searched in: {gt_dir}"
             )
 
-        data = self._load_file(gt_path)
-        return GTLoadResult(data=data, gt_type="per_contract_type", source_files=[gt_path])
+        gt = self._load_file(gt_path)
+        return GTLoadResult(data=gt.data, gt_type="per_contract_type", source_files=[gt_path], parts=[gt])
 
     def _infer_contract_type(self, contract: str) -> str:
         """Infer contract type from contract ID prefix."""
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Persistent metrics cube over evaluation results.
+
+The cube holds pre-aggregated measures with dimensions (mode, env, model,
+contract, tier). A slab is everything one results file contributes: one
+cell per tier (GT item count, Y/P/N/NMI counts, point sums, quality score
+sums and counts, detected items with clause and redline references) plus
+contract-level measures that have no tier (additional issue assessments,
+T1 gate, Part A).
+
+update() compares each {contract}/{model}.json under a results directory
+with the fingerprint recorded for its slab and rebuilds only the slabs
+whose file is new or changed, so adding an env or a model touches nothing
+else. Queries read the cube file alone and derive metrics through the
+same MetricsAccumulator as sales_metrics, so a slice reports the same
+numbers sales_metrics would for those files. As in sales_metrics, slabs of
+a stacking mode (freeform_stacking, rules_stacking) feed only the Part A
+measures; every other slab feeds all measures except Part A.
+
+Usage:
+    python -m framework.scripts.metrics_cube update --mode freeform --env hotfix --results-dir freeform/results
+    python -m framework.scripts.metrics_cube query --model sonnet45 --tier T1 --by env
+    python -m framework.scripts.metrics_cube query --mode freeform --env hotfix --by model --json
+"""
+
+import argparse
+import json
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from framework.fileio import atomic_write_json, file_fingerprint, fingerprint_matches
+from framework.scoring import weighted_recall_points
+from framework.scripts.sales_metrics import (
+    ADDITIONAL_ASSESSMENTS,
+    QUALITY_DIMENSIONS,
+    TIER_CONFIG,
+    MetricsAccumulator,
+)
+
+CUBE_VERSION = 1
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_CUBE_PATH = PROJECT_ROOT / "_metrics_cube.json"
+
+DIMENSIONS = ("mode", "env", "model", "contract", "tier")
+POINT_FIELDS = ("detection_points", "quality_points", "total_points")
+
+SlabKey = Tuple[str, str, str, str]  # (mode, env, model, contract)
+
+
+@dataclass
+class TierCell:
+    """Measures of the GT items of one tier in one results file."""
+    items: int = 0
+    detections: Counter = field(default_factory=Counter)
+    detected_with_refs: int = 0
+    points: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(POINT_FIELDS, 0.0))
+    quality_totals: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(QUALITY_DIMENSIONS, 0.0))
+    quality_counts: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(QUALITY_DIMENSIONS, 0))
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "items": self.items,
+            "detections": dict(self.detections),
+            "detected_with_refs": self.detected_with_refs,
+            "points": self.points,
+            "quality_totals": self.quality_totals,
+            "quality_counts": self.quality_counts,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "TierCell":
+        return cls(
+            items=data["items"],
+            detections=Counter(data["detections"]),
+            detected_with_refs=data["detected_with_refs"],
+            points=data["points"],
+            quality_totals=data["quality_totals"],
+            quality_counts=data["quality_counts"],
+        )
+
+
+@dataclass
+class Slab:
+    """Everything one results file contributes to the cube."""
+    source: Dict[str, Any]
+    tiers: Dict[Optional[str], TierCell]
+    assessments: Dict[str, int]
+    t1_pass: bool
+    part_a_pct: Optional[float] = None
+    part_a_pass: Optional[bool] = None
+
+    @classmethod
+    def from_evaluation(cls, evaluation: dict, source: Dict[str, Any]) -> "Slab":
+        """Build a slab with the same per-item rules as MetricsAccumulator.add_evaluation."""
+        tiers: Dict[Optional[str], TierCell] = {}
+        t1_pass = True
+        for issue in evaluation.get("gt_evaluations", []):
+            det = issue.get("detection", "NMI")
+            tier = issue.get("tier", "T3")
+            cell = tiers.get(tier)
+            if cell is None:
+                cell = tiers[tier] = TierCell()
+            cell.items += 1
+            cell.detections[det] += 1
+            for name in POINT_FIELDS:
+                value = issue.get(name)
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    cell.points[name] += value
+            for d in QUALITY_DIMENSIONS:
+                val = issue.get(d)
+                if val is not None:
+                    cell.quality_totals[d] += val
+                    cell.quality_counts[d] += 1
+            if det in ("Y", "P"):
+                if issue.get("clause") and issue.get("matched_redline_id"):
+                    cell.detected_with_refs += 1
+            elif tier == "T1":
+                t1_pass = False
+
+        assessments: Counter = Counter()
+        for ai in evaluation.get("additional_issues", []):
+            assessments[ADDITIONAL_ASSESSMENTS.get(ai.get("assessment", ""), "other")] += 1
+
+        part_a = evaluation.get("part_a_summary") or evaluation.get("summary", {}).get("part_a")
+        return cls(
+            source=source,
+            tiers=tiers,
+            assessments=dict(assessments),
+            t1_pass=t1_pass,
+            part_a_pct=part_a.get("percentage", 0) if part_a else None,
+            part_a_pass=part_a.get("pass_fail") == "PASS" if part_a else None,
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "source": self.source,
+            "tiers": [{"tier": tier, **cell.to_json()} for tier, cell in self.tiers.items()],
+            "assessments": self.assessments,
+            "t1_pass": self.t1_pass,
+            "part_a_pct": self.part_a_pct,
+            "part_a_pass": self.part_a_pass,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Slab":
+        return cls(
+            source=data["source"],
+            tiers={cell["tier"]: TierCell.from_json(cell) for cell in data["tiers"]},
+            assessments=data["assessments"],
+            t1_pass=data["t1_pass"],
+            part_a_pct=data["part_a_pct"],
+            part_a_pass=data["part_a_pass"],
+        )
+
+
+def is_stacking_mode(mode: str) -> bool:
+    """Whether a mode's results are stacking evaluations (Part A + Part B)."""
+    return mode.endswith("_stacking")
+
+
+def _matches(value: Any, wanted: Any) -> bool:
+    if isinstance(wanted, (list, tuple, set, frozenset)):
+        return value in wanted
+    return value == wanted
+
+
+def discover_files(results_dir: Path) -> Dict[Tuple[str, str], Path]:
+    """(model, contract) -> {contract}/{model}.json, skipping baseline/ and _ files."""
+    files = {}
+    for contract_dir in sorted(Path(results_dir).iterdir()):
+        if not contract_dir.is_dir() or contract_dir.name == "baseline" or contract_dir.name.startswith("_"):
+            continue
+        for path in sorted(contract_dir.glob("*.json")):
+            if not path.name.startswith("_"):
+                files[(path.stem, contract_dir.name)] = path
+    return files
+
+
+class MetricsCube:
+    """
+    Slabs keyed by (mode, env, model, contract), each split into tier cells.
+
+    Filters passed to the query methods are dimension=value, where a list,
+    tuple or set value matches any of its members. The tier filter applies
+    to GT measures only; contract-level measures (additional issues, T1
+    gate, Part A) count once per matching results file. Stacking-mode slabs
+    count towards Part A only, and other slabs towards everything else, so
+    a slice spanning freeform and freeform_stacking matches sales_metrics.
+
+    Usage:
+        cube = MetricsCube.load(path)
+        cube.update("freeform", "hotfix", Path("freeform/results"))
+        cube.save(path)
+        cube.group_by("env", model="sonnet45", tier="T1")
+    """
+
+    def __init__(self, slabs: Optional[Dict[SlabKey, Slab]] = None):
+        self.slabs: Dict[SlabKey, Slab] = slabs or {}
+
+    @classmethod
+    def load(cls, path: Path) -> "MetricsCube":
+        """
+        Load a saved cube.
+
+        Returns an empty cube if the file is missing, unreadable or was
+        written by a different CUBE_VERSION.
+        """
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return cls()
+        if data.get("version") != CUBE_VERSION:
+            return cls()
+        return cls({
+            (s["mode"], s["env"], s["model"], s["contract"]): Slab.from_json(s)
+            for s in data.get("slabs", [])
+        })
+
+    def save(self, path: Path) -> None:
+        atomic_write_json(path, {
+            "version": CUBE_VERSION,
+            "slabs": [
+                {"mode": mode, "env": env, "model": model, "contract": contract, **slab.to_json()}
+                for (mode, env, model, contract), slab in sorted(self.slabs.items())
+            ],
+        })
+
+    def update(self, mode: str, env: str, results_dir: Path, full: bool = False) -> Dict[str, int]:
+        """
+        Bring the (mode, env) slabs in line with a results directory.
+
+        Files whose fingerprint matches their slab are not read. Slabs of
+        this (mode, env) whose file no longer exists are dropped.
+
+        Args:
+            mode: Evaluation mode the results belong to
+            env: Environment the results belong to
+            results_dir: Aggregated results, {contract}/{model}.json
+            full: Rebuild every slab of this (mode, env)
+
+        Returns:
+            Counts of added, updated, unchanged and removed slabs
+        """
+        stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0}
+        files = discover_files(results_dir)
+
+        for (model, contract), path in files.items():
+            key = (mode, env, model, contract)
+            slab = self.slabs.get(key)
+            if slab is not None and not full and slab.source.get("path") == str(path) \
+                    and fingerprint_matches(path, slab.source):
+                stats["unchanged"] += 1
+                continue
+            # Fingerprint before reading, so a file changed mid-read is rebuilt next time
+            source = {"path": str(path), **file_fingerprint(path)}
+            with open(path) as f:
+                self.slabs[key] = Slab.from_evaluation(json.load(f), source)
+            stats["updated" if slab is not None else "added"] += 1
+
+        for key in [k for k in self.slabs if k[:2] == (mode, env) and (k[2], k[3]) not in files]:
+            del self.slabs[key]
+            stats["removed"] += 1
+        return stats
+
+    def select(self, **filters: Any) -> Iterator[Tuple[SlabKey, Slab]]:
+        """Slabs matching the mode/env/model/contract filters, in key order."""
+        unknown = set(filters) - set(DIMENSIONS)
+        if unknown:
+            raise ValueError(f"Unknown cube dimensions: {', '.join(sorted(unknown))}")
+        slab_filters = [(DIMENSIONS.index(d), v) for d, v in filters.items() if d != "tier"]
+        for key in sorted(self.slabs):
+            if all(_matches(key[i], wanted) for i, wanted in slab_filters):
+                yield key, self.slabs[key]
+
+    def values(self, dimension: str, **filters: Any) -> List[Any]:
+        """Distinct values of a dimension among matching cells."""
+        if dimension == "tier":
+            found = {
+                tier for _, slab in self.select(**filters) for tier in slab.tiers
+                if "tier" not in filters or _matches(tier, filters["tier"])
+            }
+        else:
+            found = {key[DIMENSIONS.index(dimension)] for key, _ in self.select(**filters)}
+        return sorted(found, key=lambda v: (v is None, v))
+
+    def accumulator(self, **filters: Any) -> MetricsAccumulator:
+        """
+        A MetricsAccumulator holding the matching cells.
+
+        Stacking-mode slabs are added as MetricsAccumulator.add_stacking
+        would add their file, other slabs as add_evaluation would.
+        """
+        acc = MetricsAccumulator()
+        tier_filter = filters.get("tier")
+        for (mode, _, _, _), slab in self.select(**filters):
+            if is_stacking_mode(mode):
+                acc.part_a_pcts.append(slab.part_a_pct or 0)
+                acc.part_a_passes += bool(slab.part_a_pass)
+                continue
+
+            acc.evaluations += 1
+            acc.assessments.update(slab.assessments)
+            acc.t1_passes += slab.t1_pass
+
+            for tier, cell in slab.tiers.items():
+                if "tier" in filters and not _matches(tier, tier_filter):
+                    continue
+                acc.detections.update(cell.detections)
+                actual, maximum = weighted_recall_points(TIER_CONFIG.get(tier, {}), cell.detections, cell.items)
+                acc.recall_actual += actual
+                acc.recall_max += maximum
+                for d in QUALITY_DIMENSIONS:
+                    acc.quality_totals[d] += cell.quality_totals[d]
+                    acc.quality_counts[d] += cell.quality_counts[d]
+                acc.detected_total += cell.detections["Y"] + cell.detections["P"]
+                acc.detected_with_refs += cell.detected_with_refs
+        return acc
+
+    def points(self, **filters: Any) -> Dict[str, float]:
+        """Sums of the per-item point fields over matching cells."""
+        totals = dict.fromkeys(POINT_FIELDS, 0.0)
+        for _, slab in self.select(**filters):
+            for tier, cell in slab.tiers.items():
+                if "tier" not in filters or _matches(tier, filters["tier"]):
+                    for name in POINT_FIELDS:
+                        totals[name] += cell.points[name]
+        return totals
+
+    def metrics(self, **filters: Any) -> Dict[str, Any]:
+        """sales_metrics measures plus point sums for the matching cells."""
+        return {**self.accumulator(**filters).measures(), "points": self.points(**filters)}
+
+    def group_by(self, dimension: str, **filters: Any) -> Dict[Any, Dict[str, Any]]:
+        """metrics() for each value of a dimension, e.g. group_by("env", model="sonnet45", tier="T1")."""
+        return {
+            value: self.metrics(**{**filters, dimension: value})
+            for value in self.values(dimension, **filters)
+        }
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _filter_value(values: Optional[List[str]]) -> Any:
+    if not values:
+        return None
+    return values[0] if len(values) == 1 else values
+
+
+def format_table(groups: Dict[Any, Dict[str, Any]], dimension: str) -> str:
+    lines = [
+        f"{dimension:<16}{'contracts':>10}{'GT items':>10}{'detect %':>10}"
+        f"{'w. recall':>11}{'precision':>11}{'F1':>8}{'quality':>9}{'points':>10}"
+    ]
+    for value, m in groups.items():
+        d, prf = m["risk_identification_accuracy"], m["precision_recall_f1"]
+        quality = m["quality_score"]["overall_avg"]
+        lines.append(
+            f"{str(value):<16}{m['contracts_evaluated']:>10}{d['total_gt_issues']:>10}"
+            f"{d['detection_rate']:>10.1f}{prf['weighted_recall']:>11.4f}{prf['precision']:>11.4f}"
+            f"{prf['f1']:>8.4f}{quality if quality is not None else 'N/A':>9}"
+            f"{m['points']['total_points']:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Persistent metrics cube over evaluation results",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python -m framework.scripts.metrics_cube update --mode freeform --env hotfix --results-dir freeform/results
+    python -m framework.scripts.metrics_cube query --model sonnet45 --tier T1 --by env
+    python -m framework.scripts.metrics_cube query --env hotfix test_prod2 --by model --json
+        """,
+    )
+    parser.add_argument("--cube", type=Path, default=DEFAULT_CUBE_PATH,
+                        help=f"Cube file (default: {DEFAULT_CUBE_PATH})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    update = sub.add_parser("update", help="Add or refresh one (mode, env) from a results directory")
+    update.add_argument("--mode", required=True)
+    update.add_argument("--env", required=True)
+    update.add_argument("--results-dir", type=Path, required=True)
+    update.add_argument("--full", action="store_true", help="Rebuild every slab of this (mode, env)")
+
+    query = sub.add_parser("query", help="Metrics for a slice, optionally grouped by a dimension")
+    for dimension in DIMENSIONS:
+        query.add_argument(f"--{dimension}", nargs="+", help=f"Filter on {dimension} (several = any)")
+    query.add_argument("--by", choices=DIMENSIONS, help="Group by this dimension")
+    query.add_argument("--json", action="store_true", help="Print metrics as JSON")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    cube = MetricsCube.load(args.cube)
+
+    if args.command == "update":
+        if not args.results_dir.is_dir():
+            print(f"ERROR: Results directory not found: {args.results_dir}")
+            exit(1)
+        stats = cube.update(args.mode, args.env, args.results_dir, full=args.full)
+        cube.save(args.cube)
+        print(f"{args.mode}/{args.env}: " + ", ".join(f"{v} {k}" for k, v in stats.items()))
+        print(f"Cube: {len(cube.slabs)} slabs -> {args.cube} ({(time.perf_counter() - start) * 1000:.0f} ms)")
+        return
+
+    filters = {
+        d: _filter_value(getattr(args, d)) for d in DIMENSIONS if getattr(args, d)
+    }
+    if args.by:
+        groups = cube.group_by(args.by, **filters)
+    else:
+        groups = {"all": cube.metrics(**filters)}
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if args.json:
+        print(json.dumps({str(k): v for k, v in groups.items()}, indent=2))
+    else:
+        print(format_table(groups, args.by or "slice"))
+        print(f"\n{elapsed_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
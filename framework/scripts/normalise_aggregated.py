@@ -10,15 +10,27 @@ Fixes test_prod2-style JSONs that use a different field naming convention:
 - Computes detection_by_tier from gt_evaluations
 - Maps t1_detected -> t1_all_detected
 
+Files are normalised on a process pool and rewritten via a temp file and
+rename, so an interrupted run leaves each file either untouched or
+complete. Fingerprints of canonical files are recorded in
+_normalise_manifest.json in the aggregated directory; later runs skip
+those files without reading them (--full checks everything again).
+
 Usage:
-    python3 normalise_aggregated.py --env test_prod2
-    python3 normalise_aggregated.py --env test_prod2 --dry-run
+    python3 -m framework.scripts.normalise_aggregated --env test_prod2
+    python3 -m framework.scripts.normalise_aggregated --env test_prod2 --dry-run
+    python3 -m framework.scripts.normalise_aggregated --env test_prod2 --workers 4 --full
 """
 
 import json
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from copy import deepcopy
+from typing import Any, Dict, Optional, Tuple
+
+from framework.fileio import atomic_write_json, file_fingerprint, fingerprint_matches
+from framework.scripts.gt_index import load_indexes
 
 
 CONTRACTS = [
@@ -26,26 +38,37 @@ CONTRACTS = [
     "partnership", "reseller", "services", "sla", "supply"
 ]
 
+MANIFEST_NAME = "_normalise_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def load_gt_lookup(gt_dir: Path, write_cache: bool = True) -> dict:
+    """
+    Build gt_id -> {clause, issue, tier} lookup from the compiled GT indexes.
 
-def load_gt_lookup(gt_dir: Path) -> dict:
-    """Build gt_id -> {clause, issue} lookup from ground truth files."""
+    A gt_id that appears more than once maps to its last item. An item
+    without a clause falls back to its clause_ref.
+
+    Args:
+        gt_dir: Ground truth directory
+        write_cache: Let load_indexes() update _gt_index.pickle (off for dry runs)
+    """
+    indexes = load_indexes(gt_dir, write_cache=write_cache)
     lookup = {}
     for contract in CONTRACTS:
-        gt_path = gt_dir / f"{contract}.json"
-        if not gt_path.exists():
-            print(f"  WARNING: GT file not found: {gt_path}")
+        index = indexes.get(contract)
+        if index is None:
+            print(f"  WARNING: GT file not found: {gt_dir / f'{contract}.json'}")
             continue
-        with open(gt_path) as f:
-            gt = json.load(f)
-        issues = gt.get("ground_truth", [])
-        lookup[contract] = {}
-        for issue in issues:
-            gt_id = issue.get("gt_id", "")
-            lookup[contract][gt_id] = {
-                "clause": issue.get("clause", ""),
-                "issue": issue.get("issue", ""),
-                "tier": issue.get("tier", ""),
+        lookup[contract] = {
+            gt_id: {
+                "clause": index.clauses[position],
+                "issue": index.issues[position],
+                "tier": index.tiers[position] or "",
             }
+            for position, gt_id in enumerate(index.ids)
+            if gt_id is not None
+        }
     return lookup
 
 
@@ -79,56 +102,87 @@ def compute_detection_by_tier(gt_evals: list) -> dict:
     return tiers
 
 
+FIELD_RENAMES = (
+    ("amendment_quality", "amendment_score"),
+    ("rationale_quality", "rationale_score"),
+)
+# Canonical fields added as null when missing
+NULL_DEFAULTS = ("redline_quality_score", "matched_redline_id")
+EVIDENCE_FIELDS = ("judge_reasoning", "proposed_revision_excerpt", "effective_rationale_excerpt")
+
+
+def normalise_gt_evaluation(gt: dict, gt_info: dict) -> dict:
+    """
+    Normalise one gt_evaluation entry.
+
+    Returns gt itself if it is already canonical, otherwise a copy with the
+    fixes applied (evidence is copied only if it changes too).
+    """
+    evidence = gt.get("evidence")
+    evidence_changes = "evidence" in gt and any(f not in evidence for f in EVIDENCE_FIELDS)
+    if (
+        gt.get("clause") and gt.get("issue") and not evidence_changes
+        and all(new in gt or old not in gt for old, new in FIELD_RENAMES)
+        and all(field in gt for field in NULL_DEFAULTS)
+    ):
+        return gt
+
+    gt = dict(gt)
+
+    # Extract clause from evidence if missing, with GT as fallback
+    if not gt.get("clause"):
+        matched = gt.get("evidence", {}).get("matched_clause")
+        gt["clause"] = matched if matched else gt_info.get("clause", "")
+
+    # Add issue text from GT if missing
+    if not gt.get("issue"):
+        gt["issue"] = gt_info.get("issue", "")
+
+    # Map field names
+    for old, new in FIELD_RENAMES:
+        if old in gt and new not in gt:
+            gt[new] = gt.pop(old)
+
+    # null = not scored / not matched
+    for field in NULL_DEFAULTS:
+        if field not in gt:
+            gt[field] = None
+
+    # Restructure evidence to canonical format if needed
+    if evidence_changes:
+        ev = gt["evidence"] = dict(evidence)
+        if "judge_reasoning" not in ev:
+            # Build judge_reasoning from excerpt
+            reasoning = ev.get("excerpt", "")
+            if ev.get("matched_source"):
+                reasoning = f"[{ev['matched_source']}] {reasoning}"
+            ev["judge_reasoning"] = reasoning
+        if "proposed_revision_excerpt" not in ev:
+            ev["proposed_revision_excerpt"] = ev.get("excerpt")
+        if "effective_rationale_excerpt" not in ev:
+            ev["effective_rationale_excerpt"] = None
+    return gt
+
+
 def normalise_evaluation(eval_data: dict, gt_lookup: dict, contract: str) -> dict:
-    """Normalise a single evaluation to the canonical schema."""
-    data = deepcopy(eval_data)
+    """
+    Normalise a single evaluation to the canonical schema.
+
+    eval_data is not modified. The result shares every entry that needs no
+    change with it (copy-on-write per gt_evaluation) instead of deep-copying
+    the whole evaluation.
+    """
+    data = dict(eval_data)
     contract_gt = gt_lookup.get(contract, {})
 
-    # Normalise gt_evaluations
-    for gt in data.get("gt_evaluations", []):
-        gt_id = gt.get("gt_id", "")
-        gt_info = contract_gt.get(gt_id, {})
-
-        # Extract clause from evidence if missing, with GT as fallback
-        if "clause" not in gt or not gt["clause"]:
-            evidence = gt.get("evidence", {})
-            matched = evidence.get("matched_clause")
-            gt["clause"] = matched if matched else gt_info.get("clause", "")
-
-        # Add issue text from GT if missing
-        if "issue" not in gt or not gt["issue"]:
-            gt["issue"] = gt_info.get("issue", "")
-
-        # Map field names
-        if "amendment_quality" in gt and "amendment_score" not in gt:
-            gt["amendment_score"] = gt.pop("amendment_quality")
-        if "rationale_quality" in gt and "rationale_score" not in gt:
-            gt["rationale_score"] = gt.pop("rationale_quality")
-
-        # Add redline_quality_score if missing (null = not scored)
-        if "redline_quality_score" not in gt:
-            gt["redline_quality_score"] = None
-
-        # Add matched_redline_id if missing
-        if "matched_redline_id" not in gt:
-            gt["matched_redline_id"] = None
-
-        # Restructure evidence to canonical format if needed
-        if "evidence" in gt:
-            ev = gt["evidence"]
-            if "judge_reasoning" not in ev:
-                # Build judge_reasoning from excerpt
-                reasoning = ev.get("excerpt", "")
-                if ev.get("matched_source"):
-                    reasoning = f"[{ev['matched_source']}] {reasoning}"
-                ev["judge_reasoning"] = reasoning
-            if "proposed_revision_excerpt" not in ev:
-                ev["proposed_revision_excerpt"] = ev.get("excerpt")
-            if "effective_rationale_excerpt" not in ev:
-                ev["effective_rationale_excerpt"] = None
+    if "gt_evaluations" in data:
+        data["gt_evaluations"] = [
+            normalise_gt_evaluation(gt, contract_gt.get(gt.get("gt_id", ""), {}))
+            for gt in data["gt_evaluations"]
+        ]
 
     # Normalise summary
-    summary = data.get("summary", {})
+    summary = dict(data.get("summary", {}))
 
     # Map t1_detected (bool) -> t1_all_detected
     if "t1_detected" in summary and "t1_all_detected" not in summary:
@@ -144,12 +198,130 @@ def normalise_evaluation(eval_data: dict, gt_lookup: dict, contract: str) -> dic
     return data
 
 
+def load_manifest(agg_dir: Path) -> Dict[str, Any]:
+    """
+    Load the fingerprints of files recorded as canonical by the last run.
+
+    Returns an empty dict if the manifest is missing, unreadable or was
+    written by a different MANIFEST_VERSION.
+    """
+    try:
+        with open(agg_dir / MANIFEST_NAME) as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("canonical", {})
+
+
+def normalise_file(json_file: Path, contract_gt: dict, contract: str, dry_run: bool = False) -> Dict[str, Any]:
+    """
+    Normalise one aggregated JSON in place (written via temp file + rename).
+
+    Returns {"status": "canonical" | "normalised" | "error"} plus the
+    fingerprint of the now-canonical file (not on dry runs), a preview of
+    the normalised data on dry runs, or the error message.
+    """
+    try:
+        with open(json_file) as f:
+            eval_data = json.load(f)
+
+        if not needs_normalisation(eval_data):
+            return {"status": "canonical", "fingerprint": file_fingerprint(json_file)}
+
+        normalised_data = normalise_evaluation(eval_data, {contract: contract_gt}, contract)
+        if dry_run:
+            gt_evals = normalised_data["gt_evaluations"]
+            return {
+                "status": "normalised",
+                "preview": gt_evals[0] if gt_evals else {},
+                "has_detection_by_tier": "detection_by_tier" in normalised_data["summary"],
+            }
+
+        atomic_write_json(json_file, normalised_data, indent=2, ensure_ascii=False)
+        return {"status": "normalised", "fingerprint": file_fingerprint(json_file)}
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+
+
+def normalise_files(
+    agg_dir: Path,
+    gt_lookup: dict,
+    max_workers: Optional[int] = None,
+    dry_run: bool = False,
+    full: bool = False,
+) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    Normalise every {contract}/{model}.json under agg_dir.
+
+    Files whose fingerprint the manifest records as canonical are skipped
+    without being read; the rest are checked and normalised on a process
+    pool (max_workers=None: CPU count; 1: in-process).
+
+    Args:
+        agg_dir: Aggregated data directory (holds the manifest)
+        gt_lookup: load_gt_lookup() result
+        max_workers: Process pool size
+        dry_run: Do not write files or the manifest
+        full: Ignore the manifest and check every file
+
+    Returns:
+        (contract, model) -> normalise_file() result, or {"status":
+        "cached"} for files skipped via the manifest, in contract then
+        model order
+    """
+    previous = {} if full else load_manifest(agg_dir)
+    outcomes: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    to_check = []
+
+    for contract in CONTRACTS:
+        for json_file in sorted((agg_dir / contract).glob("*.json")):
+            key = (contract, json_file.stem)
+            recorded = previous.get(f"{contract}/{json_file.stem}")
+            if recorded and fingerprint_matches(json_file, recorded):
+                outcomes[key] = {"status": "cached", "fingerprint": recorded}
+            else:
+                outcomes[key] = None
+                to_check.append((json_file, contract))
+
+    workers = min(max_workers or os.cpu_count() or 1, len(to_check))
+    worker_args = [
+        (json_file, gt_lookup.get(contract, {}), contract, dry_run)
+        for json_file, contract in to_check
+    ]
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(normalise_file, *zip(*worker_args)))
+    else:
+        results = [normalise_file(*args) for args in worker_args]
+
+    for (json_file, contract), result in zip(to_check, results):
+        outcomes[contract, json_file.stem] = result
+
+    if not dry_run:
+        atomic_write_json(agg_dir / MANIFEST_NAME, {
+            "version": MANIFEST_VERSION,
+            "canonical": {
+                f"{contract}/{model}": outcome["fingerprint"]
+                for (contract, model), outcome in outcomes.items()
+                if "fingerprint" in outcome
+            },
+        }, indent=2)
+    return outcomes
+
+
 def main():
     parser = argparse.ArgumentParser(description="Normalise aggregated JSONs to canonical schema")
     parser.add_argument("--env", required=True, help="Environment name (e.g., test_prod2)")
     parser.add_argument("--base-dir", help="Override aggregated data directory")
     parser.add_argument("--gt-dir", help="Override ground truth directory")
     parser.add_argument("--dry-run", action="store_true", help="Show changes without writing")
+    parser.add_argument("--workers", "-w", type=int, default=None,
+                        help="Parallel worker processes (default: CPU count; 1 = serial)")
+    parser.add_argument("--full", action="store_true",
+                        help="Check every file, including those recorded as canonical")
     args = parser.parse_args()
 
     project_dir = Path(__file__).parent.parent.parent
@@ -174,60 +346,45 @@ def main():
     print()
 
     # Load GT lookup
-    gt_lookup = load_gt_lookup(gt_dir)
+    gt_lookup = load_gt_lookup(gt_dir, write_cache=not args.dry_run)
     print(f"Loaded GT for {len(gt_lookup)} contracts")
     print()
 
-    normalised = 0
-    skipped = 0
-    errors = 0
+    outcomes = normalise_files(
+        agg_dir, gt_lookup, max_workers=args.workers, dry_run=args.dry_run, full=args.full
+    )
+    counts = {"normalised": 0, "canonical": 0, "cached": 0, "error": 0}
 
     for contract in CONTRACTS:
-        contract_dir = agg_dir / contract
-        if not contract_dir.exists():
+        if not (agg_dir / contract).exists():
             print(f"  {contract}: SKIPPED (no directory)")
-            continue
 
-        for json_file in sorted(contract_dir.glob("*.json")):
-            model = json_file.stem
-            with open(json_file) as f:
-                eval_data = json.load(f)
-
-            if not needs_normalisation(eval_data):
-                print(f"  {contract}/{model}: already canonical")
-                skipped += 1
-                continue
-
-            try:
-                normalised_data = normalise_evaluation(eval_data, gt_lookup, contract)
-
-                if args.dry_run:
-                    # Show what would change
-                    first_gt = normalised_data["gt_evaluations"][0] if normalised_data["gt_evaluations"] else {}
-                    print(f"  {contract}/{model}: WOULD NORMALISE")
-                    print(f"    clause: {first_gt.get('clause', '?')}")
-                    print(f"    issue: {first_gt.get('issue', '?')[:50]}")
-                    print(f"    amendment_score: {first_gt.get('amendment_score')}")
-                    has_dbt = "detection_by_tier" in normalised_data.get("summary", {})
-                    print(f"    detection_by_tier: {'added' if has_dbt else 'missing'}")
-                else:
-                    with open(json_file, 'w') as f:
-                        json.dump(normalised_data, f, indent=2, ensure_ascii=False)
-                    print(f"  {contract}/{model}: NORMALISED")
-
-                normalised += 1
-            except Exception as e:
-                print(f"  {contract}/{model}: ERROR - {e}")
-                errors += 1
+    for (contract, model), outcome in outcomes.items():
+        status = outcome["status"]
+        counts[status] += 1
+        if status == "error":
+            print(f"  {contract}/{model}: ERROR - {outcome['error']}")
+        elif status in ("canonical", "cached"):
+            print(f"  {contract}/{model}: already canonical")
+        elif args.dry_run:
+            # Show what would change
+            first_gt = outcome["preview"]
+            print(f"  {contract}/{model}: WOULD NORMALISE")
+            print(f"    clause: {first_gt.get('clause', '?')}")
+            print(f"    issue: {first_gt.get('issue', '?')[:50]}")
+            print(f"    amendment_score: {first_gt.get('amendment_score')}")
+            print(f"    detection_by_tier: {'added' if outcome['has_detection_by_tier'] else 'missing'}")
+        else:
+            print(f"  {contract}/{model}: NORMALISED")
 
     print()
     print("=" * 60)
     print("RESULTS")
     print("=" * 60)
-    print(f"Normalised: {normalised}")
-    print(f"Already canonical: {skipped}")
-    if errors:
-        print(f"Errors: {errors}")
+    print(f"Normalised: {counts['normalised']}")
+    print(f"Already canonical: {counts['canonical'] + counts['cached']} ({counts['cached']} unchanged since last run)")
+    if counts["error"]:
+        print(f"Errors: {counts['error']}")
     if args.dry_run:
         print("\nDry run — no files were modified. Remove --dry-run to apply.")
 
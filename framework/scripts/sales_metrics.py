@@ -10,13 +10,19 @@ Usage:
     python -m framework.scripts.sales_metrics --model sonnet45
     python -m framework.scripts.sales_metrics --format markdown
     python -m framework.scripts.sales_metrics --output-dir ./output
+    python -m framework.scripts.sales_metrics --workers 4
 """
 
 import argparse
 import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict
 
 from framework.scoring import (
     calculate_f1,
@@ -54,7 +60,6 @@ TIER_CONFIG = {
     "T3": {"Y": 1, "P": 0.5, "N": 0, "NMI": 0},
 }
 
-
 # ---------------------------------------------------------------------------
 # Data loading
 # ---------------------------------------------------------------------------
@@ -94,217 +99,253 @@ def load_summary(results_dir: Path) -> dict | None:
 
 
 # ---------------------------------------------------------------------------
-# Pure compute functions
+# Fused single-pass accumulator
 # ---------------------------------------------------------------------------
 
-def compute_detection_rate(evaluations: list[dict]) -> dict:
-    """
-    Compute risk identification accuracy across all contracts for one model.
+QUALITY_DIMENSIONS = ("amendment_score", "rationale_score", "redline_quality_score")
+ADDITIONAL_ASSESSMENTS = {
+    "Valid": "valid",
+    "Not Material": "not_material",
+    "Hallucination": "hallucination",
+}
+
 
-    Returns dict with y, p, n, nmi counts and detection_rate = (Y+P)/total.
+@dataclass
+class MetricsAccumulator:
+    """
+    Running state of every sales metric for one model.
+
+    add_evaluation() walks a freeform evaluation's gt_evaluations and
+    additional_issues and feeds all reducers; add_stacking() does the same
+    for a stacking evaluation. Accumulators built from disjoint sets of
+    contracts merge() into the accumulator of their union, so contracts can
+    be accumulated in parallel. result() gives the compute_model_metrics
+    dict; the compute_* functions are views of one accumulator.
+
+    State is integer counts plus score sums. The sums are of TIER_CONFIG
+    points and 0-3 quality scores, which add exactly in any order, so a
+    merged result equals a single pass. Part A percentages are kept per
+    evaluation and summed in contract order.
     """
-    y = p = n = nmi = 0
-    for ev in evaluations:
-        for issue in ev.get("gt_evaluations", []):
+    evaluations: int = 0
+    detections: Counter = field(default_factory=Counter)
+    assessments: Counter = field(default_factory=Counter)
+    recall_actual: float = 0.0
+    recall_max: float = 0.0
+    quality_totals: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(QUALITY_DIMENSIONS, 0.0))
+    quality_counts: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(QUALITY_DIMENSIONS, 0))
+    t1_passes: int = 0
+    detected_total: int = 0
+    detected_with_refs: int = 0
+    part_a_pcts: list = field(default_factory=list)
+    part_a_passes: int = 0
+
+    def add_evaluation(self, ev: dict) -> None:
+        """Feed one freeform evaluation to every reducer."""
+        detections = self.detections
+        quality_totals, quality_counts = self.quality_totals, self.quality_counts
+        issues = ev.get("gt_evaluations", [])
+        t1_all_detected = True
+
+        for issue in issues:
             det = issue.get("detection", "NMI")
-            if det == "Y":
-                y += 1
-            elif det == "P":
-                p += 1
-            elif det == "N":
-                n += 1
-            else:
-                nmi += 1
-    total = y + p + n + nmi
-    rate = calculate_recall(y + p, total)
-    return {
-        "Y": y, "P": p, "N": n, "NMI": nmi,
-        "total_gt_issues": total,
-        "detected": y + p,
-        "detection_rate": round(rate * 100, 1),
-    }
+            detections[det] += 1
 
+            for d in QUALITY_DIMENSIONS:
+                val = issue.get(d)
+                if val is not None:
+                    quality_totals[d] += val
+                    quality_counts[d] += 1
 
-def compute_additional_issues_stats(evaluations: list[dict]) -> dict:
-    """
-    Compute false positive / additional issues statistics.
+            if det in ("Y", "P"):
+                self.detected_total += 1
+                if issue.get("clause") and issue.get("matched_redline_id"):
+                    self.detected_with_refs += 1
+            elif issue.get("tier") == "T1":
+                t1_all_detected = False
 
-    Returns assessment counts and flags audit status.
-    """
-    valid = not_material = hallucination = other = 0
-    for ev in evaluations:
         for ai in ev.get("additional_issues", []):
-            assessment = ai.get("assessment", "")
-            if assessment == "Valid":
-                valid += 1
-            elif assessment == "Not Material":
-                not_material += 1
-            elif assessment == "Hallucination":
-                hallucination += 1
-            else:
-                other += 1
+            self.assessments[ADDITIONAL_ASSESSMENTS.get(ai.get("assessment", ""), "other")] += 1
 
-    total = valid + not_material + hallucination + other
-    all_valid = (not_material == 0 and hallucination == 0 and total > 0)
+        actual, maximum, _ = calculate_weighted_recall(issues, TIER_CONFIG, tier_field="tier")
+        self.recall_actual += actual
+        self.recall_max += maximum
+        self.t1_passes += t1_all_detected
+        self.evaluations += 1
 
-    return {
-        "valid": valid,
-        "not_material": not_material,
-        "hallucination": hallucination,
-        "other": other,
-        "total_additional": total,
-        "false_positive_rate": round(
-            (hallucination + not_material) / total * 100, 1
-        ) if total > 0 else 0.0,
-        "audit_status": "pending" if all_valid else "complete",
-    }
+    def add_stacking(self, ev: dict) -> None:
+        """Feed one stacking evaluation (Part A) to the stacking reducer."""
+        part_a_summary = ev.get("part_a_summary", {})
+        if not part_a_summary:
+            part_a_summary = ev.get("summary", {}).get("part_a", {})
+        self.part_a_pcts.append(part_a_summary.get("percentage", 0))
+        if part_a_summary.get("pass_fail") == "PASS":
+            self.part_a_passes += 1
+
+    def merge(self, other: "MetricsAccumulator") -> "MetricsAccumulator":
+        """Add another accumulator's contracts (which follow this one's) in place."""
+        self.evaluations += other.evaluations
+        self.detections.update(other.detections)
+        self.assessments.update(other.assessments)
+        self.recall_actual += other.recall_actual
+        self.recall_max += other.recall_max
+        for d in QUALITY_DIMENSIONS:
+            self.quality_totals[d] += other.quality_totals[d]
+            self.quality_counts[d] += other.quality_counts[d]
+        self.t1_passes += other.t1_passes
+        self.detected_total += other.detected_total
+        self.detected_with_refs += other.detected_with_refs
+        self.part_a_pcts.extend(other.part_a_pcts)
+        self.part_a_passes += other.part_a_passes
+        return self
+
+    def detection_rate(self) -> dict:
+        d = self.detections
+        y, p, n = d["Y"], d["P"], d["N"]
+        total = sum(d.values())
+        return {
+            "Y": y, "P": p, "N": n, "NMI": total - y - p - n,
+            "total_gt_issues": total,
+            "detected": y + p,
+            "detection_rate": round(calculate_recall(y + p, total) * 100, 1),
+        }
+
+    def additional_issues_stats(self) -> dict:
+        a = self.assessments
+        valid, not_material, hallucination = a["valid"], a["not_material"], a["hallucination"]
+        total = sum(a.values())
+        all_valid = (not_material == 0 and hallucination == 0 and total > 0)
+        return {
+            "valid": valid,
+            "not_material": not_material,
+            "hallucination": hallucination,
+            "other": a["other"],
+            "total_additional": total,
+            "false_positive_rate": round(
+                (hallucination + not_material) / total * 100, 1
+            ) if total > 0 else 0.0,
+            "audit_status": "pending" if all_valid else "complete",
+        }
+
+    def precision_recall_f1(self, additional_stats: dict) -> dict:
+        weighted_recall = self.recall_actual / self.recall_max if self.recall_max > 0 else 0.0
+        precision = calculate_precision(additional_stats["valid"], additional_stats["not_material"])
+        f1 = calculate_f1(weighted_recall, precision)
+        return {
+            "weighted_recall": round(weighted_recall, 4),
+            "precision": round(precision, 4),
+            "f1": round(f1, 4),
+        }
+
+    def quality_scores(self) -> dict:
+        averages = {
+            d: round(self.quality_totals[d] / self.quality_counts[d], 2) if self.quality_counts[d] > 0 else None
+            for d in QUALITY_DIMENSIONS
+        }
+        scored = [v for v in averages.values() if v is not None]
+        return {
+            "dimensions": averages,
+            "overall_avg": round(sum(scored) / len(scored), 2) if scored else None,
+            "scored_issues": max(self.quality_counts.values()),
+        }
+
+    def t1_gate(self) -> dict:
+        total = self.evaluations
+        return {
+            "passes": self.t1_passes,
+            "total": total,
+            "pass_rate": round(self.t1_passes / total * 100, 1) if total > 0 else 0.0,
+        }
+
+    def traceability(self) -> dict:
+        return {
+            "detected_with_refs": self.detected_with_refs,
+            "detected_total": self.detected_total,
+            "traceability_pct": round(
+                self.detected_with_refs / self.detected_total * 100, 1
+            ) if self.detected_total > 0 else 0.0,
+        }
+
+    def stacking_metrics(self) -> dict | None:
+        total = len(self.part_a_pcts)
+        if not total:
+            return None
+        return {
+            "avg_part_a_pct": round(sum(self.part_a_pcts) / total, 1),
+            "part_a_pass_rate": round(self.part_a_passes / total * 100, 1),
+            "passes": self.part_a_passes,
+            "total": total,
+        }
+
+    def measures(self) -> dict:
+        """All sales metrics, without the model labels."""
+        additional = self.additional_issues_stats()
+        return {
+            "contracts_evaluated": self.evaluations,
+            "risk_identification_accuracy": self.detection_rate(),
+            "additional_issues": additional,
+            "precision_recall_f1": self.precision_recall_f1(additional),
+            "quality_score": self.quality_scores(),
+            "t1_gate": self.t1_gate(),
+            "traceability": self.traceability(),
+            "stacking": self.stacking_metrics(),
+        }
+
+    def result(self, model: str) -> dict:
+        """All sales metrics for the model, as compute_model_metrics returns them."""
+        return {
+            "model": model,
+            "display_name": MODEL_DISPLAY.get(model, model),
+            **self.measures(),
+        }
+
+
+def accumulate(
+    freeform_evals: list[dict],
+    stacking_evals: list[dict] = (),
+) -> MetricsAccumulator:
+    """Single-pass accumulator over one model's evaluations."""
+    acc = MetricsAccumulator()
+    for ev in freeform_evals:
+        acc.add_evaluation(ev)
+    for ev in stacking_evals:
+        acc.add_stacking(ev)
+    return acc
 
 
-def compute_precision_recall_f1(
-    evaluations: list[dict],
-    additional_stats: dict,
-) -> dict:
-    """
-    Compute precision, weighted recall, and F1 from evaluations.
-
-    Uses framework.scoring functions with tier_field="tier" (matching result JSONs).
-    """
-    # Gather all scored issues for weighted recall
-    all_issues: list[dict] = []
-    for ev in evaluations:
-        all_issues.extend(ev.get("gt_evaluations", []))
+def compute_detection_rate(evaluations: list[dict]) -> dict:
+    """Risk identification accuracy: Y/P/N/NMI counts and (Y+P)/total."""
+    return accumulate(evaluations).detection_rate()
 
-    _, _, weighted_recall = calculate_weighted_recall(
-        all_issues, TIER_CONFIG, tier_field="tier",
-    )
 
-    precision = calculate_precision(
-        additional_stats["valid"], additional_stats["not_material"],
-    )
+def compute_additional_issues_stats(evaluations: list[dict]) -> dict:
+    """Additional issue assessment counts, false positive rate and audit status."""
+    return accumulate(evaluations).additional_issues_stats()
 
-    f1 = calculate_f1(weighted_recall, precision)
 
-    return {
-        "weighted_recall": round(weighted_recall, 4),
-        "precision": round(precision, 4),
-        "f1": round(f1, 4),
-    }
+def compute_precision_recall_f1(evaluations: list[dict], additional_stats: dict) -> dict:
+    """Tier-weighted recall, precision from additional_stats, and F1."""
+    return accumulate(evaluations).precision_recall_f1(additional_stats)
 
 
 def compute_quality_scores(evaluations: list[dict]) -> dict:
-    """
-    Compute average quality across amendment, rationale, redline dimensions.
-
-    Only includes issues where detection is Y or P (quality scores are null for N/NMI).
-    """
-    dims = ["amendment_score", "rationale_score", "redline_quality_score"]
-    totals = {d: 0.0 for d in dims}
-    counts = {d: 0 for d in dims}
-
-    for ev in evaluations:
-        for issue in ev.get("gt_evaluations", []):
-            for d in dims:
-                val = issue.get(d)
-                if val is not None:
-                    totals[d] += val
-                    counts[d] += 1
-
-    averages = {}
-    for d in dims:
-        averages[d] = round(totals[d] / counts[d], 2) if counts[d] > 0 else None
-
-    scored_count = max(counts.values()) if counts else 0
-    overall = sum(v for v in averages.values() if v is not None)
-    n_dims = sum(1 for v in averages.values() if v is not None)
-
-    return {
-        "dimensions": averages,
-        "overall_avg": round(overall / n_dims, 2) if n_dims > 0 else None,
-        "scored_issues": scored_count,
-    }
+    """Average amendment, rationale and redline quality over scored issues."""
+    return accumulate(evaluations).quality_scores()
 
 
 def compute_t1_gate(evaluations: list[dict]) -> dict:
-    """
-    Compute T1 gate pass rate across contracts.
-
-    Computed directly from gt_evaluations (source of truth), not from
-    summary.t1_gate_pass which may be stale.
-    """
-    passes = 0
-    total = len(evaluations)
-    for ev in evaluations:
-        t1_issues = [
-            i for i in ev.get("gt_evaluations", [])
-            if i.get("tier") == "T1"
-        ]
-        if t1_issues and all(
-            i.get("detection") in ("Y", "P") for i in t1_issues
-        ):
-            passes += 1
-        elif not t1_issues:
-            # No T1 issues in this contract — vacuously passes
-            passes += 1
-    return {
-        "passes": passes,
-        "total": total,
-        "pass_rate": round(passes / total * 100, 1) if total > 0 else 0.0,
-    }
+    """Share of contracts with every T1 issue detected (Y or P)."""
+    return accumulate(evaluations).t1_gate()
 
 
 def compute_traceability(evaluations: list[dict]) -> dict:
-    """
-    Compute data traceability: % of detected issues with clause ref + redline match.
-    """
-    detected_with_ref = 0
-    detected_total = 0
-    for ev in evaluations:
-        for issue in ev.get("gt_evaluations", []):
-            det = issue.get("detection", "NMI")
-            if det in ("Y", "P"):
-                detected_total += 1
-                has_clause = bool(issue.get("clause"))
-                has_redline = bool(issue.get("matched_redline_id"))
-                if has_clause and has_redline:
-                    detected_with_ref += 1
-    return {
-        "detected_with_refs": detected_with_ref,
-        "detected_total": detected_total,
-        "traceability_pct": round(
-            detected_with_ref / detected_total * 100, 1
-        ) if detected_total > 0 else 0.0,
-    }
+    """Share of detected issues with both a clause ref and a matched redline."""
+    return accumulate(evaluations).traceability()
 
 
 def compute_stacking_metrics(evaluations: list[dict]) -> dict | None:
-    """
-    Compute stacking-specific metrics from Part A evaluations.
-
-    Returns None if no stacking data available.
-    """
-    if not evaluations:
-        return None
-
-    pct_sum = 0.0
-    passes = 0
-    total = len(evaluations)
-
-    for ev in evaluations:
-        part_a_summary = ev.get("part_a_summary", {})
-        if not part_a_summary:
-            part_a_summary = ev.get("summary", {}).get("part_a", {})
-
-        pct_sum += part_a_summary.get("percentage", 0)
-
-        if part_a_summary.get("pass_fail") == "PASS":
-            passes += 1
-
-    return {
-        "avg_part_a_pct": round(pct_sum / total, 1) if total > 0 else 0.0,
-        "part_a_pass_rate": round(passes / total * 100, 1) if total > 0 else 0.0,
-        "passes": passes,
-        "total": total,
-    }
+    """Part A averages and pass rate; None without stacking evaluations."""
+    return accumulate([], evaluations).stacking_metrics()
 
 
 def compute_model_metrics(
@@ -313,26 +354,68 @@ def compute_model_metrics(
     stacking_evals: list[dict],
 ) -> dict:
     """Compute all sales metrics for a single model."""
-    detection = compute_detection_rate(freeform_evals)
-    additional = compute_additional_issues_stats(freeform_evals)
-    prf = compute_precision_recall_f1(freeform_evals, additional)
-    quality = compute_quality_scores(freeform_evals)
-    t1_gate = compute_t1_gate(freeform_evals)
-    traceability = compute_traceability(freeform_evals)
-    stacking = compute_stacking_metrics(stacking_evals)
+    return accumulate(freeform_evals, stacking_evals).result(model)
+
+
+def accumulate_contract(
+    freeform_results: Path,
+    stacking_results: Path | None,
+    contract: str,
+    freeform_models: list[str],
+    stacking_models: list[str],
+) -> dict[str, MetricsAccumulator]:
+    """
+    Worker: load one contract's evaluations and accumulate them per model.
+
+    Each file is read and walked once and not kept; models with no file
+    for this contract are left out.
+    """
+    accumulators: dict[str, MetricsAccumulator] = {}
+    for model in freeform_models:
+        data = load_evaluation(freeform_results, contract, model)
+        if data is not None:
+            accumulators.setdefault(model, MetricsAccumulator()).add_evaluation(data)
+    if stacking_results is not None:
+        for model in stacking_models:
+            data = load_evaluation(stacking_results, contract, model)
+            if data is not None:
+                accumulators.setdefault(model, MetricsAccumulator()).add_stacking(data)
+    return accumulators
 
-    return {
-        "model": model,
-        "display_name": MODEL_DISPLAY.get(model, model),
-        "contracts_evaluated": len(freeform_evals),
-        "risk_identification_accuracy": detection,
-        "additional_issues": additional,
-        "precision_recall_f1": prf,
-        "quality_score": quality,
-        "t1_gate": t1_gate,
-        "traceability": traceability,
-        "stacking": stacking,
-    }
+
+def accumulate_models(
+    freeform_results: Path,
+    stacking_results: Path | None,
+    contracts: list[str],
+    freeform_models: list[str],
+    stacking_models: list[str],
+    max_workers: int | None = 1,
+) -> dict[str, MetricsAccumulator]:
+    """
+    Per-model accumulators over all contracts.
+
+    Contracts are accumulated on a process pool (max_workers=None: CPU
+    count; 1: in-process) and merged in contract order.
+    """
+    worker = partial(
+        accumulate_contract, freeform_results, stacking_results,
+        freeform_models=freeform_models, stacking_models=stacking_models,
+    )
+    workers = min(max_workers or os.cpu_count() or 1, len(contracts))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            per_contract = list(pool.map(worker, contracts))
+    else:
+        per_contract = [worker(contract) for contract in contracts]
+
+    by_model: dict[str, MetricsAccumulator] = {}
+    for accumulators in per_contract:
+        for model, acc in accumulators.items():
+            if model in by_model:
+                by_model[model].merge(acc)
+            else:
+                by_model[model] = acc
+    return by_model
 
 
 # ---------------------------------------------------------------------------
@@ -553,6 +636,7 @@ Examples:
     python -m framework.scripts.sales_metrics --model sonnet45
     python -m framework.scripts.sales_metrics --format markdown
     python -m framework.scripts.sales_metrics --output-dir ./output
+    python -m framework.scripts.sales_metrics --workers 4
         """,
     )
     parser.add_argument(
@@ -570,6 +654,12 @@ Examples:
         type=Path,
         help="Output directory (default: freeform/results/)",
     )
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=1,
+        help="Process pool size for loading contracts (default: 1, in-process)",
+    )
     parser.add_argument(
         "--project-root",
         type=Path,
@@ -594,29 +684,26 @@ Examples:
         else (STACKING_MODELS if not args.model else [])
     )
 
-    # Load data
+    # Load and accumulate, one pass per evaluation file
     print(f"Loading freeform evaluations from {freeform_results}")
-    freeform_by_model = load_all_evaluations(
-        freeform_results, CONTRACTS, freeform_models,
-    )
-
-    stacking_by_model: dict[str, list[dict]] = {}
     if stacking_results.exists() and stacking_models:
         print(f"Loading stacking evaluations from {stacking_results}")
-        stacking_by_model = load_all_evaluations(
-            stacking_results, CONTRACTS, stacking_models,
-        )
+    else:
+        stacking_models = []
+    accumulators = accumulate_models(
+        freeform_results, stacking_results if stacking_models else None,
+        CONTRACTS, freeform_models, stacking_models, max_workers=args.workers,
+    )
 
     # Compute metrics
     all_metrics: dict[str, dict] = {}
     for model in freeform_models:
-        evals = freeform_by_model.get(model, [])
-        if not evals:
+        acc = accumulators.get(model)
+        if acc is None or not acc.evaluations:
             print(f"  WARNING: No evaluations found for {model}")
             continue
-        stacking_evals = stacking_by_model.get(model, [])
-        print(f"  {model}: {len(evals)} freeform, {len(stacking_evals)} stacking")
-        all_metrics[model] = compute_model_metrics(model, evals, stacking_evals)
+        print(f"  {model}: {acc.evaluations} freeform, {len(acc.part_a_pcts)} stacking")
+        all_metrics[model] = acc.result(model)
 
     # Cross-validate
     freeform_summary = load_summary(freeform_results)
@@ -3,8 +3,8 @@
 Validate Ground Truth JSON files.
 
 Usage:
-    python validate_gt.py ground_truth/consulting.json
-    python validate_gt.py ground_truth/consulting.json --contract contracts/consulting.docx
+    python -m framework.scripts.validate_gt ground_truth/consulting.json
+    python -m framework.scripts.validate_gt ground_truth/consulting.json --contract contracts/consulting.docx
 """
 
 import json
@@ -14,6 +14,8 @@ from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass, field
 
+from framework.scripts.gt_index import GroundTruthIndex
+
 
 # GT Schema v4 field specifications
 V4_FIELDS = {
@@ -119,7 +121,6 @@ def validate_gt(gt_path: str, contract_path: Optional[str] = None) -> Validation
 
     # GT entry validation
     gt_ids = set()
-    tier_counts = {'T1': 0, 'T2': 0, 'T3': 0}
     
     for i, entry in enumerate(gt['ground_truth']):
         prefix = f"GT entry {i+1}"
@@ -143,8 +144,6 @@ def validate_gt(gt_path: str, contract_path: Optional[str] = None) -> Validation
         if 'tier' in entry:
             if entry['tier'] not in ['T1', 'T2', 'T3']:
                 result.add_error(f"{prefix}: Invalid tier '{entry['tier']}'")
-            else:
-                tier_counts[entry['tier']] += 1
         
         if 'issue' in entry and len(entry['issue']) > 60:
             result.add_warning(f"{prefix}: Issue text exceeds 60 chars ({len(entry['issue'])})")
@@ -175,7 +174,9 @@ def validate_gt(gt_path: str, contract_path: Optional[str] = None) -> Validation
             for error in v4_errors:
                 result.add_error(error)
 
-    # Tier summary validation
+    # Tier summary validation (invalid tiers are already errors above)
+    index = GroundTruthIndex.from_data(gt)
+    tier_counts = {t: index.tier_counts.get(t, 0) for t in ('T1', 'T2', 'T3')}
     summary = gt['tier_summary']
     for tier in ['T1', 'T2', 'T3']:
         if tier not in summary:
@@ -189,8 +190,8 @@ def validate_gt(gt_path: str, contract_path: Optional[str] = None) -> Validation
             )
     
     # Weighted max calculation
-    expected_weights = {'T1': 8, 'T2': 5, 'T3': 1}
-    calculated_max = sum(tier_counts[t] * expected_weights[t] for t in tier_counts)
+    expected_weights = {'T1': {'Y': 8}, 'T2': {'Y': 5}, 'T3': {'Y': 1}}
+    calculated_max = int(index.max_points(expected_weights, default_max=0))
     
     if 'weighted_max' in summary:
         if summary['weighted_max'] != calculated_max:
@@ -0,0 +1,127 @@
+"""
+Streaming xlsx backend for the evaluation workbooks.
+
+openpyxl's write-only mode streams each row to disk as it is appended, so a
+workbook never holds its cells in memory, but column widths have to be set
+before the first row and every styled cell needs its own style lookup.
+
+SheetBuffer collects a sheet's rows as plain values plus style names and
+keeps the widest value per column as rows arrive, so widths come from those
+statistics instead of a rescan of finished cells. StreamingWorkbook
+registers the styles once per workbook as named styles, resolves each
+name to its style array once, and streams each sheet as soon as it is
+complete:
+
+    book = StreamingWorkbook(NAMED_STYLES)
+    sheet = SheetBuffer("Summary")
+    sheet.append(["Rank", "Model"], "header")
+    sheet.append([1, "pioneer"], "cell")
+    book.write_sheet(sheet)
+    book.save(path)
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from openpyxl import Workbook
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.styles import NamedStyle
+from openpyxl.styles.borders import DEFAULT_BORDER
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.utils import get_column_letter
+
+# A style name for the whole row, or one per cell (None = unstyled)
+RowStyles = Union[None, str, Sequence[Optional[str]]]
+
+
+class SheetBuffer:
+    """
+    Rows of one sheet, buffered until the column widths are known.
+
+    A column's width is its longest str(value) over all non-empty cells
+    plus 2, clamped to [min_width, max_width]. Rows are (values, styles)
+    pairs of plain Python objects, far smaller than openpyxl cells.
+    """
+
+    def __init__(self, title: str, min_width: int = 8, max_width: int = 50):
+        self.title = title
+        self.min_width = min_width
+        self.max_width = max_width
+        self.rows: List[tuple] = []
+        self.merged: List[str] = []
+        self._lengths: List[int] = []
+
+    def append(self, values: Sequence[Any], styles: RowStyles = None) -> None:
+        lengths = self._lengths
+        if len(values) > len(lengths):
+            lengths.extend([0] * (len(values) - len(lengths)))
+        for col, value in enumerate(values):
+            if value:
+                length = len(str(value))
+                if length > lengths[col]:
+                    lengths[col] = length
+        self.rows.append((values, styles))
+
+    def merge(self, cell_range: str) -> None:
+        """Merge a range such as "A1:P1" (the value goes in its first cell)."""
+        self.merged.append(cell_range)
+
+    def column_widths(self) -> List[float]:
+        return [
+            min(max(length + 2, self.min_width), self.max_width)
+            for length in self._lengths
+        ]
+
+
+class StreamingWorkbook:
+    """
+    Write-only openpyxl workbook with named styles.
+
+    Args:
+        styles: Style name -> NamedStyle keyword arguments (font, fill,
+            alignment, border, number_format). Missing font and border
+            fall back to the workbook defaults.
+    """
+
+    def __init__(self, styles: Dict[str, Dict[str, Any]]):
+        self.workbook = Workbook(write_only=True)
+        for name, attributes in styles.items():
+            attributes = {'font': DEFAULT_FONT, 'border': DEFAULT_BORDER, **attributes}
+            self.workbook.add_named_style(NamedStyle(name=name, **attributes))
+        self._style_arrays: Dict[str, Any] = {}
+
+    def _resolve_style(self, ws, name: str):
+        # Assigning a style by name searches the workbook's named styles on
+        # every cell; resolve each name once and copy its array instead
+        prototype = WriteOnlyCell(ws)
+        prototype.style = name
+        self._style_arrays[name] = prototype._style
+        return prototype._style
+
+    def write_sheet(self, sheet: SheetBuffer) -> None:
+        """Stream a finished sheet into the workbook."""
+        ws = self.workbook.create_sheet(sheet.title)
+        for col, width in enumerate(sheet.column_widths(), 1):
+            ws.column_dimensions[get_column_letter(col)].width = width
+        for cell_range in sheet.merged:
+            ws.merged_cells.add(cell_range)
+
+        arrays = self._style_arrays
+        for values, styles in sheet.rows:
+            if styles is None:
+                ws.append(values)
+                continue
+            if isinstance(styles, str):
+                styles = [styles] * len(values)
+            row = []
+            for value, style in zip(values, styles):
+                if style is None:
+                    row.append(value)
+                    continue
+                array = arrays.get(style) or self._resolve_style(ws, style)
+                row.append(Cell(ws, row=1, column=1, value=value, style_array=array))
+            ws.append(row)
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.workbook.save(path)
@@ -7,8 +7,13 @@ Guidelines mode uses playbook-driven evaluation with:
 """
 
 from pathlib import Path
-from typing import Optional
-import re
+from typing import Optional, Union
+
+from ..scoring.clauses import (
+    clause_refs_match as _clause_refs_match,
+    clause_refs_same_article as _clause_refs_same_article,
+)
+from ..scoring.output_view import OutputView, as_output_view
 
 
 def check_red_flag_gate(evaluations: list[dict], gt_issues: list[dict]) -> dict:
@@ -61,7 +66,7 @@ def check_red_flag_gate(evaluations: list[dict], gt_issues: list[dict]) -> dict:
 
 
 def score_guidelines_issue(
-    leah_output: Optional[dict],
+    leah_output: Optional[Union[dict, OutputView]],
     gt_issue: dict,
     config: dict,
     playbook_loader=None
@@ -110,9 +115,10 @@ def score_guidelines_issue(
             "max_score": max_total,
         }
 
-    leah_action = leah_output.get("action", leah_output.get("recommendation", ""))
-    leah_amendment = leah_output.get("proposed_text", leah_output.get("redline_text", ""))
-    leah_rationale = leah_output.get("rationale", leah_output.get("detailed_reasoning", ""))
+    view = as_output_view(leah_output)
+    leah_action = view.action
+    leah_amendment = view.revision
+    leah_rationale = view.reasoning
     leah_classification = leah_output.get("classification", "")
     leah_clause = leah_output.get("clause_ref", "")
 
@@ -123,7 +129,7 @@ def score_guidelines_issue(
         detected = "Y"
         detection_score = max_detection
         if trigger_phrase:
-            combined = (leah_rationale + " " + leah_amendment).lower()
+            combined = view.lower("reasoning") + " " + view.lower("revision")
             if trigger_phrase.lower() not in combined:
                 detected = "P"
                 detection_score = max_detection * 0.5
@@ -147,7 +153,7 @@ def score_guidelines_issue(
     amendment_score = 0
     if max_amendment > 0 and detected != "NMI" and leah_amendment and expected_amendment:
         expected_words = set(w.lower() for w in expected_amendment.split() if len(w) > 3)
-        leah_words = set(w.lower() for w in leah_amendment.split() if len(w) > 3)
+        leah_words = view.words("revision", min_len=4)
         overlap = len(expected_words & leah_words) / len(expected_words) if expected_words else 0
         if overlap >= 0.5:
             amendment_score = max_amendment
@@ -159,7 +165,7 @@ def score_guidelines_issue(
     if max_rationale > 0 and detected != "NMI" and leah_rationale:
         rationale_must = gt_issue.get("rationale_must_include", [])
         if rationale_must:
-            rationale_lower = leah_rationale.lower()
+            rationale_lower = view.lower("reasoning")
             matched = sum(1 for r in rationale_must if any(w.lower() in rationale_lower for w in r.split()[:3] if len(w) > 3))
             if matched >= len(rationale_must) * 0.5:
                 rationale_score = max_rationale
@@ -185,22 +191,6 @@ def score_guidelines_issue(
     }
 
 
-def _clause_refs_match(clause1: str, clause2: str) -> bool:
-    def normalise(c):
-        c = c.lower().replace("section", "").replace("clause", "").strip()
-        match = re.match(r'^(\d+(?:\.\d+)*)', c)
-        return match.group(1) if match else c
-    return normalise(clause1) == normalise(clause2)
-
-
-def _clause_refs_same_article(clause1: str, clause2: str) -> bool:
-    def get_article(c):
-        match = re.match(r'^(\d+)', c.replace("Section", "").replace("Clause", "").strip())
-        return match.group(1) if match else None
-    a1, a2 = get_article(clause1), get_article(clause2)
-    return a1 and a2 and a1 == a2
-
-
 def calculate_guidelines_pass_fail(
     evaluations: list[dict],
     gt_issues: list[dict],
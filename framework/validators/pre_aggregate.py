@@ -6,12 +6,19 @@ before aggregation begins.
 
 import json
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
 from .base import ValidationResult, ValidationIssue, Severity
 
+if TYPE_CHECKING:
+    from ..document_store import DocumentStore
 
-def validate_pre_aggregation(runs: list[Path]) -> ValidationResult:
+
+def validate_pre_aggregation(
+    runs: list[Path],
+    store: Optional["DocumentStore"] = None,
+    changed_files: Optional[Iterable[Path]] = None
+) -> ValidationResult:
     """Validate all prerequisites for aggregation.
 
     Gates:
@@ -20,8 +27,19 @@ def validate_pre_aggregation(runs: list[Path]) -> ValidationResult:
     - All evaluation files are valid JSON
     - Zero-score anomalies flagged as warnings
 
+    The run tree is walked once (Gate 1); later gates reuse that listing.
+    Coverage gates only list directories. Gate 4 parses files, and can be
+    limited to the files that changed since the last aggregation, or left
+    to AggregationEngine (changed_files=[]), which runs the same checks
+    (invalid_json_issue, evaluation_issues) on the files it decodes.
+
     Args:
         runs: List of run directories to validate
+        store: Optional shared DocumentStore for I/O counters; run files
+            are parsed without being cached
+        changed_files: If given, Gate 4 parses only these files (see
+            framework.aggregation.plan_aggregation); the others passed it
+            before their outputs were aggregated
 
     Returns:
         ValidationResult with valid=True only if no ERROR-severity issues
@@ -44,6 +62,7 @@ def validate_pre_aggregation(runs: list[Path]) -> ValidationResult:
     # Gate 1: Discover expected scope from all runs
     all_contracts: set[str] = set()
     all_models: set[str] = set()
+    present: set[tuple[str, str, str]] = set()  # (run, contract, model)
 
     for run in existing_runs:
         eval_dir = run / "evaluations"
@@ -61,6 +80,7 @@ def validate_pre_aggregation(runs: list[Path]) -> ValidationResult:
                 all_contracts.add(contract_dir.name)
                 for model_file in contract_dir.glob("*.json"):
                     all_models.add(model_file.stem)
+                    present.add((str(run), contract_dir.name, model_file.stem))
 
     if not all_contracts:
         issues.append(ValidationIssue(
@@ -85,8 +105,7 @@ def validate_pre_aggregation(runs: list[Path]) -> ValidationResult:
 
         for contract in sorted(all_contracts):
             for model in sorted(all_models):
-                path = eval_dir / contract / f"{model}.json"
-                if path.exists():
+                if (str(run), contract, model) in present:
                     actual += 1
                 else:
                     missing.append(f"{contract}/{model}")
@@ -115,44 +134,69 @@ def validate_pre_aggregation(runs: list[Path]) -> ValidationResult:
         ))
 
     # Gate 4: Validate JSON integrity and check for anomalies
+    to_parse = None if changed_files is None else {str(p) for p in changed_files}
     for run in existing_runs:
         eval_dir = run / "evaluations"
         for contract in all_contracts:
             for model in all_models:
-                path = eval_dir / contract / f"{model}.json"
-                if not path.exists():
+                if (str(run), contract, model) not in present:
                     continue  # Already flagged in Gate 2
+                path = eval_dir / contract / f"{model}.json"
+                if to_parse is not None and str(path) not in to_parse:
+                    continue
 
                 # JSON integrity check
                 try:
-                    with open(path) as f:
-                        data = json.load(f)
+                    if store is not None:
+                        data = store.load(path, stage="pre_aggregate", cache=False)
+                    else:
+                        with open(path) as f:
+                            data = json.load(f)
                 except json.JSONDecodeError as e:
-                    issues.append(ValidationIssue(
-                        severity=Severity.ERROR,
-                        message=f"Invalid JSON at line {e.lineno}: {e.msg}",
-                        location=str(path),
-                        context={"error": str(e)}
-                    ))
+                    issues.append(invalid_json_issue(path, e))
                     continue
 
-                # Semantic validation: zero-score anomaly
-                gt_evals = data.get("gt_evaluations", [])
-                summary = data.get("summary", {})
-                total_pts = summary.get("total_points", 0)
-
-                if total_pts == 0 and len(gt_evals) > 0:
-                    issues.append(ValidationIssue(
-                        severity=Severity.WARNING,
-                        message=f"Zero score with {len(gt_evals)} GT items - verify data/config",
-                        location=f"{run.name}/{contract}/{model}",
-                        context={
-                            "gt_count": len(gt_evals),
-                            "total_points": total_pts
-                        }
-                    ))
+                issues.extend(evaluation_issues(data, f"{run.name}/{contract}/{model}"))
 
     return ValidationResult(
         valid=len([i for i in issues if i.severity == Severity.ERROR]) == 0,
         issues=issues
     )
+
+
+def invalid_json_issue(path: Path, error: json.JSONDecodeError) -> ValidationIssue:
+    """Gate 4 error for an evaluation file that is not valid JSON."""
+    return ValidationIssue(
+        severity=Severity.ERROR,
+        message=f"Invalid JSON at line {error.lineno}: {error.msg}",
+        location=str(path),
+        context={"error": str(error)}
+    )
+
+
+def evaluation_issues(data: dict, location: str) -> list[ValidationIssue]:
+    """Gate 4 semantic checks of one parsed evaluation file.
+
+    Args:
+        data: Parsed evaluation JSON
+        location: "{run}/{contract}/{model}" reported with each issue
+    """
+    issues: list[ValidationIssue] = []
+
+    # Zero-score anomaly
+    gt_evals = data.get("gt_evaluations", [])
+    summary = data.get("summary", {})
+    total_pts = summary.get("total_points", 0)
+
+    if total_pts == 0 and len(gt_evals) > 0:
+        issues.append(ValidationIssue(
+            severity=Severity.WARNING,
+            message=f"Zero score with {len(gt_evals)} GT items - verify data/config",
+            location=location,
+            context={
+                "gt_count": len(gt_evals),
+                "total_points": total_pts
+            }
+        ))
+
+    return issues
@@ -2,12 +2,19 @@
 
 import json
 from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING, Optional, Union
 
 from .base import ValidationResult, ValidationIssue, Severity
 
+if TYPE_CHECKING:
+    from ..document_store import DocumentStore
 
-def validate_pre_workbook(mode_dir: Union[Path, str], env: str) -> ValidationResult:
+
+def validate_pre_workbook(
+    mode_dir: Union[Path, str],
+    env: str,
+    store: Optional["DocumentStore"] = None
+) -> ValidationResult:
     """Validate prerequisites before workbook generation stage.
 
     Checks:
@@ -19,6 +26,7 @@ def validate_pre_workbook(mode_dir: Union[Path, str], env: str) -> ValidationRes
     Args:
         mode_dir: Path to mode directory (e.g., freeform/)
         env: Environment name (e.g., hotfix, test_prod2)
+        store: Optional shared DocumentStore for reading aggregated files
 
     Returns:
         ValidationResult with errors/warnings
@@ -69,8 +77,11 @@ def validate_pre_workbook(mode_dir: Union[Path, str], env: str) -> ValidationRes
 
     for agg_file in json_files[:10]:  # Check first 10 files (don't need to check all)
         try:
-            with open(agg_file) as f:
-                data = json.load(f)
+            if store is not None:
+                data = store.load(agg_file, stage="pre_workbook")
+            else:
+                with open(agg_file) as f:
+                    data = json.load(f)
 
             if not data:
                 continue
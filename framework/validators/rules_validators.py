@@ -10,11 +10,13 @@ Rules mode uses deterministic 5-dimension scoring per rule:
 Total: 9 points per rule
 """
 
-from typing import Optional
+from typing import Optional, Union
+
+from ..scoring.output_view import OutputView, as_output_view
 
 
 def score_rule_evaluation(
-    leah_output: Optional[dict],
+    leah_output: Optional[Union[dict, OutputView]],
     gt_rule: dict,
     config: dict
 ) -> dict:
@@ -45,15 +47,16 @@ def score_rule_evaluation(
             "max_score": scoring_config.get("per_rule_max", 9),
         }
 
-    leah_action = leah_output.get("action", leah_output.get("recommendation", ""))
-    leah_language = leah_output.get("proposed_text", leah_output.get("redline_text", ""))
-    leah_rationale = leah_output.get("rationale", leah_output.get("detailed_reasoning", ""))
+    view = as_output_view(leah_output)
+    leah_action = view.action
+    leah_language = view.revision
+    leah_rationale = view.reasoning
     leah_classification = leah_output.get("classification", "")
 
     # Score detection (2 pts)
     detection_score = 0
     detected = "NMI"
-    trigger_found = trigger_quote and trigger_quote.lower() in (leah_rationale + leah_language).lower()
+    trigger_found = trigger_quote and trigger_quote.lower() in view.lower("reasoning") + view.lower("revision")
     if trigger_found or _clause_mentioned_with_concern(leah_output):
         detection_score = dimensions.get("detection", {}).get("max", 2)
         detected = "Y"
@@ -79,7 +82,7 @@ def score_rule_evaluation(
     # Score language (2 pts)
     language_score = 0
     if leah_language and key_elements:
-        language_lower = leah_language.lower()
+        language_lower = view.lower("revision")
         matched = sum(1 for elem in key_elements
                      if any(word.lower() in language_lower for word in elem.split()[:3] if len(word) > 3))
         if matched >= len(key_elements) * 0.7:
@@ -90,7 +93,7 @@ def score_rule_evaluation(
     # Score rationale (2 pts)
     rationale_score = 0
     if leah_rationale and rationale_must_include:
-        rationale_lower = leah_rationale.lower()
+        rationale_lower = view.lower("reasoning")
         matched = sum(1 for citation in rationale_must_include
                      if any(word.lower() in rationale_lower for word in citation.split()[:3] if len(word) > 3))
         if matched >= len(rationale_must_include) * 0.5:
@@ -124,7 +127,7 @@ def score_rule_evaluation(
     }
 
 
-def _clause_mentioned_with_concern(leah_output: dict) -> bool:
+def _clause_mentioned_with_concern(leah_output: Union[dict, OutputView]) -> bool:
     classification = leah_output.get("classification", "")
     return any(marker in classification for marker in ["❌", "⚠️", "Unfavourable"])
 
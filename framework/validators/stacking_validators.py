@@ -5,7 +5,10 @@ Handles:
 - Rules_stacking: Scope violation detection (added in 07-04)
 """
 
-from typing import Optional
+from typing import Optional, Union
+
+from ..scoring.clauses import normalise_clause_ref as _normalise_clause_ref
+from ..scoring.output_view import OutputView, as_output_view
 
 
 def validate_cp_redline_action(
@@ -57,7 +60,7 @@ def detect_critical_failures(evaluations: list[dict]) -> list[dict]:
 
 
 def score_part_a_redline(
-    leah_response: Optional[dict],
+    leah_response: Optional[Union[dict, OutputView]],
     gt_redline: dict,
     config: dict
 ) -> dict:
@@ -96,9 +99,10 @@ def score_part_a_redline(
             } if is_adversarial else None
         }
 
-    leah_action = leah_response.get("action", leah_response.get("recommendation", ""))
-    leah_revision = leah_response.get("proposed_text", leah_response.get("redline_text", ""))
-    leah_reasoning = leah_response.get("rationale", leah_response.get("detailed_reasoning", ""))
+    view = as_output_view(leah_response)
+    leah_action = view.action
+    leah_revision = view.revision
+    leah_reasoning = view.reasoning
 
     validation = validate_cp_redline_action(leah_action, acceptable_actions, redline_id)
     action_score = max_per_dimension if validation["action_correct"] else 0
@@ -108,7 +112,7 @@ def score_part_a_redline(
     if leah_revision and len(leah_revision) > 20:
         key_elements = gt_redline.get("key_elements", [])
         if key_elements:
-            revision_lower = leah_revision.lower()
+            revision_lower = view.lower("revision")
             matched = sum(1 for elem in key_elements if any(word in revision_lower for word in elem.lower().split()[:3]))
             revision_score = min(max_per_dimension, matched)
         else:
@@ -119,7 +123,7 @@ def score_part_a_redline(
     if leah_reasoning and len(leah_reasoning) > 30:
         reasoning_must_address = gt_redline.get("reasoning_must_address", "")
         if reasoning_must_address:
-            reasoning_lower = leah_reasoning.lower()
+            reasoning_lower = view.lower("reasoning")
             must_lower = reasoning_must_address.lower()
             if any(word in reasoning_lower for word in must_lower.split()[:5] if len(word) > 4):
                 reasoning_score = max_per_dimension
@@ -238,19 +242,6 @@ def detect_scope_violations(
     return violations
 
 
-def _normalise_clause_ref(clause: str) -> str:
-    """Normalise clause reference for scope matching."""
-    if not clause:
-        return ""
-    import re
-    text = clause.strip()
-    for prefix in ["Section ", "Clause ", "Article ", "§ ", "§"]:
-        if text.lower().startswith(prefix.lower()):
-            text = text[len(prefix):].strip()
-    match = re.match(r'^(\d+(?:\.\d+)*)', text)
-    return match.group(1).lower() if match else text.split()[0].lower() if text else ""
-
-
 def _is_meaningful_comment(classification: str) -> bool:
     """Check if classification indicates a meaningful comment."""
     if not classification:
@@ -280,7 +271,7 @@ def build_redline_clause_set(gt_redlines: list) -> set[str]:
 
 
 def score_rules_stacking_redline(
-    leah_response: Optional[dict],
+    leah_response: Optional[Union[dict, OutputView]],
     gt_redline: dict,
     config: dict
 ) -> dict:
@@ -314,9 +305,10 @@ def score_rules_stacking_redline(
             "max_score": max_total,
         }
 
-    leah_action = leah_response.get("action", leah_response.get("recommendation", ""))
-    leah_revision = leah_response.get("proposed_text", leah_response.get("redline_text", ""))
-    leah_reasoning = leah_response.get("rationale", leah_response.get("detailed_reasoning", ""))
+    view = as_output_view(leah_response)
+    leah_action = view.action
+    leah_revision = view.revision
+    leah_reasoning = view.reasoning
 
     leah_action_norm = leah_action.upper().strip() if leah_action else ""
     expected_norm = expected_action.upper().strip() if expected_action else ""
@@ -329,7 +321,7 @@ def score_rules_stacking_redline(
 
     revision_score = 0
     if leah_revision and key_elements:
-        revision_lower = leah_revision.lower()
+        revision_lower = view.lower("revision")
         matched = sum(1 for elem in key_elements if any(word.lower() in revision_lower for word in elem.split()[:3] if len(word) > 3))
         revision_score = max_per_dimension if matched >= len(key_elements) * 0.5 else (1 if matched > 0 else 0)
     elif leah_revision and len(leah_revision) > 20:
@@ -337,7 +329,7 @@ def score_rules_stacking_redline(
 
     reasoning_score = 0
     if leah_reasoning and rationale_must_include:
-        reasoning_lower = leah_reasoning.lower()
+        reasoning_lower = view.lower("reasoning")
         matched = sum(1 for r in rationale_must_include if any(word.lower() in reasoning_lower for word in r.split()[:3] if len(word) > 3))
         reasoning_score = max_per_dimension if matched >= len(rationale_must_include) * 0.5 else (1 if matched > 0 else 0)
     elif leah_reasoning and len(leah_reasoning) > 30:
@@ -0,0 +1,247 @@
+"""Tests for the parallel aggregation engine."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from framework.aggregation import MANIFEST_NAME, AggregationEngine, discover_inputs
+from framework.document_store import DocumentStore
+from framework.validators import ValidationError
+
+
+def _write_eval(run_dir: Path, contract: str, model: str, total_points: float) -> Path:
+    path = run_dir / "evaluations" / contract / f"{model}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({
+            "gt_evaluations": [{"gt_id": "GT-01", "tier": "T1", "detection": "Y"}],
+            "summary": {"total_points": total_points},
+        }, f)
+    return path
+
+
+@pytest.fixture
+def three_runs(tmp_path):
+    """Three runs x two contracts x two models, points encode run number."""
+    runs = []
+    for run_num in [1, 2, 3]:
+        run_dir = tmp_path / f"run{run_num}"
+        for contract in ["consulting", "dpa"]:
+            for model in ["model_a", "model_b"]:
+                _write_eval(run_dir, contract, model, total_points=run_num)
+        runs.append(run_dir)
+    return runs
+
+
+class TestDiscoverInputs:
+
+    def test_groups_files_by_key_in_run_order(self, three_runs):
+        inputs = discover_inputs(three_runs)
+
+        assert set(inputs) == {
+            ("consulting", "model_a"), ("consulting", "model_b"),
+            ("dpa", "model_a"), ("dpa", "model_b"),
+        }
+        run_order = [run_dir for run_dir, _ in inputs[("dpa", "model_b")]]
+        assert run_order == three_runs
+
+    def test_skips_runs_without_evaluations(self, tmp_path):
+        (tmp_path / "empty_run").mkdir()
+        assert discover_inputs([tmp_path / "empty_run"]) == {}
+
+
+class TestAggregationEngine:
+
+    def test_last_run_is_primary(self, three_runs, tmp_path):
+        output_dir = tmp_path / "aggregated"
+        summary = AggregationEngine(max_workers=2).run(three_runs, output_dir)
+
+        assert summary["files_written"] == 4
+        assert summary["contracts"] == ["consulting", "dpa"]
+        assert summary["models"] == ["model_a", "model_b"]
+
+        with open(output_dir / "dpa" / "model_a.json") as f:
+            data = json.load(f)
+        assert data["summary"]["total_points"] == 3
+        assert data["aggregation_meta"]["num_runs"] == 3
+        assert data["aggregation_meta"]["run_dirs"] == [str(r) for r in three_runs]
+
+    def test_reports_per_key_and_total_timings(self, three_runs, tmp_path):
+        summary = AggregationEngine().run(three_runs, tmp_path / "aggregated")
+
+        timings = summary["timings"]
+        assert timings["total_seconds"] >= 0
+        assert len(timings["per_key"]) == 4
+        for entry in timings["per_key"]:
+            assert entry["num_runs"] == 3
+            assert entry["total_seconds"] == pytest.approx(
+                entry["read_seconds"] + entry["write_seconds"], abs=1e-3
+            )
+
+    def test_invalid_run_file_is_skipped(self, three_runs, tmp_path):
+        bad = three_runs[2] / "evaluations" / "consulting" / "model_a.json"
+        bad.write_text("{not json")
+
+        output_dir = tmp_path / "aggregated"
+        AggregationEngine().run(three_runs, output_dir)
+
+        with open(output_dir / "consulting" / "model_a.json") as f:
+            data = json.load(f)
+        # Run 3 failed to load, so run 2 becomes primary
+        assert data["summary"]["total_points"] == 2
+        assert data["aggregation_meta"]["num_runs"] == 2
+
+    def test_gate_checks_run_on_merged_documents(self, three_runs, tmp_path):
+        bad = three_runs[2] / "evaluations" / "consulting" / "model_a.json"
+        bad.write_text("{not json")
+
+        output_dir = tmp_path / "aggregated"
+        store = DocumentStore()
+        with pytest.raises(ValidationError, match="Invalid JSON"):
+            AggregationEngine(store=store, validate=True).run(three_runs, output_dir)
+
+        # Each file was parsed once, and no output was written
+        assert store.stats("aggregate")["parse_calls"] == 11
+        assert not output_dir.exists()
+
+    def test_gate_warnings_do_not_abort(self, three_runs, tmp_path):
+        _write_eval(three_runs[0], "dpa", "model_a", total_points=0)
+
+        with pytest.warns(UserWarning, match="Zero score"):
+            summary = AggregationEngine(validate=True).run(three_runs, tmp_path / "aggregated")
+        assert summary["files_written"] == 4
+
+    def test_no_inputs_writes_nothing(self, tmp_path):
+        output_dir = tmp_path / "aggregated"
+        summary = AggregationEngine().run([tmp_path / "missing"], output_dir)
+
+        assert summary["files_written"] == 0
+        assert summary["timings"]["per_key"] == []
+        assert not output_dir.exists()
+
+    def test_custom_loader_is_used(self, three_runs, tmp_path):
+        seen = []
+
+        def loader(path):
+            seen.append(path)
+            with open(path) as f:
+                return json.load(f)
+
+        AggregationEngine(load_json=loader).run(three_runs, tmp_path / "aggregated")
+        assert len(seen) == 12
+
+
+class TestIncrementalAggregation:
+
+    def test_unchanged_inputs_are_skipped(self, three_runs, tmp_path):
+        output_dir = tmp_path / "aggregated"
+        engine = AggregationEngine()
+        engine.run(three_runs, output_dir)
+        before = (output_dir / "dpa" / "model_a.json").stat().st_mtime_ns
+
+        summary = engine.run(three_runs, output_dir)
+
+        assert summary["files_written"] == 0
+        assert summary["files_skipped"] == 4
+        assert summary["contracts"] == ["consulting", "dpa"]
+        assert (output_dir / "dpa" / "model_a.json").stat().st_mtime_ns == before
+
+    def test_only_changed_key_is_rewritten(self, three_runs, tmp_path):
+        output_dir = tmp_path / "aggregated"
+        engine = AggregationEngine()
+        engine.run(three_runs, output_dir)
+
+        _write_eval(three_runs[2], "dpa", "model_a", total_points=99)
+        summary = engine.run(three_runs, output_dir)
+
+        assert summary["files_written"] == 1
+        assert summary["files_skipped"] == 3
+        with open(output_dir / "dpa" / "model_a.json") as f:
+            assert json.load(f)["summary"]["total_points"] == 99
+
+    def test_touched_file_with_same_content_is_skipped(self, three_runs, tmp_path):
+        output_dir = tmp_path / "aggregated"
+        engine = AggregationEngine()
+        engine.run(three_runs, output_dir)
+
+        path = three_runs[0] / "evaluations" / "dpa" / "model_a.json"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+
+        assert engine.run(three_runs, output_dir)["files_written"] == 0
+
+    def test_new_run_directory_invalidates_keys(self, three_runs, tmp_path):
+        output_dir = tmp_path / "aggregated"
+        engine = AggregationEngine()
+        engine.run(three_runs, output_dir)
+
+        run4 = tmp_path / "run4"
+        _write_eval(run4, "dpa", "model_a", total_points=4)
+        summary = engine.run(three_runs + [run4], output_dir)
+
+        assert summary["files_written"] == 1
+        with open(output_dir / "dpa" / "model_a.json") as f:
+            assert json.load(f)["aggregation_meta"]["num_runs"] == 4
+
+    def test_full_rewrites_everything(self, three_runs, tmp_path):
+        output_dir = tmp_path / "aggregated"
+        engine = AggregationEngine()
+        engine.run(three_runs, output_dir)
+
+        summary = engine.run(three_runs, output_dir, full=True)
+        assert summary["files_written"] == 4
+        assert summary["files_skipped"] == 0
+
+    def test_deleted_output_is_rebuilt(self, three_runs, tmp_path):
+        output_dir = tmp_path / "aggregated"
+        engine = AggregationEngine()
+        engine.run(three_runs, output_dir)
+
+        (output_dir / "consulting" / "model_b.json").unlink()
+        assert engine.run(three_runs, output_dir)["files_written"] == 1
+
+    def test_outputs_without_inputs_are_removed(self, three_runs, tmp_path):
+        output_dir = tmp_path / "aggregated"
+        engine = AggregationEngine()
+        engine.run(three_runs, output_dir)
+
+        for run_dir in three_runs:
+            (run_dir / "evaluations" / "dpa" / "model_b.json").unlink()
+        summary = engine.run(three_runs, output_dir)
+
+        assert summary["files_removed"] == 1
+        assert summary["files_skipped"] == 3
+        assert not (output_dir / "dpa" / "model_b.json").exists()
+        with open(output_dir / MANIFEST_NAME) as f:
+            assert "dpa/model_b" not in json.load(f)["outputs"]
+
+    def test_each_input_is_read_once(self, three_runs, tmp_path):
+        store = DocumentStore()
+        AggregationEngine(store=store).run(three_runs, tmp_path / "aggregated")
+        assert store.stats("aggregate")["parse_calls"] == 12
+
+    def test_manifest_records_fingerprints(self, three_runs, tmp_path):
+        output_dir = tmp_path / "aggregated"
+        AggregationEngine().run(three_runs, output_dir)
+
+        with open(output_dir / MANIFEST_NAME) as f:
+            manifest = json.load(f)
+        inputs = manifest["outputs"]["dpa/model_a"]["inputs"]
+        assert len(inputs) == 3
+        assert set(inputs[0]) == {"path", "mtime_ns", "size", "sha256"}
+
+
+class TestAggregationStatistics:
+
+    def test_statistics_cover_all_runs(self, three_runs, tmp_path):
+        output_dir = tmp_path / "aggregated"
+        AggregationEngine().run(three_runs, output_dir)
+
+        with open(output_dir / "dpa" / "model_a.json") as f:
+            stats = json.load(f)["aggregation_meta"]["statistics"]
+
+        assert stats["num_runs"] == 3
+        assert stats["gt_items"]["GT-01"]["detection_counts"]["Y"] == 3
+        assert stats["gt_items"]["GT-01"]["majority_detection"] == "Y"
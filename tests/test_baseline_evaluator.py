@@ -0,0 +1,104 @@
+"""Tests for batched evaluator prompts in baseline_comparison.evaluator."""
+
+import json
+
+import pytest
+
+pytest.importorskip("anthropic")
+pytest.importorskip("openai")
+
+from baseline_comparison import llm_clients
+from baseline_comparison.evaluator import (
+    build_batch_evaluator_prompt,
+    evaluate_issue_batch,
+    parse_batch_evaluator_response,
+)
+from baseline_comparison.stub_server import StubProviderServer
+
+
+def _gt(gt_id: str, tier: str = "T2") -> dict:
+    return {"gt_id": gt_id, "tier": tier, "issue": f"Issue {gt_id}", "clause": "1.1"}
+
+
+def _prompt_text(body: dict) -> str:
+    content = body["messages"][0]["content"]
+    if isinstance(content, str):
+        return content
+    return "".join(block["text"] for block in content)
+
+
+def _verdict(gt_id: str, detection: str) -> dict:
+    return {"gt_id": gt_id, "detection": detection, "evidence_excerpt": "", "reasoning": "stub"}
+
+
+class TestParseBatchResponse:
+
+    def test_returns_verdicts_in_requested_order(self):
+        text = "```json\n" + json.dumps([_verdict("GT-02", "n"), _verdict("GT-01", "Y")]) + "\n```"
+        verdicts = parse_batch_evaluator_response(text, ["GT-01", "GT-02"])
+        assert [v["detection"] for v in verdicts] == ["Y", "N"]
+
+    @pytest.mark.parametrize("payload", [
+        "not json",
+        json.dumps(_verdict("GT-01", "Y")),
+        json.dumps([_verdict("GT-01", "Y")]),
+        json.dumps([_verdict("GT-01", "Y"), _verdict("GT-01", "N")]),
+        json.dumps([_verdict("GT-01", "Y"), _verdict("GT-09", "N")]),
+        json.dumps([_verdict("GT-01", "Y"), _verdict("GT-02", "MAYBE")]),
+    ])
+    def test_rejects_malformed_answers(self, payload):
+        with pytest.raises(ValueError):
+            parse_batch_evaluator_response(payload, ["GT-01", "GT-02"])
+
+
+class TestEvaluateIssueBatch:
+
+    @pytest.fixture(autouse=True)
+    def _fast_retries(self, monkeypatch):
+        monkeypatch.setattr(llm_clients, "INITIAL_BACKOFF", 0.01)
+
+    def test_prompt_lists_every_issue_without_review(self):
+        prompt = build_batch_evaluator_prompt([_gt("GT-01"), _gt("GT-02")], "consulting")
+        assert "GT-01" in prompt and "GT-02" in prompt
+        assert "<review>" not in prompt
+
+    def test_one_call_shares_review_block(self, monkeypatch):
+        def _responder(api, body):
+            return json.dumps([_verdict("GT-01", "Y"), _verdict("GT-02", "P"), _verdict("GT-03", "N")])
+
+        issues = [_gt("GT-01", "T1"), _gt("GT-02"), _gt("GT-03")]
+        with StubProviderServer(_responder) as stub:
+            monkeypatch.setenv("ANTHROPIC_BASE_URL", stub.url)
+            batch = evaluate_issue_batch("x" * 5000, issues, "consulting", "test-key")
+
+        assert len(stub.requests) == 1
+        content = stub.requests[0]["messages"][0]["content"]
+        assert content[0]["cache_control"] == {"type": "ephemeral"}
+        assert "<review>" in content[0]["text"] and "<review>" not in content[1]["text"]
+
+        assert [ev["detection"] for ev in batch.evaluations] == ["Y", "P", "N"]
+        assert [ev["detection_points"] for ev in batch.evaluations] == [8, 2.5, 0]
+        usage = batch.usage.to_dict()
+        assert usage["calls"] == 1 and usage["fallback_batches"] == 0
+        assert usage["input_tokens_saved_est"] > usage["input_tokens"]
+
+    def test_malformed_batch_falls_back_to_per_issue_calls(self, monkeypatch):
+        def _responder(api, body):
+            if isinstance(body["messages"][0]["content"], list):
+                return json.dumps([_verdict("GT-01", "Y")])
+            detection = "Y" if "GT-02" in _prompt_text(body) else "N"
+            return json.dumps({"detection": detection, "evidence_excerpt": "", "reasoning": "stub"})
+
+        with StubProviderServer(_responder) as stub:
+            monkeypatch.setenv("ANTHROPIC_BASE_URL", stub.url)
+            batch = evaluate_issue_batch("review", [_gt("GT-01"), _gt("GT-02")], "consulting", "test-key")
+
+        assert len(stub.requests) == 3
+        assert [ev["detection"] for ev in batch.evaluations] == ["N", "Y"]
+        assert batch.usage.calls == 3
+        assert batch.usage.fallback_batches == 1
+
+    def test_dry_run_makes_no_calls(self):
+        batch = evaluate_issue_batch("review", [_gt("GT-01"), _gt("GT-02")], "consulting", "", dry_run=True)
+        assert [ev["detection"] for ev in batch.evaluations] == ["N", "N"]
+        assert batch.usage.calls == 0
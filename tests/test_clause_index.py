@@ -0,0 +1,128 @@
+"""Tests for the inverted clause index."""
+
+import pytest
+
+from framework.scoring import ClauseIndex
+from framework.scoring.clause_index import linear_candidates
+from framework.scoring.clauses import (
+    clause_article,
+    clause_refs_match,
+    clause_refs_same_article,
+    split_clause_refs,
+)
+
+CANONICAL = {
+    "risk_table": [
+        {"clause_ref": "Section 4.1", "clause_summary": "Payment terms"},
+        {"clause_ref": "Section 4.3(b)", "clause_summary": "Late payment"},
+        {"clause_ref": "Clause 9.2", "clause_summary": "Termination"},
+        {"clause_ref": "Exhibit A", "clause_summary": "Service levels"},
+        {"clause_ref": "", "clause_summary": "General"},
+    ],
+    "proposed_redlines": [
+        {"clause_ref": "9.1", "proposed_text": "Either party may terminate..."},
+        {"clause_ref": "Section 4.1", "proposed_text": "Payment within 30 days"},
+    ],
+    "new_clauses_proposed": [
+        {"clause_type": "Data Protection", "proposed_text": "New DPA clause"},
+        {"clause_ref": "Section 15", "proposed_text": "Anti-bribery"},
+    ],
+}
+
+
+def _keys(candidates):
+    return [(c.section, c.position, c.match) for c in candidates]
+
+
+class TestClauseHelpers:
+
+    def test_refs_match_ignores_prefix_and_subclause(self):
+        assert clause_refs_match("Section 4.3(b)", "4.3")
+        assert clause_refs_match("Clause 9.2", "section 9.2")
+        assert not clause_refs_match("4.1", "4.10")
+
+    def test_article(self):
+        assert clause_article("Section 4.2") == "4"
+        assert clause_article("Exhibit A") is None
+        assert clause_refs_same_article("4.1", "Section 4.3")
+        assert not clause_refs_same_article("Exhibit A", "Exhibit B")
+
+    def test_split_clause_refs(self):
+        assert split_clause_refs("9.1 / 9.2") == ["9.1", "9.2"]
+        assert split_clause_refs("4.1, 4.2") == ["4.1", "4.2"]
+        assert split_clause_refs("N/A (Missing)") == ["N/A (Missing)"]
+        assert split_clause_refs("") == []
+
+
+class TestClauseIndex:
+
+    def test_lookup(self):
+        index = ClauseIndex(CANONICAL)
+        assert len(index) == 9
+        assert _keys(index.lookup("4.1")) == [
+            ("risk_table", 0, "exact"),
+            ("proposed_redlines", 1, "exact"),
+        ]
+        assert index.lookup("Section 12") == []
+
+    def test_lookup_article(self):
+        index = ClauseIndex(CANONICAL)
+        assert _keys(index.lookup_article("9")) == [
+            ("risk_table", 2, "article"),
+            ("proposed_redlines", 0, "article"),
+        ]
+
+    def test_standard_candidates_exact_then_article(self):
+        index = ClauseIndex(CANONICAL)
+        gt_item = {"clause": "4.1"}
+        assert _keys(index.candidates(gt_item)) == [
+            ("risk_table", 0, "exact"),
+            ("proposed_redlines", 1, "exact"),
+            ("risk_table", 1, "article"),
+        ]
+
+    def test_multi_ref_clause(self):
+        index = ClauseIndex(CANONICAL)
+        candidates = index.candidates({"clause": "9.1 / 9.2"})
+        assert _keys(candidates) == [
+            ("risk_table", 2, "exact"),
+            ("proposed_redlines", 0, "exact"),
+        ]
+        assert candidates[0].entry.get("clause_summary") == "Termination"
+
+    def test_standard_items_skip_new_clauses(self):
+        index = ClauseIndex(CANONICAL)
+        assert index.candidates({"clause": "Section 15"}) == []
+
+    def test_new_clause_recommendation(self):
+        index = ClauseIndex(CANONICAL)
+        gt_item = {"clause": "Section 15", "detection_logic": "new_clause_recommendation"}
+        assert _keys(index.candidates(gt_item)) == [
+            ("new_clauses_proposed", 1, "exact"),
+            ("new_clauses_proposed", 0, "section"),
+        ]
+
+    def test_pattern_match_gets_every_entry(self):
+        index = ClauseIndex(CANONICAL)
+        candidates = index.candidates({"clause": "4.1", "detection_logic": "pattern_match"})
+        assert len(candidates) == len(index)
+        assert {c.match for c in candidates} == {"section"}
+
+    @pytest.mark.parametrize("gt_item", [
+        {"clause": "4.1"},
+        {"clause": "Section 4.3"},
+        {"clause": "9.1 / 9.2"},
+        {"clause": "Exhibit A / 2.2"},
+        {"clause": "N/A (Missing)"},
+        {"clause": ""},
+        {"clause": "15", "detection_logic": "new_clause_recommendation"},
+        {"clause": "4.1", "detection_logic": "pattern_match"},
+        {"clause": "9", "detection_logic": "any_mention"},
+        {"section": "Section 9.2"},
+    ])
+    def test_matches_linear_scan(self, gt_item):
+        index = ClauseIndex(CANONICAL)
+        field = "section" if "section" in gt_item else "clause"
+        assert _keys(index.candidates(gt_item, field)) == _keys(
+            linear_candidates(CANONICAL, gt_item, field)
+        )
@@ -0,0 +1,74 @@
+"""Tests for config validation caching and lazy CLI imports."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from framework import config_loader
+from framework.config_loader import ConfigValidationError, get_validator, load_mode_config
+
+
+@pytest.fixture
+def stamps_path(tmp_path, monkeypatch):
+    path = tmp_path / ".validated_configs.json"
+    monkeypatch.setattr(config_loader, "VALIDATION_STAMPS_PATH", path)
+    return path
+
+
+def _write_config(path, **overrides):
+    config = json.loads((config_loader.DEFAULT_SCHEMA_PATH.parents[1] / "config" / "freeform.json").read_text())
+    config.update(overrides)
+    path.write_text(json.dumps(config))
+    return path
+
+
+class TestValidationStamps:
+
+    def test_successful_validation_is_stamped(self, tmp_path, stamps_path):
+        config_path = _write_config(tmp_path / "config.json")
+        load_mode_config(config_path)
+
+        assert list(json.loads(stamps_path.read_text()).values()) == ["config.json"]
+
+    def test_stamped_config_skips_validation(self, tmp_path, stamps_path, monkeypatch):
+        config_path = _write_config(tmp_path / "config.json")
+        load_mode_config(config_path)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("validator used for a stamped config")
+        monkeypatch.setattr(config_loader, "get_validator", fail)
+
+        assert load_mode_config(config_path)["mode"]
+
+    def test_edited_config_is_validated_again(self, tmp_path, stamps_path):
+        config_path = _write_config(tmp_path / "config.json")
+        load_mode_config(config_path)
+
+        _write_config(config_path, mode="not-a-mode")
+        with pytest.raises(ConfigValidationError):
+            load_mode_config(config_path)
+        assert len(json.loads(stamps_path.read_text())) == 1
+
+    def test_stamps_disabled(self, tmp_path, stamps_path):
+        load_mode_config(_write_config(tmp_path / "config.json"), use_stamps=False)
+        assert not stamps_path.exists()
+
+    def test_stamps_live_outside_the_package(self):
+        package_dir = config_loader.DEFAULT_SCHEMA_PATH.resolve().parents[1]
+        assert package_dir not in config_loader.VALIDATION_STAMPS_PATH.parents
+        assert config_loader.VALIDATION_STAMPS_PATH.parent == package_dir.parent
+
+
+def test_validator_is_compiled_once():
+    assert get_validator() is get_validator(config_loader.DEFAULT_SCHEMA_PATH)
+
+
+def test_cli_import_is_light():
+    code = (
+        "import sys, framework.cli, framework.pipeline; "
+        "print(sorted(m for m in ('numpy', 'jsonschema', 'openpyxl', 'pandas') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
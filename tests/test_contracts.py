@@ -0,0 +1,90 @@
+"""Tests for cached .docx extraction in baseline_comparison.contracts."""
+
+import shutil
+
+import pytest
+
+pytest.importorskip("docx")
+
+from baseline_comparison import contracts
+from baseline_comparison.config import CONTRACTS_DIR, STACKING_CONTRACT_DIRS
+from baseline_comparison.contracts import (
+    all_contract_paths,
+    extract_all,
+    extract_contract,
+    extract_text,
+)
+
+CONSULTING = CONTRACTS_DIR / "Consulting_TechAdvisors_Beta.docx"
+
+
+class TestExtractContract:
+
+    def test_offsets_slice_out_paragraphs(self):
+        contract = extract_contract(CONSULTING, cache_dir=None)
+        assert contract.text == "\n\n".join(contract.paragraphs)
+        assert contract.paragraphs[0] == "CONSULTING SERVICES AGREEMENT"
+        start, end = contract.paragraph_offsets[3]
+        assert contract.paragraph_index(start) == 3
+        assert contract.paragraph_index(end) is None  # separator
+
+    def test_cache_is_keyed_by_content(self, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        first = extract_contract(CONSULTING, cache_dir)
+
+        def _fail(path):
+            raise AssertionError("cache miss")
+
+        monkeypatch.setattr(contracts, "_parse_docx", _fail)
+        copy = tmp_path / "renamed.docx"
+        shutil.copy(CONSULTING, copy)
+
+        assert extract_text(copy, cache_dir) == first.text
+        assert extract_contract(copy, cache_dir).paragraph_offsets == first.paragraph_offsets
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            extract_text(tmp_path / "missing.docx", cache_dir=None)
+
+
+class TestExtractAll:
+
+    def test_covers_base_and_stacking_contracts(self):
+        paths = all_contract_paths()
+        assert CONSULTING in paths
+        for stacking_dir in STACKING_CONTRACT_DIRS:
+            assert any(stacking_dir in p.parents for p in paths)
+
+    def test_parallel_matches_serial_and_fills_cache(self, tmp_path):
+        paths = all_contract_paths()[:4] + [STACKING_CONTRACT_DIRS[1] / "nda" / "NDA_Vertex_Strategic_Stacking.docx"]
+        cache_dir = tmp_path / "cache"
+
+        results = extract_all(paths, cache_dir=cache_dir, max_workers=2)
+
+        assert list(results) == paths
+        for path, contract in results.items():
+            assert contract.text == extract_text(path, cache_dir=None)
+        assert len(list(cache_dir.glob("*.json"))) == len(paths)
+        assert extract_all(paths, cache_dir=cache_dir, max_workers=2) == results
+
+    def test_unreadable_file_is_skipped(self, tmp_path):
+        bad = tmp_path / "bad.docx"
+        bad.write_bytes(b"not a docx")
+
+        results = extract_all([CONSULTING, bad], cache_dir=None, max_workers=2)
+
+        assert list(results) == [CONSULTING]
+
+    def test_missing_file_is_skipped(self, tmp_path):
+        results = extract_all([tmp_path / "missing.docx", CONSULTING], cache_dir=None, max_workers=1)
+
+        assert list(results) == [CONSULTING]
+
+    def test_parser_version_invalidates_cache(self, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        extract_contract(CONSULTING, cache_dir)
+
+        monkeypatch.setattr(contracts, "PARSER_VERSION", contracts.PARSER_VERSION + 1)
+        monkeypatch.setattr(contracts, "_parse_docx", lambda path: ("new parse", [(0, 9)]))
+
+        assert extract_text(CONSULTING, cache_dir) == "new parse"
@@ -0,0 +1,177 @@
+"""Tests for the shared parsed-document store."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from framework.aggregation import AggregationEngine
+from framework.document_store import DocumentStore
+from framework.pipeline import EvaluationPipeline
+from framework.validators import ValidationError
+from framework.validators.pre_aggregate import validate_pre_aggregation
+
+
+def _write_json(path: Path, data: dict) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f)
+    return path
+
+
+def _make_eval(points: float = 8) -> dict:
+    return {
+        "gt_evaluations": [{"gt_id": "GT-01", "tier": "T1", "detection": "Y"}],
+        "summary": {"total_points": points, "total_detection_points": points, "t1_gate_pass": True},
+    }
+
+
+class TestDocumentStore:
+
+    def test_file_parsed_once_across_stages(self, tmp_path):
+        path = _write_json(tmp_path / "a.json", {"x": 1})
+        store = DocumentStore()
+
+        first = store.load(path, stage="gate")
+        second = store.load(path, stage="aggregate")
+
+        assert first is second
+        assert store.stats("gate") == {
+            "bytes_read": path.stat().st_size, "parse_calls": 1, "cache_hits": 0,
+        }
+        assert store.stats("aggregate") == {
+            "bytes_read": 0, "parse_calls": 0, "cache_hits": 1,
+        }
+
+    def test_put_and_release(self, tmp_path):
+        path = tmp_path / "written.json"
+        store = DocumentStore()
+
+        store.put(path, {"y": 2})
+        assert path in store
+        assert store.load(path, stage="workbook") == {"y": 2}
+
+        store.release(path)
+        assert path not in store
+
+    def test_invalid_json_is_not_cached(self, tmp_path):
+        path = tmp_path / "bad.json"
+        path.write_text("{bad")
+        store = DocumentStore()
+
+        with pytest.raises(json.JSONDecodeError):
+            store.load(path)
+        assert path not in store
+
+    def test_uncached_load(self, tmp_path):
+        path = _write_json(tmp_path / "run.json", {"x": 1})
+        store = DocumentStore()
+
+        assert store.load(path, stage="gate", cache=False) == {"x": 1}
+        assert path not in store
+        store.load(path, stage="gate", cache=False)
+        assert store.stats("gate")["parse_calls"] == 2
+
+
+class TestSharedParsing:
+
+    def test_run_files_are_not_retained(self, tmp_path):
+        runs = []
+        for run_num in [1, 2]:
+            run_dir = tmp_path / f"run{run_num}"
+            for contract in ["consulting", "dpa"]:
+                _write_json(run_dir / "evaluations" / contract / "model_a.json", _make_eval())
+            runs.append(run_dir)
+
+        store = DocumentStore()
+        result = validate_pre_aggregation(runs, store=store)
+        assert result.valid is True
+        assert store.stats("pre_aggregate")["parse_calls"] == 4
+
+        # Memory is bounded by keys, not runs: the gate keeps no run file
+        run_files = [p for run in runs for p in (run / "evaluations").rglob("*.json")]
+        assert not any(p in store for p in run_files)
+
+        AggregationEngine(store=store).run(runs, tmp_path / "aggregated")
+        assert store.stats("aggregate")["parse_calls"] == 4
+        assert not any(p in store for p in run_files)
+
+        # Aggregated outputs are retained for the workbook stage
+        assert tmp_path / "aggregated" / "dpa" / "model_a.json" in store
+
+    def test_full_pipeline_reports_io_stats(self, tmp_path):
+        pytest.importorskip("openpyxl")
+
+        mode_dir = tmp_path / "freeform"
+        env_dir = mode_dir / "environments" / "test"
+        _write_json(mode_dir / "ground_truth" / "consulting.json", {"ground_truth": []})
+        _write_json(env_dir / "canonical_json" / "consulting" / "model_a.json", {})
+        _write_json(env_dir / "run1" / "evaluations" / "consulting" / "model_a.json", _make_eval())
+        _write_json(env_dir / "run1" / "evaluations" / "consulting" / "model_b.json", _make_eval())
+
+        pipeline = EvaluationPipeline(mode="freeform", mode_dir=mode_dir)
+        summary = pipeline.run_full_pipeline(
+            env="test",
+            run_dirs=[env_dir / "run1"],
+            output_dir=env_dir / "aggregated",
+        )
+
+        # Each run file is parsed once per invocation, by the merge of its key
+        stats = summary["io_stats"]
+        assert stats["aggregate"]["parse_calls"] == 2
+        for stage in ("pre_aggregate", "results_table"):
+            assert stats.get(stage, {}).get("parse_calls", 0) == 0
+        assert Path(summary["results_table"]).exists()
+        assert stats["pre_workbook"]["parse_calls"] == 0
+        assert stats["workbook"]["parse_calls"] == 0
+        assert Path(summary["workbook"]).exists()
+
+    def test_unchanged_rerun_parses_no_run_files(self, tmp_path):
+        pytest.importorskip("openpyxl")
+        pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+        mode_dir = tmp_path / "freeform"
+        env_dir = mode_dir / "environments" / "test"
+        _write_json(mode_dir / "ground_truth" / "consulting.json", {"ground_truth": []})
+        _write_json(env_dir / "canonical_json" / "consulting" / "model_a.json", {})
+        for model in ["model_a", "model_b"]:
+            _write_json(env_dir / "run1" / "evaluations" / "consulting" / f"{model}.json", _make_eval())
+
+        pipeline = EvaluationPipeline(mode="freeform", mode_dir=mode_dir)
+        kwargs = {"env": "test", "run_dirs": [env_dir / "run1"], "output_dir": env_dir / "aggregated"}
+        pipeline.run_full_pipeline(**kwargs)
+        summary = pipeline.run_full_pipeline(**kwargs)
+
+        # Stages that read nothing have no counters at all
+        stats = summary["io_stats"]
+        for stage in ("pre_aggregate", "results_table", "aggregate"):
+            assert stats.get(stage, {}).get("parse_calls", 0) == 0
+        assert summary["files_skipped"] == 2
+
+        # Only the changed file is read; the other's table rows are kept
+        _write_json(env_dir / "run1" / "evaluations" / "consulting" / "model_b.json", _make_eval(3))
+        summary = pipeline.run_full_pipeline(**kwargs)
+        stats = summary["io_stats"]
+        assert stats["aggregate"]["parse_calls"] == 1
+        for stage in ("pre_aggregate", "results_table"):
+            assert stats.get(stage, {}).get("parse_calls", 0) == 0
+
+        table = pyarrow_parquet.read_table(summary["results_table"])
+        assert sorted(table.column("model").to_pylist()) == ["model_a", "model_b"]
+
+    def test_invalid_run_file_aborts_before_writing(self, tmp_path):
+        pytest.importorskip("openpyxl")
+
+        mode_dir = tmp_path / "freeform"
+        env_dir = mode_dir / "environments" / "test"
+        _write_json(mode_dir / "ground_truth" / "consulting.json", {"ground_truth": []})
+        _write_json(env_dir / "canonical_json" / "consulting" / "model_a.json", {})
+        _write_json(env_dir / "run1" / "evaluations" / "consulting" / "model_a.json", _make_eval())
+        (env_dir / "run1" / "evaluations" / "consulting" / "model_b.json").write_text("{bad")
+
+        pipeline = EvaluationPipeline(mode="freeform", mode_dir=mode_dir)
+        with pytest.raises(ValidationError, match="Invalid JSON"):
+            pipeline.run_full_pipeline(
+                env="test", run_dirs=[env_dir / "run1"], output_dir=env_dir / "aggregated"
+            )
+        assert not (env_dir / "aggregated" / "consulting" / "model_a.json").exists()
@@ -0,0 +1,103 @@
+"""Tests for selective reads in framework.eval_reader."""
+
+import json
+
+import pytest
+
+from framework import eval_reader
+from framework.eval_reader import parse_fields, project, read_fields
+
+
+def _evaluation():
+    return {
+        "meta": {"contract": "jv", "model_id": "velocity"},
+        "gt_evaluations": [
+            {
+                "gt_id": "GT-01",
+                "tier": "T1",
+                "detection": "Y",
+                "evidence": {"quote": 'text with "quotes", commas\nand\n  "summary": lookalikes'},
+            },
+            {"gt_id": "GT-02", "tier": "T2", "detection": "N", "evidence": {}},
+            {"gt_id": "GT-03"},
+        ],
+        "additional_issues": [],
+        "summary": {"total_points": 13.0, "detection_counts": {"Y": 1, "N": 1}},
+    }
+
+
+FIELDS = [
+    "summary",
+    "gt_evaluations[*].detection",
+    "gt_evaluations[*].tier",
+    "additional_issues[*].assessment",
+    "missing_key",
+]
+
+
+def _write(path, document, **dump_kwargs):
+    path.write_text(json.dumps(document, **dump_kwargs))
+    return path
+
+
+class TestReadFields:
+
+    @pytest.mark.parametrize("indent", [2, 4])
+    def test_indented_matches_full_parse(self, tmp_path, monkeypatch, indent):
+        path = _write(tmp_path / "velocity.json", _evaluation(), indent=indent)
+
+        def _no_full_parse(document, spec):
+            raise AssertionError("fell back to a full parse")
+
+        monkeypatch.setattr(eval_reader, "project", _no_full_parse)
+        result = read_fields(path, FIELDS)
+
+        assert result == {
+            "summary": _evaluation()["summary"],
+            "gt_evaluations": [
+                {"detection": "Y", "tier": "T1"},
+                {"detection": "N", "tier": "T2"},
+                {},
+            ],
+            "additional_issues": [],
+        }
+
+    def test_compact_file_falls_back(self, tmp_path):
+        path = _write(tmp_path / "velocity.json", _evaluation())
+        assert read_fields(path, FIELDS) == project(_evaluation(), parse_fields(FIELDS))
+
+    def test_multiline_value_falls_back(self, tmp_path):
+        path = _write(tmp_path / "velocity.json", _evaluation(), indent=2)
+        result = read_fields(path, ["gt_evaluations[*].evidence"])
+        assert result["gt_evaluations"][0]["evidence"] == _evaluation()["gt_evaluations"][0]["evidence"]
+
+    def test_whole_key_wins_over_projection(self, tmp_path):
+        path = _write(tmp_path / "velocity.json", _evaluation(), indent=2)
+        result = read_fields(path, ["gt_evaluations[*].tier", "gt_evaluations"])
+        assert result["gt_evaluations"] == _evaluation()["gt_evaluations"]
+
+    def test_invalid_json(self, tmp_path):
+        path = tmp_path / "broken.json"
+        path.write_text('{\n  "summary": {\n')
+        with pytest.raises(json.JSONDecodeError):
+            read_fields(path, ["summary"])
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.json"
+        path.write_text("")
+        with pytest.raises(json.JSONDecodeError):
+            read_fields(path, ["summary"])
+
+
+class TestParseFields:
+
+    def test_specs(self):
+        assert parse_fields(["summary", "gt_evaluations[*].tier", "gt_evaluations[*].detection"]) == {
+            "summary": None,
+            "gt_evaluations": {"tier", "detection"},
+        }
+
+    @pytest.mark.parametrize("spec", ["", "gt_evaluations[*].", "gt_evaluations[0].tier", "a[*].b.c"])
+    def test_rejects_unsupported(self, spec):
+        with pytest.raises(ValueError):
+            parse_fields([spec])
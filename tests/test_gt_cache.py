@@ -0,0 +1,110 @@
+"""Tests for the shared GT cache behind GTLoader."""
+
+import json
+import os
+
+import pytest
+
+from framework.scripts.gt_loader import GTCache, GTLoader
+
+
+def _write_gt(path, items):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"ground_truth": items}))
+
+
+def _items():
+    return [
+        {"gt_id": "GT-01", "tier": "T1"},
+        {"gt_id": "GT-02", "tier": "T2"},
+        {"gt_id": "GT-03", "tier": "T2"},
+    ]
+
+
+class TestGTCache:
+
+    def test_second_load_is_a_hit(self, tmp_path):
+        path = tmp_path / "consulting.json"
+        _write_gt(path, _items())
+        cache = GTCache()
+
+        first = cache.load(path)
+        assert cache.load(tmp_path / "." / "consulting.json") is first
+        assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+    def test_changed_file_is_reloaded(self, tmp_path):
+        path = tmp_path / "consulting.json"
+        _write_gt(path, _items())
+        cache = GTCache()
+        cache.load(path)
+
+        _write_gt(path, _items()[:1])
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert list(cache.load(path).items_by_id) == ["GT-01"]
+        assert cache.stats()["misses"] == 2
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = GTCache(maxsize=2)
+        paths = [tmp_path / f"{name}.json" for name in ("a", "b", "c")]
+        for path in paths:
+            _write_gt(path, _items())
+
+        cache.load(paths[0])
+        cache.load(paths[1])
+        cache.load(paths[0])
+        cache.load(paths[2])
+        cache.load(paths[0])
+        assert cache.stats()["hits"] == 2
+        cache.load(paths[1])
+        assert cache.stats()["misses"] == 4
+
+    def test_derived_structures(self, tmp_path):
+        path = tmp_path / "consulting.json"
+        _write_gt(path, _items())
+        gt = GTCache().load(path)
+
+        assert gt.items_by_id["GT-02"] is gt.data["ground_truth"][1]
+        assert gt.tier_counts == {"T1": 1, "T2": 2}
+        assert gt.max_points({"T1": {"Y": 8}, "T2": {"Y": 5}}) == 18.0
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            GTCache().load(tmp_path / "missing.json")
+
+
+class TestGTLoaderSharing:
+
+    def test_loaders_share_one_parse(self, tmp_path):
+        config = {"gt_structure": {"type": "flat"}, "paths": {"ground_truth": "ground_truth"}}
+        _write_gt(tmp_path / "ground_truth" / "consulting.json", _items())
+        cache = GTCache()
+
+        results = [GTLoader(tmp_path, config, cache=cache).load("consulting") for _ in range(6)]
+
+        assert all(r.data is results[0].data for r in results)
+        assert cache.stats()["misses"] == 1
+        assert results[0].tier_counts == {"T1": 1, "T2": 2}
+
+    def test_dual_part_reuses_freeform_part_b(self, tmp_path):
+        _write_gt(tmp_path / "freeform" / "ground_truth" / "consulting.json", _items())
+        stacking_gt = tmp_path / "freeform_stacking" / "ground_truth" / "consulting_stacking.json"
+        stacking_gt.parent.mkdir(parents=True)
+        stacking_gt.write_text(json.dumps({"part_a_cp_redlines": [{"test_id": "CP-01"}]}))
+
+        cache = GTCache()
+        freeform = GTLoader(tmp_path / "freeform", {"gt_structure": {"type": "flat"}}, cache=cache)
+        stacking = GTLoader(tmp_path / "freeform_stacking", {
+            "gt_structure": {"type": "dual_part"},
+            "paths": {"gt_pattern": {"part_b": "../../freeform/ground_truth/{contract}.json"}},
+        }, cache=cache)
+
+        part_b = freeform.load("consulting")
+        dual = stacking.load("consulting")
+        stacking.load("consulting")
+
+        assert dual.data["part_b"] is part_b.data
+        assert cache.stats() == {"hits": 3, "misses": 2, "entries": 2}
+        assert dual.tier_counts == {"T1": 1, "T2": 2}
+        assert set(dual.items_by_id) == {"CP-01", "GT-01", "GT-02", "GT-03"}
@@ -0,0 +1,149 @@
+"""Tests for the compiled GroundTruthIndex and its on-disk cache."""
+
+import json
+import os
+
+import numpy as np
+
+from framework.scoring import compile_points_matrix, encode_tiers, score_batch
+from framework.scripts import gt_index as gt_index_module
+from framework.scripts.gt_index import INDEX_CACHE_NAME, GroundTruthIndex, load_indexes
+from framework.scripts.gt_loader import GTCache
+from framework.scripts.normalise_aggregated import load_gt_lookup
+from framework.validators import build_redline_clause_set
+
+TIER_CONFIG = {
+    "T1": {"Y": 8, "P": 4, "N": 0, "NMI": 0},
+    "T2": {"Y": 5, "P": 2.5, "N": 0, "NMI": 0},
+    "T3": {"Y": 1, "P": 0.5, "N": 0, "NMI": 0},
+}
+
+
+def _items():
+    return [
+        {"gt_id": "GT-01", "tier": "T1", "clause": "4.2", "issue": "Uncapped liability"},
+        {"gt_id": "GT-02", "tier": "T2", "clause": "7.1", "issue": "Auto-renewal"},
+        {"gt_id": "GT-03", "clause": "9", "issue": "No tier"},
+        {"gt_id": "GT-04", "tier": "T2", "clause": "11.3", "issue": "Assignment"},
+    ]
+
+
+def _write_gt(path, items, key="ground_truth"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({key: items}))
+
+
+class TestGroundTruthIndex:
+
+    def test_positions_and_tiers(self):
+        index = GroundTruthIndex.from_items(_items())
+
+        assert len(index) == 4
+        assert index.position("GT-04") == 3
+        assert index.position("GT-99") is None
+        assert index.tier_of("GT-02") == "T2"
+        assert index.tier_counts == {"T1": 1, "T2": 2}
+        assert index.untiered == 1
+
+    def test_max_points(self):
+        index = GroundTruthIndex.from_items(_items())
+        assert index.max_points(TIER_CONFIG) == 18.0
+
+    def test_max_detection_points_matches_score_batch(self):
+        items = _items() + [{"gt_id": "GT-05", "tier": "T9"}]
+        matrix = compile_points_matrix(TIER_CONFIG)
+        expected = score_batch(
+            encode_tiers((gt.get("tier", "T3") for gt in items), matrix),
+            np.zeros(len(items), dtype=np.intp),
+            matrix,
+        ).max_total
+
+        assert GroundTruthIndex.from_items(items).max_detection_points(matrix) == expected
+
+    def test_red_flags(self):
+        items = [
+            {"test_id": "NDA_01", "playbook_standard": "Red Flag", "tier": 1},
+            {"test_id": "NDA_02", "playbook_standard": "Gold Standard", "tier": 1},
+            {"test_id": "NDA_03", "playbook_standard": "red flag", "tier": 2},
+        ]
+        assert GroundTruthIndex.from_items(items).red_flag_ids == ("NDA_01", "NDA_03")
+
+    def test_redline_clauses_match_validator(self):
+        redlines = [
+            {"test_id": "CP-01", "clause_ref": "Section 3.4", "section": "3.4"},
+            {"test_id": "CP-02", "clause_ref": "Limitation of Liability", "section": 9},
+        ]
+        index = GroundTruthIndex.from_data({"part_a_cp_redlines": redlines})
+        assert index.redline_clauses == build_redline_clause_set(redlines)
+
+    def test_cached_gt_carries_index(self, tmp_path):
+        path = tmp_path / "consulting.json"
+        _write_gt(path, _items())
+        gt = GTCache().load(path)
+        assert gt.index.positions["GT-02"] == 1
+        assert gt.tier_counts == gt.index.tier_counts
+
+
+class TestLoadIndexes:
+
+    def test_skips_manifest_and_writes_cache(self, tmp_path):
+        _write_gt(tmp_path / "consulting.json", _items())
+        (tmp_path / "_manifest.json").write_text(json.dumps({"files": {}}))
+
+        indexes = load_indexes(tmp_path)
+
+        assert list(indexes) == ["consulting"]
+        assert (tmp_path / INDEX_CACHE_NAME).exists()
+
+    def test_unchanged_files_come_from_cache(self, tmp_path, monkeypatch):
+        _write_gt(tmp_path / "consulting.json", _items())
+        first = load_indexes(tmp_path)["consulting"]
+
+        def _fail(data):
+            raise AssertionError("recompiled")
+
+        monkeypatch.setattr(gt_index_module.GroundTruthIndex, "from_data", _fail)
+        cached = load_indexes(tmp_path)["consulting"]
+        assert cached.positions == first.positions
+        assert cached.tier_counts == first.tier_counts
+
+    def test_edited_file_is_recompiled(self, tmp_path):
+        path = tmp_path / "consulting.json"
+        _write_gt(path, _items())
+        load_indexes(tmp_path)
+
+        _write_gt(path, _items()[:1])
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert list(load_indexes(tmp_path)["consulting"].positions) == ["GT-01"]
+
+    def test_corrupt_cache_is_rebuilt(self, tmp_path):
+        _write_gt(tmp_path / "consulting.json", _items())
+        (tmp_path / INDEX_CACHE_NAME).write_bytes(b"not a pickle")
+
+        assert load_indexes(tmp_path)["consulting"].tier_counts == {"T1": 1, "T2": 2}
+
+    def test_load_gt_lookup(self, tmp_path):
+        _write_gt(tmp_path / "consulting.json", _items())
+        lookup = load_gt_lookup(tmp_path)
+
+        assert lookup["consulting"]["GT-03"] == {"clause": "9", "issue": "No tier", "tier": ""}
+        assert "dpa" not in lookup
+
+    def test_load_gt_lookup_duplicate_id_and_clause_ref(self, tmp_path):
+        _write_gt(tmp_path / "consulting.json", [
+            {"gt_id": "GT-01", "tier": "T1", "clause": "4.2", "issue": "First"},
+            {"gt_id": "GT-01", "tier": "T2", "clause": "5.1", "issue": "Second"},
+            {"gt_id": "GT-02", "tier": "T3", "clause_ref": "Section 8", "issue": "Ref only"},
+        ])
+        lookup = load_gt_lookup(tmp_path)["consulting"]
+
+        assert lookup["GT-01"] == {"clause": "5.1", "issue": "Second", "tier": "T2"}
+        assert lookup["GT-02"]["clause"] == "Section 8"
+
+    def test_load_gt_lookup_without_cache_write(self, tmp_path):
+        _write_gt(tmp_path / "consulting.json", _items())
+        load_gt_lookup(tmp_path, write_cache=False)
+
+        assert not (tmp_path / INDEX_CACHE_NAME).exists()
@@ -0,0 +1,357 @@
+"""Tests for the Phase 2 judge scheduler, run against the local stub provider API."""
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("anthropic")
+pytest.importorskip("openai")
+pytest.importorskip("docx")
+pytest.importorskip("dotenv")
+
+from baseline_comparison import llm_clients, run_comparison, scheduler
+from baseline_comparison.checkpoint import JudgeCheckpoint
+from baseline_comparison.evaluator import BatchEvaluation, JudgeUsage
+from baseline_comparison.scheduler import JudgeBudget, JudgeCall, JudgeScheduler, TokenBucket
+from baseline_comparison.stub_server import StubProviderServer
+
+
+class _FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _gt(gt_id: str, tier: str = "T2") -> dict:
+    return {"gt_id": gt_id, "tier": tier, "issue": f"Issue {gt_id}", "clause": "1.1"}
+
+
+class TestTokenBucket:
+
+    def test_burst_then_waits_for_refill(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(2.0, capacity=2, clock=clock, sleep=clock.sleep)
+
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert clock.now == pytest.approx(0.5)
+
+    def test_per_minute(self):
+        bucket = TokenBucket.per_minute(120)
+        assert bucket.rate == 2.0
+        assert bucket.capacity == 2.0
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+
+
+class TestJudgeScheduler:
+
+    def test_results_keep_index_order(self):
+        def _slow(value):
+            time.sleep(0.01 * (5 - value))
+            return value
+
+        calls = [
+            JudgeCall(group=g, index=i, provider="anthropic", fn=lambda v=i: _slow(v))
+            for g in ("a", "b") for i in range(5)
+        ]
+        completed = {}
+        outcome = JudgeScheduler(max_concurrency=4, provider_limits={}).run(
+            calls, on_group_complete=lambda g, r: completed.__setitem__(g, r),
+        )
+
+        assert completed == {"a": [0, 1, 2, 3, 4], "b": [0, 1, 2, 3, 4]}
+        assert outcome.completed == completed
+        assert outcome.calls_made == 10
+
+    def test_per_provider_semaphore_limits_concurrency(self):
+        lock = threading.Lock()
+        state = {"in_flight": 0, "peak": 0}
+
+        def _call():
+            with lock:
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+            time.sleep(0.02)
+            with lock:
+                state["in_flight"] -= 1
+
+        calls = [JudgeCall(group="g", index=i, provider="anthropic", fn=_call) for i in range(8)]
+        JudgeScheduler(max_concurrency=8, provider_limits={"anthropic": {"concurrency": 2}}).run(calls)
+
+        assert state["peak"] == 2
+
+    def test_failure_fails_only_its_group(self):
+        def _boom():
+            raise RuntimeError("judge down")
+
+        calls = [
+            JudgeCall(group="bad", index=0, provider="anthropic", fn=_boom),
+            JudgeCall(group="good", index=0, provider="anthropic", fn=lambda: "ok"),
+        ]
+        completed = []
+        outcome = JudgeScheduler(max_concurrency=2, provider_limits={}).run(
+            calls, on_group_complete=lambda g, r: completed.append(g),
+        )
+
+        assert completed == ["good"]
+        assert outcome.failed == {"bad": "RuntimeError: judge down"}
+
+    def test_lower_priority_starts_first(self):
+        started = []
+        calls = [
+            JudgeCall(group=g, index=i, provider="anthropic", priority=p,
+                      fn=lambda g=g, p=p: started.append((g, p)))
+            for g in ("a", "b") for i, p in enumerate((2, 0, 1))
+        ]
+        JudgeScheduler(max_concurrency=1, provider_limits={}).run(calls)
+
+        assert [p for _, p in started] == [0, 0, 1, 1, 2, 2]
+
+    def test_budget_defers_remaining_calls(self):
+        budget = JudgeBudget(max_tokens=250)
+        usage = SimpleNamespace(input_tokens=90, output_tokens=10)
+        calls = [
+            JudgeCall(group=g, index=0, provider="anthropic", fn=lambda: SimpleNamespace(usage=usage))
+            for g in range(5)
+        ]
+        completed = []
+
+        outcome = JudgeScheduler(max_concurrency=1, provider_limits={}, budget=budget).run(
+            calls, on_group_complete=lambda g, r: completed.append(g),
+        )
+
+        assert completed == [0, 1, 2]
+        assert outcome.deferred == 2
+        assert outcome.failed == {}
+        assert outcome.budget_stop == "token budget of 250 reached"
+
+    def test_budget_cost_and_time_limits(self):
+        clock = _FakeClock()
+        budget = JudgeBudget(max_cost_usd=1.0, max_seconds=60, input_usd_per_mtok=3.0,
+                             output_usd_per_mtok=15.0, clock=clock)
+        budget.start()
+        budget.charge(100_000, 40_000)
+        assert budget.cost_usd == pytest.approx(0.9)
+        assert budget.exceeded() is None
+        clock.now = 61
+        assert budget.exceeded() == "time budget of 60s reached"
+        budget.charge(0, 10_000)
+        assert budget.exceeded() == "cost budget of $1.00 reached"
+
+    def test_every_request_takes_a_token(self, monkeypatch):
+        monkeypatch.setattr(llm_clients, "INITIAL_BACKOFF", 0.01)
+        clock = _FakeClock()
+        judge = JudgeScheduler(max_concurrency=1, provider_limits={"anthropic": {"requests_per_minute": 60}})
+        judge._buckets["anthropic"] = TokenBucket(1.0, capacity=1, clock=clock, sleep=clock.sleep)
+
+        def _judge():
+            # One retried request, then a second request (as in per-issue fallback)
+            llm_clients.call_anthropic("first", model="m", api_key="k", max_tokens=10)
+            return llm_clients.call_anthropic("second", model="m", api_key="k", max_tokens=10)
+
+        with StubProviderServer(fail_first=1) as server:
+            monkeypatch.setenv("ANTHROPIC_BASE_URL", server.url)
+            outcome = judge.run([JudgeCall(group="g", index=0, provider="anthropic", fn=_judge)])
+
+        assert len(server.requests) == 3
+        assert outcome.completed
+        assert outcome.rate_limit_wait_seconds == pytest.approx(2.0)
+
+    def test_budget_prices_prompt_cache_tokens(self):
+        budget = JudgeBudget(input_usd_per_mtok=3.0, output_usd_per_mtok=15.0,
+                             cache_read_usd_per_mtok=0.3, cache_write_usd_per_mtok=3.75)
+        # 1M input tokens: 200k uncached, 500k cache reads, 300k cache writes
+        budget.charge(1_000_000, 0, cache_read_tokens=500_000, cache_creation_tokens=300_000)
+        assert budget.cost_usd == pytest.approx(0.6 + 0.15 + 1.125)
+        assert budget.spent()["cache_creation_tokens"] == 300_000
+
+    def test_replayed_responses_are_not_charged(self):
+        usage = JudgeUsage()
+        response = llm_clients.LLMResponse(text="", model="m", input_tokens=100, output_tokens=10,
+                                           latency_seconds=0, cache_read_tokens=60, cache_creation_tokens=30)
+        usage.record(response)
+        usage.record(llm_clients.LLMResponse(**{**response.__dict__, "cached": True}))
+
+        budget = JudgeBudget(input_usd_per_mtok=1.0)
+        budget.record(BatchEvaluation([], usage))
+        assert (usage.calls, usage.cached_calls) == (1, 1)
+        assert budget.spent()["input_tokens"] == 100
+        assert budget.spent()["cache_read_tokens"] == 60
+
+    def test_rejects_zero_concurrency(self):
+        with pytest.raises(ValueError):
+            JudgeScheduler(max_concurrency=0)
+
+
+class TestJudgeCheckpoint:
+
+    def _batch(self, *gt_ids):
+        evaluations = [{"gt_id": g, "detection": "Y"} for g in gt_ids]
+        return BatchEvaluation(evaluations, JudgeUsage(calls=1, input_tokens=10, output_tokens=2))
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / ".model.checkpoint.jsonl"
+        checkpoint = JudgeCheckpoint(path, "review", "1.0")
+        checkpoint.append(self._batch("GT-01"))
+        checkpoint.append(self._batch("GT-02", "GT-03"))
+
+        restored = JudgeCheckpoint(path, "review", "1.0")
+        assert list(restored.load()) == ["GT-01", "GT-02", "GT-03"]
+        assert restored.usage.calls == 2
+        assert restored.usage.input_tokens == 20
+
+    def test_changed_review_or_gt_discards_checkpoint(self, tmp_path):
+        path = tmp_path / ".model.checkpoint.jsonl"
+        JudgeCheckpoint(path, "review", "1.0").append(self._batch("GT-01"))
+
+        assert JudgeCheckpoint(path, "review", "1.1").load() == {}
+        assert not path.exists()
+
+    def test_truncated_line_is_dropped(self, tmp_path):
+        path = tmp_path / ".model.checkpoint.jsonl"
+        JudgeCheckpoint(path, "review", "1.0").append(self._batch("GT-01"))
+        with open(path, "a") as f:
+            f.write('{"evaluations": [{"gt_id": "GT-0')
+
+        checkpoint = JudgeCheckpoint(path, "review", "1.0")
+        assert list(checkpoint.load()) == ["GT-01"]
+        checkpoint.append(self._batch("GT-02"))
+        assert list(JudgeCheckpoint(path, "review", "1.0").load()) == ["GT-01", "GT-02"]
+
+
+class TestPhase2AgainstStub:
+
+    @pytest.fixture
+    def workspace(self, tmp_path, monkeypatch):
+        gt_dir = tmp_path / "gt"
+        raw_dir = tmp_path / "raw"
+        results_dir = tmp_path / "results"
+        gt_dir.mkdir()
+        for contract in ("consulting", "sla"):
+            gt = {"gt_metadata": {"gt_version": "1.0"},
+                  "ground_truth": [_gt(f"GT-{i:02d}", "T1" if i == 1 else "T2") for i in range(1, 6)]}
+            (gt_dir / f"{contract}.json").write_text(json.dumps(gt))
+            (raw_dir / contract).mkdir(parents=True)
+            for model_id in ("gpt41", "haiku35"):
+                (raw_dir / contract / f"{model_id}.txt").write_text(f"{contract} review by {model_id}")
+
+        monkeypatch.setattr(run_comparison, "GT_DIR", gt_dir)
+        monkeypatch.setattr(run_comparison, "RAW_RESPONSES_DIR", raw_dir)
+        monkeypatch.setattr(run_comparison, "RESULTS_DIR", results_dir)
+        monkeypatch.setattr(llm_clients, "INITIAL_BACKOFF", 0.01)
+        monkeypatch.setattr(scheduler, "PROVIDER_LIMITS", {"anthropic": {"concurrency": 6, "requests_per_minute": 6000}})
+        return results_dir
+
+    @staticmethod
+    def _responder(api, body):
+        prompt = body["messages"][0]["content"]
+        detection = "Y" if "GT-01" in prompt or "GT-03" in prompt else "N"
+        return json.dumps({"detection": detection, "evidence_excerpt": "", "reasoning": "stub"})
+
+    def test_concurrent_run_writes_deterministic_results(self, workspace, monkeypatch):
+        with StubProviderServer(self._responder, latency=0.02, fail_first=2) as stub:
+            monkeypatch.setenv("ANTHROPIC_BASE_URL", stub.url)
+            run_comparison.phase2_evaluate(
+                ["consulting", "sla"], ["gpt41", "haiku35"], {"anthropic": "test-key"}, concurrency=6,
+            )
+
+        # 4 result files x 5 GT issues, plus the two injected 429s that were retried
+        assert len(stub.requests) == 22
+        assert 1 < stub.max_in_flight <= 6
+
+        for contract in ("consulting", "sla"):
+            for model_id in ("gpt41", "haiku35"):
+                result = json.loads((workspace / contract / f"{model_id}.json").read_text())
+                assert [e["gt_id"] for e in result["gt_evaluations"]] == [f"GT-{i:02d}" for i in range(1, 6)]
+                assert [e["detection"] for e in result["gt_evaluations"]] == ["Y", "N", "Y", "N", "N"]
+                assert result["summary"]["t1_gate_pass"] is True
+                assert result["meta"]["gt_version"] == "1.0"
+
+    def test_failed_group_writes_no_result(self, workspace, monkeypatch):
+        def _responder(api, body):
+            if "sla review" in body["messages"][0]["content"]:
+                return "not json"
+            return self._responder(api, body)
+
+        with StubProviderServer(_responder) as stub:
+            monkeypatch.setenv("ANTHROPIC_BASE_URL", stub.url)
+            run_comparison.phase2_evaluate(
+                ["consulting", "sla"], ["gpt41"], {"anthropic": "test-key"}, concurrency=4,
+            )
+
+        assert (workspace / "consulting" / "gpt41.json").exists()
+        assert not (workspace / "sla" / "gpt41.json").exists()
+
+    def test_batched_run_matches_per_issue_results(self, workspace, monkeypatch):
+        def _responder(api, body):
+            content = body["messages"][0]["content"]
+            if isinstance(content, str):
+                return self._responder(api, body)
+            prompt = "".join(block["text"] for block in content)
+            gt_ids = [f"GT-{i:02d}" for i in range(1, 6) if f"**GT ID:** GT-{i:02d}" in prompt]
+            return json.dumps([
+                {"gt_id": g, "detection": "Y" if g in ("GT-01", "GT-03") else "N",
+                 "evidence_excerpt": "", "reasoning": "stub"}
+                for g in gt_ids
+            ])
+
+        with StubProviderServer(_responder) as stub:
+            monkeypatch.setenv("ANTHROPIC_BASE_URL", stub.url)
+            run_comparison.phase2_evaluate(
+                ["consulting"], ["gpt41"], {"anthropic": "test-key"}, batch_size=3,
+            )
+
+        # One tier per batch: [GT-01] (T1), [GT-02..04], [GT-05]
+        assert len(stub.requests) == 3
+        result = json.loads((workspace / "consulting" / "gpt41.json").read_text())
+        assert [e["detection"] for e in result["gt_evaluations"]] == ["Y", "N", "Y", "N", "N"]
+        assert result["meta"]["judge_usage"]["batch_size"] == 3
+        assert result["meta"]["judge_usage"]["calls"] == 3
+
+    def test_t1_issues_are_judged_first(self, workspace, monkeypatch):
+        monkeypatch.setattr(scheduler, "PROVIDER_LIMITS", {})
+        with StubProviderServer(self._responder) as stub:
+            monkeypatch.setenv("ANTHROPIC_BASE_URL", stub.url)
+            run_comparison.phase2_evaluate(
+                ["consulting", "sla"], ["gpt41"], {"anthropic": "test-key"}, concurrency=1,
+            )
+
+        tiers = ["T1" if "**Tier:** T1" in r["messages"][0]["content"] else "T2" for r in stub.requests]
+        assert tiers == ["T1", "T1"] + ["T2"] * 8
+
+    def test_budget_stop_resumes_from_checkpoint(self, workspace, monkeypatch):
+        result_path = workspace / "consulting" / "gpt41.json"
+        with StubProviderServer(self._responder) as stub:
+            monkeypatch.setenv("ANTHROPIC_BASE_URL", stub.url)
+            budget = JudgeBudget(max_tokens=1)
+            run_comparison.phase2_evaluate(
+                ["consulting"], ["gpt41"], {"anthropic": "test-key"}, concurrency=1, budget=budget,
+            )
+            assert len(stub.requests) == 1
+            assert not result_path.exists()
+            assert (workspace / "consulting" / ".gpt41.checkpoint.jsonl").exists()
+
+            run_comparison.phase2_evaluate(
+                ["consulting"], ["gpt41"], {"anthropic": "test-key"}, concurrency=1,
+            )
+
+        # The T1 judgement from the first run is not paid for again
+        assert len(stub.requests) == 5
+        assert sum("GT-01" in r["messages"][0]["content"] for r in stub.requests) == 1
+        result = json.loads(result_path.read_text())
+        assert [e["detection"] for e in result["gt_evaluations"]] == ["Y", "N", "Y", "N", "N"]
+        assert result["meta"]["judge_usage"]["calls"] == 5
+        assert not (workspace / "consulting" / ".gpt41.checkpoint.jsonl").exists()
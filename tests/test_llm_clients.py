@@ -0,0 +1,98 @@
+"""Tests for pooled API clients in baseline_comparison.llm_clients."""
+
+import threading
+
+import pytest
+
+pytest.importorskip("anthropic")
+pytest.importorskip("openai")
+
+from baseline_comparison import llm_clients
+from baseline_comparison.config import CLIENT_POOL
+from baseline_comparison.llm_clients import (
+    call_anthropic,
+    call_openai,
+    close_clients,
+    configure_client_pool,
+    get_client,
+)
+from baseline_comparison.stub_server import StubProviderServer
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    close_clients()
+    yield
+    configure_client_pool(**CLIENT_POOL)
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    with StubProviderServer(latency=0.05) as server:
+        monkeypatch.setenv("ANTHROPIC_BASE_URL", server.url)
+        monkeypatch.setenv("OPENAI_BASE_URL", server.url + "/v1")
+        yield server
+
+
+class TestClientRegistry:
+
+    def test_one_client_per_provider_and_key(self, stub):
+        client = get_client("anthropic", "key-a")
+        assert get_client("anthropic", "key-a") is client
+        assert get_client("anthropic", "key-b") is not client
+        assert get_client("openai", "key-a") is not client
+
+    def test_base_url_change_gets_new_client(self, stub, monkeypatch):
+        client = get_client("anthropic", "key-a")
+        monkeypatch.setenv("ANTHROPIC_BASE_URL", "http://127.0.0.1:1")
+        assert get_client("anthropic", "key-a") is not client
+
+    def test_rejects_unknown_provider_and_settings(self):
+        with pytest.raises(ValueError):
+            get_client("mistral", "key")
+        with pytest.raises(ValueError):
+            configure_client_pool(max_sockets=4)
+
+    def test_calls_reuse_one_connection(self, stub):
+        for _ in range(3):
+            call_anthropic("hi", model="m", api_key="k", max_tokens=10)
+        for _ in range(2):
+            call_openai("hi", model="gpt-4.1", api_key="k", max_tokens=10)
+
+        assert len(stub.requests) == 5
+        assert len(stub.connections) == 2
+
+
+class TestLatencySplit:
+
+    def test_network_time_covers_round_trip(self, stub):
+        response = call_anthropic("hi", model="m", api_key="k", max_tokens=10)
+        assert response.network_seconds >= 0.05
+        assert response.queue_seconds >= 0
+        assert response.queue_seconds + response.network_seconds == pytest.approx(response.latency_seconds, abs=0.01)
+
+    def test_waiting_for_a_pooled_connection_is_queue_time(self, stub):
+        configure_client_pool(max_connections=1)
+        results = []
+
+        def _call():
+            results.append(call_anthropic("hi", model="m", api_key="k", max_tokens=10))
+
+        threads = [threading.Thread(target=_call) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert stub.max_in_flight == 1
+        assert max(r.queue_seconds for r in results) >= 0.04
+        assert all(r.network_seconds < 0.1 for r in results)
+
+    def test_retry_backoff_is_queue_time(self, monkeypatch):
+        monkeypatch.setattr(llm_clients, "INITIAL_BACKOFF", 0.05)
+        with StubProviderServer(fail_first=1) as server:
+            monkeypatch.setenv("ANTHROPIC_BASE_URL", server.url)
+            response = call_anthropic("hi", model="m", api_key="k", max_tokens=10)
+
+        assert len(server.requests) == 2
+        assert response.queue_seconds >= 0.05
@@ -0,0 +1,91 @@
+"""Tests for the compiled phrase matcher."""
+
+import random
+
+import pytest
+
+from framework.scoring.concepts import (
+    assess_concept_coverage,
+    calculate_pattern_match_score,
+    matches_output_patterns,
+)
+from framework.scoring.matcher import GTItemMatcher, PhraseMatcher
+from framework.scoring.reasoning import validate_reasoning
+
+WORDS = ["liability", "cap", "limitation of liability", "limit", "indemn", "indemnity",
+         "data", "breach", "notice", "a", "ab", "b", "", "Gross Negligence", "(c)", "e.g."]
+
+
+def _naive(phrases, text):
+    text = text.lower()
+    return frozenset(p.lower() for p in phrases if p.lower() in text)
+
+
+class TestPhraseMatcher:
+
+    def test_overlapping_and_nested_phrases(self):
+        matcher = PhraseMatcher(["Liability", "limitation of liability", "limit", "ability"])
+        assert matcher.scan("The Limitation of Liability clause") == {
+            "liability", "limitation of liability", "limit", "ability",
+        }
+
+    def test_regex_metacharacters_are_literal(self):
+        matcher = PhraseMatcher(["(c)", "e.g.", "a+b"])
+        assert matcher.scan("see clause 4(c), e.g. here") == {"(c)", "e.g."}
+
+    def test_no_phrases(self):
+        assert PhraseMatcher([]).scan("anything") == frozenset()
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_substring_semantics(self, seed):
+        rng = random.Random(seed)
+        phrases = rng.sample(WORDS, 8)
+        text = " ".join(rng.choice(WORDS + ["x", "of", "Indemnification"]) for _ in range(30))
+
+        assert PhraseMatcher(phrases).scan(text) == _naive(phrases, text)
+
+
+class TestGTItemMatcher:
+
+    GT_ITEM = {
+        "expected_output_patterns": ["liability cap", "uncapped", "indemnity"],
+        "required_concepts": ["gross negligence", "consequential loss"],
+        "reasoning_must_contain": ["cap"],
+        "reasoning_must_not_contain": ["market standard"],
+    }
+
+    OUTPUT = {
+        "clause_name": "Limitation of Liability",
+        "rationale": "The liability cap excludes gross negligence.",
+        "proposed_text": "Indemnity obligations are uncapped.",
+        "detailed_reasoning": "Loss of profits is market standard here.",
+    }
+
+    def test_agrees_with_module_functions(self):
+        matcher = GTItemMatcher(self.GT_ITEM)
+        reasoning = self.OUTPUT["rationale"] + " " + self.OUTPUT["detailed_reasoning"]
+
+        assert matcher.matches_output_patterns(self.OUTPUT) == \
+            matches_output_patterns(self.GT_ITEM, self.OUTPUT)
+        assert matcher.pattern_match_score(self.OUTPUT) == \
+            calculate_pattern_match_score(self.GT_ITEM, self.OUTPUT) == 1.0
+        for strict in (False, True):
+            assert matcher.concept_coverage(reasoning, strict) == assess_concept_coverage(
+                self.GT_ITEM["required_concepts"], reasoning, strict
+            )
+        assert matcher.validate_reasoning(reasoning) == validate_reasoning(
+            reasoning, ["cap"], ["market standard"]
+        )
+
+    def test_detection_level(self):
+        matcher = GTItemMatcher(self.GT_ITEM)
+        assert matcher.detection_level(self.OUTPUT) == "Y"  # 1 of 2 concepts
+        assert GTItemMatcher({}).detection_level(self.OUTPUT) == "Y"
+        assert matcher.detection_level({"rationale": "nothing relevant"}) == "P"
+
+    def test_empty_item(self):
+        matcher = GTItemMatcher({})
+        assert matcher.matches_output_patterns(self.OUTPUT) is False
+        assert matcher.pattern_match_score(self.OUTPUT) == 0.0
+        assert matcher.concept_coverage("text")["coverage"] == 1.0
+        assert matcher.validate_reasoning("text")["valid"] is True
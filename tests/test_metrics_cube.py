@@ -0,0 +1,203 @@
+"""Tests for the persistent metrics cube."""
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from framework.scripts.metrics_cube import DEFAULT_CUBE_PATH, MetricsCube
+from framework.scripts.sales_metrics import accumulate, compute_model_metrics
+
+CONTRACTS = ["consulting", "dpa", "jv"]
+MODELS = ["alpha", "beta"]
+
+
+def _random_evaluation(rng: random.Random) -> dict:
+    issues = []
+    for i in range(rng.randint(0, 12)):
+        issue = {
+            "gt_id": f"GT-{i + 1:02d}",
+            "tier": rng.choice(["T1", "T2", "T3", None]),
+            "detection": rng.choice(["Y", "P", "N", "NMI"]),
+            "clause": rng.choice(["", "4.1"]),
+            "matched_redline_id": rng.choice([None, "R-01"]),
+            "detection_points": rng.choice([0, 0.5, 2.5, 5]),
+            "quality_points": rng.choice([0, 1, 3]),
+            "total_points": rng.choice([0, 1.5, 8]),
+            "evidence": "ignored " * 10,
+        }
+        for dim in ("amendment_score", "rationale_score", "redline_quality_score"):
+            issue[dim] = rng.choice([None, 0, 1, 2, 3])
+        if rng.random() < 0.1:
+            del issue["tier"]
+        issues.append(issue)
+    assessments = ["Valid", "Not Material", "Hallucination", "Unsure"]
+    return {
+        "summary": {"total_points": 0},
+        "gt_evaluations": issues,
+        "additional_issues": [{"assessment": rng.choice(assessments)} for _ in range(rng.randint(0, 4))],
+    }
+
+
+def _write(results_dir, contract, model, data):
+    path = results_dir / contract / f"{model}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2))
+
+
+@pytest.fixture
+def results(tmp_path):
+    """freeform/results and freeform_stacking/results with every contract x model."""
+    rng = random.Random(7)
+    freeform, stacking = tmp_path / "freeform", tmp_path / "stacking"
+    evaluations = {"freeform": {}, "stacking": {}}
+    for contract in CONTRACTS:
+        for model in MODELS:
+            ff = _random_evaluation(rng)
+            part_a = {"percentage": round(rng.uniform(0, 100), 1), "pass_fail": rng.choice(["PASS", "FAIL"])}
+            st = {**_random_evaluation(rng), "part_a_summary": part_a}
+            _write(freeform, contract, model, ff)
+            _write(stacking, contract, model, st)
+            evaluations["freeform"][contract, model] = ff
+            evaluations["stacking"][contract, model] = st
+    # Neither baseline/ nor _-prefixed files are evaluations
+    _write(freeform, "baseline", "alpha", {"gt_evaluations": [{"detection": "Y"}]})
+    (freeform / "_summary.json").write_text("{}")
+    return freeform, stacking, evaluations
+
+
+@pytest.fixture
+def cube(results):
+    freeform, stacking, _ = results
+    cube = MetricsCube()
+    cube.update("freeform", "hotfix", freeform)
+    cube.update("freeform_stacking", "hotfix", stacking)
+    return cube
+
+
+class TestQueries:
+
+    @pytest.mark.parametrize("model", MODELS)
+    def test_slice_matches_sales_metrics(self, cube, results, model):
+        _, _, evaluations = results
+        freeform = [evaluations["freeform"][c, model] for c in CONTRACTS]
+        stacking = [evaluations["stacking"][c, model] for c in CONTRACTS]
+
+        metrics = cube.metrics(mode="freeform", env="hotfix", model=model)
+        expected = compute_model_metrics(model, freeform, [])
+        assert {"model": model, "display_name": expected["display_name"], **metrics} == {
+            **expected, "points": metrics["points"]}
+
+        stacked = cube.accumulator(mode="freeform_stacking", model=model)
+        assert stacked.stacking_metrics() == accumulate([], stacking).stacking_metrics()
+        assert stacked.evaluations == 0 and not stacked.detections
+
+        # Both modes together: freeform feeds GT measures, stacking feeds Part A
+        mixed = cube.accumulator(env="hotfix", model=model).result(model)
+        assert mixed == compute_model_metrics(model, freeform, stacking)
+
+    @pytest.mark.parametrize("model", MODELS)
+    def test_recall_points_match_accumulator(self, cube, results, model):
+        _, _, evaluations = results
+        freeform = [evaluations["freeform"][c, model] for c in CONTRACTS]
+
+        sliced = cube.accumulator(mode="freeform", model=model)
+        expected = accumulate(freeform)
+        assert (sliced.recall_actual, sliced.recall_max) == (expected.recall_actual, expected.recall_max)
+
+    def test_tier_slice(self, cube, results):
+        _, _, evaluations = results
+        only_t1 = []
+        for contract in CONTRACTS:
+            ev = evaluations["freeform"][contract, "alpha"]
+            only_t1.append({**ev, "gt_evaluations": [i for i in ev["gt_evaluations"] if i.get("tier") == "T1"]})
+
+        metrics = cube.metrics(mode="freeform", model="alpha", tier="T1")
+        expected = accumulate(only_t1).measures()
+
+        # GT measures follow the tier; contract-level measures do not
+        for key in ("risk_identification_accuracy", "quality_score", "traceability", "additional_issues"):
+            assert metrics[key] == expected[key]
+        assert metrics["contracts_evaluated"] == len(CONTRACTS)
+        assert metrics["points"]["detection_points"] == sum(
+            i["detection_points"] for ev in only_t1 for i in ev["gt_evaluations"])
+
+    def test_group_by_and_values(self, cube, results):
+        _, stacking, _ = results
+        cube.update("freeform_stacking", "test_prod2", stacking)
+
+        assert cube.values("env") == ["hotfix", "test_prod2"]
+        assert cube.values("contract", mode="freeform") == CONTRACTS
+        assert set(cube.values("tier")) <= {"T1", "T2", "T3", None}
+
+        groups = cube.group_by("env", mode="freeform_stacking", model="alpha", tier="T1")
+        assert list(groups) == ["hotfix", "test_prod2"]
+        assert groups["hotfix"] == groups["test_prod2"]
+        assert cube.metrics(env=["hotfix", "test_prod2"], mode="freeform_stacking")["stacking"]["total"] == 12
+
+    def test_unknown_dimension(self, cube):
+        with pytest.raises(ValueError, match="provider"):
+            cube.metrics(provider="openai")
+
+
+class TestUpdate:
+
+    def test_only_changed_slabs_are_rebuilt(self, cube, results):
+        freeform, _, _ = results
+        before = dict(cube.slabs)
+
+        assert cube.update("freeform", "hotfix", freeform) == {
+            "added": 0, "updated": 0, "unchanged": 6, "removed": 0}
+
+        _write(freeform, "dpa", "beta", {"gt_evaluations": [{"tier": "T1", "detection": "Y"}]})
+        _write(freeform, "dpa", "gamma", {"gt_evaluations": [{"tier": "T2", "detection": "N"}]})
+        (freeform / "jv" / "alpha.json").unlink()
+        stats = cube.update("freeform", "hotfix", freeform)
+
+        assert stats == {"added": 1, "updated": 1, "unchanged": 4, "removed": 1}
+        changed = {key for key in before if cube.slabs.get(key) is not before[key]}
+        assert changed == {("freeform", "hotfix", "beta", "dpa"), ("freeform", "hotfix", "alpha", "jv")}
+        assert cube.metrics(model="gamma")["risk_identification_accuracy"]["N"] == 1
+
+    def test_new_env_leaves_others_untouched(self, cube, results):
+        freeform, _, _ = results
+        before = dict(cube.slabs)
+
+        assert cube.update("freeform", "test_prod2", freeform)["added"] == 6
+        assert all(cube.slabs[key] is slab for key, slab in before.items())
+
+    def test_full_rebuilds(self, cube, results):
+        freeform, _, _ = results
+        assert cube.update("freeform", "hotfix", freeform, full=True)["updated"] == 6
+
+
+class TestPersistence:
+
+    def test_round_trip(self, cube, tmp_path):
+        path = tmp_path / "cube.json"
+        cube.save(path)
+
+        loaded = MetricsCube.load(path)
+
+        assert loaded.slabs.keys() == cube.slabs.keys()
+        for dim in ("env", "model", "tier"):
+            assert loaded.group_by(dim) == cube.group_by(dim)
+
+    def test_loaded_cube_skips_unchanged_files(self, cube, results, tmp_path):
+        freeform, _, _ = results
+        path = tmp_path / "cube.json"
+        cube.save(path)
+
+        stats = MetricsCube.load(path).update("freeform", "hotfix", freeform)
+        assert stats["unchanged"] == 6
+
+    @pytest.mark.parametrize("content", [None, "not json", '{"version": 0, "slabs": []}'])
+    def test_missing_or_stale_file_gives_empty_cube(self, tmp_path, content):
+        path = tmp_path / "cube.json"
+        if content is not None:
+            path.write_text(content)
+        assert MetricsCube.load(path).slabs == {}
+
+    def test_default_path_is_in_project_root(self):
+        assert DEFAULT_CUBE_PATH == Path(__file__).resolve().parent.parent / "_metrics_cube.json"
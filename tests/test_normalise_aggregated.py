@@ -0,0 +1,147 @@
+"""Tests for normalising aggregated JSONs to the canonical schema."""
+
+import copy
+import json
+
+import pytest
+
+from framework.scripts.normalise_aggregated import (
+    MANIFEST_NAME,
+    normalise_evaluation,
+    normalise_files,
+)
+
+GT_LOOKUP = {
+    "consulting": {
+        "GT-01": {"clause": "4.2", "issue": "Uncapped liability", "tier": "T1"},
+        "GT-02": {"clause": "7.1", "issue": "Auto-renewal", "tier": "T2"},
+    },
+}
+
+
+def _legacy_evaluation() -> dict:
+    """A test_prod2-style evaluation: *_quality names, clause only in evidence."""
+    return {
+        "summary": {"t1_detected": True, "total_points": 8},
+        "gt_evaluations": [
+            {
+                "gt_id": "GT-01", "tier": "T1", "detection": "Y",
+                "amendment_quality": 2, "rationale_quality": 3,
+                "evidence": {"matched_clause": "4.2(a)", "excerpt": "Cap at fees", "matched_source": "redline"},
+            },
+            {
+                "gt_id": "GT-02", "tier": "T2", "detection": "N",
+                "amendment_quality": None, "rationale_quality": None,
+                "evidence": {"excerpt": "Not found"},
+            },
+        ],
+    }
+
+
+def _canonical_gt() -> dict:
+    return {
+        "gt_id": "GT-03", "tier": "T3", "detection": "P", "clause": "9", "issue": "Notice",
+        "amendment_score": 1, "rationale_score": 1, "redline_quality_score": None,
+        "matched_redline_id": "R-2",
+    }
+
+
+class TestNormaliseEvaluation:
+
+    def test_legacy_fields_are_mapped(self):
+        data = normalise_evaluation(_legacy_evaluation(), GT_LOOKUP, "consulting")
+        first, second = data["gt_evaluations"]
+
+        assert first["clause"] == "4.2(a)" and first["issue"] == "Uncapped liability"
+        assert (first["amendment_score"], first["rationale_score"]) == (2, 3)
+        assert "amendment_quality" not in first
+        assert first["redline_quality_score"] is None and first["matched_redline_id"] is None
+        assert first["evidence"]["judge_reasoning"] == "[redline] Cap at fees"
+        assert first["evidence"]["proposed_revision_excerpt"] == "Cap at fees"
+        assert second["clause"] == "7.1" and second["issue"] == "Auto-renewal"
+        assert data["summary"]["t1_all_detected"] is True
+        assert data["summary"]["detection_by_tier"]["T1"] == {"Y": 1, "P": 0, "N": 0, "NMI": 0}
+
+    def test_input_is_not_modified(self):
+        original = _legacy_evaluation()
+        original["gt_evaluations"].append(_canonical_gt())
+        snapshot = copy.deepcopy(original)
+
+        data = normalise_evaluation(original, GT_LOOKUP, "consulting")
+
+        assert original == snapshot
+        # Canonical entries are shared, changed ones are copies
+        assert data["gt_evaluations"][2] is original["gt_evaluations"][2]
+        assert data["gt_evaluations"][0] is not original["gt_evaluations"][0]
+        assert data["gt_evaluations"][0]["evidence"] is not original["gt_evaluations"][0]["evidence"]
+
+    def test_key_order_matches_in_place_normalisation(self):
+        data = normalise_evaluation(_legacy_evaluation(), GT_LOOKUP, "consulting")
+
+        assert list(data["gt_evaluations"][0]) == [
+            "gt_id", "tier", "detection", "evidence", "clause", "issue",
+            "amendment_score", "rationale_score", "redline_quality_score", "matched_redline_id",
+        ]
+
+
+def _write(agg_dir, contract, model, data):
+    path = agg_dir / contract / f"{model}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2))
+    return path
+
+
+@pytest.fixture
+def agg_dir(tmp_path):
+    _write(tmp_path, "consulting", "alpha", _legacy_evaluation())
+    _write(tmp_path, "consulting", "beta", {"summary": {}, "gt_evaluations": [_canonical_gt()]})
+    _write(tmp_path, "dpa", "alpha", _legacy_evaluation())
+    return tmp_path
+
+
+def _statuses(outcomes):
+    return {f"{contract}/{model}": outcome["status"] for (contract, model), outcome in outcomes.items()}
+
+
+class TestNormaliseFiles:
+
+    def test_normalises_and_records_canonical_files(self, agg_dir):
+        statuses = _statuses(normalise_files(agg_dir, GT_LOOKUP, max_workers=1))
+
+        assert statuses == {"consulting/alpha": "normalised", "consulting/beta": "canonical", "dpa/alpha": "normalised"}
+        written = json.loads((agg_dir / "consulting" / "alpha.json").read_text())
+        assert written == normalise_evaluation(_legacy_evaluation(), GT_LOOKUP, "consulting")
+        assert not list(agg_dir.glob("*/.*.tmp"))
+
+        manifest = json.loads((agg_dir / MANIFEST_NAME).read_text())
+        assert set(manifest["canonical"]) == set(statuses)
+
+    def test_recorded_files_are_skipped_until_changed(self, agg_dir):
+        normalise_files(agg_dir, GT_LOOKUP, max_workers=1)
+        assert set(_statuses(normalise_files(agg_dir, GT_LOOKUP, max_workers=1)).values()) == {"cached"}
+
+        _write(agg_dir, "dpa", "alpha", _legacy_evaluation())
+        statuses = _statuses(normalise_files(agg_dir, GT_LOOKUP, max_workers=1))
+        assert statuses["dpa/alpha"] == "normalised" and statuses["consulting/alpha"] == "cached"
+
+        statuses = _statuses(normalise_files(agg_dir, GT_LOOKUP, max_workers=1, full=True))
+        assert set(statuses.values()) == {"canonical"}
+
+    def test_dry_run_writes_nothing(self, agg_dir):
+        before = (agg_dir / "dpa" / "alpha.json").read_text()
+
+        outcomes = normalise_files(agg_dir, GT_LOOKUP, max_workers=1, dry_run=True)
+
+        assert outcomes["dpa", "alpha"]["preview"]["clause"] == "4.2(a)"
+        assert (agg_dir / "dpa" / "alpha.json").read_text() == before
+        assert not (agg_dir / MANIFEST_NAME).exists()
+
+    def test_errors_do_not_stop_other_files(self, agg_dir):
+        (agg_dir / "dpa" / "broken.json").write_text("{not json")
+
+        outcomes = normalise_files(agg_dir, GT_LOOKUP, max_workers=2)
+
+        assert outcomes["dpa", "broken"]["status"] == "error"
+        assert _statuses(outcomes)["dpa/alpha"] == "normalised"
+        manifest = json.loads((agg_dir / MANIFEST_NAME).read_text())
+        assert "dpa/broken" not in manifest["canonical"]
@@ -0,0 +1,91 @@
+"""Tests for the cached Leah output view."""
+
+import pytest
+
+from framework.scoring import OutputView, as_output_view
+from framework.scoring.concepts import calculate_pattern_match_score
+from framework.scoring.polarity import assign_detection_with_polarity
+from framework.validators import (
+    score_guidelines_issue,
+    score_part_a_redline,
+    score_rule_evaluation,
+    score_rules_stacking_redline,
+)
+
+ITEM = {
+    "clause_ref": "Section 12.3(b)",
+    "clause_name": "Limitation of Liability",
+    "classification": "❌ Unfavourable",
+    "action": "AMEND",
+    "proposed_text": "Liability is capped at twelve months of Fees, excluding Gross Negligence.",
+    "rationale": "The uncapped indemnity exposes the Customer to unlimited liability claims.",
+    "detailed_reasoning": "Market practice caps liability.",
+}
+
+
+class TestOutputView:
+
+    def test_behaves_like_the_dict(self):
+        view = OutputView(ITEM)
+        assert view.get("action") == "AMEND"
+        assert view["clause_name"] == "Limitation of Liability"
+        assert "rationale" in view
+        assert view.get("missing", "x") == "x"
+        assert not OutputView({})
+
+    def test_fields_are_memoised(self):
+        view = OutputView(ITEM)
+        assert view.lower("revision") is view.lower("revision")
+        assert view.combined_lower is view.combined_lower
+        assert view.tokens is view.tokens
+        assert view.words("revision") is view.words("revision")
+
+    def test_derived_values(self):
+        view = OutputView({**ITEM, "proposed_text": None, "redline_text": "ignored"})
+        assert view.lower("revision") == ""
+        assert OutputView({"redline_text": "Delete It"}).lower("revision") == "delete it"
+        assert OutputView(ITEM).clause_ref_norm == "12.3"
+        assert "indemnity" in OutputView(ITEM).tokens
+        assert OutputView(ITEM).words("revision", min_len=4) >= {"liability", "capped", "gross"}
+
+    def test_as_output_view(self):
+        view = OutputView(ITEM)
+        assert as_output_view(view) is view
+        assert as_output_view(None) is None
+        assert as_output_view(ITEM).item is ITEM
+
+
+class TestScorersAcceptView:
+
+    GT = {
+        "test_id": "T-01",
+        "tier": 1,
+        "clause_ref": "12.3",
+        "trigger_phrase": "uncapped indemnity",
+        "expected_action": "AMEND",
+        "expected_amendment": "Liability capped at twelve months fees",
+        "rationale_must_include": ["unlimited liability exposure"],
+        "key_elements": ["twelve months", "gross negligence"],
+        "acceptable_actions": ["MODIFY", "AMEND"],
+        "reasoning_must_address": "uncapped exposure",
+        "expected_output_patterns": ["liability", "indemnity", "escrow"],
+    }
+
+    @pytest.mark.parametrize("scorer", [
+        score_guidelines_issue,
+        score_rule_evaluation,
+        score_part_a_redline,
+        score_rules_stacking_redline,
+    ])
+    def test_same_result_for_dict_and_view(self, scorer):
+        view = OutputView(ITEM)
+        assert scorer(view, self.GT, {}) == scorer(ITEM, self.GT, {})
+        # A second GT entry reuses the view's cached text
+        assert scorer(view, self.GT, {}) == scorer(ITEM, self.GT, {})
+
+    def test_scoring_functions(self):
+        view = OutputView(ITEM)
+        assert calculate_pattern_match_score(self.GT, view) == \
+            calculate_pattern_match_score(self.GT, ITEM)
+        assert assign_detection_with_polarity(self.GT, [{"item": view}]) == \
+            assign_detection_with_polarity(self.GT, [{"item": ITEM}])
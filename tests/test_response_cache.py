@@ -0,0 +1,117 @@
+"""Tests for the content-addressed LLM response cache."""
+
+import json
+from dataclasses import replace
+
+import pytest
+
+pytest.importorskip("anthropic")
+pytest.importorskip("openai")
+
+from baseline_comparison import llm_clients
+from baseline_comparison.llm_clients import LLMResponse, call_anthropic, call_openai
+from baseline_comparison.response_cache import ResponseCache, ResponseCacheMiss
+from baseline_comparison.stub_server import StubProviderServer
+
+
+def _response(text: str = "ok") -> LLMResponse:
+    return LLMResponse(text=text, model="m", input_tokens=10, output_tokens=2, latency_seconds=0.5)
+
+
+class TestResponseCache:
+
+    def test_key_covers_every_request_field(self):
+        base = ("anthropic", "m", "sys", "prompt", 500)
+        key = ResponseCache.key(*base)
+        assert key == ResponseCache.key(*base)
+        for i, changed in enumerate(("openai", "m2", "sys2", "prompt2", 501)):
+            fields = list(base)
+            fields[i] = changed
+            assert ResponseCache.key(*fields) != key
+
+    def test_prefix_is_a_separate_field(self):
+        key = ResponseCache.key("anthropic", "m", "", "review: issue", 500)
+        split = ResponseCache.key("anthropic", "m", "", "issue", 500, cache_prefix="review: ")
+        other_split = ResponseCache.key("anthropic", "m", "", ": issue", 500, cache_prefix="review")
+        assert len({key, split, other_split}) == 3
+        assert ResponseCache.key("anthropic", "m", "", "p", 500, cache_prefix="") == ResponseCache.key(
+            "anthropic", "m", "", "p", 500)
+
+    def test_round_trip_and_stats(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        key = cache.key("anthropic", "m", "", "p", 10)
+
+        assert cache.get(key) is None
+        cache.put(key, _response("hello"))
+        assert cache.get(key) == _response("hello")
+
+        # A new instance sees entries written by earlier runs
+        assert ResponseCache(tmp_path).get(key) == _response("hello")
+        assert cache.stats() | {"bytes": 0} == {
+            "hits": 1, "misses": 1, "hit_rate": 0.5, "writes": 1, "evictions": 0,
+            "entries": 1, "bytes": 0, "read_only": False,
+        }
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        probe = ResponseCache(tmp_path / "probe")
+        probe.put("x" * 64, _response("a"))
+        entry_size = probe.stats()["bytes"]
+
+        cache = ResponseCache(tmp_path / "cache", max_bytes=2 * entry_size)
+        keys = [cache.key("anthropic", "m", "", f"p{i}", 10) for i in range(3)]
+        cache.put(keys[0], _response("a"))
+        cache.put(keys[1], _response("b"))
+        cache.get(keys[0])
+        cache.put(keys[2], _response("c"))
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None and cache.get(keys[2]) is not None
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["entries"] == 2
+
+    def test_replay_mode_raises_on_miss_and_never_writes(self, tmp_path):
+        writer = ResponseCache(tmp_path)
+        hit_key = writer.key("openai", "m", "", "cached", 10)
+        writer.put(hit_key, _response())
+
+        replay = ResponseCache(tmp_path, read_only=True)
+        assert replay.get(hit_key) == _response()
+        miss_key = replay.key("openai", "m", "", "new", 10)
+        with pytest.raises(ResponseCacheMiss):
+            replay.get(miss_key)
+        replay.put(miss_key, _response())
+        assert replay.stats()["writes"] == 0
+        assert ResponseCache(tmp_path).get(miss_key) is None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        key = cache.key("anthropic", "m", "", "p", 10)
+        cache.put(key, _response())
+        next(tmp_path.glob("*/*.json")).write_text("{not json")
+        assert cache.get(key) is None
+
+
+class TestClientsUseCache:
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        llm_clients.set_response_cache(cache)
+        yield cache
+        llm_clients.set_response_cache(None)
+
+    def test_only_changed_prompts_reach_the_api(self, cache, monkeypatch):
+        with StubProviderServer() as stub:
+            monkeypatch.setenv("ANTHROPIC_BASE_URL", stub.url)
+            monkeypatch.setenv("OPENAI_BASE_URL", stub.url + "/v1")
+            first = call_anthropic("prompt", system="sys", model="m", api_key="k", max_tokens=50)
+            again = call_anthropic("prompt", system="sys", model="m", api_key="k", max_tokens=50)
+            call_anthropic("prompt v2", system="sys", model="m", api_key="k", max_tokens=50)
+            call_openai("prompt", model="gpt-4.1", api_key="k", max_tokens=50)
+            call_openai("prompt", model="gpt-4.1", api_key="k", max_tokens=50)
+
+        assert again == replace(first, cached=True)
+        assert again.cached and not first.cached
+        assert len(stub.requests) == 3
+        assert cache.stats()["hits"] == 2
+        assert json.loads(first.text)["detection"] == "Y"
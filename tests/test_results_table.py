@@ -0,0 +1,160 @@
+"""Tests for the columnar results table."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from framework.document_store import DocumentStore
+from framework.fileio import file_sha256
+from framework.results_table import (
+    ResultsTableBuilder,
+    build_filters,
+    flatten_evaluation,
+    load_results,
+    read_results_table,
+    write_results_table,
+)
+
+DIMS = ["amendment_score", "rationale_score"]
+
+
+def _write_eval(run_dir: Path, contract: str, model: str, detection: str) -> None:
+    path = run_dir / "evaluations" / contract / f"{model}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({
+            "gt_evaluations": [
+                {"gt_id": "GT-01", "tier": "T1", "detection": detection,
+                 "detection_points": 8.0 if detection == "Y" else 0.0,
+                 "amendment_score": 3 if detection == "Y" else None,
+                 "rationale_score": 2 if detection == "Y" else None},
+                {"gt_id": "GT-02", "tier": "T3", "detection": "N", "detection_points": 0},
+            ],
+        }, f)
+
+
+@pytest.fixture
+def table_path(tmp_path):
+    runs = []
+    for run_num, detection in [(1, "Y"), (2, "N")]:
+        run_dir = tmp_path / f"run{run_num}"
+        for contract in ["consulting", "dpa"]:
+            for model in ["model_a", "model_b"]:
+                _write_eval(run_dir, contract, model, detection)
+        runs.append(run_dir)
+
+    path = tmp_path / "out" / "_gt_evaluations.parquet"
+    summary = write_results_table(runs, path, mode="freeform", env="test", quality_dims=DIMS)
+    assert summary == {"path": str(path), "rows": 16, "files": 8, "written": True}
+    return path
+
+
+class TestFlatten:
+
+    def test_rows_carry_context_and_scores(self):
+        evaluation = {"gt_evaluations": [
+            {"gt_id": "GT-01", "tier": "T1", "detection": "P", "detection_points": 4,
+             "amendment_score": 2, "rationale_score": None},
+        ]}
+        context = {"mode": "freeform", "env": "e", "run": "run1", "contract": "dpa", "model": "m"}
+
+        [row] = flatten_evaluation(evaluation, context, DIMS)
+        assert row["contract"] == "dpa"
+        assert row["detection_points"] == 4.0
+        assert row["quality_points"] is None
+        assert row["amendment_score"] == 2.0
+        assert row["rationale_score"] is None
+
+
+class TestResultsTable:
+
+    def test_full_read(self, table_path):
+        table = read_results_table(table_path)
+        assert table.num_rows == 16
+        assert table.column_names[:8] == [
+            "mode", "env", "run", "contract", "model", "gt_id", "tier", "detection",
+        ]
+        assert "amendment_score" in table.column_names
+
+    def test_predicates_are_pushed_down(self, table_path):
+        df = load_results(table_path, contract="dpa", run=["run1"], tier="T1")
+
+        assert len(df) == 2
+        assert set(df["model"]) == {"model_a", "model_b"}
+        assert (df["detection"] == "Y").all()
+        assert (df["amendment_score"] == 3).all()
+
+    def test_column_projection_and_filters(self, table_path):
+        df = load_results(
+            table_path,
+            columns=["model", "gt_id"],
+            filters=[("detection_points", ">", 0)],
+        )
+        assert list(df.columns) == ["model", "gt_id"]
+        assert len(df) == 4
+
+    def test_unchanged_inputs_keep_table(self, table_path):
+        tmp_path = table_path.parent.parent
+        recorded = [
+            (str(path), file_sha256(path))
+            for path in sorted(tmp_path.glob("run*/evaluations/*/*.json"))
+        ]
+        runs = [tmp_path / "run1", tmp_path / "run2"]
+        mtime = table_path.stat().st_mtime_ns
+
+        summary = write_results_table(runs, table_path, "freeform", "test", DIMS, recorded_inputs=recorded)
+        assert summary == {"path": str(table_path), "rows": 16, "files": 8, "written": False}
+        assert table_path.stat().st_mtime_ns == mtime
+
+        # A different file hash or different settings rebuild the table
+        recorded[0] = (recorded[0][0], "0" * 64)
+        assert write_results_table(runs, table_path, "freeform", "test", DIMS, recorded_inputs=recorded)["written"]
+        assert write_results_table(runs, table_path, "freeform", "other", DIMS, recorded_inputs=None)["written"]
+
+    def test_builder_reuses_rows_of_unchanged_files(self, table_path):
+        tmp_path = table_path.parent.parent
+        paths = sorted(tmp_path.glob("run*/evaluations/*/*.json"))
+        changed, unchanged = paths[0], paths[1:]
+        _write_eval(changed.parents[2], changed.parent.name, changed.stem, "P")
+
+        store = DocumentStore()
+        builder = ResultsTableBuilder(table_path, "freeform", "test", DIMS, store=store)
+        with open(changed) as f:
+            builder.add(changed.parents[2], changed, json.load(f), file_sha256(changed))
+        summary = builder.write([(str(path), file_sha256(path)) for path in unchanged])
+
+        assert summary == {"path": str(table_path), "rows": 16, "files": 8, "written": True}
+        assert store.stats().get("results_table", {}).get("parse_calls", 0) == 0
+        df = load_results(table_path, run=changed.parents[2].name, contract=changed.parent.name,
+                          model=changed.stem, gt_id="GT-01")
+        assert list(df["detection"]) == ["P"]
+
+    def test_builder_decodes_files_missing_from_table(self, table_path):
+        tmp_path = table_path.parent.parent
+        _write_eval(tmp_path / "run3", "dpa", "model_a", "Y")
+        paths = sorted(tmp_path.glob("run*/evaluations/*/*.json"))
+
+        store = DocumentStore()
+        builder = ResultsTableBuilder(table_path, "freeform", "test", DIMS, store=store)
+        summary = builder.write([(str(path), file_sha256(path)) for path in paths])
+
+        assert summary["rows"] == 18 and summary["written"]
+        assert store.stats("results_table")["parse_calls"] == 1
+        assert len(load_results(table_path, run="run3")) == 2
+
+    def test_empty_runs_write_empty_table(self, tmp_path):
+        path = tmp_path / "empty.parquet"
+        summary = write_results_table([tmp_path / "missing"], path, "freeform", "test", DIMS)
+
+        assert summary["rows"] == 0
+        assert read_results_table(path).column_names[-2:] == DIMS
+
+
+def test_build_filters():
+    assert build_filters() is None
+    assert build_filters([("tier", "==", "T1")], model=["a", "b"]) == [
+        ("tier", "==", "T1"), ("model", "in", ["a", "b"]),
+    ]
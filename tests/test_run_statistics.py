@@ -0,0 +1,103 @@
+"""Tests for run-to-run statistics."""
+
+import numpy as np
+import pytest
+
+from framework.run_statistics import RunStatistics, describe
+
+
+def _eval(detections: dict, total_detection_points: float, quality: int = 2) -> dict:
+    items = []
+    for gt_id, detection in detections.items():
+        scored = detection in ("Y", "P")
+        items.append({
+            "gt_id": gt_id,
+            "detection": detection,
+            "amendment_score": quality if scored else None,
+            "rationale_score": quality if scored else None,
+            "redline_quality_score": quality if scored else None,
+        })
+    return {
+        "gt_evaluations": items,
+        "summary": {
+            "total_detection_points": total_detection_points,
+            "total_quality_points": 3 * quality * sum(d in ("Y", "P") for d in detections.values()),
+        },
+    }
+
+
+class TestDescribe:
+
+    def test_ignores_missing_values(self):
+        result = describe(np.array([1.0, np.nan, 3.0]))
+        assert result == {"n": 2, "mean": 2.0, "median": 2.0, "std": pytest.approx(1.4142),
+                          "min": 1.0, "max": 3.0}
+
+    def test_single_and_empty(self):
+        assert describe(np.array([5.0]))["std"] == 0.0
+        assert describe(np.array([np.nan]))["mean"] is None
+
+
+class TestRunStatistics:
+
+    def test_detection_distribution_and_majority(self):
+        stats = RunStatistics()
+        stats.add(_eval({"GT-01": "Y", "GT-02": "N"}, 8))
+        stats.add(_eval({"GT-01": "Y", "GT-02": "P"}, 12))
+        stats.add(_eval({"GT-01": "P", "GT-02": "N"}, 4))
+
+        result = stats.compute()
+        gt1 = result["gt_items"]["GT-01"]
+        assert result["num_runs"] == 3
+        assert gt1["detection_counts"] == {"Y": 2, "P": 1, "N": 0, "NMI": 0}
+        assert gt1["majority_detection"] == "Y"
+        assert gt1["agreement"] == pytest.approx(0.6667)
+        assert result["gt_items"]["GT-02"]["majority_detection"] == "N"
+
+    def test_tie_goes_to_conservative_detection(self):
+        stats = RunStatistics()
+        stats.add(_eval({"GT-01": "Y"}, 8))
+        stats.add(_eval({"GT-01": "N"}, 0))
+
+        assert stats.compute()["gt_items"]["GT-01"]["majority_detection"] == "N"
+
+    def test_totals_spread(self):
+        stats = RunStatistics()
+        for points in [8, 12, 4]:
+            stats.add(_eval({"GT-01": "Y"}, points))
+
+        totals = stats.compute()["total_detection_points"]
+        assert totals["mean"] == 8.0
+        assert totals["median"] == 8.0
+        assert totals["std"] == 4.0
+        assert (totals["min"], totals["max"]) == (4.0, 12.0)
+
+    def test_quality_skips_unscored_items(self):
+        stats = RunStatistics()
+        stats.add(_eval({"GT-01": "Y", "GT-02": "N"}, 8, quality=3))
+        stats.add(_eval({"GT-01": "Y", "GT-02": "N"}, 8, quality=1))
+
+        result = stats.compute()
+        gt1 = result["gt_items"]["GT-01"]
+        assert gt1["quality_mean"]["amendment_score"] == 2.0
+        assert gt1["quality_std"]["amendment_score"] == pytest.approx(1.4142)
+        assert result["gt_items"]["GT-02"]["quality_mean"]["amendment_score"] is None
+        assert result["quality_dimensions"]["rationale_score"]["mean"] == 2.0
+
+    def test_items_missing_from_some_runs(self):
+        stats = RunStatistics(quality_dims=["amendment_score"])
+        stats.add(_eval({"GT-01": "Y"}, 8))
+        stats.add(_eval({"GT-01": "Y", "GT-02": "yes"}, 13))
+
+        gt2 = stats.compute()["gt_items"]["GT-02"]
+        assert gt2["detection_counts"]["Y"] == 1
+        assert gt2["agreement"] == 1.0
+        assert set(gt2["quality_mean"]) == {"amendment_score"}
+
+    def test_unknown_detection_is_not_counted(self):
+        stats = RunStatistics()
+        stats.add(_eval({"GT-01": "?"}, 0))
+
+        gt1 = stats.compute()["gt_items"]["GT-01"]
+        assert sum(gt1["detection_counts"].values()) == 0
+        assert gt1["majority_detection"] is None
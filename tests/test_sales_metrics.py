@@ -1,8 +1,14 @@
 """Tests for sales metrics compute functions."""
 
+import json
+import random
+
 import pytest
 
 from framework.scripts.sales_metrics import (
+    MetricsAccumulator,
+    accumulate,
+    accumulate_models,
     compute_additional_issues_stats,
     compute_detection_rate,
     compute_model_metrics,
@@ -418,3 +424,76 @@ class TestComputeModelMetrics:
         freeform = [_make_evaluation([_make_gt_issue("Y")])]
         result = compute_model_metrics("velocity", freeform, [])
         assert result["stacking"] is None
+
+
+# ---------------------------------------------------------------------------
+# Fused accumulator
+# ---------------------------------------------------------------------------
+
+def _random_evaluations(seed: int, count: int) -> tuple[list[dict], list[dict]]:
+    rng = random.Random(seed)
+    freeform, stacking = [], []
+    for _ in range(count):
+        issues = []
+        for _ in range(rng.randint(0, 12)):
+            issue = _make_gt_issue(
+                rng.choice(["Y", "P", "N", "NMI", "△"]),
+                tier=rng.choice(["T1", "T2", "T3", None]),
+                clause=rng.choice(["", "4.1"]),
+                matched_redline_id=rng.choice([None, "R-01"]),
+            )
+            for dim in ("amendment_score", "rationale_score", "redline_quality_score"):
+                issue[dim] = rng.choice([None, 0, 1, 2, 3])
+            if rng.random() < 0.1:
+                del issue["detection"]
+            issues.append(issue)
+        assessments = ["Valid", "Not Material", "Hallucination", "Unsure"]
+        freeform.append(_make_evaluation(
+            issues, [{"assessment": rng.choice(assessments)} for _ in range(rng.randint(0, 4))],
+        ))
+        part_a = {"percentage": round(rng.uniform(0, 100), 1), "pass_fail": rng.choice(["PASS", "FAIL"])}
+        stacking.append({"part_a_summary": part_a} if rng.random() < 0.5 else {"summary": {"part_a": part_a}})
+    return freeform, stacking
+
+
+class TestMetricsAccumulator:
+
+    def test_merge_equals_single_pass(self):
+        freeform, stacking = _random_evaluations(7, 9)
+        merged = MetricsAccumulator()
+        for i in range(0, 9, 3):
+            merged.merge(accumulate(freeform[i:i + 3], stacking[i:i + 3]))
+
+        assert merged.result("pathfinder") == accumulate(freeform, stacking).result("pathfinder")
+
+    def test_empty(self):
+        result = MetricsAccumulator().result("velocity")
+        assert result["contracts_evaluated"] == 0
+        assert result["stacking"] is None
+        assert result["quality_score"]["overall_avg"] is None
+
+
+class TestAccumulateModels:
+
+    @pytest.fixture
+    def results_dirs(self, tmp_path):
+        freeform, stacking = _random_evaluations(3, 6)
+        for i, (ff, st) in enumerate(zip(freeform, stacking)):
+            contract, model = f"c{i // 2}", ["alpha", "beta"][i % 2]
+            for root, data in (("freeform", ff), ("stacking", st)):
+                path = tmp_path / root / contract / f"{model}.json"
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(json.dumps(data, indent=2))
+        return tmp_path / "freeform", tmp_path / "stacking", freeform, stacking
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_matches_in_memory(self, results_dirs, workers):
+        freeform_dir, stacking_dir, freeform, stacking = results_dirs
+
+        accumulators = accumulate_models(
+            freeform_dir, stacking_dir, ["c0", "c1", "c2", "missing"],
+            ["alpha", "beta"], ["alpha"], max_workers=workers,
+        )
+
+        assert accumulators["alpha"].result("alpha") == compute_model_metrics("alpha", freeform[::2], stacking[::2])
+        assert accumulators["beta"].result("beta") == compute_model_metrics("beta", freeform[1::2], [])
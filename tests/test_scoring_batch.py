@@ -0,0 +1,143 @@
+"""Tests for the vectorised scoring kernel against the scalar functions."""
+
+import random
+
+import numpy as np
+import pytest
+
+from framework.pipeline import EvaluationPipeline
+from framework.scoring import (
+    calculate_detection_points,
+    calculate_weighted_recall,
+    compile_points_matrix,
+    encode_detections,
+    encode_tiers,
+    score_batch,
+    score_issues,
+)
+
+TIER_CONFIG = {
+    "T1": {"Y": 8, "P": 4, "N": 0, "NMI": 0},
+    "T2": {"Y": 5, "P": 2.5, "N": 0, "NMI": 0},
+    "T3": {"Y": 1, "P": 0.5, "N": 0, "NMI": 0},
+}
+
+
+def _random_issues(n: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {"gt_tier": rng.choice(["T1", "T2", "T3"]), "detection": rng.choice(["Y", "P", "N", "NMI"])}
+        for _ in range(n)
+    ]
+
+
+class TestScoreBatch:
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_scalar_functions(self, seed):
+        issues = _random_issues(50, seed)
+        matrix = compile_points_matrix(TIER_CONFIG)
+
+        scores = score_issues(issues, matrix)
+
+        expected_points = [
+            calculate_detection_points(i["detection"], i["gt_tier"], TIER_CONFIG) for i in issues
+        ]
+        assert scores.points.tolist() == expected_points
+        assert (scores.total_points, scores.max_total, scores.weighted_recall) == \
+            calculate_weighted_recall(issues, TIER_CONFIG)
+
+    def test_non_dyadic_weights_sum_identically(self):
+        config = {"T1": {"Y": 0.1, "P": 0.3}, "T2": {"Y": 0.7, "P": 0.2}}
+        issues = _random_issues(200, 7)
+        for issue in issues:
+            issue["gt_tier"] = "T1" if issue["gt_tier"] == "T1" else "T2"
+
+        scores = score_issues(issues, compile_points_matrix(config))
+        assert (scores.total_points, scores.max_total, scores.weighted_recall) == \
+            calculate_weighted_recall(issues, config)
+
+    def test_unknown_values_match_weighted_recall_defaults(self):
+        issues = [
+            {"gt_tier": "T9", "detection": "Y"},
+            {"gt_tier": "T1", "detection": "maybe"},
+            {},
+        ]
+        config = {"T1": {"P": 4}, "T3": {"Y": 1}}
+
+        scores = score_issues(issues, compile_points_matrix(config))
+        assert (scores.total_points, scores.max_total, scores.weighted_recall) == \
+            calculate_weighted_recall(issues, config)
+
+    def test_empty_batch(self):
+        matrix = compile_points_matrix(TIER_CONFIG)
+        scores = score_batch(np.array([], dtype=int), np.array([], dtype=int), matrix)
+
+        assert scores.points.size == 0
+        assert (scores.total_points, scores.max_total, scores.weighted_recall) == (0.0, 0.0, 0.0)
+
+    def test_strict_encoding_errors(self):
+        matrix = compile_points_matrix(TIER_CONFIG)
+        with pytest.raises(ValueError, match="Invalid detection value"):
+            encode_detections(["Y", "yes"], strict=True)
+        with pytest.raises(ValueError, match="Unknown tier"):
+            encode_tiers(["T4"], matrix, strict=True)
+
+    def test_non_tier_entries_are_skipped(self):
+        # rules mode: detection_points holds per-dimension ints, not tiers
+        matrix = compile_points_matrix({"per_rule_max": 9, "detection": 2, "T1": {"Y": 8}}, default_max=0)
+
+        assert matrix.tiers == ("T1",)
+        assert matrix.integer_max
+        assert not compile_points_matrix(TIER_CONFIG, default_max=0.5).integer_max
+
+
+class TestCalculateSummary:
+
+    def _scalar_summary(self, config, gt_evaluations, gt_issues):
+        tier_config = config["detection_points"]
+        total = 0.0
+        counts = {"Y": 0, "P": 0, "N": 0, "NMI": 0}
+        t1_pass = True
+        for item in gt_evaluations:
+            detection, tier = item.get("detection", "NMI"), item.get("tier", "T3")
+            total += calculate_detection_points(detection, tier, tier_config)
+            counts[detection] += 1
+            if tier == "T1" and detection not in ("Y", "P"):
+                t1_pass = False
+        max_points = sum(tier_config.get(gt.get("tier", "T3"), {}).get("Y", 0) for gt in gt_issues)
+        return total, max_points, counts, t1_pass
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_matches_scalar_summary(self, seed):
+        pipeline = EvaluationPipeline(mode="freeform")
+        issues = _random_issues(30, seed)
+        gt_evaluations = [{"tier": i["gt_tier"], "detection": i["detection"]} for i in issues]
+        gt_issues = [{"tier": i["gt_tier"]} for i in issues] + [{"tier": "T9"}]
+
+        summary = pipeline._calculate_summary(gt_evaluations, gt_issues)
+        total, max_points, counts, t1_pass = self._scalar_summary(
+            pipeline.config, gt_evaluations, gt_issues
+        )
+
+        assert summary["total_detection_points"] == total
+        assert summary["max_detection_points"] == max_points
+        assert type(summary["max_detection_points"]) is type(max_points)
+        assert summary["detection_counts"] == counts
+        assert summary["t1_gate_pass"] is t1_pass
+        assert summary["weighted_recall"] == total / max_points
+
+    def test_rules_mode_summary(self):
+        pipeline = EvaluationPipeline(mode="rules")
+        gt_issues = [{"tier": "T1"}, {"tier": "T2"}, {}]
+
+        summary = pipeline._calculate_summary([], gt_issues)
+
+        assert summary["max_detection_points"] == 0
+        assert type(summary["max_detection_points"]) is int
+        assert summary["weighted_recall"] == 0.0
+
+    def test_invalid_detection_raises(self):
+        pipeline = EvaluationPipeline(mode="freeform")
+        with pytest.raises(ValueError, match="Invalid detection value"):
+            pipeline._calculate_summary([{"tier": "T1", "detection": "X"}], [])
@@ -0,0 +1,289 @@
+"""Tests for deterministic canonical JSON scoring."""
+
+import json
+
+import pytest
+
+from framework.pipeline import EvaluationPipeline
+from framework.scoring_engine import (
+    ScoringEngine,
+    score_canonical,
+    summarise_detections,
+)
+from framework.scoring import compile_points_matrix
+
+FREEFORM_GT = {
+    "gt_metadata": {"gt_version": "test"},
+    "ground_truth": [
+        {"gt_id": "GT-01", "clause": "8.1", "tier": "T1", "issue": "No deadlock resolution",
+         "key_elements": ["Deadlock mechanism missing", "Escalation to CEOs"],
+         "acceptable_actions": ["ADD"]},
+        {"gt_id": "GT-02", "clause": "4.1", "tier": "T2", "issue": "Unanimous consent"},
+        {"gt_id": "GT-03", "clause": "6.2", "tier": "T3", "issue": "IP lock-up"},
+        {"gt_id": "GT-04", "clause": "N/A (Missing)", "tier": "T2", "issue": "No audit rights",
+         "detection_logic": "pattern_match", "expected_output_patterns": ["audit rights"]},
+    ],
+}
+
+CANONICAL = {
+    "meta": {"contract": "jv", "model_id": "test", "environment": "hotfix"},
+    "risk_table": [
+        {"clause_ref": "Section 8.1", "classification": "❌",
+         "clause_summary": "Deadlock", "detailed_reasoning": "Deadlock risk; no escalation path."},
+        {"clause_ref": "4.1", "classification": "✅", "clause_summary": "Consent"},
+        {"clause_ref": "12.1", "classification": "⚠️", "clause_summary": "Governing law"},
+        {"clause_ref": "13.2", "classification": "❌", "clause_summary": "Missing audit rights"},
+    ],
+    "proposed_redlines": [
+        {"clause_ref": "8.1", "change_type": "Add", "recommendation_id": "R-1",
+         "proposed_revision": "Deadlock escalates to the CEOs, then to mediation.",
+         "rationale": "Provides a deadlock mechanism."},
+    ],
+}
+
+
+@pytest.fixture
+def freeform_pipeline():
+    return EvaluationPipeline(mode="freeform")
+
+
+def _by_id(evaluations, field="gt_id"):
+    return {e[field]: e for e in evaluations}
+
+
+class TestScoreFreeform:
+
+    def test_detections(self, freeform_pipeline):
+        scored = score_canonical(CANONICAL, FREEFORM_GT, freeform_pipeline.config, "jv", "test")
+        evals = _by_id(scored["gt_evaluations"])
+
+        assert evals["GT-01"]["detection"] == "Y"
+        assert evals["GT-01"]["detection_points"] == 8
+        assert evals["GT-02"]["detection"] == "N"
+        assert evals["GT-03"]["detection"] == "NMI"
+        assert evals["GT-04"]["detection"] == "Y"
+
+    def test_quality_scores(self, freeform_pipeline):
+        scored = score_canonical(CANONICAL, FREEFORM_GT, freeform_pipeline.config, "jv", "test")
+        evals = _by_id(scored["gt_evaluations"])
+
+        gt01 = evals["GT-01"]
+        assert gt01["matched_redline_id"] == "R-1"
+        assert gt01["amendment_score"] == 3
+        assert gt01["redline_quality_score"] == 3
+        assert gt01["quality_points"] == (
+            gt01["amendment_score"] + gt01["rationale_score"] + gt01["redline_quality_score"]
+        )
+        assert gt01["total_points"] == 8 + gt01["quality_points"]
+
+        assert evals["GT-03"]["amendment_score"] is None
+        assert evals["GT-03"]["quality_points"] == 0
+
+    def test_additional_issues_are_unmatched_flags(self, freeform_pipeline):
+        scored = score_canonical(CANONICAL, FREEFORM_GT, freeform_pipeline.config, "jv", "test")
+        clauses = [i["clause"] for i in scored["additional_issues"]]
+        # 13.2 was matched by the pattern_match item; 4.1 is favourable
+        assert clauses == ["12.1"]
+
+    def test_summary_matches_pipeline_summary(self, freeform_pipeline):
+        scored = score_canonical(CANONICAL, FREEFORM_GT, freeform_pipeline.config, "jv", "test")
+        expected = freeform_pipeline._calculate_summary(
+            scored["gt_evaluations"], FREEFORM_GT["ground_truth"]
+        )
+        summary = scored["summary"]
+        for key, value in expected.items():
+            assert summary[key] == value
+        assert summary["t1_count"] == 1
+        assert summary["by_tier"]["T1"]["detected"] == 1
+        assert summary["additional_issues_count"] == 1
+
+    def test_meta(self, freeform_pipeline):
+        scored = score_canonical(CANONICAL, FREEFORM_GT, freeform_pipeline.config, "jv", "test")
+        assert scored["meta"]["contract"] == "jv"
+        assert scored["meta"]["environment"] == "hotfix"
+        assert scored["meta"]["gt_version"] == "test"
+
+    def test_summarise_detections_ignores_null_quality(self):
+        matrix = compile_points_matrix({"T1": {"Y": 8, "P": 4}}, default_max=0)
+        evaluations = [
+            {"tier": "T1", "detection": "Y", "amendment_score": 2},
+            {"tier": "T1", "detection": "NMI", "amendment_score": None},
+        ]
+        summary = summarise_detections(evaluations, evaluations, matrix, ["amendment_score"])
+        assert summary["total_quality_points"] == 2
+        assert summary["t1_gate_pass"] is False
+
+
+class TestOtherModes:
+
+    def test_freeform_stacking_part_a(self):
+        config = EvaluationPipeline(mode="freeform_stacking").config
+        gt = {
+            "part_a": {"part_a_cp_redlines": [
+                {"test_id": "JV_01", "clause_ref": "Material Decisions", "section": "4.1",
+                 "acceptable_actions": ["REJECT"]},
+            ]},
+            "part_b": FREEFORM_GT,
+        }
+        canonical = dict(CANONICAL, cp_redline_responses=[
+            {"clause_ref": "4.1", "action": "REJECT",
+             "rationale": "Sole discretion removes the unanimous consent protection."},
+        ])
+
+        scored = score_canonical(canonical, gt, config, "jv", "test")
+
+        part_a = scored["part_a_evaluations"][0]
+        assert part_a["action_correct"] is True
+        assert scored["part_a_summary"]["critical_failures"] == 0
+        assert len(scored["part_b_evaluations"]) == 4
+        assert "pass_fail" in scored["combined_summary"]
+
+    def test_rules_filters_gt_by_contract(self):
+        config = EvaluationPipeline(mode="rules").config
+        gt = {"ground_truth": [
+            {"test_id": "A_01", "contract": "NDA_Alpha", "clause_ref": "1.1",
+             "expected_action": "DELETE", "trigger_quote": "whether or not marked"},
+            {"test_id": "B_01", "contract": "NDA_Beta", "clause_ref": "1.1",
+             "expected_action": "DELETE"},
+        ]}
+        canonical = {"risk_table": [
+            {"clause_ref": "Section 1.1", "classification": "❌", "action": "DELETE",
+             "detailed_reasoning": "Information whether or not marked is overbroad."},
+        ], "proposed_redlines": []}
+
+        scored = score_canonical(canonical, gt, config, "NDA_Alpha", "test")
+
+        assert [e["test_id"] for e in scored["rule_evaluations"]] == ["A_01"]
+        assert scored["rule_evaluations"][0]["detected"] == "Y"
+        assert scored["summary"]["total_score"] > 0
+
+    def test_rules_stacking_scope_violations(self):
+        config = EvaluationPipeline(mode="rules_stacking").config
+        gt = {"ground_truth": [
+            {"test_id": "V1", "contract": "NDA_Vertex.docx", "section": "§1.1 CI Definition",
+             "expected_action": "REJECT"},
+        ]}
+        canonical = {
+            "risk_table": [{"clause_ref": "5.2", "classification": "❌"}],
+            "proposed_redlines": [{"clause_ref": "1.1", "action": "REJECT"}],
+        }
+
+        scored = score_canonical(canonical, gt, config, "NDA_Vertex", "test")
+
+        assert scored["redline_evaluations"][0]["detected"] == "Y"
+        assert len(scored["scope_violations"]) == 1
+        assert scored["summary"]["pass_fail"] == "FAIL"
+
+    def test_guidelines(self):
+        config = json.loads(open("framework/config/guidelines.json").read())
+        gt = {"ground_truth": [
+            {"test_id": "T_01", "contract": "NDA_Alpha", "clause_ref": "Section 1.1",
+             "tier": 1, "playbook_standard": "Red Flag", "expected_action": "AMEND"},
+        ]}
+        canonical = {"risk_table": [
+            {"clause_ref": "1.1", "classification": "❌", "action": "AMEND"},
+        ], "proposed_redlines": []}
+
+        scored = score_canonical(canonical, gt, config, "NDA_Alpha", "test")
+
+        evaluation = scored["gt_evaluations"][0]
+        assert evaluation["detected"] == "Y"
+        assert evaluation["location_score"] == 1
+        assert scored["summary"]["red_flag_gate"]["gate"] == "PASS"
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError, match="No scoring engine"):
+            score_canonical(CANONICAL, FREEFORM_GT, {"mode": "other"}, "jv", "test")
+
+
+class TestScoringEngine:
+
+    def _write_env(self, tmp_path, contracts, models):
+        canonical_dir = tmp_path / "canonical_json"
+        for contract in contracts:
+            for model in models:
+                path = canonical_dir / contract / f"{model}.json"
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(json.dumps(CANONICAL))
+        return canonical_dir
+
+    def test_pool_matches_in_process(self, freeform_pipeline, tmp_path):
+        canonical_dir = self._write_env(tmp_path, ["jv", "sla"], ["m1", "m2"])
+
+        outputs = {}
+        for workers in (1, 2):
+            engine = ScoringEngine(freeform_pipeline.config, max_workers=workers)
+            out = tmp_path / f"run{workers}"
+            jobs = engine.discover_jobs(canonical_dir, out, freeform_pipeline.gt_loader)
+            summary = engine.run(jobs)
+            assert summary["files_written"] == 4
+            assert summary["errors"] == []
+            outputs[workers] = {
+                (r["contract"], r["model"]): json.loads(open(r["path"]).read())
+                for r in summary["results"]
+            }
+
+        for key, evaluation in outputs[1].items():
+            other = outputs[2][key]
+            assert evaluation["gt_evaluations"] == other["gt_evaluations"]
+            assert evaluation["summary"] == other["summary"]
+
+    def test_failed_job_is_reported(self, freeform_pipeline, tmp_path):
+        canonical_dir = self._write_env(tmp_path, ["jv"], ["good"])
+        (canonical_dir / "jv" / "bad.json").write_text("{not json")
+
+        engine = ScoringEngine(freeform_pipeline.config, max_workers=1)
+        jobs = engine.discover_jobs(canonical_dir, tmp_path / "run", freeform_pipeline.gt_loader)
+        summary = engine.run(jobs)
+
+        assert summary["files_written"] == 1
+        assert [(e["contract"], e["model"]) for e in summary["errors"]] == [("jv", "bad")]
+
+    def test_contracts_without_gt_are_skipped(self, freeform_pipeline, tmp_path):
+        canonical_dir = self._write_env(tmp_path, ["jv", "unknown_contract"], ["m1"])
+        engine = ScoringEngine(freeform_pipeline.config, max_workers=1)
+        jobs = engine.discover_jobs(canonical_dir, tmp_path / "run", freeform_pipeline.gt_loader)
+        assert [j.contract for j in jobs] == ["jv"]
+
+
+class TestPipelineScoring:
+
+    def test_score_evaluation_scores_raw_canonical(self, freeform_pipeline, tmp_path):
+        path = tmp_path / "jv.json"
+        path.write_text(json.dumps(CANONICAL))
+
+        scored = freeform_pipeline.score_evaluation("jv", "test", path)
+
+        assert len(scored["gt_evaluations"]) == 18
+        assert scored["meta"]["evaluator_model"] == "deterministic"
+
+    def test_score_environment_output_aggregates(self, freeform_pipeline, tmp_path):
+        canonical_dir = TestScoringEngine()._write_env(tmp_path, ["jv"], ["m1", "m2"])
+        run_dir = tmp_path / "scored"
+
+        summary = freeform_pipeline.score_environment(
+            "hotfix", output_dir=run_dir, canonical_dir=canonical_dir, max_workers=1
+        )
+        assert summary["files_written"] == 2
+
+        aggregated = freeform_pipeline.aggregate_results([run_dir], tmp_path / "results")
+        assert aggregated["files_written"] == 2
+
+    def test_default_output_is_not_a_discovered_run(self, freeform_pipeline, tmp_path):
+        canonical_dir = TestScoringEngine()._write_env(tmp_path, ["jv"], ["m1"])
+        env_dir = tmp_path / "environments" / "hotfix"
+        for run in ["run10", "run2", "run1"]:
+            (env_dir / run / "evaluations").mkdir(parents=True)
+        freeform_pipeline.mode_dir = tmp_path
+
+        summary = freeform_pipeline.score_environment(
+            "hotfix", canonical_dir=canonical_dir, max_workers=1
+        )
+
+        assert summary["output_dir"] == str(tmp_path / "scored" / "hotfix")
+        assert freeform_pipeline.discover_runs("hotfix") == [
+            env_dir / "run1", env_dir / "run2", env_dir / "run10"]
+
+    def test_score_environment_without_canonical_dir(self, freeform_pipeline):
+        with pytest.raises(FileNotFoundError, match="No canonical JSON"):
+            freeform_pipeline.score_environment("no_such_env")
@@ -180,6 +180,29 @@ class TestValidatePreAggregation:
             errors = [i for i in result.issues if i.severity == Severity.ERROR]
             assert any("Invalid JSON" in e.message for e in errors)
 
+    def test_changed_files_limits_parsing(self):
+        """Test only changed_files are parsed; coverage still spans all runs."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+
+            contract_dir = tmpdir / "run1" / "evaluations" / "contract1"
+            contract_dir.mkdir(parents=True)
+            with open(contract_dir / "model_a.json", "w") as f:
+                json.dump({"gt_evaluations": [], "summary": {"total_points": 0}}, f)
+            with open(contract_dir / "model_b.json", "w") as f:
+                f.write("{invalid json")
+
+            result = validate_pre_aggregation([tmpdir / "run1"], changed_files=[contract_dir / "model_a.json"])
+            assert result.valid is True
+
+            result = validate_pre_aggregation([tmpdir / "run1"], changed_files=[contract_dir / "model_b.json"])
+            assert result.valid is False
+
+            # A run missing a file still fails coverage even if nothing changed
+            (tmpdir / "run2" / "evaluations" / "contract1").mkdir(parents=True)
+            result = validate_pre_aggregation([tmpdir / "run1", tmpdir / "run2"], changed_files=[])
+            assert result.valid is False
+
     def test_zero_score_anomaly_warning(self):
         """Test warning issued for zero score with GT items present."""
         with tempfile.TemporaryDirectory() as tmpdir:
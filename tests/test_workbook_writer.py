@@ -0,0 +1,192 @@
+"""Tests for the streaming workbook backend and generate_workbooks."""
+
+import json
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+
+from framework.scripts.generate_workbooks import (
+    MANIFEST_NAME,
+    NAMED_STYLES,
+    build_contracts,
+    generate_contract_workbook,
+    generate_master_workbook,
+)
+from framework.scripts.workbook_writer import SheetBuffer, StreamingWorkbook
+
+
+def _fill(cell) -> str:
+    return cell.fill.start_color.rgb[-6:] if cell.fill.fill_type else ""
+
+
+class TestSheetBuffer:
+
+    def test_widths_track_longest_value(self):
+        sheet = SheetBuffer("S", min_width=8, max_width=20)
+        sheet.append(["Rank", "A much longer model name", None, 3.25])
+        sheet.append([10, "", "x"])
+
+        # Clamped to max_width, padded by 2, at least min_width
+        assert sheet.column_widths() == [8, 20, 8, 8]
+
+    def test_empty_sheet_has_no_widths(self):
+        assert SheetBuffer("S").column_widths() == []
+
+
+class TestStreamingWorkbook:
+
+    def test_round_trip(self, tmp_path):
+        book = StreamingWorkbook(NAMED_STYLES)
+        sheet = SheetBuffer("Summary")
+        sheet.append(["Title"], "title")
+        sheet.merge("A1:C1")
+        sheet.append([])
+        sheet.append(["Model", "Score", "T1"], "header")
+        sheet.append(["pioneer", 12.5, "PASS"], ["cell", "cell", "pass"])
+        sheet.append(["plain", None, 0])
+        book.write_sheet(sheet)
+        path = tmp_path / "out" / "book.xlsx"
+        book.save(path)
+
+        ws = openpyxl.load_workbook(path)["Summary"]
+        assert [[c.value for c in row] for row in ws.iter_rows()] == [
+            ["Title", None, None],
+            [None, None, None],
+            ["Model", "Score", "T1"],
+            ["pioneer", 12.5, "PASS"],
+            ["plain", None, 0],
+        ]
+        assert [str(r) for r in ws.merged_cells.ranges] == ["A1:C1"]
+        assert ws["A1"].font.b and ws["A1"].font.sz == 14
+        assert ws["A3"].style == "header" and ws["A3"].font.color.rgb.endswith("FFFFFF")
+        assert ws["C4"].style == "pass" and _fill(ws["C4"]) == "C6EFCE"
+        assert ws["A4"].border.left.style == "thin" and _fill(ws["A4"]) == ""
+        assert ws["A5"].style == "Normal"
+        assert ws.column_dimensions["A"].width == 9
+
+
+def _write_aggregated(base, contract, model, detections, total):
+    path = base / contract / f"{model}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        "summary": {
+            "total_points": total,
+            "total_detection_points": total,
+            "t1_all_detected": detections[0] == "Y",
+            "detection_counts": {"Y": detections.count("Y")},
+            "detection_by_tier": {"T1": {"pct": 100.0}},
+        },
+        "gt_evaluations": [
+            {"gt_id": f"GT-0{i + 1}", "clause": "4.1", "tier": tier, "issue": "Issue",
+             "detection": det, "total_points": 2.0 if det == "Y" else 0}
+            for i, (tier, det) in enumerate(zip(["T1", "T2", None], detections))
+        ],
+    }, indent=2))
+
+
+class TestGenerateWorkbooks:
+
+    def test_contract_workbook(self, tmp_path):
+        _write_aggregated(tmp_path, "consulting", "alpha", ["Y", "P", "N"], 4.0)
+        _write_aggregated(tmp_path, "consulting", "beta", ["N", "Y", "Y"], 6.0)
+        out = tmp_path / "workbooks" / "CONSULTING_Evaluations.xlsx"
+
+        assert generate_contract_workbook(tmp_path, "consulting", ["alpha", "beta"], out) == out
+
+        wb = openpyxl.load_workbook(out)
+        summary, matrix = wb["Summary"], wb["GT Matrix"]
+        assert [c.value for c in summary[4]][:3] == [1, "beta", 6.0]
+        assert summary["F4"].value == "FAIL" and _fill(summary["F4"]) == "FFC7CE"
+        assert [c.value for c in matrix[2]] == ["GT-01", "4.1", "T1", "Issue", "Y (2.0)", "N (0.0)"]
+        assert _fill(matrix["A2"]) == "F4CCCC"
+        assert _fill(matrix["E3"]) == "FFEB9C" and matrix["E3"].alignment.horizontal == "center"
+        assert _fill(matrix["A4"]) == "" and matrix["A4"].border.left.style == "thin"
+
+    def test_contract_without_data(self, tmp_path):
+        (tmp_path / "consulting").mkdir()
+        assert generate_contract_workbook(tmp_path, "consulting", ["alpha"], tmp_path / "x.xlsx") is None
+
+    def test_master_workbook(self, tmp_path):
+        _write_aggregated(tmp_path, "consulting", "alpha", ["Y", "P", "N"], 4.0)
+        _write_aggregated(tmp_path, "dpa", "alpha", ["N", "Y", "Y"], 6.0)
+        out = tmp_path / "MASTER_EVALUATION_WORKBOOK.xlsx"
+
+        results = generate_master_workbook(tmp_path, ["consulting", "dpa"], ["alpha"], out)
+
+        assert [r["contract_raw"] for r in results] == ["dpa", "consulting"]
+        wb = openpyxl.load_workbook(out)
+        assert wb.sheetnames == ["Summary Rankings", "Model Aggregates", "Contract Comparison", "Penalty Impact"]
+        rankings = wb["Summary Rankings"]
+        assert [c.value for c in rankings[5]][:3] == [1, "Dpa", "Alpha"]
+        assert _fill(rankings["I6"]) == "C6EFCE"
+        assert wb["Model Aggregates"]["B4"].value == 2
+
+    def test_master_from_cached_summaries(self, tmp_path):
+        _write_aggregated(tmp_path, "consulting", "alpha", ["Y", "P", "N"], 4.0)
+        summaries = {"consulting": {"alpha": {"total_points": 9.0}}}
+        (tmp_path / "consulting" / "alpha.json").unlink()
+
+        results = generate_master_workbook(
+            tmp_path, ["consulting"], ["alpha"], tmp_path / "master.xlsx", summaries=summaries)
+
+        assert [(r["contract_raw"], r["raw_score"]) for r in results] == [("consulting", 9.0)]
+
+
+class TestBuildContracts:
+
+    @pytest.fixture
+    def aggregated(self, tmp_path):
+        base = tmp_path / "aggregated"
+        _write_aggregated(base, "consulting", "alpha", ["Y", "P", "N"], 4.0)
+        _write_aggregated(base, "consulting", "beta", ["N", "Y", "Y"], 6.0)
+        _write_aggregated(base, "dpa", "alpha", ["Y", "Y", "Y"], 8.0)
+        return base
+
+    def _build(self, base, out, **kwargs):
+        outcomes = build_contracts(base, ["consulting", "dpa"], ["alpha", "beta"], out, **kwargs)
+        return {contract: outcome["status"] for contract, outcome in outcomes.items()}, outcomes
+
+    def test_unchanged_contracts_are_skipped(self, aggregated, tmp_path):
+        out = tmp_path / "workbooks"
+        statuses, first = self._build(aggregated, out, max_workers=1)
+        assert statuses == {"consulting": "built", "dpa": "built"}
+        assert (out / "CONSULTING_Evaluations.xlsx").exists() and (out / MANIFEST_NAME).exists()
+
+        statuses, second = self._build(aggregated, out, max_workers=1)
+        assert statuses == {"consulting": "unchanged", "dpa": "unchanged"}
+        assert second["consulting"]["summaries"] == first["consulting"]["summaries"]
+        assert second["dpa"]["summaries"]["alpha"]["total_points"] == 8.0
+
+    def test_changed_input_or_missing_output_rebuilds(self, aggregated, tmp_path):
+        out = tmp_path / "workbooks"
+        self._build(aggregated, out, max_workers=1)
+
+        _write_aggregated(aggregated, "consulting", "beta", ["Y", "Y", "Y"], 7.5)
+        (out / "DPA_Evaluations.xlsx").unlink()
+        statuses, outcomes = self._build(aggregated, out, max_workers=1)
+
+        assert statuses == {"consulting": "built", "dpa": "built"}
+        assert outcomes["consulting"]["summaries"]["beta"]["total_points"] == 7.5
+
+    def test_new_model_rebuilds(self, aggregated, tmp_path):
+        out = tmp_path / "workbooks"
+        self._build(aggregated, out, max_workers=1)
+        _write_aggregated(aggregated, "dpa", "beta", ["N", "N", "N"], 0.0)
+
+        statuses, _ = self._build(aggregated, out, max_workers=1)
+        assert statuses == {"consulting": "unchanged", "dpa": "built"}
+
+    def test_full_and_process_pool(self, aggregated, tmp_path):
+        out = tmp_path / "workbooks"
+        self._build(aggregated, out, max_workers=1)
+
+        statuses, outcomes = self._build(aggregated, out, max_workers=2, full=True)
+
+        assert statuses == {"consulting": "built", "dpa": "built"}
+        assert set(outcomes["consulting"]["summaries"]) == {"alpha", "beta"}
+
+    def test_contract_without_data(self, aggregated, tmp_path):
+        (aggregated / "empty").mkdir()
+        outcomes = build_contracts(aggregated, ["empty"], ["alpha"], tmp_path / "workbooks", max_workers=1)
+        assert outcomes == {"empty": {"status": "no data", "summaries": {}}}